@@ -156,6 +156,7 @@ describe("AutoLoadingTable Component", () => {
                 infinite: true,
                 orderby: "Entity",
                 pagekey: "Infinite-Entity-Entity-asc",
+                data_formats: ["ARROW", "JSON"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
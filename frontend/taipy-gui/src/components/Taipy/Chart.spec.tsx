@@ -178,6 +178,7 @@ describe("Chart Component", () => {
             payload: {
                 alldata: true,
                 pagekey: "Day-Daily hospital occupancy",
+                data_formats: ["ARROW", "JSON"],
                 columns: ["Day", "Daily hospital occupancy"],
                 decimatorPayload: undefined,
                 id: "chart",
@@ -204,6 +205,7 @@ describe("Chart Component", () => {
                 columns: ["Day", "Daily hospital occupancy"],
                 decimatorPayload: undefined,
                 pagekey: "Day-Daily hospital occupancy",
+                data_formats: ["ARROW", "JSON"],
             },
             type: "REQUEST_DATA_UPDATE",
         });
@@ -244,6 +246,7 @@ describe("Chart Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: "100-200--asc",
+                data_formats: ["ARROW", "JSON"],
                 sort: "asc",
                 start: 100,
             },
@@ -243,6 +243,7 @@ describe("PaginatedTable Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: valueKey,
+                data_formats: ["ARROW", "JSON"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
@@ -269,6 +270,7 @@ describe("PaginatedTable Component", () => {
                 end: 99,
                 orderby: "Entity",
                 pagekey: "0-99-Entity,Daily hospital occupancy-Entity-asc",
+                data_formats: ["ARROW", "JSON"],
                 handlenan: false,
                 sort: "asc",
                 start: 0,
@@ -312,6 +314,7 @@ describe("PaginatedTable Component", () => {
                 id: "table",
                 orderby: "",
                 pagekey: "100-199-Entity,Daily hospital occupancy-asc",
+                data_formats: ["ARROW", "JSON"],
                 handlenan: false,
                 sort: "asc",
                 start: 100,
@@ -300,6 +300,7 @@ describe("createRequestDataUpdateAction function", () => {
         expect(action.payload.id).toEqual(id);
         expect(action.payload.columns).toEqual(columns);
         expect(action.payload.pagekey).toEqual(pageKey);
+        expect(action.payload.data_formats).toEqual(["ARROW", "JSON"]);
         expect(action.payload.key).toEqual(payload.key);
         expect(action.payload.alldata).toEqual(allData);
         expect(action.payload.library).toEqual(library);
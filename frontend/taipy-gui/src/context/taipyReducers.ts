@@ -20,7 +20,7 @@ import { io, Socket } from "socket.io-client";
 import { FilterDesc } from "../components/Taipy/tableUtils";
 import { stylekitModeThemes, stylekitTheme } from "../themes/stylekit";
 import { getBaseURL, TIMEZONE_CLIENT } from "../utils";
-import { parseData } from "../utils/dataFormat";
+import { acceptedDataFormats, parseData } from "../utils/dataFormat";
 import { MenuProps } from "../utils/lov";
 import { changeFavicon, getLocalStorageValue, IdMessage, storeClientId } from "./utils";
 import { lightenPayload, sendWsMessage, TAIPY_CLIENT_ID, WsMessage } from "./wsUtils";
@@ -733,6 +733,7 @@ export const createRequestDataUpdateAction = (
     }
     payload.columns = columns;
     payload.pagekey = pageKey;
+    payload.data_formats = acceptedDataFormats;
     if (library !== undefined) {
         payload.library = library;
     }
@@ -33,6 +33,16 @@ describe("does nothing", () => {
     it("returns records from arrow", async () => {
         expect(await parseData(arrowRecordsData)).toStrictEqual({ data: [{i32: 1, str: "One"}, {i32: 2, str: "Two"}, {i32: 3, str: "Three"}], format: "ARROW", orient: "records" });
     });
+    it("returns records with nulls from arrow", async () => {
+        const nullsTable = tableToIPC(tableFromArrays({ f64: new Float64Array([1.5, 2.5]), str: ["One", null] }));
+        expect(
+            await parseData({ format: DataFormat.APACHE_ARROW, orient: "records", data: nullsTable })
+        ).toStrictEqual({
+            data: [{ f64: 1.5, str: "One" }, { f64: 2.5, str: null }],
+            format: "ARROW",
+            orient: "records",
+        });
+    });
     it("returns list from arrow", async () => {
         expect(await parseData(arrowListData)).toStrictEqual({ data: {i32: [1, 2, 3], str: ["One", "Two", "Three"]}, format: "ARROW", orient: "list" });
     });
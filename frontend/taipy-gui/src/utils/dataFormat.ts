@@ -18,6 +18,9 @@ export enum DataFormat {
     APACHE_ARROW = "ARROW",
 }
 
+// The data formats that can be decoded, sent with the data requests so that the server can pick one.
+export const acceptedDataFormats: string[] = [DataFormat.APACHE_ARROW, DataFormat.JSON];
+
 const coerceBigInt = (val: unknown) => {
     if (typeof val == "bigint") {
         try {
@@ -40,13 +43,18 @@ export const parseData = (data: Record<string, unknown>): Promise<Record<string,
                     const arrowData = tableFromIPC(new Uint8Array(d as ArrayBuffer));
                     const tableHeading = arrowData.schema.fields.map((f) => f.name);
                     if (orient === "records") {
-                        const convertedData: Array<unknown> = [];
-                        for (const row of arrowData) {
+                        // Decode column by column, which is much faster than going through the row proxies
+                        const columns = tableHeading.map((_, i) => {
+                            const col = arrowData.getChildAt(i);
+                            return col ? Array.from(col, coerceBigInt) : [];
+                        });
+                        const convertedData: Array<unknown> = new Array(arrowData.numRows);
+                        for (let r = 0; r < arrowData.numRows; r++) {
                             const dataRow: Record<string, unknown> = {};
-                            for (const cell of row) {
-                                dataRow[cell[0]] = coerceBigInt(cell[1]);
+                            for (let c = 0; c < tableHeading.length; c++) {
+                                dataRow[tableHeading[c]] = columns[c][r];
                             }
-                            convertedData.push(dataRow);
+                            convertedData[r] = dataRow;
                         }
                         return convertedData;
                     } else if (orient === "list") {
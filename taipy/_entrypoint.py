@@ -18,6 +18,7 @@ from taipy.common._cli._create_cli import _CreateCLI
 from taipy.common._cli._help_cli import _HelpCLI
 from taipy.common._cli._run_cli import _RunCLI
 from taipy.core._cli._core_cli_factory import _CoreCLIFactory
+from taipy.core._entity._history_cli import _HistoryCLI
 from taipy.core._entity._migrate_cli import _MigrateCLI
 from taipy.core._version._cli._version_cli_factory import _VersionCLIFactory
 from taipy.gui._gui_cli import _GuiCLI
@@ -51,6 +52,7 @@ def _entrypoint():
     _CreateCLI.generate_template_map()
     _CreateCLI.create_parser()
     _MigrateCLI.create_parser()
+    _HistoryCLI.create_parser()
     _HelpCLI.create_parser()
 
     if find_spec("taipy.enterprise"):
@@ -67,6 +69,7 @@ def _entrypoint():
     _HelpCLI.handle_command()
     _VersionCLIFactory._build_cli().handle_command()
     _MigrateCLI.handle_command()
+    _HistoryCLI.handle_command()
     _CreateCLI.handle_command()
 
     _TaipyParser._remove_argument("help")
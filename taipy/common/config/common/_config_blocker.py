@@ -33,6 +33,10 @@ class _ConfigBlocker:
             cls.__logger.debug("Unblocking configuration update.")
             cls.__block_config_update = False
 
+    @classmethod
+    def _is_blocked(cls) -> bool:
+        return cls.__block_config_update
+
     @classmethod
     def _check(cls):
         def inner(f):
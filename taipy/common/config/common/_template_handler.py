@@ -61,6 +61,8 @@ class _TemplateHandler:
                 return cls._to_scope(val)
             elif type is Frequency:
                 return cls._to_frequency(val)
+            elif type is timedelta:
+                return cls._to_timedelta(val)
             else:
                 if dynamic_type == "bool":
                     return cls._to_bool(val)
@@ -342,7 +342,7 @@ class Config:
         Parameters:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"arrow"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -394,8 +394,8 @@ class Config:
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
-                *"generic"*.
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"arrow"*, *"mongo_collection"*, *"in_memory"*,
+                or *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
                 `(Config.)set_default_data_node_configuration()^`).
@@ -526,6 +526,46 @@ class Config:
             The new Parquet data node configuration.
         """  # noqa: E501
 
+    @classmethod
+    def configure_arrow_data_node(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        exposed_type: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new Arrow data node configuration.
+
+        The data is stored in an uncompressed Arrow IPC file which is memory-mapped when read, so
+        the data is neither parsed nor copied when it is exchanged between tasks.
+
+        Parameters:
+            id (str): The unique identifier of the new Arrow data node configuration.
+            default_path (Optional[str]): The default path of the Arrow file. A path on a
+                memory-backed file system (such as */dev/shm* on Linux) avoids any disk I/O.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this Arrow data node configuration.
+            exposed_type (Optional[str]): The exposed type of the data read from the Arrow file.
+                The possible values are *"pandas"*, *"numpy"*, *"arrow"* (a memory-mapped
+                `pyarrow.Table`), or a custom type.<br/>
+                The default value is `pandas`.
+            scope (Optional[Scope^]): The scope of the Arrow data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new Arrow data node configuration.
+        """  # noqa: E501
+
     @classmethod
     def configure_excel_data_node(
         cls,
@@ -900,7 +940,9 @@ class Config:
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                In *"standalone"* job execution mode, setting the *execution_mode* property to
+                *"thread"* executes the jobs of this task in threads of the main process.
 
         Returns:
             The new task configuration.
@@ -940,19 +982,39 @@ class Config:
 
     @staticmethod
     def configure_job_executions(
-        mode: Optional[str] = None, max_nb_of_workers: Optional[Union[int, str]] = None, **properties
+        mode: Optional[str] = None,
+        max_nb_of_workers: Optional[Union[int, str]] = None,
+        history_max_nb: Optional[Union[int, str]] = None,
+        history_max_age: Optional[Union[timedelta, str]] = None,
+        submission_status_persistence_delay: Optional[Union[float, str]] = None,
+        **properties,
     ) -> "JobConfig":
         """Configure job execution.
 
         Parameters:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
-            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                Possible values are: *"standalone"*, *"thread"* or *"development"*.
+            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* and *"thread"* modes.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
+            history_max_nb (Optional[int, str]): The number of most recent jobs kept for each task,
+                and of most recent submissions kept for each submitted entity.<br/>
+                Older finished jobs and submissions are moved to a read-only archive when the history
+                is compacted, unless they are kept by *history_max_age*.<br/>
+                By default, the number of jobs and submissions kept is not limited.
+            history_max_age (Optional[timedelta, str]): The period for which finished jobs and
+                submissions are kept. Older ones are moved to a read-only archive when the history is
+                compacted, unless they are kept by *history_max_nb*. The latest job of each task and the
+                latest submission of each entity are always kept.<br/>
+                By default, jobs and submissions are kept regardless of their age.
+            submission_status_persistence_delay (Optional[float, str]): The number of seconds for which
+                the persistence of the intermediate statuses of a running submission is delayed, so that
+                successive job status changes only persist the submission once. Finished submissions are
+                always persisted immediately.<br/>
+                By default, the submission is persisted on each job status change.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -0,0 +1,77 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sys
+from datetime import timedelta
+
+from taipy.common._cli._base_cli._abstract_cli import _AbstractCLI
+from taipy.common._cli._base_cli._taipy_parser import _TaipyParser
+from taipy.common.config import Config
+
+from ._history_compaction import _compact_history
+
+
+class _HistoryCLI(_AbstractCLI):
+    _COMMAND_NAME = "compact-history"
+    _ARGUMENTS = ["--repository-type", "--storage-folder", "--max-nb", "--max-age-days"]
+
+    @classmethod
+    def create_parser(cls):
+        history_parser = _TaipyParser._add_subparser(
+            cls._COMMAND_NAME,
+            help="Move the finished jobs and submissions that are not retained by the history retention policy to"
+            " read-only archives. The compaction should be performed while the application is not running.",
+        )
+        history_parser.add_argument(
+            "--repository-type",
+            choices=["filesystem", "sql"],
+            help="The type of repository holding the entities. By default, the repository type of the configuration.",
+        )
+        history_parser.add_argument(
+            "--storage-folder",
+            help="The Taipy storage folder holding the entities and the archives. By default, the Taipy storage"
+            " folder of the configuration.",
+        )
+        history_parser.add_argument(
+            "--max-nb",
+            type=int,
+            help="The number of most recent jobs retained per task, and of submissions retained per submitted entity."
+            " By default, the history_max_nb of the job configuration.",
+        )
+        history_parser.add_argument(
+            "--max-age-days",
+            type=float,
+            help="The number of days for which jobs and submissions are retained. By default, the history_max_age of"
+            " the job configuration.",
+        )
+
+    @classmethod
+    def handle_command(cls):
+        args = cls._parse_arguments()
+        if not args:
+            return
+
+        if args.storage_folder is not None and not os.path.isdir(args.storage_folder):
+            cls._logger.error(f"Folder '{args.storage_folder}' does not exist.")
+            sys.exit(1)
+        if args.max_nb is not None and args.max_nb < 1:
+            cls._logger.error("The number of retained jobs and submissions must be a positive integer.")
+            sys.exit(1)
+        history_max_age = timedelta(days=args.max_age_days) if args.max_age_days is not None else None
+        if args.max_nb is None and history_max_age is None and not Config.job_config.has_history_retention:
+            _TaipyParser._sub_taipyparsers.get(cls._COMMAND_NAME).print_help()
+            cls._logger.error("No history retention policy is configured: use --max-nb or --max-age-days.")
+            sys.exit(1)
+
+        Config.configure_core(repository_type=args.repository_type, taipy_storage_folder=args.storage_folder)
+        _compact_history(args.max_nb, history_max_age)
+        sys.exit(0)
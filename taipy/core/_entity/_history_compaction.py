@@ -0,0 +1,107 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ..job._job_manager_factory import _JobManagerFactory
+from ..job.job import Job
+from ..submission._submission_manager_factory import _SubmissionManagerFactory
+from ..submission.submission import Submission
+from ._reload import _Reloader
+
+__logger = _TaipyLogger._get_logger()
+
+_Historized = TypeVar("_Historized", Job, Submission)
+
+
+def _compact_history(
+    history_max_nb: Optional[int] = None,
+    history_max_age: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+) -> Tuple[int, int]:
+    """Move the finished jobs and submissions that are not retained to the read-only archives.
+
+    For each task, the *history_max_nb* most recent jobs are retained, as well as the jobs created
+    within *history_max_age*. The same goes for the submissions of each submitted entity. The latest
+    job of each task and the latest submission of each entity are always retained, as are the jobs of
+    the retained submissions, so that a submission never loses its jobs.
+
+    Parameters:
+        history_max_nb: The number of jobs retained per task and of submissions retained per entity.
+            If None, the `history_max_nb` of the job config is used.
+        history_max_age: The period for which jobs and submissions are retained. If None, the
+            `history_max_age` of the job config is used.
+        now: The date the age of the entities is computed from. The current date by default.
+
+    Returns:
+        The number of jobs and the number of submissions archived.
+    """
+    if history_max_nb is None:
+        history_max_nb = Config.job_config.history_max_nb
+    if history_max_age is None:
+        history_max_age = Config.job_config.history_max_age
+    if history_max_nb is None and history_max_age is None:
+        return 0, 0
+    max_nb = max(int(history_max_nb or 1), 1)
+    min_creation_date = (now or datetime.now()) - history_max_age if history_max_age is not None else None
+
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submissions = submission_manager._get_all(version_number="all")
+    archived_submissions = __select_archived(
+        submissions, lambda submission: submission.entity_id, max_nb, min_creation_date
+    )
+    nb_submissions = submission_manager._archive_many(archived_submissions)
+
+    archived_submission_ids = {submission.id for submission in archived_submissions}
+    retained_submission_ids = {submission.id for submission in submissions} - archived_submission_ids
+    job_manager = _JobManagerFactory._build_manager()
+    archived_jobs = __select_archived(
+        job_manager._get_all(version_number="all"),
+        lambda job: job.task.id,
+        max_nb,
+        min_creation_date,
+        retained_submission_ids,
+    )
+    nb_jobs = job_manager._archive_many(archived_jobs)
+
+    __logger.info(f"Archived {nb_jobs} jobs and {nb_submissions} submissions.")
+    return nb_jobs, nb_submissions
+
+
+def __select_archived(
+    entities: Iterable[_Historized],
+    get_key: Callable[[_Historized], str],
+    max_nb: int,
+    min_creation_date: Optional[datetime],
+    retained_submission_ids: Optional[Set[str]] = None,
+) -> List[_Historized]:
+    entities_by_key: Dict[str, List[_Historized]] = defaultdict(list)
+    archived = []
+    # The entities were just loaded: they do not need to be reloaded on each property access
+    with _Reloader():
+        for entity in entities:
+            entities_by_key[get_key(entity)].append(entity)
+        for key_entities in entities_by_key.values():
+            key_entities.sort(key=lambda entity: entity.creation_date, reverse=True)
+            for entity in key_entities[max_nb:]:
+                if not entity.is_finished():
+                    continue
+                if min_creation_date is not None and entity.creation_date >= min_creation_date:
+                    continue
+                if retained_submission_ids is not None and entity.submit_id in retained_submission_ids:  # type: ignore
+                    continue
+                archived.append(entity)
+    return archived
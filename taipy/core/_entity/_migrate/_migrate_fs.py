@@ -16,6 +16,7 @@ from typing import Dict
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ..._repository._filesystem_catalog import _rebuild_catalogs, _remove_catalogs
 from ._utils import _migrate
 
 __logger = _TaipyLogger._get_logger()
@@ -112,6 +113,89 @@ def _migrate_fs_entities(path: str, backup: bool = True) -> bool:
     entities = _load_all_entities_from_fs(path)
     entities, _ = _migrate(entities)
     __write_entities_to_fs(entities, path)
+    # The catalogs index the entities before migration. They are rebuilt on the next access.
+    _remove_catalogs(path)
 
     __logger.info("Migration finished")
     return True
+
+
+def _rebuild_fs_catalogs(path: str) -> bool:
+    """Rebuild the catalogs indexing the entities stored in a filesystem folder.
+
+    Args:
+        path (str): The path to the folder containing the entities.
+
+    Returns:
+        bool: True if the catalogs were rebuilt, False otherwise.
+    """
+    if not os.path.isdir(path):
+        __logger.error(f"Folder '{path}' does not exist.")
+        return False
+
+    for dir_name, nb_entities in _rebuild_catalogs(path).items():
+        __logger.info(f"Indexed {nb_entities} entities in the '{dir_name}' catalog.")
+    __logger.info(f"Rebuilt the entity catalogs of the '{path}' folder.")
+    return True
+
+
+def _copy_fs_entities_to_sql(path: str, db_location: str) -> bool:
+    """Copy the entities stored in a filesystem folder to an SQLite database.
+
+    The entities must be compatible with the current taipy version. Entities already stored in the
+    database with the same ids are replaced.
+
+    Args:
+        path (str): The path to the folder containing the entities.
+        db_location (str): The path to the SQLite database file.
+
+    Returns:
+        bool: True if the entities were copied, False otherwise.
+    """
+    from ..._version._version_sql_repository import _VersionSQLRepository
+    from ...cycle._cycle_sql_repository import _CycleSQLRepository
+    from ...data._data_sql_repository import _DataSQLRepository
+    from ...job._job_sql_repository import _JobSQLRepository
+    from ...scenario._scenario_sql_repository import _ScenarioSQLRepository
+    from ...submission._submission_sql_repository import _SubmissionSQLRepository
+    from ...task._task_sql_repository import _TaskSQLRepository
+
+    if not os.path.isdir(path):
+        __logger.error(f"Folder '{path}' does not exist.")
+        return False
+
+    __logger.info(f"Starting entity copy from '{path}' folder to '{db_location}' database.")
+    repositories = [
+        _CycleSQLRepository(),
+        _DataSQLRepository(),
+        _JobSQLRepository(),
+        _ScenarioSQLRepository(),
+        _SubmissionSQLRepository(),
+        _TaskSQLRepository(),
+        _VersionSQLRepository(),
+    ]
+    for repository in repositories:
+        repository._db_location = db_location
+        folder = os.path.join(path, repository.table_name)
+        if not os.path.isdir(folder):
+            continue
+        documents = []
+        for file in os.listdir(folder):
+            if file.endswith(".json"):
+                with open(os.path.join(folder, file), encoding="UTF-8") as f:
+                    documents.append(json.load(f))
+        repository._save_documents(documents)
+        __logger.info(f"Copied {len(documents)} entities to the '{repository.table_name}' table.")
+
+    version_file = os.path.join(path, "version.json")
+    if os.path.isfile(version_file):
+        with open(version_file, encoding="UTF-8") as f:
+            versions = json.load(f)
+        version_repository = repositories[-1]
+        if development_version := versions.get(_VersionSQLRepository._DEVELOPMENT_VERSION_KEY):
+            version_repository._set_development_version(development_version)
+        if latest_version := versions.get(_VersionSQLRepository._LATEST_VERSION_KEY):
+            version_repository._set_latest_version(latest_version)
+
+    __logger.info("Copy finished")
+    return True
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 import sys
 from typing import List
 
@@ -17,8 +18,10 @@ from taipy.common._cli._base_cli._taipy_parser import _TaipyParser
 from taipy.common.config import Config
 
 from ._migrate import (
+    _copy_fs_entities_to_sql,
     _migrate_fs_entities,
     _migrate_mongo_entities,
+    _rebuild_fs_catalogs,
     _remove_backup_file_entities,
     _remove_backup_mongo_entities,
     _restore_migrate_file_entities,
@@ -28,7 +31,7 @@ from ._migrate import (
 
 class _MigrateCLI(_AbstractCLI):
     _COMMAND_NAME = "migrate"
-    _ARGUMENTS = ["--repository-type", "--skip-backup", "--restore", "--remove-backup"]
+    _ARGUMENTS = ["--repository-type", "--skip-backup", "--restore", "--remove-backup", "--rebuild-catalog", "--to-sql"]
 
     @classmethod
     def create_parser(cls):
@@ -59,6 +62,20 @@ class _MigrateCLI(_AbstractCLI):
             action="store_true",
             help="Remove the backup of entities. Only use this option if the migration was successful.",
         )
+        migrate_parser.add_argument(
+            "--rebuild-catalog",
+            action="store_true",
+            help="Rebuild the catalogs indexing the entities of a filesystem repository. Use this option on folders"
+            " written by older taipy versions.",
+        )
+        migrate_parser.add_argument(
+            "--to-sql",
+            nargs="?",
+            const="",
+            help="Copy the entities of a filesystem repository to an SQLite database, to be used with the 'sql'"
+            " repository type. The path to the database file can be informed, by default it is 'taipy.sqlite3' in the"
+            " filesystem folder. The entities should be migrated to the current taipy version first.",
+        )
 
     @classmethod
     def handle_command(cls):
@@ -78,6 +95,10 @@ class _MigrateCLI(_AbstractCLI):
             cls.__handle_restore_backup(repository_type, repository_args)
         if args.remove_backup:
             cls.__handle_remove_backup(repository_type, repository_args)
+        if args.rebuild_catalog:
+            cls.__handle_rebuild_catalog(repository_type, repository_args)
+        if args.to_sql is not None:
+            cls.__handle_copy_to_sql(repository_type, repository_args, args.to_sql)
 
         do_backup = not args.skip_backup
         cls.__migrate_entities(repository_type, repository_args, do_backup)
@@ -113,6 +134,28 @@ class _MigrateCLI(_AbstractCLI):
             sys.exit(1)
         sys.exit(0)
 
+    @classmethod
+    def __handle_rebuild_catalog(cls, repository_type: str, repository_args: List):
+        if repository_type != "filesystem":
+            cls._logger.error(f"Catalogs can only be rebuilt for a filesystem repository, not {repository_type}")
+            sys.exit(1)
+
+        path = repository_args[0] or Config.core.taipy_storage_folder
+        if not _rebuild_fs_catalogs(path):
+            sys.exit(1)
+        sys.exit(0)
+
+    @classmethod
+    def __handle_copy_to_sql(cls, repository_type: str, repository_args: List, db_location: str):
+        if repository_type != "filesystem":
+            cls._logger.error(f"Entities can only be copied to SQL from a filesystem repository, not {repository_type}")
+            sys.exit(1)
+
+        path = repository_args[0] or Config.core.taipy_storage_folder
+        if not _copy_fs_entities_to_sql(path, db_location or os.path.join(path, "taipy.sqlite3")):
+            sys.exit(1)
+        sys.exit(0)
+
     @classmethod
     def __migrate_entities(cls, repository_type: str, repository_args: List, do_backup: bool):
         if repository_type == "filesystem":
@@ -9,12 +9,14 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+import weakref
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity._entity_ids import _EntityIds
 from .._repository._abstract_repository import _AbstractRepository
+from .._repository._archive import _Archive
 from ..exceptions.exceptions import ModelNotFound
 from ..notification import Event, EventOperation, Notifier
 from ..reason import EntityDoesNotExist, ReasonCollection
@@ -26,6 +28,33 @@ class _Manager(Generic[EntityType]):
     _repository: _AbstractRepository
     _logger = _TaipyLogger._get_logger()
     _ENTITY_NAME: str = "Entity"
+    _ARCHIVE_NAME: Optional[str] = None
+    # key = entity id, value = (revision, reference to the last instance of the entity loaded at this revision)
+    __revisions: Dict[str, Tuple[Hashable, weakref.ReferenceType]] = {}
+
+    @classmethod
+    def __remember(cls, entity: EntityType, revision: Optional[Hashable]):
+        entity_id = entity.id  # type: ignore[attr-defined]
+        if revision is None:
+            cls.__revisions.pop(entity_id, None)
+            return
+        revisions = cls.__revisions
+
+        def forget(ref: weakref.ReferenceType):
+            if revisions.get(entity_id, (None, None))[1] is ref:
+                revisions.pop(entity_id, None)
+
+        revisions[entity_id] = (revision, weakref.ref(entity, forget))
+
+    @classmethod
+    def __is_up_to_date(cls, entity: EntityType) -> bool:
+        if getattr(entity, "_is_in_context", False):
+            # The changes made in a context are only applied to the reloaded entities when the context exits.
+            return False
+        entry = cls.__revisions.get(entity.id)  # type: ignore[attr-defined]
+        if entry is None or entry[1]() is not entity:
+            return False
+        return entry[0] == cls._repository._get_revision(entity.id)  # type: ignore[attr-defined]
 
     @classmethod
     def _delete_all(cls):
@@ -33,6 +62,7 @@ class _Manager(Generic[EntityType]):
         Deletes all entities.
         """
         cls._repository._delete_all()
+        cls.__revisions.clear()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -48,6 +78,8 @@ class _Manager(Generic[EntityType]):
         Deletes entities by a list of ids.
         """
         cls._repository._delete_many(ids)
+        for entity_id in ids:
+            cls.__revisions.pop(entity_id, None)
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             for entity_id in ids:
                 Notifier.publish(
@@ -59,6 +91,31 @@ class _Manager(Generic[EntityType]):
                     )
                 )
 
+    @classmethod
+    def _archive_many(cls, entities: Iterable[EntityType]) -> int:
+        """
+        Moves entities to the read-only archive of the manager.
+        """
+        entities = list(entities)
+        if not entities or cls._ARCHIVE_NAME is None:
+            return 0
+        converter = cls._repository.converter  # type: ignore[attr-defined]
+        nb_archived = _Archive(cls._ARCHIVE_NAME)._append(
+            converter._entity_to_model(entity).to_dict() for entity in entities
+        )
+        cls._delete_many([entity.id for entity in entities])  # type: ignore[attr-defined]
+        return nb_archived
+
+    @classmethod
+    def _get_archived(cls, filters: Optional[List[Dict]] = None) -> List:
+        """
+        Returns the models of the archived entities matching the filters, as read-only records.
+        """
+        if cls._ARCHIVE_NAME is None:
+            return []
+        model_type = cls._repository.model_type  # type: ignore[attr-defined]
+        return [model_type.from_dict(data) for data in _Archive(cls._ARCHIVE_NAME)._load_all(filters)]
+
     @classmethod
     def _delete_by_version(cls, version_number: str):
         """
@@ -80,6 +137,7 @@ class _Manager(Generic[EntityType]):
         Deletes an entity by id.
         """
         cls._repository._delete(id)
+        cls.__revisions.pop(id, None)
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -95,6 +153,18 @@ class _Manager(Generic[EntityType]):
         Save or update an entity.
         """
         cls._repository._save(entity)
+        # The state of a saved instance may differ from the state of the entity loaded from the repository.
+        cls.__revisions.pop(entity.id, None)  # type: ignore[attr-defined]
+
+    @classmethod
+    def _set_many(cls, entities: Iterable[EntityType]):
+        """
+        Save or update several entities at once.
+        """
+        entities = list(entities)
+        cls._repository._save_many(entities)
+        for entity in entities:
+            cls.__revisions.pop(entity.id, None)  # type: ignore[attr-defined]
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
@@ -113,17 +183,51 @@ class _Manager(Generic[EntityType]):
             filters = []
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _get_page(
+        cls,
+        filters: Optional[List[Dict]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[EntityType]:
+        """
+        Returns a page of the entities based on a criteria, ordered by id.
+        """
+        return cls._repository._load_page(filters or [], limit, offset, after)
+
     @classmethod
     def _get(cls, entity: Union[str, EntityType], default=None) -> EntityType:
         """
         Returns an entity by id or reference.
+
+        An entity passed by reference is returned as is if it is the last instance of the entity
+        loaded, and the entity was not saved since.
         """
+        if not isinstance(entity, str) and cls.__is_up_to_date(entity):
+            return entity
         entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+        # The revision is read first, so an entity saved while it is loaded is never considered up to date.
+        revision = cls._repository._get_revision(entity_id, reliable=False)
         try:
-            return cls._repository._load(entity_id)
+            loaded_entity = cls._repository._load(entity_id)
         except ModelNotFound:
             cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
             return default
+        cls.__remember(loaded_entity, revision)
+        return loaded_entity
+
+    @classmethod
+    def _get_many(cls, entities: Iterable[Union[str, EntityType]]) -> List[EntityType]:
+        """
+        Returns several entities by id or reference, in the given order. Missing entities are skipped.
+        """
+        entity_ids = [entity if isinstance(entity, str) else entity.id for entity in entities]  # type: ignore
+        found = {entity.id: entity for entity in cls._repository._load_many(entity_ids)}  # type: ignore
+        for entity_id in entity_ids:
+            if entity_id not in found:
+                cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
+        return [found[entity_id] for entity_id in entity_ids if entity_id in found]
 
     @classmethod
     def _exists(cls, entity_id: str) -> ReasonCollection:
@@ -66,3 +66,11 @@ class _AbstractOrchestrator:
     @abstractmethod
     def cancel_job(cls, job: Job):
         raise NotImplementedError
+
+    @classmethod
+    def _on_data_node_ready(cls, data_node_id: str) -> None:
+        """Called when a data node is persisted while ready for reading."""
+
+    @classmethod
+    def _on_submissions_deleted(cls, submission_ids: Optional[Iterable[str]] = None) -> None:
+        """Called when submissions are deleted, or all the submissions if *submission_ids* is None."""
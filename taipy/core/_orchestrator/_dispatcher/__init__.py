@@ -12,3 +12,4 @@
 from ._development_job_dispatcher import _DevelopmentJobDispatcher
 from ._job_dispatcher import _JobDispatcher
 from ._standalone_job_dispatcher import _StandaloneJobDispatcher
+from ._thread_job_dispatcher import _ThreadJobDispatcher
@@ -10,7 +10,6 @@
 # specific language governing permissions and limitations under the License.
 
 import threading
-import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
@@ -57,23 +56,25 @@ class _JobDispatcher(threading.Thread):
             timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
         """
         self._STOP_FLAG = True
+        self.orchestrator._notify_dispatcher()  # type: ignore
         if wait and self.is_running():
             self._logger.debug("Waiting for the dispatcher thread to stop...")
             self.join(timeout=timeout)
 
     def run(self):
         self._logger.debug("Job dispatcher started.")
+        condition = self.orchestrator.dispatcher_condition  # type: ignore
         while not self._STOP_FLAG:
-            if not self._can_execute():
-                time.sleep(0.2)  # We need to sleep to avoid busy waiting.
-                continue
+            with condition:
+                # The orchestrator and the workers notify the condition, so there is no need to poll.
+                condition.wait_for(self._has_job_to_dispatch)
 
             with self.lock:
                 self._logger.debug("Acquiring lock to check jobs to run.")
                 job = None
                 try:
                     if not self._STOP_FLAG:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
+                        job = self.orchestrator.jobs_to_run.get_nowait()
                 except Empty:  # In case the last job of the queue has been removed.
                     pass
             if job:
@@ -87,6 +88,10 @@ class _JobDispatcher(threading.Thread):
                     self._logger.exception(e)
         self._logger.debug("Job dispatcher stopped.")
 
+    def _has_job_to_dispatch(self) -> bool:
+        """Returns True if the dispatcher is stopped or if a job can be dispatched."""
+        return self._STOP_FLAG or (self._can_execute() and not self.orchestrator.jobs_to_run.empty())
+
     @abstractmethod
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a new job."""
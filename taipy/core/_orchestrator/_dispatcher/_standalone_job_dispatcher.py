@@ -10,14 +10,17 @@
 # specific language governing permissions and limitations under the License.
 
 import multiprocessing as mp
-from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
+from taipy.common.config.common._config_blocker import _ConfigBlocker
 
+from ...config.job_config import JobConfig
+from ...config.task_config import TaskConfig
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
 from ._job_dispatcher import _JobDispatcher
@@ -25,19 +28,42 @@ from ._task_function_wrapper import _TaskFunctionWrapper
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor.
+
+    The jobs of the tasks configured with the *"thread"* execution mode are executed by a ThreadPoolExecutor
+    instead. Both executors share the same number of available workers.
+    """
 
     _nb_available_workers_lock = Lock()
     _DEFAULT_MAX_NB_OF_WORKERS = 2
 
+    _config: Optional[Tuple[str, str]] = None
+    _workers_config_hash: Optional[str] = None
+    _thread_executor: Optional[Executor] = None
+
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
         max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+        # The workers receive the config once, when they are spawned.
+        config_as_string, self._workers_config_hash = self._get_config()
         self._executor: Executor = ProcessPoolExecutor(
-            max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
+            max_workers=max_workers,
+            initializer=_TaskFunctionWrapper._initialize_worker,
+            initargs=(config_as_string, self._workers_config_hash, subproc_initializer),
+            mp_context=mp.get_context("spawn"),
         )
         self._nb_available_workers = self._executor._max_workers  # type: ignore
 
+    def _get_config(self) -> Tuple[str, str]:
+        """Return the applied config serialized as a string, along with its hash.
+
+        The result is reused as long as the config update is blocked since the config cannot change meanwhile.
+        """
+        if self._config is None or not _ConfigBlocker._is_blocked():
+            config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+            self._config = (config_as_string, _TaskFunctionWrapper._hash_config(config_as_string))
+        return self._config
+
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a job."""
         with self._nb_available_workers_lock:
@@ -46,9 +72,23 @@ class _StandaloneJobDispatcher(_JobDispatcher):
 
     def run(self):
         with self._executor:
-            super().run()
+            try:
+                super().run()
+            finally:
+                if self._thread_executor:
+                    self._thread_executor.shutdown()
         self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
 
+    def _get_thread_executor(self) -> Executor:
+        if self._thread_executor is None:
+            max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+            self._thread_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thread-Taipy-Job")
+        return self._thread_executor
+
+    @staticmethod
+    def _is_executed_in_thread(job: Job) -> bool:
+        return job.task._properties.get(TaskConfig._EXECUTION_MODE_KEY) == JobConfig._THREAD_MODE
+
     def _dispatch(self, job: Job):
         """Dispatches the given `Job^` on an available worker for execution.
 
@@ -58,13 +98,25 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         with self._nb_available_workers_lock:
             self._nb_available_workers -= 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+        if self._is_executed_in_thread(job):
+            # The job is executed in the main process, so the config does not need to be synchronized.
+            future = self._get_thread_executor().submit(_TaskFunctionWrapper(job.id, job.task))
+            future.add_done_callback(partial(self._update_job_status_from_future, job))
+            return
 
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
+        config_as_string, config_hash = self._get_config()
+        if config_hash == self._workers_config_hash:
+            # The workers were initialized with the same config, so there is nothing to synchronize.
+            future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_hash=config_hash)
+        else:
+            future = self._executor.submit(
+                _TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string, config_hash=config_hash
+            )
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
             self._nb_available_workers += 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
+        self.orchestrator._notify_dispatcher()  # type: ignore
         self._update_job_status(job, ft.result())
@@ -9,23 +9,37 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+import hashlib
+from typing import Any, Callable, List, Optional
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
+from taipy.common.config.common._config_blocker import _ConfigBlocker
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
-from ...data._data_manager_factory import _DataManagerFactory
 from ...data.data_node import DataNode
 from ...exceptions import DataNodeWritingError
 from ...job.job_id import JobId
 from ...task.task import Task
+from ._warm_data_node_cache import _WarmDataNodeCache
 
 logger = _TaipyLogger._get_logger()
 
 
 class _TaskFunctionWrapper:
-    """Wrapper around task function."""
+    """Wrapper around task function.
+
+    In a standalone worker, the configuration is applied once by `_initialize_worker()` and is identified
+    by its hash. A job only carries the configuration when it differs from the one the worker was
+    initialized with, and the worker only applies it again when its hash changes.
+    """
+
+    _WORKER_CACHE_SIZE_KEY = "worker_cache_size"
+    _DEFAULT_WORKER_CACHE_SIZE = 256
+
+    _in_worker = False
+    _config_hash: Optional[str] = None
+    _data_node_cache = _WarmDataNodeCache(0)
 
     def __init__(self, job_id: JobId, task: Task):
         self.job_id = job_id
@@ -35,12 +49,46 @@ class _TaskFunctionWrapper:
         """Make this object callable as a function. Actually calls `execute`."""
         return self.execute(**kwargs)
 
+    @staticmethod
+    def _hash_config(config_as_string: str) -> str:
+        return hashlib.sha256(config_as_string.encode("UTF-8")).hexdigest()
+
+    @classmethod
+    def _initialize_worker(
+        cls, config_as_string: str, config_hash: Optional[str] = None, initializer: Optional[Callable] = None
+    ):
+        """Apply the configuration once in a new worker process, then call the optional `initializer`."""
+        cls._in_worker = True
+        cls._sync_config(config_as_string, config_hash)
+        if initializer:
+            initializer()
+
+    @classmethod
+    def _sync_config(cls, config_as_string: str, config_hash: Optional[str] = None):
+        config_hash = config_hash or cls._hash_config(config_as_string)
+        # The config can only have been modified since the last synchronization if it was unblocked meanwhile.
+        if config_hash == cls._config_hash and _ConfigBlocker._is_blocked():
+            return
+        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+        Config.block_update()
+        cls._config_hash = config_hash
+        cls._data_node_cache = _WarmDataNodeCache(cls.__get_worker_cache_size() if cls._in_worker else 0)
+
+    @classmethod
+    def __get_worker_cache_size(cls) -> int:
+        cache_size = getattr(Config.job_config, cls._WORKER_CACHE_SIZE_KEY)
+        return cls._DEFAULT_WORKER_CACHE_SIZE if cache_size is None else int(cache_size)
+
     def execute(self, **kwargs):
-        """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
+        """Execute the wrapped function.
+
+        If `config_as_string` is given, it is applied to the config unless the worker already applied
+        a config with the same `config_hash`.
+        """
         try:
+            config_hash = kwargs.pop("config_hash", None)
             if config_as_string := kwargs.pop("config_as_string", None):
-                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-                Config.block_update()
+                self._sync_config(config_as_string, config_hash)
 
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
@@ -53,18 +101,26 @@ class _TaskFunctionWrapper:
             return [e]
 
     def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
-        data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        data_node_cache = self._data_node_cache
+        return [self.__read_input(data_node_cache._get(dn.id)) for dn in inputs]
+
+    @staticmethod
+    def __read_input(data_node: DataNode) -> Any:
+        # A data node configured with a chunk size is passed to the function as a lazy iterator over its chunks.
+        if data_node.properties.get(DataNode._CHUNK_SIZE_PROPERTY):
+            return data_node.read_chunks()
+        return data_node.read_or_raise()
 
     def _write_data(self, outputs: List[DataNode], results, job_id: JobId):
-        data_manager = _DataManagerFactory._build_manager()
+        data_node_cache = self._data_node_cache
         try:
             if outputs:
                 _results = self._extract_results(outputs, results)
                 exceptions = []
                 for res, dn in zip(_results, outputs):
                     try:
-                        data_node = data_manager._get(dn.id)
+                        data_node = data_node_cache._get(dn.id)
+                        data_node_cache._pop(dn.id)
                         data_node.write(res, job_id=job_id)
                     except Exception as e:
                         logger.error("Error during write", exc_info=1)
@@ -0,0 +1,66 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import OrderedDict
+
+from ...data._data_manager_factory import _DataManagerFactory
+from ...data.data_node import DataNode
+from ...data.data_node_id import DataNodeId
+
+
+class _WarmDataNodeCache:
+    """
+    Bounded LRU cache of the data node entities loaded by a standalone worker between jobs.
+
+    An entity is only served if the repository reports the same revision as when it was loaded. A
+    repository that does not provide revisions, such as the SQL repository, always reloads the entity.
+
+    Attributes:
+        max_size (int): The maximum number of cached data nodes. The cache is disabled if it is 0.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max(int(max_size), 0)
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, data_node_id: DataNodeId) -> DataNode:
+        data_manager = _DataManagerFactory._build_manager()
+        if not self.max_size:
+            return data_manager._get(data_node_id)
+
+        revision = data_manager._repository._get_revision(data_node_id)
+        entry = self._entries.get(data_node_id)
+        if revision is not None and entry is not None and entry[0] == revision:
+            self._entries.move_to_end(data_node_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        data_node = data_manager._get(data_node_id)
+        if revision is None or data_node is None:
+            self._entries.pop(data_node_id, None)
+            return data_node
+        self._entries[data_node_id] = (revision, data_node)
+        self._entries.move_to_end(data_node_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return data_node
+
+    def _pop(self, data_node_id: DataNodeId):
+        self._entries.pop(data_node_id, None)
+
+    def _clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
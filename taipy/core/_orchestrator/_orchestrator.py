@@ -12,9 +12,9 @@
 import itertools
 from datetime import datetime
 from queue import Queue
-from threading import Lock
+from threading import Condition, RLock
 from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -26,8 +26,10 @@ from ..job.job import Job
 from ..job.job_id import JobId
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
 from ..submission.submission import Submission
+from ..submission.submission_status import SubmissionStatus
 from ..task.task import Task
 from ._abstract_orchestrator import _AbstractOrchestrator
+from ._readiness_graph import _ReadinessGraph
 
 
 class _Orchestrator(_AbstractOrchestrator):
@@ -37,8 +39,17 @@ class _Orchestrator(_AbstractOrchestrator):
 
     jobs_to_run: Queue = Queue()
     blocked_jobs: List[Job] = []
-
-    lock = Lock()
+    # Indexes the blocked jobs by the input data nodes they are waiting for.
+    readiness_graph = _ReadinessGraph()
+    __indexed_blocked_jobs: Optional[List[Job]] = None
+    # The running submissions, which hold the current statuses of their jobs, indexed by id.
+    tracked_submissions: Dict[str, Submission] = {}
+
+    # Reentrant, as data nodes can become ready for reading while the orchestrator holds the lock.
+    lock = RLock()
+    # Notified whenever the dispatcher may have a job to dispatch: a job is queued, a worker is released or the
+    # dispatcher is stopped.
+    dispatcher_condition = Condition()
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -79,23 +90,22 @@ class _Orchestrator(_AbstractOrchestrator):
             getattr(submittable, "config_id", None),
             **properties,
         )
-        jobs: List[Job] = []
+        cls.tracked_submissions[submission.id] = submission
         tasks = submittable._get_sorted_tasks()
         with cls.lock:
             cls.__logger.debug(f"Acquiring lock to submit {submission.entity_id}.")
-            for ts in tasks:
-                jobs.extend(
-                    cls._lock_dn_output_and_create_job(
-                        task,
-                        submission.id,
-                        submission.entity_id,
-                        callbacks=itertools.chain([cls._update_submission_status], callbacks or []),
-                        force=force,  # type: ignore
-                    )
-                    for task in ts
-                )
+            jobs = cls._lock_dn_outputs_and_create_jobs(
+                [task for ts in tasks for task in ts],
+                submission.id,
+                submission.entity_id,
+                callbacks=itertools.chain([cls._update_submission_status], callbacks or []),
+                force=force,  # type: ignore
+            )
             submission.jobs = jobs  # type: ignore
             cls._orchestrate_job_to_run_or_block(jobs)
+        if not jobs:
+            # No job status change will ever update the submission
+            cls.tracked_submissions.pop(submission.id, None)
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         elif wait:
@@ -132,6 +142,7 @@ class _Orchestrator(_AbstractOrchestrator):
         submission = _SubmissionManagerFactory._build_manager()._create(
             task.id, task._ID_PREFIX, task.config_id, **properties
         )
+        cls.tracked_submissions[submission.id] = submission
         submit_id = submission.id
         with cls.lock:
             cls.__logger.debug(f"Acquiring lock to submit task {task.id}.")
@@ -163,14 +174,40 @@ class _Orchestrator(_AbstractOrchestrator):
     ) -> Job:
         for dn in task.output.values():
             dn.lock_edit()
-        return _JobManagerFactory._build_manager()._create(
+        job = _JobManagerFactory._build_manager()._create(
             task, itertools.chain([cls._on_status_change], callbacks or []), submit_id, submit_entity_id, force=force
         )
+        cls.readiness_graph._add_producer(job, cls.__get_output_ids([job]))
+        return job
+
+    @classmethod
+    def _lock_dn_outputs_and_create_jobs(
+        cls,
+        tasks: List[Task],
+        submit_id: str,
+        submit_entity_id: str,
+        callbacks: Optional[Iterable[Callable]] = None,
+        force: bool = False,
+    ) -> List[Job]:
+        for task in tasks:
+            for dn in task.output.values():
+                dn.lock_edit()
+        jobs = _JobManagerFactory._build_manager()._bulk_create(
+            tasks, itertools.chain([cls._on_status_change], callbacks or []), submit_id, submit_entity_id, force=force
+        )
+        for job in jobs:
+            cls.readiness_graph._add_producer(job, cls.__get_output_ids([job]))
+        return jobs
 
     @classmethod
     def _update_submission_status(cls, job: Job) -> None:
         submission_manager = _SubmissionManagerFactory._build_manager()
-        if submission := submission_manager._get(job.submit_id):
+        if submission := cls.tracked_submissions.get(job.submit_id):
+            # The tracked submission holds the current job statuses: it does not need to be reloaded
+            submission_manager._update_submission_status(submission, job, reload=False)
+            if submission._is_finished() or submission._submission_status == SubmissionStatus.UNDEFINED:
+                cls.tracked_submissions.pop(submission.id, None)
+        elif submission := submission_manager._get(job.submit_id):
             submission_manager._update_submission_status(submission, job)
         else:
             submissions = submission_manager._get_all()
@@ -187,12 +224,14 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def _orchestrate_job_to_run_or_block(cls, jobs: List[Job]) -> None:
+        cls.__sync_readiness_graph()
         blocked_jobs = []
         pending_jobs = []
 
         for job in jobs:
-            if cls._is_blocked(job):
+            if unresolved_data_node_ids := cls.__get_unresolved_input_ids(job):
                 job.blocked()
+                cls.readiness_graph._add(job, unresolved_data_node_ids)
                 blocked_jobs.append(job)
             else:
                 job.pending()
@@ -201,6 +240,13 @@ class _Orchestrator(_AbstractOrchestrator):
         cls.blocked_jobs.extend(blocked_jobs)
         for job in pending_jobs:
             cls.jobs_to_run.put(job)
+        if pending_jobs:
+            cls._notify_dispatcher()
+
+    @classmethod
+    def _notify_dispatcher(cls) -> None:
+        with cls.dispatcher_condition:
+            cls.dispatcher_condition.notify_all()
 
     @classmethod
     def _wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None) -> None:
@@ -236,6 +282,35 @@ class _Orchestrator(_AbstractOrchestrator):
         data_manager = _DataManagerFactory._build_manager()
         return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
 
+    @staticmethod
+    def __get_unresolved_input_ids(job: Job) -> Set[str]:
+        data_manager = _DataManagerFactory._build_manager()
+        return {dn.id for dn in job.task.input.values() if not data_manager._get(dn.id).is_ready_for_reading}
+
+    @classmethod
+    def __sync_readiness_graph(cls) -> None:
+        """Index the jobs added to `blocked_jobs`, or forget the jobs removed from it, outside the orchestrator."""
+        if cls.__indexed_blocked_jobs is cls.blocked_jobs and len(cls.readiness_graph) == len(cls.blocked_jobs):
+            return
+        if cls.__indexed_blocked_jobs is not cls.blocked_jobs:
+            cls.readiness_graph._clear()
+            cls.__indexed_blocked_jobs = cls.blocked_jobs
+        blocked_job_ids = {job.id for job in cls.blocked_jobs}
+        for job_id in cls.readiness_graph._job_ids():
+            if job_id not in blocked_job_ids:
+                cls.readiness_graph._remove(job_id)
+        unblocked = False
+        for job in list(cls.blocked_jobs):
+            if job.id in cls.readiness_graph:
+                continue
+            if unresolved_data_node_ids := cls.__get_unresolved_input_ids(job):
+                cls.readiness_graph._add(job, unresolved_data_node_ids)
+            else:
+                cls.__unblock_job(job)
+                unblocked = True
+        if unblocked:
+            cls._notify_dispatcher()
+
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]) -> None:
         jobs = [jobs] if isinstance(jobs, Job) else jobs
@@ -244,27 +319,77 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def _on_status_change(cls, job: Job) -> None:
+        if job._is_finished():
+            cls.readiness_graph._remove_producer(job, cls.__get_output_ids([job]))
         if job.is_completed() or job.is_skipped():
             cls.__logger.debug(f"{job.id} has been completed or skipped. Unblocking jobs.")
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(job)
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
 
     @classmethod
-    def __unblock_jobs(cls) -> None:
+    def _on_data_node_ready(cls, data_node_id: str) -> None:
+        """Unblock the jobs waiting for a data node that became ready for reading.
+
+        The data node may be written manually, or be unlocked after the failure or cancellation of the
+        job that was editing it. The waiting jobs are not released while an unfinished job still writes
+        the data node: they are released when that job completes.
+        """
+        if not cls.readiness_graph._jobs_waiting_for(data_node_id) or cls.readiness_graph._is_produced(data_node_id):
+            return
+        with cls.lock:
+            cls.__logger.debug(f"Acquiring lock to unblock jobs waiting for {data_node_id}.")
+            cls.__release_jobs_waiting_for([data_node_id])
+
+    @classmethod
+    def _on_submissions_deleted(cls, submission_ids: Optional[Iterable[str]] = None) -> None:
+        """Stop tracking the deleted submissions."""
+        if submission_ids is None:
+            cls.tracked_submissions.clear()
+            return
+        for submission_id in submission_ids:
+            cls.tracked_submissions.pop(submission_id, None)
+
+    @classmethod
+    def __unblock_jobs(cls, job: Job) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
-                if not cls._is_blocked(job):
-                    cls.__logger.debug(f"Unblocking job: {job.id}.")
-                    job.pending()
-                    cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
-                    cls.__remove_blocked_job(job)
-                    cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
-                    cls.jobs_to_run.put(job)
+            cls.__sync_readiness_graph()
+            cls.__release_jobs_waiting_for(cls.__get_output_ids([job]))
+
+    @classmethod
+    def __release_jobs_waiting_for(cls, data_node_ids: Iterable[str]) -> None:
+        """Unblock the jobs for which the given data nodes were the last inputs not ready for reading."""
+        data_manager = _DataManagerFactory._build_manager()
+        unblocked = False
+        for data_node_id in data_node_ids:
+            if not cls.readiness_graph._jobs_waiting_for(data_node_id):
+                continue
+            data_node = data_manager._get(data_node_id)
+            if data_node is None or not data_node.is_ready_for_reading:
+                continue
+            for job in cls.readiness_graph._resolve(data_node_id):
+                cls.__unblock_job(job)
+                unblocked = True
+        if unblocked:
+            cls._notify_dispatcher()
+
+    @classmethod
+    def __unblock_job(cls, job: Job) -> None:
+        cls.__logger.debug(f"Unblocking job: {job.id}.")
+        job.pending()
+        cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
+        cls.__remove_blocked_job(job)
+        cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
+        cls.jobs_to_run.put(job)
+
+    @staticmethod
+    def __get_output_ids(jobs: Iterable[Job]) -> Set[str]:
+        return {dn.id for job in jobs for dn in job.task.output.values()}
 
     @classmethod
     def __remove_blocked_job(cls, job: Job) -> None:
+        cls.readiness_graph._remove(job.id)
         try:  # In case the job has been removed from the list of blocked_jobs.
             cls.blocked_jobs.remove(job)
         except Exception:
@@ -281,26 +406,27 @@ class _Orchestrator(_AbstractOrchestrator):
         else:
             with cls.lock:
                 cls.__logger.debug(f"Acquiring lock to cancel job {job.id}.")
+                cls.__sync_readiness_graph()
                 to_cancel_or_abandon_jobs = {job}
-                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
+                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, cls.__get_output_ids([job])))
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
                 cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
 
     @classmethod
-    def __find_subsequent_jobs(cls, submit_id, output_dn_config_ids: Set) -> Set[Job]:
-        next_output_dn_config_ids = set()
-        subsequent_jobs = set()
-        for job in cls.blocked_jobs:
-            job_input_dn_config_ids = job.task.input.keys()
-            if job.submit_id == submit_id and len(output_dn_config_ids.intersection(job_input_dn_config_ids)) > 0:
-                next_output_dn_config_ids.update(job.task.output.keys())
-                subsequent_jobs.update([job])
-        if next_output_dn_config_ids:
-            subsequent_jobs.update(
-                cls.__find_subsequent_jobs(submit_id, output_dn_config_ids=next_output_dn_config_ids)
-            )
+    def __find_subsequent_jobs(cls, submit_id, output_dn_ids: Set[str]) -> Set[Job]:
+        subsequent_jobs: Set[Job] = set()
+        dn_ids_to_visit = list(output_dn_ids)
+        visited_dn_ids = set(output_dn_ids)
+        while dn_ids_to_visit:
+            for job in cls.readiness_graph._jobs_waiting_for(dn_ids_to_visit.pop()):
+                if job.submit_id != submit_id or job in subsequent_jobs:
+                    continue
+                subsequent_jobs.add(job)
+                for dn_id in cls.__get_output_ids([job]) - visited_dn_ids:
+                    visited_dn_ids.add(dn_id)
+                    dn_ids_to_visit.append(dn_id)
         return subsequent_jobs
 
     @classmethod
@@ -321,9 +447,10 @@ class _Orchestrator(_AbstractOrchestrator):
     def _fail_subsequent_jobs(cls, failed_job: Job) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to fail subsequent jobs.")
+            cls.__sync_readiness_graph()
             to_fail_or_abandon_jobs = set()
             to_fail_or_abandon_jobs.update(
-                cls.__find_subsequent_jobs(failed_job.submit_id, set(failed_job.task.output.keys()))
+                cls.__find_subsequent_jobs(failed_job.submit_id, cls.__get_output_ids([failed_job]))
             )
             for job in to_fail_or_abandon_jobs:
                 job.abandoned()
@@ -0,0 +1,95 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Dict, Iterable, List, Set
+
+from ..job.job import Job
+
+
+class _ReadinessGraph:
+    """
+    In-memory index of the blocked jobs by the input data nodes they are waiting for.
+
+    Each job keeps the set of its unresolved input data node ids, which acts as a dependency counter.
+    When a data node becomes ready for reading, only the jobs waiting for it are updated, and the jobs
+    with no unresolved input left are returned to be run.
+
+    The graph also keeps the unfinished jobs producing each data node, since a data node unlocked by
+    one job may still be written by another one.
+    """
+
+    def __init__(self):
+        self._unresolved: Dict[str, Set[str]] = {}
+        self._waiting_jobs: Dict[str, Dict[str, Job]] = {}
+        self._producers: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._unresolved)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._unresolved
+
+    def _add(self, job: Job, unresolved_data_node_ids: Iterable[str]):
+        """Index a blocked job by the ids of the input data nodes that are not ready for reading."""
+        self._remove(job.id)
+        data_node_ids = set(unresolved_data_node_ids)
+        self._unresolved[job.id] = data_node_ids
+        for data_node_id in data_node_ids:
+            self._waiting_jobs.setdefault(data_node_id, {})[job.id] = job
+
+    def _remove(self, job_id: str):
+        for data_node_id in self._unresolved.pop(job_id, ()):
+            if waiting_jobs := self._waiting_jobs.get(data_node_id):
+                waiting_jobs.pop(job_id, None)
+                if not waiting_jobs:
+                    del self._waiting_jobs[data_node_id]
+
+    def _add_producer(self, job: Job, output_ids: Iterable[str]):
+        """Index an unfinished job by the ids of the data nodes it writes."""
+        for data_node_id in output_ids:
+            self._producers.setdefault(data_node_id, set()).add(job.id)
+
+    def _remove_producer(self, job: Job, output_ids: Iterable[str]):
+        for data_node_id in output_ids:
+            if producers := self._producers.get(data_node_id):
+                producers.discard(job.id)
+                if not producers:
+                    del self._producers[data_node_id]
+
+    def _is_produced(self, data_node_id: str) -> bool:
+        """Return True if an unfinished job writes the data node."""
+        return data_node_id in self._producers
+
+    def _job_ids(self) -> List[str]:
+        return list(self._unresolved)
+
+    def _jobs_waiting_for(self, data_node_id: str) -> List[Job]:
+        return list(self._waiting_jobs.get(data_node_id, {}).values())
+
+    def _resolve(self, data_node_id: str) -> List[Job]:
+        """Mark a data node as ready for reading.
+
+        Returns:
+            The jobs that are no longer waiting for any data node. They are removed from the graph.
+        """
+        ready_jobs = []
+        for job_id, job in self._waiting_jobs.pop(data_node_id, {}).items():
+            unresolved = self._unresolved[job_id]
+            unresolved.discard(data_node_id)
+            if not unresolved:
+                del self._unresolved[job_id]
+                ready_jobs.append(job)
+        return ready_jobs
+
+    def _clear(self):
+        """Forget the blocked jobs. The producers are kept, as they do not depend on the blocked jobs."""
+        self._unresolved.clear()
+        self._waiting_jobs.clear()
@@ -12,9 +12,9 @@
 import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar, Union
 
-from ..exceptions import FileCannotBeRead
+from ..exceptions import FileCannotBeRead, ModelNotFound
 from ._decoder import _Decoder
 
 ModelType = TypeVar("ModelType")
@@ -32,6 +32,18 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository.
+
+        Repositories should override this method to save all the entities in a single operation.
+
+        Parameters:
+            entities: The entities to save.
+        """
+        for entity in entities:
+            self._save(entity)
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -56,6 +68,41 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_many(self, ids: Iterable[str]) -> List[Entity]:
+        """
+        Retrieve several entities from the repository.
+
+        Parameters:
+            ids: The entity ids.
+
+        Returns:
+            The list of the entities found, in the order of the ids. Missing entities are skipped.
+        """
+        entities = []
+        for entity_id in ids:
+            try:
+                entities.append(self._load(entity_id))
+            except ModelNotFound:
+                continue
+        return entities
+
+    def _get_revision(self, entity_id: str, reliable: bool = True) -> Optional[Hashable]:
+        """
+        Retrieve a token identifying the current saved state of an entity.
+
+        The token changes every time the entity is saved, so it can be used to validate an entity
+        loaded earlier without loading it again.
+
+        Parameters:
+            entity_id: The entity id, i.e., its primary key.
+            reliable: If False, the token of a state saved too recently to be reliable is returned
+                as well. Such a token can only be compared with a reliable token retrieved later.
+
+        Returns:
+            The revision token, or None if the repository cannot provide a reliable one.
+        """
+        return None
+
     @abstractmethod
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         """
@@ -66,6 +113,46 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Entity]:
+        """
+        Retrieve a page of the entities matching the filters, in the order of their ids.
+
+        Parameters:
+            filters: The filters the entities must match.
+            limit: The maximum number of entities to retrieve. All the remaining entities are
+                retrieved if None.
+            offset: The number of matching entities to skip.
+            after: If not None, only the entities with an id greater than *after* are retrieved.
+
+        Returns:
+            The list of the entities of the page.
+        """
+        entities = sorted(self._load_all(filters), key=lambda entity: entity.id)  # type: ignore[attr-defined]
+        if after is not None:
+            entities = [entity for entity in entities if entity.id > after]  # type: ignore[attr-defined]
+        return entities[offset : None if limit is None else offset + limit]
+
+    def _load_latest(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        """
+        Retrieve the latest created entity whose model attribute is equal to the value.
+
+        Parameters:
+            attribute: The model attribute that is the key to the search.
+            value: The value of the attribute.
+            filters: The filters the entity must match.
+
+        Returns:
+            The entity with the greatest creation date, or None if no entity matches.
+        """
+        filters = [{**_filter, attribute: value} for _filter in (filters or [{}])]
+        return max(self._load_all(filters), default=None)  # type: ignore[type-var]
+
     @abstractmethod
     def _delete(self, entity_id: str):
         """
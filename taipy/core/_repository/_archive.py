@@ -0,0 +1,117 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gzip
+import json
+import pathlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+
+
+class _Archive:
+    """Read-only archive of the models removed from a repository.
+
+    The archived models are stored as compressed JSON lines, in one file per month of creation
+    (`<taipy_storage_folder>/archive/<name>/<YYYY-MM>.jsonl.gz`), whatever the repository type.
+    Archiving appends a new compressed member to the files, so the existing content is never
+    rewritten. A model archived twice (if the archiving was interrupted before the model was
+    removed from the repository) is only loaded once.
+
+    Attributes:
+        name (str): The name of the archive, which is the folder name of the repository.
+    """
+
+    _FOLDER_NAME = "archive"
+    _FILE_SUFFIX = ".jsonl.gz"
+    _UNKNOWN_MONTH = "unknown"
+
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(self, name: str, storage_folder: Optional[str] = None):
+        self.name = name
+        self._storage_folder = storage_folder
+
+    @property
+    def dir_path(self) -> pathlib.Path:
+        storage_folder = self._storage_folder or Config.core.taipy_storage_folder
+        return pathlib.Path(storage_folder) / self._FOLDER_NAME / self.name
+
+    def _append(self, models: Iterable[Dict[str, Any]]) -> int:
+        """Append the models, given as dictionaries, to the files of their creation month.
+
+        Returns:
+            The number of models archived.
+        """
+        lines: Dict[str, List[str]] = defaultdict(list)
+        for data in models:
+            lines[self.__month(data)].append(
+                json.dumps(data, ensure_ascii=False, cls=_Encoder, check_circular=False) + "\n"
+            )
+        if not lines:
+            return 0
+        self.dir_path.mkdir(parents=True, exist_ok=True)
+        for month, month_lines in lines.items():
+            with gzip.open(self.dir_path / f"{month}{self._FILE_SUFFIX}", "at", encoding="UTF-8") as f:
+                f.write("".join(month_lines))
+        return sum(len(month_lines) for month_lines in lines.values())
+
+    def _months(self) -> List[str]:
+        """Return the months for which models were archived, in chronological order."""
+        if not self.dir_path.is_dir():
+            return []
+        return sorted(path.name[: -len(self._FILE_SUFFIX)] for path in self.dir_path.glob(f"*{self._FILE_SUFFIX}"))
+
+    def _load_all(
+        self, filters: Optional[List[Dict]] = None, months: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Load the archived models matching at least one of the filters.
+
+        Parameters:
+            filters: The filters the models must match. A filter matches a model if all its keys
+                are equal to the ones of the model.
+            months: If not None, only the models archived for these months ("YYYY-MM") are loaded.
+        """
+        models: Dict[str, Dict[str, Any]] = {}
+        for month in self._months() if months is None else months:
+            path = self.dir_path / f"{month}{self._FILE_SUFFIX}"
+            if not path.exists():
+                continue
+            with gzip.open(path, "rt", encoding="UTF-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line, cls=_Decoder)
+                    except ValueError:
+                        self.__logger.warning(f"Skipping corrupted record in archive {path}.")
+                        continue
+                    if self.__match(data, filters):
+                        models[data["id"]] = data
+        return list(models.values())
+
+    @classmethod
+    def __month(cls, data: Dict[str, Any]) -> str:
+        creation_date = data.get("creation_date")
+        if isinstance(creation_date, str) and len(creation_date) >= 7:
+            return creation_date[:7]
+        return cls._UNKNOWN_MONTH
+
+    @staticmethod
+    def __match(data: Dict[str, Any], filters: Optional[List[Dict]]) -> bool:
+        if not filters:
+            return True
+        return any(all(data.get(key) == value for key, value in _filter.items()) for _filter in filters)
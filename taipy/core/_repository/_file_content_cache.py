@@ -0,0 +1,86 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class _FileContentCache:
+    """
+    Bounded LRU cache of entity file contents, validated against the status of the files.
+
+    An entry is only served if the file still has the same modification time, size and inode as when
+    it was cached. Files modified less than `_RACY_WINDOW_NS` ago are never served from the cache since
+    another write could happen within the resolution of the file system timestamps. Writers in other
+    processes, such as standalone workers, are therefore always observed.
+
+    The cache stores the raw file content, so every read still builds new entities and no instance is
+    ever shared between callers.
+
+    Attributes:
+        max_size (int): The maximum number of cached files. The cache is disabled if it is 0.
+    """
+
+    _RACY_WINDOW_NS = 1_000_000_000
+
+    def __init__(self, max_size: int):
+        self.max_size = max(int(max_size), 0)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @classmethod
+    def _stable_signature(cls, stat: os.stat_result) -> Optional[Tuple[int, int, int]]:
+        """Return the signature of a file, or None if it was modified too recently to be trusted."""
+        if time.time_ns() - stat.st_mtime_ns > cls._RACY_WINDOW_NS:
+            return cls._signature(stat)
+        return None
+
+    def _get(self, filepath: pathlib.Path, stat: os.stat_result) -> Optional[str]:
+        if not self.max_size:
+            return None
+        with self._lock:
+            entry = self._entries.get(filepath)
+            if entry is not None and entry[0] == self._stable_signature(stat):
+                self._entries.move_to_end(filepath)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def _put(self, filepath: pathlib.Path, content: str, stat: os.stat_result):
+        if not self.max_size:
+            return
+        with self._lock:
+            self._entries[filepath] = (self._signature(stat), content)
+            self._entries.move_to_end(filepath)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _pop(self, filepath: pathlib.Path):
+        with self._lock:
+            self._entries.pop(filepath, None)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
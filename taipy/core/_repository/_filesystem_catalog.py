@@ -0,0 +1,352 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import pathlib
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ._decoder import _Decoder
+
+_MISSING = "__taipy_missing__"
+
+
+class _FileSystemCatalog:
+    """
+    Sidecar index of the entity files stored by a `_FileSystemRepository`.
+
+    The catalog is an append-only JSON-lines journal written in the repository folder. Each record
+    stores the id of an entity together with the values of its indexed attributes, or marks the
+    entity as deleted. Every process sharing the storage folder appends its own records and reads
+    the records written by others incrementally, so queries only stat the journal instead of listing
+    and reading the whole folder.
+
+    The catalog only narrows down the files to read: the repository still checks the content of
+    each candidate file. A folder written without a catalog (by an older version of Taipy) is
+    indexed the first time it is accessed.
+
+    For each value of the *latest_attributes*, the catalog also keeps the id of the most recently
+    created entity, per version.
+
+    Attributes:
+        dir_path (pathlib.Path): The repository folder indexed by the catalog.
+        attributes (Tuple[str]): The model attributes being indexed.
+        latest_attributes (Tuple[str]): The indexed attributes for which the latest entity is tracked.
+    """
+
+    _FILE_NAME = ".catalog.jsonl"
+    _SET = "s"
+    _DEL = "d"
+
+    __logger = _TaipyLogger._get_logger()
+
+    def __init__(self, dir_path: pathlib.Path, attributes: Iterable[str], latest_attributes: Iterable[str] = ()):
+        self.dir_path = dir_path
+        self.attributes = tuple(attributes)
+        self.latest_attributes = tuple(attribute for attribute in latest_attributes if attribute in self.attributes)
+        self._lock = threading.RLock()
+        self.__reset()
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.dir_path / self._FILE_NAME
+
+    def _put(self, model_id: str, data: Dict[str, Any]):
+        """Index the entity saved under `model_id`. Nothing is written if the indexed values did not change."""
+        self._put_many({model_id: data})
+
+    def _put_many(self, models: Dict[str, Dict[str, Any]]):
+        """Index several entities, given by id, appending all the changed records in a single write."""
+        with self._lock:
+            self._refresh()
+            records = []
+            for model_id, data in models.items():
+                entry = self.__extract_entry(data)
+                if self._entries.get(model_id) != entry:
+                    records.append([self._SET, model_id, entry])
+            if not records:
+                return
+            self.__append(records)
+            for _, model_id, entry in records:
+                self.__apply_set(model_id, entry)
+
+    def _remove(self, model_id: str):
+        self._remove_many([model_id])
+
+    def _remove_many(self, model_ids: Iterable[str]):
+        with self._lock:
+            self._refresh()
+            records = [[self._DEL, model_id] for model_id in dict.fromkeys(model_ids) if model_id in self._entries]
+            if not records:
+                return
+            self.__append(records)
+            for _, model_id in records:
+                self.__apply_delete(model_id)
+
+    def _clear(self):
+        with self._lock:
+            self.__reset()
+
+    def _get(self, model_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            return self._entries.get(model_id)
+
+    def _search(self, filters: Optional[List[Dict]] = None) -> List[str]:
+        """Return the ids of the entities that may match at least one of the filters.
+
+        A filter key that is not indexed does not narrow down the result.
+        """
+        with self._lock:
+            self._refresh()
+            if not filters:
+                return list(self._entries)
+
+            candidates: Set[str] = set()
+            for _filter in filters:
+                ids = self.__match(_filter)
+                if ids is None:
+                    return list(self._entries)
+                candidates.update(ids)
+            return [model_id for model_id in self._entries if model_id in candidates]
+
+    def _get_latest(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Optional[List[str]]:
+        """Return the ids of the latest entities created with `attribute` set to `value`, one per filter.
+
+        Only filters on the version are supported. None is returned when the catalog cannot tell: the
+        filters are not supported, or some entities were indexed without the attribute.
+        """
+        with self._lock:
+            self._refresh()
+            if attribute not in self.latest_attributes or self._index[attribute].get(_MISSING):
+                return None
+            versions: List[Optional[str]] = []
+            for _filter in filters or [{}]:
+                if any(key != "version" for key in _filter):
+                    return None
+                versions.append(_filter.get("version"))
+            model_ids = []
+            for version in dict.fromkeys(versions):
+                if (latest := self._latest.get((attribute, value, version))) and latest[1] not in model_ids:
+                    model_ids.append(latest[1])
+            return model_ids
+
+    def _get_unindexed(self, attribute: str) -> List[str]:
+        """Return the ids of the entities indexed without `attribute`."""
+        with self._lock:
+            self._refresh()
+            return list(self._index[attribute].get(_MISSING, ()))
+
+    def _refresh(self):
+        """Synchronize the in-memory catalog with the journal, reading only the records appended since last time."""
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                self.__reset()
+                if self.dir_path.is_dir():
+                    self._rebuild()
+                return
+
+            file_id = (stat.st_dev, stat.st_ino)
+            if file_id != self._file_id or stat.st_size < self._offset:
+                self.__reset()
+                self._file_id = file_id
+            if stat.st_size > self._offset:
+                try:
+                    self.__read_from_offset()
+                except FileNotFoundError:
+                    self.__reset()
+
+    def _rebuild(self) -> int:
+        """Re-index every entity file of the repository folder and atomically replace the journal.
+
+        Returns:
+            The number of indexed entities.
+        """
+        with self._lock:
+            self.__reset()
+            if not self.dir_path.is_dir():
+                return 0
+
+            lines = []
+            for filepath in self.dir_path.iterdir():
+                if filepath.suffix != ".json":
+                    continue
+                try:
+                    data = json.loads(filepath.read_text(encoding="UTF-8"), cls=_Decoder)
+                except Exception:
+                    self.__logger.warning(f"Entity file {filepath} could not be indexed.")
+                    continue
+                model_id = data.get("id", filepath.stem) if isinstance(data, dict) else filepath.stem
+                entry = self.__extract_entry(data if isinstance(data, dict) else {})
+                lines.append(self.__dumps([self._SET, model_id, entry]))
+                self.__apply_set(model_id, entry)
+
+            tmp_path = self.dir_path / f"{self._FILE_NAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                tmp_path.write_text("".join(lines), encoding="UTF-8")
+                os.replace(tmp_path, self.path)
+                stat = self.path.stat()
+            except FileNotFoundError:
+                # The repository folder was deleted meanwhile.
+                self.__reset()
+                return 0
+            self._file_id = (stat.st_dev, stat.st_ino)
+            self._offset = stat.st_size
+            return len(self._entries)
+
+    def __reset(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._index: Dict[str, Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        # key = (attribute, value, version or None for all versions), value = (creation date, id) of the latest entity
+        self._latest: Dict[Tuple[str, Any, Optional[str]], Tuple[str, str]] = {}
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._offset = 0
+
+    def __extract_entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {}
+        for attribute in self.attributes:
+            if attribute not in data:
+                continue
+            value = data[attribute]
+            if isinstance(value, (list, tuple, set)):
+                value = sorted(str(v) for v in value)
+            elif value is not None and not isinstance(value, str):
+                value = str(value)
+            entry[attribute] = value
+        return entry
+
+    def __match(self, _filter: Dict) -> Optional[Set[str]]:
+        result: Optional[Set[str]] = None
+        for key, value in _filter.items():
+            if key not in self.attributes or not (value is None or isinstance(value, str)):
+                continue
+            buckets = self._index[key]
+            ids = buckets.get(value, set()) | buckets.get(_MISSING, set())
+            result = ids if result is None else result & ids
+        return result
+
+    def __apply_set(self, model_id: str, entry: Dict[str, Any]):
+        if model_id in self._entries:
+            self.__apply_delete(model_id)
+        self._entries[model_id] = entry
+        for attribute in self.attributes:
+            for value in self.__index_values(entry.get(attribute, _MISSING)):
+                self._index[attribute][value].add(model_id)
+        for key in self.__latest_keys(entry):
+            latest = self._latest.get(key)
+            if latest is None or (entry.get("creation_date") or "") > latest[0]:
+                self._latest[key] = (entry.get("creation_date") or "", model_id)
+
+    def __apply_delete(self, model_id: str):
+        entry = self._entries.pop(model_id, None)
+        if entry is None:
+            return
+        for attribute in self.attributes:
+            for value in self.__index_values(entry.get(attribute, _MISSING)):
+                bucket = self._index[attribute].get(value)
+                if bucket is not None:
+                    bucket.discard(model_id)
+                    if not bucket:
+                        del self._index[attribute][value]
+        for key in self.__latest_keys(entry):
+            if (latest := self._latest.get(key)) is not None and latest[1] == model_id:
+                self.__update_latest(key)
+
+    def __latest_keys(self, entry: Dict[str, Any]) -> List[Tuple[str, Any, Optional[str]]]:
+        keys = []
+        for attribute in self.latest_attributes:
+            if isinstance(value := entry.get(attribute), str):
+                keys.append((attribute, value, None))
+                if (version := entry.get("version")) is not None:
+                    keys.append((attribute, value, version))
+        return keys
+
+    def __update_latest(self, key: Tuple[str, Any, Optional[str]]):
+        attribute, value, version = key
+        model_ids = self._index[attribute].get(value, set())
+        if version is not None:
+            model_ids = model_ids & self._index["version"].get(version, set())
+        latest = max(
+            ((self._entries[model_id].get("creation_date") or "", model_id) for model_id in model_ids), default=None
+        )
+        if latest is None:
+            self._latest.pop(key, None)
+        else:
+            self._latest[key] = latest
+
+    @staticmethod
+    def __index_values(value) -> Iterable:
+        return value if isinstance(value, list) else (value,)
+
+    def __read_from_offset(self):
+        with self.path.open("rb") as f:
+            f.seek(self._offset)
+            content = f.read()
+
+        # A record being written by another process may not be complete yet.
+        end = content.rfind(b"\n") + 1
+        for line in content[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                self.__logger.warning(f"Skipping corrupted record in catalog {self.path}.")
+                continue
+            if record[0] == self._SET:
+                self.__apply_set(record[1], record[2])
+            elif record[0] == self._DEL:
+                self.__apply_delete(record[1])
+        self._offset += end
+
+    def __append(self, records: List[List]):
+        self.dir_path.mkdir(parents=True, exist_ok=True)
+        # A single write on a file opened in append mode keeps records from concurrent processes whole.
+        with self.path.open("a", encoding="UTF-8") as f:
+            f.write("".join(self.__dumps(record) for record in records))
+
+    @staticmethod
+    def __dumps(record: List) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _rebuild_catalogs(path: str) -> Dict[str, int]:
+    """Rebuild the catalogs of every repository folder found in the Taipy storage folder `path`.
+
+    Returns:
+        The number of indexed entities by repository folder.
+    """
+    from ._filesystem_repository import _FileSystemRepository
+
+    result = {}
+    root = pathlib.Path(path)
+    if not root.is_dir():
+        return result
+    for dir_path in sorted(p for p in root.iterdir() if p.is_dir()):
+        result[dir_path.name] = _FileSystemCatalog(
+            dir_path, _FileSystemRepository._CATALOG_ATTRIBUTES, _FileSystemRepository._CATALOG_LATEST_ATTRIBUTES
+        )._rebuild()
+    return result
+
+
+def _remove_catalogs(path: str):
+    """Remove the catalogs of every repository folder found in `path`. They are rebuilt on the next access."""
+    root = pathlib.Path(path)
+    if not root.is_dir():
+        return
+    for catalog_path in root.glob(f"*/{_FileSystemCatalog._FILE_NAME}"):
+        catalog_path.unlink(missing_ok=True)
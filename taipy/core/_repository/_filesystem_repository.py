@@ -9,11 +9,13 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import bisect
 import copy
 import json
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+import stat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from taipy.common.config import Config
 
@@ -23,6 +25,8 @@ from ..exceptions import FileCannotBeRead, FileEmpty, ModelNotFound
 from ._abstract_repository import _AbstractRepository
 from ._decoder import _Decoder
 from ._encoder import _Encoder
+from ._file_content_cache import _FileContentCache
+from ._filesystem_catalog import _FileSystemCatalog
 
 
 class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
@@ -37,19 +41,53 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         model_type (ModelType): Generic dataclass.
         converter: A class that handles conversion to and from a database backend
         dir_name (str): Folder that will hold the files for this dataclass model.
+
+    The entity files are indexed by a `_FileSystemCatalog` stored in the same folder, so that queries
+    only read the files of the entities that may match. The content of the files read is kept in a
+    `_FileContentCache` whose size is set by the *cache_size* repository property (0 disables it).
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    _CATALOG_ATTRIBUTES = (
+        "config_id",
+        "owner_id",
+        "version",
+        "parent_ids",
+        "creation_date",
+        "cycle",
+        "task_id",
+        "entity_id",
+    )
+    _CATALOG_LATEST_ATTRIBUTES = ("task_id", "entity_id")
+    _CACHE_SIZE_KEY = "cache_size"
+    _DEFAULT_CACHE_SIZE = 1024
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
         self.converter = converter
         self._dir_name = dir_name
+        self.__catalog: Optional[_FileSystemCatalog] = None
+        self.__cache: Optional[_FileContentCache] = None
 
     @property
     def dir_path(self):
         return self._storage_folder / self._dir_name
 
+    @property
+    def _catalog(self) -> _FileSystemCatalog:
+        dir_path = self.dir_path
+        if self.__catalog is None or self.__catalog.dir_path != dir_path:
+            self.__catalog = _FileSystemCatalog(dir_path, self._CATALOG_ATTRIBUTES, self._CATALOG_LATEST_ATTRIBUTES)
+            self.__cache = None
+        return self.__catalog
+
+    @property
+    def _cache(self) -> _FileContentCache:
+        if self.__cache is None:
+            cache_size = Config.core.repository_properties.get(self._CACHE_SIZE_KEY, self._DEFAULT_CACHE_SIZE)
+            self.__cache = _FileContentCache(int(cache_size))
+        return self.__cache
+
     @property
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.taipy_storage_folder)
@@ -59,16 +97,41 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     ###############################
 
     def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        models = {}
+        for entity in entities:
+            model = self.converter._entity_to_model(entity)  # type: ignore
+            models[model.id] = model.to_dict()
+        if not models:
+            return
+
         self.__create_directory_if_not_exists()
-        model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
+        # Index the entities first so that an interrupted save never leaves an entity file out of the catalog.
+        self._catalog._put_many(models)
+        for model_id, data in models.items():
+            path = self.__get_path(model_id)
+            # The file status is the only way to validate the cached content against other processes, so the entry
+            # is invalidated rather than updated. It is cached again on the next read.
+            self._cache._pop(path)
+            path.write_text(
+                json.dumps(data, ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
+                encoding="UTF-8",
+            )
 
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
 
+    def _get_revision(self, entity_id: str, reliable: bool = True) -> Optional[Tuple[int, int, int]]:
+        try:
+            file_stat = self.__get_path(entity_id).stat()
+        except OSError:
+            return None
+        if reliable:
+            return _FileContentCache._stable_signature(file_stat)
+        return _FileContentCache._signature(file_stat)
+
     def _load(self, entity_id: str) -> Entity:
         path = pathlib.Path(self.__get_path(entity_id))
 
@@ -81,42 +144,93 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         entities = []
-        try:
-            for f in self.dir_path.iterdir():
-                if data := self.__filter_by(f, filters):
-                    entities.append(self.__file_content_to_entity(data))
-        except FileNotFoundError:
-            pass
+        for f in self.__candidate_files(filters):
+            if data := self.__filter_by(f, filters):
+                entities.append(self.__file_content_to_entity(data))
+        return entities
+
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Entity]:
+        # The ids come from the catalog, so only the files of the entities skipped or returned are read.
+        model_ids = sorted(self._catalog._search(filters))
+        if after is not None:
+            model_ids = model_ids[bisect.bisect_right(model_ids, after) :]
+        entities: List[Entity] = []
+        for model_id in model_ids:
+            if limit is not None and len(entities) >= limit:
+                break
+            if data := self.__filter_by(self.__get_path(model_id), filters):
+                if offset > 0:
+                    offset -= 1
+                    continue
+                entities.append(self.__file_content_to_entity(data))
         return entities
 
     def _delete(self, entity_id: str):
+        path = self.__get_path(entity_id)
         try:
-            self.__get_path(entity_id).unlink()
+            path.unlink()
         except FileNotFoundError:
             raise ModelNotFound(str(self.dir_path), entity_id) from None
+        finally:
+            self._catalog._remove(entity_id)
+            self._cache._pop(path)
 
     def _delete_all(self):
         shutil.rmtree(self.dir_path, ignore_errors=True)
+        self._catalog._clear()
+        self._cache._clear()
 
     def _delete_many(self, ids: Iterable[str]):
+        ids = list(ids)
+        missing_ids = []
         for model_id in ids:
-            self._delete(model_id)
+            path = self.__get_path(model_id)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                missing_ids.append(model_id)
+            self._cache._pop(path)
+        self._catalog._remove_many(ids)
+        if missing_ids:
+            raise ModelNotFound(str(self.dir_path), missing_ids[0])
 
     def _delete_by(self, attribute: str, value: str):
         filters: List[Dict] = [{}]
         for fil in filters:
             fil.update({attribute: value})
 
-        try:
-            for f in self.dir_path.iterdir():
-                if self.__filter_by(f, filters):
-                    f.unlink()
-        except FileNotFoundError:
-            pass
+        deleted_ids = []
+        for f in self.__candidate_files(filters):
+            if self.__filter_by(f, filters):
+                f.unlink(missing_ok=True)
+                self._cache._pop(f)
+                deleted_ids.append(f.stem)
+        self._catalog._remove_many(deleted_ids)
 
     def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
         return list(self.__search(attribute, value, filters))
 
+    def _load_latest(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        if attribute in self._CATALOG_LATEST_ATTRIBUTES:
+            self.__index_unindexed(attribute)
+        model_ids = self._catalog._get_latest(attribute, value, filters)
+        if model_ids is None:
+            return super()._load_latest(attribute, value, filters)
+        entities = []
+        for model_id in model_ids:
+            data = self.__filter_by(self.__get_path(model_id), filters)
+            if not data or data.get(attribute) != value:
+                # The entity file was changed or removed by another process: the catalog is not reliable.
+                return super()._load_latest(attribute, value, filters)
+            entities.append(self.__file_content_to_entity(data))
+        return max(entities, default=None)
+
     def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
         if isinstance(folder_path, str):
             folder: pathlib.Path = pathlib.Path(folder_path)
@@ -140,24 +254,16 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         if not filters:
             filters = [{}]
         res = {}
-        configs_and_owner_ids = set(configs_and_owner_ids)
 
-        try:
-            for f in self.dir_path.iterdir():
-                config_id, owner_id, entity = self.__match_file_and_get_entity(
-                    f, configs_and_owner_ids, copy.deepcopy(filters)
-                )
-
-                if entity:
-                    key = config_id, owner_id
-                    res[key] = entity
-                    configs_and_owner_ids.remove(key)
-
-                    if len(configs_and_owner_ids) == 0:
-                        return res
-        except FileNotFoundError:
-            # Folder with data was not created yet.
-            return {}
+        for config, owner_id in set(configs_and_owner_ids):
+            key_filters = copy.deepcopy(filters)
+            for fil in key_filters:
+                fil.update({"config_id": config.id, "owner_id": owner_id})
+
+            for f in self.__candidate_files(key_filters):
+                if data := self.__filter_by(f, key_filters):
+                    res[config, owner_id] = self.__file_content_to_entity(data)
+                    break
 
         return res
 
@@ -178,33 +284,37 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def __filter_files_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ):
-        try:
-            files = filter(lambda f: config_id in f.name, self.dir_path.iterdir())
-            entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
-            corresponding_entities = filter(
-                lambda e: e is not None and e.config_id == config_id and e.owner_id == owner_id,  # type: ignore
-                entities,
-            )
-            return next(corresponding_entities, None)  # type: ignore
-        except FileNotFoundError:
-            pass
-        return None
-
-    def __match_file_and_get_entity(self, filepath, config_and_owner_ids, filters):
-        if match := [(c, p) for c, p in config_and_owner_ids if c.id in filepath.name]:
-            for config, owner_id in match:
-                for fil in filters:
-                    fil.update({"config_id": config.id, "owner_id": owner_id})
-
-                if data := self.__filter_by(filepath, filters):
-                    return config, owner_id, self.__file_content_to_entity(data)
-
-        return None, None, None
+        filters = [{}] if not filters else copy.deepcopy(filters)
+        for fil in filters:
+            fil.update({"config_id": config_id})
+        files = self.__candidate_files(filters)
+        entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
+        corresponding_entities = filter(
+            lambda e: e is not None and e.config_id == config_id and e.owner_id == owner_id,  # type: ignore
+            entities,
+        )
+        return next(corresponding_entities, None)  # type: ignore
+
+    def __candidate_files(self, filters: Optional[List[Dict]] = None) -> Iterator[pathlib.Path]:
+        return (self.__get_path(model_id) for model_id in self._catalog._search(filters))
+
+    def __index_unindexed(self, attribute: str):
+        # Entities indexed by an older version of Taipy do not have the attribute in the catalog.
+        models = {}
+        for model_id in self._catalog._get_unindexed(attribute):
+            try:
+                models[model_id] = json.loads(self.__read_file(self.__get_path(model_id)), cls=_Decoder)
+            except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+                continue
+        if models:
+            self._catalog._put_many(models)
 
     def __create_directory_if_not_exists(self):
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
     def __search(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Iterator[Entity]:
+        if isinstance(value, str) and attribute in self._CATALOG_ATTRIBUTES:
+            filters = [{**fil, attribute: value} for fil in (filters or [{}])]
         return filter(lambda e: getattr(e, attribute, None) == value, self._load_all(filters))
 
     def __get_path(self, model_id) -> pathlib.Path:
@@ -237,14 +347,23 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
     @_retry_repository_operation(__EXCEPTIONS_TO_RETRY)
     def __read_file(self, filepath: pathlib.Path) -> str:
-        if not filepath.is_file():
+        try:
+            file_stat = filepath.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            self._cache._pop(filepath)
             raise FileNotFoundError
 
+        if (file_content := self._cache._get(filepath, file_stat)) is not None:
+            return file_content
+
         try:
             with filepath.open("r", encoding="UTF-8") as f:
                 file_content = f.read()
             if not file_content:
                 raise FileEmpty(str(filepath))
-            return file_content
         except Exception:
             raise FileCannotBeRead(str(filepath)) from None
+        self._cache._put(filepath, file_content, file_stat)
+        return file_content
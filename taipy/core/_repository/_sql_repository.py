@@ -0,0 +1,347 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import pathlib
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from taipy.common.config import Config
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+
+
+class _SQLRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to store dataclasses as JSON documents in an embedded SQLite database.
+
+    Each repository owns a table holding one row per entity. The row stores the JSON document of the
+    model, as the filesystem repository does, together with indexed columns for the attributes used
+    to query entities. Parent ids are indexed in a separate table. The latest entity created for a
+    value of one of the *_LATEST_COLUMNS* is found through an index on the column and the creation
+    date. Indexed columns added to an existing table are filled in from the stored documents.
+
+    The database is opened in WAL mode, so that the worker processes of the standalone dispatcher can
+    write concurrently with the main process. Connections are not shared between threads.
+
+    The database file is set by the *db_location* repository property. By default, it is
+    "taipy.sqlite3" in the Taipy storage folder.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend.
+        table_name (str): Table holding the entities. It is also the folder name used by the filesystem
+            repository, so entities can be exported to and migrated from the filesystem layout.
+    """
+
+    _DB_LOCATION_KEY = "db_location"
+    _DEFAULT_DB_NAME = "taipy.sqlite3"
+    _TIMEOUT = 30.0
+    _MAX_VARIABLES = 500
+    _INDEXED_COLUMNS: Tuple[str, ...] = ("config_id", "owner_id", "version", "creation_date", "cycle")
+    _LATEST_COLUMNS: Tuple[str, ...] = ()
+
+    __connections = threading.local()
+
+    def __init__(
+        self,
+        model_type: Type[ModelType],
+        converter: Type[Converter],
+        table_name: str,
+        db_location: Optional[Union[str, pathlib.Path]] = None,
+    ):
+        self.model_type = model_type
+        self.converter = converter
+        self.table_name = table_name
+        self._db_location = db_location
+
+    @property
+    def db_location(self) -> pathlib.Path:
+        if self._db_location:
+            return pathlib.Path(self._db_location)
+        if db_location := Config.core.repository_properties.get(self._DB_LOCATION_KEY):
+            return pathlib.Path(str(db_location))
+        return pathlib.Path(Config.core.taipy_storage_folder) / self._DEFAULT_DB_NAME
+
+    @property
+    def _parent_table_name(self) -> str:
+        return f"{self.table_name}_parents"
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        model = self.converter._entity_to_model(entity)  # type: ignore
+        self._save_documents([model.to_dict()])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        self._save_documents(self.converter._entity_to_model(entity).to_dict() for entity in entities)  # type: ignore
+
+    def _exists(self, entity_id: str) -> bool:
+        cursor = self._connection().execute(f"SELECT 1 FROM {self.table_name} WHERE id = ?", (entity_id,))
+        return cursor.fetchone() is not None
+
+    def _load(self, entity_id: str) -> Entity:
+        cursor = self._connection().execute(f"SELECT document FROM {self.table_name} WHERE id = ?", (entity_id,))
+        if row := cursor.fetchone():
+            return self.__document_to_entity(row[0])
+        raise ModelNotFound(self.table_name, entity_id)
+
+    def _load_many(self, ids: Iterable[str]) -> List[Entity]:
+        ids = list(ids)
+        documents: Dict[str, str] = {}
+        connection = self._connection()
+        for i in range(0, len(ids), self._MAX_VARIABLES):
+            chunk = ids[i : i + self._MAX_VARIABLES]
+            cursor = connection.execute(
+                f"SELECT id, document FROM {self.table_name} WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            documents.update(cursor.fetchall())
+        return [self.__document_to_entity(documents[entity_id]) for entity_id in ids if entity_id in documents]
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        where, params = self.__build_where(filters)
+        cursor = self._connection().execute(f"SELECT document FROM {self.table_name}{where}", params)
+        return [self.__document_to_entity(row[0]) for row in cursor]
+
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Entity]:
+        where, params = self.__build_where(filters)
+        query = f"SELECT id, document FROM {self.table_name}{where}"
+        if after is not None:
+            query = f"SELECT id, document FROM ({query}) WHERE id > ?"
+            params.append(after)
+        # A negative limit means no limit in SQLite
+        cursor = self._connection().execute(
+            f"{query} ORDER BY id LIMIT ? OFFSET ?", [*params, -1 if limit is None else limit, offset]
+        )
+        return [self.__document_to_entity(row[1]) for row in cursor]
+
+    def _delete(self, entity_id: str):
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (entity_id,))
+            connection.execute(f"DELETE FROM {self._parent_table_name} WHERE entity_id = ?", (entity_id,))
+        if cursor.rowcount == 0:
+            raise ModelNotFound(self.table_name, entity_id)
+
+    def _delete_all(self):
+        connection = self._connection()
+        with connection:
+            connection.execute(f"DELETE FROM {self.table_name}")
+            connection.execute(f"DELETE FROM {self._parent_table_name}")
+
+    def _delete_many(self, ids: Iterable[str]):
+        ids = list(dict.fromkeys(ids))
+        connection = self._connection()
+        existing_ids = set()
+        with connection:
+            for i in range(0, len(ids), self._MAX_VARIABLES):
+                chunk = ids[i : i + self._MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = connection.execute(f"SELECT id FROM {self.table_name} WHERE id IN ({placeholders})", chunk)
+                existing_ids.update(row[0] for row in cursor)
+                connection.execute(f"DELETE FROM {self.table_name} WHERE id IN ({placeholders})", chunk)
+                connection.execute(f"DELETE FROM {self._parent_table_name} WHERE entity_id IN ({placeholders})", chunk)
+        if missing_ids := [model_id for model_id in ids if model_id not in existing_ids]:
+            raise ModelNotFound(self.table_name, missing_ids[0])
+
+    def _delete_by(self, attribute: str, value: str):
+        where, params = self.__build_where([{attribute: value}])
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                f"DELETE FROM {self._parent_table_name} WHERE entity_id IN (SELECT id FROM {self.table_name}{where})",
+                params,
+            )
+            connection.execute(f"DELETE FROM {self.table_name}{where}", params)
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        if isinstance(value, str) and attribute in self._INDEXED_COLUMNS:
+            filters = [{**fil, attribute: value} for fil in (filters or [{}])]
+        return [e for e in self._load_all(filters) if getattr(e, attribute, None) == value]
+
+    def _load_latest(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        if attribute not in self._LATEST_COLUMNS:
+            return super()._load_latest(attribute, value, filters)
+        where, params = self.__build_where([{**fil, attribute: value} for fil in (filters or [{}])])
+        cursor = self._connection().execute(
+            f"SELECT document FROM {self.table_name}{where} ORDER BY creation_date DESC LIMIT 1", params
+        )
+        if row := cursor.fetchone():
+            return self.__document_to_entity(row[0])
+        return None
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        cursor = self._connection().execute(f"SELECT document FROM {self.table_name} WHERE id = ?", (entity_id,))
+        if not (row := cursor.fetchone()):
+            raise ModelNotFound(self.table_name, entity_id)
+
+        export_dir = pathlib.Path(folder_path) / self.table_name
+        export_dir.mkdir(parents=True, exist_ok=True)
+        (export_dir / f"{entity_id}.json").write_text(
+            json.dumps(json.loads(row[0]), ensure_ascii=False, indent=0), encoding="UTF-8"
+        )
+
+    ###########################################
+    # ##   Specific or optimized methods   ## #
+    ###########################################
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        res = {}
+        for config, owner_id in set(configs_and_owner_ids):
+            if entity := self._get_by_config_and_owner_id(config.id, owner_id, filters):
+                res[config, owner_id] = entity
+        return res
+
+    def _get_by_config_and_owner_id(
+        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
+    ) -> Optional[Entity]:
+        filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in (filters or [{}])]
+        where, params = self.__build_where(filters)
+        cursor = self._connection().execute(f"SELECT document FROM {self.table_name}{where} LIMIT 1", params)
+        if row := cursor.fetchone():
+            return self.__document_to_entity(row[0])
+        return None
+
+    def _get_by_parent_id(self, parent_id: str) -> List[Entity]:
+        cursor = self._connection().execute(
+            f"SELECT t.document FROM {self.table_name} t JOIN {self._parent_table_name} p ON p.entity_id = t.id"
+            " WHERE p.parent_id = ?",
+            (parent_id,),
+        )
+        return [self.__document_to_entity(row[0]) for row in cursor]
+
+    def _count(self, filters: Optional[List[Dict]] = None) -> int:
+        where, params = self.__build_where(filters)
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table_name}{where}", params).fetchone()[0]
+
+    def _save_documents(self, documents: Iterable[Dict[str, Any]]):
+        """Insert or replace the models, given as dictionaries, in a single transaction."""
+        columns = ("id", *self._INDEXED_COLUMNS, "document")
+        rows, parents, ids = [], [], []
+        for data in documents:
+            model_id = data["id"]
+            ids.append((model_id,))
+            indexed_values = [self.__column_value(data.get(column)) for column in self._INDEXED_COLUMNS]
+            document = json.dumps(data, ensure_ascii=False, cls=_Encoder, check_circular=False)
+            rows.append((model_id, *indexed_values, document))
+            parents.extend((model_id, str(parent_id)) for parent_id in data.get("parent_ids") or [])
+
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} ({', '.join(columns)})"
+                f" VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+            connection.executemany(f"DELETE FROM {self._parent_table_name} WHERE entity_id = ?", ids)
+            connection.executemany(
+                f"INSERT OR IGNORE INTO {self._parent_table_name} (entity_id, parent_id) VALUES (?, ?)", parents
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        db_location = str(self.db_location)
+        connections = self.__connections.__dict__.setdefault("connections", {})
+        if (connection := connections.get(db_location)) is None:
+            pathlib.Path(db_location).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(db_location, timeout=self._TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connections[db_location] = connection
+        created_tables = self.__connections.__dict__.setdefault("created_tables", set())
+        if (db_location, self.table_name) not in created_tables:
+            self._create_tables(connection)
+            created_tables.add((db_location, self.table_name))
+        return connection
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        columns = ", ".join(f"{column} TEXT" for column in self._INDEXED_COLUMNS)
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} (id TEXT PRIMARY KEY, {columns}, document TEXT NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table_name}_config_owner"
+                f" ON {self.table_name} (config_id, owner_id)"
+            )
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {self.table_name}_version ON {self.table_name} (version)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {self.table_name}_cycle ON {self.table_name} (cycle)")
+            existing_columns = {row[1] for row in connection.execute(f"PRAGMA table_info({self.table_name})")}
+            for column in self._INDEXED_COLUMNS:
+                if column not in existing_columns:
+                    # The table was created by an older version of Taipy
+                    connection.execute(f"ALTER TABLE {self.table_name} ADD COLUMN {column} TEXT")
+                    connection.execute(
+                        f"UPDATE {self.table_name} SET {column} = json_extract(document, '$.\"{column}\"')"
+                    )
+            for column in self._LATEST_COLUMNS:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table_name}_{column}_latest"
+                    f" ON {self.table_name} ({column}, creation_date)"
+                )
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._parent_table_name}"
+                " (entity_id TEXT NOT NULL, parent_id TEXT NOT NULL, PRIMARY KEY (entity_id, parent_id))"
+                " WITHOUT ROWID"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._parent_table_name}_parent"
+                f" ON {self._parent_table_name} (parent_id)"
+            )
+
+    @classmethod
+    def _close_connections(cls):
+        """Close the connections opened by the current thread."""
+        for connection in cls.__connections.__dict__.pop("connections", {}).values():
+            connection.close()
+        cls.__connections.__dict__.pop("created_tables", None)
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __build_where(self, filters: Optional[List[Dict]]) -> Tuple[str, List]:
+        if not filters:
+            return "", []
+
+        clauses, params = [], []
+        for _filter in filters:
+            conditions = []
+            for key, value in _filter.items():
+                column = key if key in self._INDEXED_COLUMNS else f"json_extract(document, '$.\"{key}\"')"
+                if value is None:
+                    conditions.append(f"{column} IS NULL")
+                else:
+                    conditions.append(f"{column} = ?")
+                    params.append(value)
+            clauses.append(f"({' AND '.join(conditions)})" if conditions else "1")
+        return f" WHERE {' OR '.join(clauses)}", params
+
+    @staticmethod
+    def __column_value(value) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+    def __document_to_entity(self, document: str) -> Entity:
+        model = self.model_type.from_dict(json.loads(document, cls=_Decoder))  # type: ignore[attr-defined]
+        return self.converter._model_to_entity(model)  # type: ignore[attr-defined]
@@ -0,0 +1,74 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sqlite3
+
+from .._repository._sql_repository import _SQLRepository
+from ..exceptions import ModelNotFound
+from ._version_converter import _VersionConverter
+from ._version_model import _VersionModel
+
+
+class _VersionSQLRepository(_SQLRepository):
+    _LATEST_VERSION_KEY = "latest_version"
+    _DEVELOPMENT_VERSION_KEY = "development_version"
+
+    def __init__(self) -> None:
+        super().__init__(model_type=_VersionModel, converter=_VersionConverter, table_name="version")
+
+    @property
+    def _info_table_name(self) -> str:
+        return f"{self.table_name}_info"
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        super()._create_tables(connection)
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._info_table_name} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def _delete_all(self):
+        super()._delete_all()
+        connection = self._connection()
+        with connection:
+            connection.execute(f"DELETE FROM {self._info_table_name}")
+
+    def _set_latest_version(self, version_number):
+        self.__set_info(self._LATEST_VERSION_KEY, version_number)
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                f"INSERT OR IGNORE INTO {self._info_table_name} (key, value) VALUES (?, '')",
+                (self._DEVELOPMENT_VERSION_KEY,),
+            )
+
+    def _get_latest_version(self) -> str:
+        return self.__get_info(self._LATEST_VERSION_KEY)
+
+    def _set_development_version(self, version_number):
+        self.__set_info(self._DEVELOPMENT_VERSION_KEY, version_number)
+        self.__set_info(self._LATEST_VERSION_KEY, version_number)
+
+    def _get_development_version(self) -> str:
+        return self.__get_info(self._DEVELOPMENT_VERSION_KEY)
+
+    def __set_info(self, key: str, value: str):
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self._info_table_name} (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def __get_info(self, key: str) -> str:
+        cursor = self._connection().execute(f"SELECT value FROM {self._info_table_name} WHERE key = ?", (key,))
+        if row := cursor.fetchone():
+            return row[0]
+        raise ModelNotFound(self._info_table_name, key)
@@ -49,6 +49,7 @@ class _DataNodeConfigChecker(_ConfigChecker):
             self._check_callable(data_node_config_id, data_node_config)
             self._check_generic_read_write_fct_and_args(data_node_config_id, data_node_config)
             self._check_exposed_type(data_node_config_id, data_node_config)
+            self._check_chunk_size(data_node_config_id, data_node_config)
         return self._collector
 
     def _check_if_config_id_is_overlapping_with_task_and_scenario_attributes(
@@ -79,8 +80,8 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 data_node_config._STORAGE_TYPE_KEY,
                 data_node_config.storage_type,
                 f"`{data_node_config._STORAGE_TYPE_KEY}` field of DataNodeConfig `{data_node_config_id}` must be"
-                f" either csv, sql_table, sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object,"
-                f" or in_memory.",
+                f" either csv, sql_table, sql, mongo_collection, pickle, excel, generic, json, parquet, arrow,"
+                f" s3_object, or in_memory.",
             )
 
     def _check_scope(self, data_node_config_id: str, data_node_config: DataNodeConfig):
@@ -222,6 +223,11 @@ class _DataNodeConfigChecker(_ConfigChecker):
     def _check_exposed_type(self, data_node_config_id: str, data_node_config: DataNodeConfig):
         if not isinstance(data_node_config.exposed_type, str):
             return
+        if (
+            data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_ARROW
+            and data_node_config.exposed_type == DataNodeConfig._EXPOSED_TYPE_ARROW
+        ):
+            return
         if data_node_config.exposed_type not in DataNodeConfig._ALL_EXPOSED_TYPES:
             self._error(
                 data_node_config._EXPOSED_TYPE_KEY,
@@ -229,3 +235,15 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 f"The `{data_node_config._EXPOSED_TYPE_KEY}` of DataNodeConfig `{data_node_config_id}` "
                 f'must be either "pandas", "numpy", or a custom type.',
             )
+
+    def _check_chunk_size(self, data_node_config_id: str, data_node_config: DataNodeConfig):
+        chunk_size = data_node_config.properties.get(DataNodeConfig._OPTIONAL_CHUNK_SIZE_PROPERTY)
+        if chunk_size is None:
+            return
+        if data_node_config.storage_type not in DataNodeConfig._CHUNKED_STORAGE_TYPES:
+            self._error(
+                DataNodeConfig._OPTIONAL_CHUNK_SIZE_PROPERTY,
+                chunk_size,
+                f"The `{DataNodeConfig._OPTIONAL_CHUNK_SIZE_PROPERTY}` of DataNodeConfig `{data_node_config_id}` "
+                f"is only supported by the {', '.join(DataNodeConfig._CHUNKED_STORAGE_TYPES)} storage types.",
+            )
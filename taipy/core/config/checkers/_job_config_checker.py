@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from datetime import timedelta
 from typing import Dict, cast
 
 from taipy.common.config._config import _Config
@@ -31,6 +32,8 @@ class _JobConfigChecker(_ConfigChecker):
                 cast(Dict[str, DataNodeConfig], data_node_configs),
             )
             self._check_job_execution_mode(cast(JobConfig, job_config))
+            self._check_history_retention(cast(JobConfig, job_config))
+            self._check_submission_status_persistence_delay(cast(JobConfig, job_config))
         return self._collector
 
     def _check_multiprocess_mode(self, job_config: JobConfig, data_node_configs: Dict[str, DataNodeConfig]):
@@ -51,3 +54,31 @@ class _JobConfigChecker(_ConfigChecker):
                 job_config.mode,
                 f"`Job execution mode must be either {', '.join(JobConfig._MODES)}.",
             )
+
+    def _check_history_retention(self, job_config: JobConfig):
+        history_max_nb = job_config.history_max_nb
+        if history_max_nb is not None and (
+            not isinstance(history_max_nb, int) or isinstance(history_max_nb, bool) or history_max_nb < 1
+        ):
+            self._error(
+                JobConfig._HISTORY_MAX_NB_KEY,
+                history_max_nb,
+                f"`{JobConfig._HISTORY_MAX_NB_KEY}` field of the job config must be a positive integer.",
+            )
+        history_max_age = job_config.history_max_age
+        if history_max_age is not None and not isinstance(history_max_age, timedelta):
+            self._error(
+                JobConfig._HISTORY_MAX_AGE_KEY,
+                history_max_age,
+                f"`{JobConfig._HISTORY_MAX_AGE_KEY}` field of the job config must be a timedelta.",
+            )
+
+    def _check_submission_status_persistence_delay(self, job_config: JobConfig):
+        delay = job_config.submission_status_persistence_delay
+        if delay is not None and (not isinstance(delay, (int, float)) or isinstance(delay, bool) or delay < 0):
+            self._error(
+                JobConfig._SUBMISSION_STATUS_PERSISTENCE_DELAY_KEY,
+                delay,
+                f"`{JobConfig._SUBMISSION_STATUS_PERSISTENCE_DELAY_KEY}` field of the job config must be a"
+                " non-negative number.",
+            )
@@ -154,6 +154,7 @@ class CoreSection(UniqueSection):
     def repository_type(self) -> str:
         """Type of the repository to be used to store Taipy data.
 
+        Possible values are "filesystem" and "sql" (an embedded SQLite database).
         The default value is "filesystem".
         """
         return _tpl._replace_templates(self._repository_type)
@@ -166,7 +167,11 @@ class CoreSection(UniqueSection):
 
     @property
     def repository_properties(self) -> Dict[str, Union[str, int]]:
-        """A dictionary of additional properties to be used by the repository."""
+        """A dictionary of additional properties to be used by the repository.
+
+        With the "sql" repository type, the *db_location* property sets the path of the SQLite
+        database file. The default value is "taipy.sqlite3" in the *taipy_storage_folder*.
+        """
         return (
             {k: _tpl._replace_templates(v) for k, v in self._repository_properties.items()}
             if self._repository_properties
@@ -400,7 +405,7 @@ class CoreSection(UniqueSection):
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
-                The default value is "filesystem".
+                Possible values are "filesystem" and "sql". The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
                 to be used by the repository.
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
@@ -442,11 +447,16 @@ class CoreSection(UniqueSection):
 
     @staticmethod
     def __reload_repositories():
-        _CycleManagerFactory._build_manager.cache_clear()
-        _SequenceManagerFactory._build_manager.cache_clear()
-        _ScenarioManagerFactory._build_manager.cache_clear()
-        _TaskManagerFactory._build_manager.cache_clear()
-        _JobManagerFactory._build_manager.cache_clear()
-        _DataManagerFactory._build_manager.cache_clear()
-        _SubmissionManagerFactory._build_manager.cache_clear()
-        _VersionManagerFactory._build_manager.cache_clear()
+        for factory in (
+            _CycleManagerFactory,
+            _SequenceManagerFactory,
+            _ScenarioManagerFactory,
+            _TaskManagerFactory,
+            _JobManagerFactory,
+            _DataManagerFactory,
+            _SubmissionManagerFactory,
+            _VersionManagerFactory,
+        ):
+            factory._build_manager.cache_clear()
+            if hasattr(factory._build_repository, "cache_clear"):
+                factory._build_repository.cache_clear()
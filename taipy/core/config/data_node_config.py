@@ -50,6 +50,7 @@ class DataNodeConfig(Section):
     _STORAGE_TYPE_VALUE_JSON = "json"
     _STORAGE_TYPE_VALUE_PARQUET = "parquet"
     _STORAGE_TYPE_VALUE_S3_OBJECT = "s3_object"
+    _STORAGE_TYPE_VALUE_ARROW = "arrow"
 
     _DEFAULT_STORAGE_TYPE = _STORAGE_TYPE_VALUE_PICKLE
     _ALL_STORAGE_TYPES = [
@@ -64,12 +65,14 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_JSON,
         _STORAGE_TYPE_VALUE_PARQUET,
         _STORAGE_TYPE_VALUE_S3_OBJECT,
+        _STORAGE_TYPE_VALUE_ARROW,
     ]
 
     _EXPOSED_TYPE_KEY = "exposed_type"
     _EXPOSED_TYPE_PANDAS = "pandas"
     _EXPOSED_TYPE_MODIN = "modin"  # Deprecated in favor of pandas since 3.1.0
     _EXPOSED_TYPE_NUMPY = "numpy"
+    _EXPOSED_TYPE_ARROW = "arrow"
     _DEFAULT_EXPOSED_TYPE = _EXPOSED_TYPE_PANDAS
 
     _ALL_EXPOSED_TYPES = [
@@ -80,6 +83,15 @@ class DataNodeConfig(Section):
     _OPTIONAL_ENCODING_PROPERTY = "encoding"
     _DEFAULT_ENCODING_VALUE = "utf-8"
 
+    _OPTIONAL_CHUNK_SIZE_PROPERTY = "chunk_size"
+    _CHUNKED_STORAGE_TYPES = [
+        _STORAGE_TYPE_VALUE_CSV,
+        _STORAGE_TYPE_VALUE_PARQUET,
+        _STORAGE_TYPE_VALUE_SQL,
+        _STORAGE_TYPE_VALUE_SQL_TABLE,
+        _STORAGE_TYPE_VALUE_MONGO_COLLECTION,
+    ]
+
     # Generic
     _OPTIONAL_READ_FUNCTION_GENERIC_PROPERTY = "read_fct"
     _OPTIONAL_READ_FUNCTION_ARGS_GENERIC_PROPERTY = "read_fct_args"
@@ -139,6 +151,10 @@ class DataNodeConfig(Section):
     _OPTIONAL_COMPRESSION_PARQUET_PROPERTY = "compression"
     _OPTIONAL_READ_KWARGS_PARQUET_PROPERTY = "read_kwargs"
     _OPTIONAL_WRITE_KWARGS_PARQUET_PROPERTY = "write_kwargs"
+    # Arrow
+    _OPTIONAL_EXPOSED_TYPE_ARROW_PROPERTY = "exposed_type"
+    _OPTIONAL_DEFAULT_PATH_ARROW_PROPERTY = "default_path"
+    _OPTIONAL_DEFAULT_DATA_ARROW_PROPERTY = "default_data"
     # S3object
     _REQUIRED_AWS_ACCESS_KEY_ID_PROPERTY = "aws_access_key"
     _REQUIRED_AWS_SECRET_ACCESS_KEY_PROPERTY = "aws_secret_access_key"
@@ -176,6 +192,7 @@ class DataNodeConfig(Section):
             _REQUIRED_AWS_STORAGE_BUCKET_NAME_PROPERTY,
             _REQUIRED_AWS_S3_OBJECT_KEY_PROPERTY,
         ],
+        _STORAGE_TYPE_VALUE_ARROW: [],
     }
 
     _OPTIONAL_PROPERTIES = {
@@ -252,6 +269,11 @@ class DataNodeConfig(Section):
             _OPTIONAL_AWS_REGION_PROPERTY: None,
             _OPTIONAL_AWS_S3_OBJECT_PARAMETERS_PROPERTY: None,
         },
+        _STORAGE_TYPE_VALUE_ARROW: {
+            _OPTIONAL_DEFAULT_PATH_ARROW_PROPERTY: None,
+            _OPTIONAL_DEFAULT_DATA_ARROW_PROPERTY: None,
+            _OPTIONAL_EXPOSED_TYPE_ARROW_PROPERTY: _DEFAULT_EXPOSED_TYPE,
+        },
     }
 
     _SCOPE_KEY = "scope"
@@ -293,7 +315,7 @@ class DataNodeConfig(Section):
         """Storage type of the data nodes created from the data node config.
 
         The possible values are : "csv", "excel", "pickle", "sql_table", "sql",
-        "mongo_collection", "generic", "json", "parquet", "in_memory and "s3_object".
+        "mongo_collection", "generic", "json", "parquet", "arrow", "in_memory and "s3_object".
 
         The default value is "pickle".
 
@@ -410,7 +432,7 @@ class DataNodeConfig(Section):
         Parameters:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"arrow"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -470,8 +492,8 @@ class DataNodeConfig(Section):
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
-                *"generic"*.
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"arrow"*, *"mongo_collection"*, *"in_memory"*,
+                or *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
                 `(Config.)set_default_data_node_configuration()^`).
@@ -498,6 +520,7 @@ class DataNodeConfig(Section):
             cls._STORAGE_TYPE_VALUE_JSON: cls._configure_json,
             cls._STORAGE_TYPE_VALUE_PARQUET: cls._configure_parquet,
             cls._STORAGE_TYPE_VALUE_S3_OBJECT: cls._configure_s3_object,
+            cls._STORAGE_TYPE_VALUE_ARROW: cls._configure_arrow,
         }
 
         if storage_type in cls._ALL_STORAGE_TYPES:
@@ -654,6 +677,54 @@ class DataNodeConfig(Section):
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PARQUET, scope, validity_period, **properties)
 
+    @classmethod
+    def _configure_arrow(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        exposed_type: Optional[str] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new Arrow data node configuration.
+
+        The data is stored in an uncompressed Arrow IPC file which is memory-mapped when read, so
+        the data is neither parsed nor copied when it is exchanged between tasks.
+
+        Parameters:
+            id (str): The unique identifier of the new Arrow data node configuration.
+            default_path (Optional[str]): The default path of the Arrow file. A path on a
+                memory-backed file system (such as */dev/shm* on Linux) avoids any disk I/O.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this Arrow data node configuration.
+            exposed_type (Optional[str]): The exposed type of the data read from the Arrow file.
+                The possible values are *"pandas"*, *"numpy"*, *"arrow"* (a memory-mapped
+                `pyarrow.Table`), or a custom type.<br/>
+                The default value is `pandas`.
+            scope (Optional[Scope^]): The scope of the Arrow data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new Arrow data node configuration.
+        """  # noqa: E501
+        if default_path is not None:
+            properties[cls._OPTIONAL_DEFAULT_PATH_ARROW_PROPERTY] = default_path
+        if default_data is not None:
+            properties[cls._OPTIONAL_DEFAULT_DATA_ARROW_PROPERTY] = default_data
+        if exposed_type is not None:
+            properties[cls._OPTIONAL_EXPOSED_TYPE_ARROW_PROPERTY] = exposed_type
+
+        return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_ARROW, scope, validity_period, **properties)
+
     @classmethod
     def _configure_excel(
         cls,
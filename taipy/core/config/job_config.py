@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from copy import copy
+from datetime import timedelta
 from typing import Any, Dict, Optional, Union
 
 from taipy.common.config import Config
@@ -19,22 +20,33 @@ from taipy.common.config.unique_section import UniqueSection
 
 
 class JobConfig(UniqueSection):
-    """ Configuration fields related to the task orchestration and the jobs' executions."""
+    """Configuration fields related to the task orchestration and the jobs' executions."""
 
     name = "JOB"
 
     _MODE_KEY = "mode"
     _STANDALONE_MODE = "standalone"
     _DEVELOPMENT_MODE = "development"
+    _THREAD_MODE = "thread"
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _DEFAULT_MAX_NB_OF_WORKERS = 2
-    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE]
+    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE, _THREAD_MODE]
+    _HISTORY_MAX_NB_KEY = "history_max_nb"
+    _HISTORY_MAX_AGE_KEY = "history_max_age"
+    _SUBMISSION_STATUS_PERSISTENCE_DELAY_KEY = "submission_status_persistence_delay"
+    # The types of the properties whose value can be set with an environment variable
+    _PROPERTY_TYPES: Dict[str, type] = {
+        _HISTORY_MAX_NB_KEY: int,
+        _HISTORY_MAX_AGE_KEY: timedelta,
+        _SUBMISSION_STATUS_PERSISTENCE_DELAY_KEY: float,
+    }
 
     mode: Optional[str]
     """The task orchestration mode.
 
     By default, the "development" mode is set for testing and debugging the
-    executions of jobs. A "standalone" mode is also available.
+    executions of jobs. A "standalone" mode is also available, as well as a "thread" mode
+    that executes the jobs in threads of the main process, which suits I/O-bound tasks.
 
     In the Taipy Enterprise Edition, the "cluster" mode is available.
     """
@@ -49,18 +61,29 @@ class JobConfig(UniqueSection):
         return JobConfig(self.mode, **copy(self._properties))
 
     def __getattr__(self, key: str) -> Optional[Any]:
-        return _tpl._replace_templates(self._properties.get(key))  # type: ignore[union-attr]
+        value = self._properties.get(key)  # type: ignore[union-attr]
+        return _tpl._replace_templates(value, type=self._PROPERTY_TYPES.get(key, str))
 
     @property
     def is_standalone(self) -> bool:
         """True if the config is set to standalone mode"""
         return self.mode == self._STANDALONE_MODE
 
+    @property
+    def is_thread(self) -> bool:
+        """True if the config is set to thread mode"""
+        return self.mode == self._THREAD_MODE
+
     @property
     def is_development(self) -> bool:
         """True if the config is set to development mode"""
         return self.mode == self._DEVELOPMENT_MODE
 
+    @property
+    def has_history_retention(self) -> bool:
+        """True if a retention policy is set for the history of jobs and submissions"""
+        return self.history_max_nb is not None or self.history_max_age is not None
+
     @classmethod
     def default_config(cls) -> "JobConfig":
         """Return a default configuration for the job execution.
@@ -97,19 +120,39 @@ class JobConfig(UniqueSection):
 
     @staticmethod
     def _configure(
-        mode: Optional[str] = None, max_nb_of_workers: Optional[Union[int, str]] = None, **properties
+        mode: Optional[str] = None,
+        max_nb_of_workers: Optional[Union[int, str]] = None,
+        history_max_nb: Optional[Union[int, str]] = None,
+        history_max_age: Optional[Union[timedelta, str]] = None,
+        submission_status_persistence_delay: Optional[Union[float, str]] = None,
+        **properties,
     ) -> "JobConfig":
         """Configure job execution.
 
         Parameters:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
-            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                Possible values are: *"standalone"*, *"thread"* or *"development"*.
+            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* and *"thread"* modes.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
+            history_max_nb (Optional[int, str]): The number of most recent jobs kept for each task,
+                and of most recent submissions kept for each submitted entity.<br/>
+                Older finished jobs and submissions are moved to a read-only archive when the history
+                is compacted, unless they are kept by *history_max_age*.<br/>
+                By default, the number of jobs and submissions kept is not limited.
+            history_max_age (Optional[timedelta, str]): The period for which finished jobs and
+                submissions are kept. Older ones are moved to a read-only archive when the history is
+                compacted, unless they are kept by *history_max_nb*. The latest job of each task and the
+                latest submission of each entity are always kept.<br/>
+                By default, jobs and submissions are kept regardless of their age.
+            submission_status_persistence_delay (Optional[float, str]): The number of seconds for which
+                the persistence of the intermediate statuses of a running submission is delayed, so that
+                successive job status changes only persist the submission once. Finished submissions are
+                always persisted immediately.<br/>
+                By default, the submission is persisted on each job status change.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -117,11 +160,17 @@ class JobConfig(UniqueSection):
         """
         if max_nb_of_workers:
             properties["max_nb_of_workers"] = max_nb_of_workers
+        if history_max_nb is not None:
+            properties[JobConfig._HISTORY_MAX_NB_KEY] = history_max_nb
+        if history_max_age is not None:
+            properties[JobConfig._HISTORY_MAX_AGE_KEY] = history_max_age
+        if submission_status_persistence_delay is not None:
+            properties[JobConfig._SUBMISSION_STATUS_PERSISTENCE_DELAY_KEY] = submission_status_persistence_delay
         section = JobConfig(mode=mode, **properties)
         Config._register(section)
         return Config.unique_sections[JobConfig.name]
 
     def _update_default_max_nb_of_workers_properties(self):
-        """If the job execution mode is standalone, set the default value for the max_nb_of_workers property"""
-        if self.is_standalone and "max_nb_of_workers" not in self._properties:
+        """If the jobs are executed in parallel, set the default value for the max_nb_of_workers property"""
+        if (self.is_standalone or self.is_thread) and "max_nb_of_workers" not in self._properties:
             self.properties.update({"max_nb_of_workers": self._DEFAULT_MAX_NB_OF_WORKERS})
@@ -44,6 +44,7 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _EXECUTION_MODE_KEY = "execution_mode"
 
     function: Optional[Callable]
     """User function taking as inputs some parameters compatible with the data type
@@ -184,7 +185,9 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                In *"standalone"* job execution mode, setting the *execution_mode* property to
+                *"thread"* executes the jobs of this task in threads of the main process.
 
         Returns:
             The new task configuration.
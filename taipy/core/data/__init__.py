@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 """Classes related to data nodes."""
 
+from .arrow import ArrowDataNode
 from .aws_s3 import S3ObjectDataNode
 from .csv import CSVDataNode
 from .data_node import DataNode
@@ -14,7 +14,7 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -132,6 +132,7 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 self.__SQLITE_FOLDER_PATH,
                 self.__SQLITE_FILE_EXTENSION,
                 self._EXPOSED_TYPE_PROPERTY,
+                self._CHUNK_SIZE_PROPERTY,
             }
         )
 
@@ -240,6 +241,16 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 return pd.DataFrame(result, columns=keys)[columns]
             return pd.DataFrame(result, columns=keys)
 
+    def _read_chunks(self, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        with self._get_engine().connect() as conn:
+            # Stream the rows with a server-side cursor instead of fetching the whole result at once.
+            result = conn.execution_options(stream_results=True).execute(text(self._get_read_query()))
+            keys = list(result.keys())
+            for rows in result.partitions(chunk_size):
+                df = pd.DataFrame(rows, columns=keys)
+                yield self._convert_dataframe_to_exposed_type(exposed_type, df[columns] if columns else df)
+
     @abstractmethod
     def _get_read_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
         query = self._get_base_read_query()
@@ -61,10 +61,18 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             dn_configs_and_owner_id, cls._build_filters_with_version(None)
         )
 
-        return {
-            dn_config: data_nodes.get((dn_config, owner_id)) or cls._create_and_set(dn_config, owner_id, None)
-            for dn_config, owner_id in dn_configs_and_owner_id
-        }
+        result = {}
+        new_data_nodes = []
+        for dn_config, owner_id in dn_configs_and_owner_id:
+            if (data_node := data_nodes.get((dn_config, owner_id))) is None:
+                data_node = cls.__create(dn_config, owner_id, None)
+                new_data_nodes.append(data_node)
+            result[dn_config] = data_node
+
+        cls._set_many(new_data_nodes)
+        for data_node in new_data_nodes:
+            Notifier.publish(_make_event(data_node, EventOperation.CREATION))
+        return result
 
     @classmethod
     def _can_create(cls, config: Optional[DataNodeConfig] = None) -> ReasonCollection:
@@ -113,6 +121,27 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         except KeyError:
             raise InvalidDataNodeType(data_node_config.storage_type) from None
 
+    @classmethod
+    def _set(cls, data_node: DataNode) -> None:
+        super()._set(data_node)
+        if not data_node._edit_in_progress and data_node._last_edit_date:
+            cls.__notify_ready([data_node])
+
+    @classmethod
+    def _set_many(cls, data_nodes: Iterable[DataNode]) -> None:
+        data_nodes = list(data_nodes)
+        super()._set_many(data_nodes)
+        cls.__notify_ready([dn for dn in data_nodes if not dn._edit_in_progress and dn._last_edit_date])
+
+    @staticmethod
+    def __notify_ready(data_nodes: List[DataNode]) -> None:
+        # The jobs blocked by these data nodes can be released, whoever wrote or unlocked them.
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        if data_nodes and (orchestrator := _OrchestratorFactory._orchestrator):
+            for data_node in data_nodes:
+                orchestrator._on_data_node_ready(data_node.id)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[DataNode]:
         """
@@ -28,7 +28,14 @@ from .data_node_id import Edit
 class _FileDataNodeMixin(object):
     """Mixin class designed to handle file-based data nodes."""
 
-    __EXTENSION_MAP = {"csv": "csv", "excel": "xlsx", "parquet": "parquet", "pickle": "p", "json": "json"}
+    __EXTENSION_MAP = {
+        "csv": "csv",
+        "excel": "xlsx",
+        "parquet": "parquet",
+        "pickle": "p",
+        "json": "json",
+        "arrow": "arrow",
+    }
 
     _DEFAULT_DATA_KEY = "default_data"
     _PATH_KEY = "path"
@@ -13,7 +13,7 @@ from collections.abc import Hashable
 from functools import reduce
 from itertools import chain
 from operator import and_, or_
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -130,40 +130,53 @@ class _FilterDataNode:
 
     @staticmethod
     def __filter_dataframe(df_data: pd.DataFrame, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        if join_operator == JoinOperator.AND:
-            how = "inner"
-        elif join_operator == JoinOperator.OR:
-            how = "outer"
-        else:
-            raise NotImplementedError
+        return df_data[_FilterDataNode._get_dataframe_mask(df_data, operators, join_operator)]
 
-        filtered_df_data = [
-            _FilterDataNode.__filter_dataframe_per_key_value(df_data, key, value, operator)
+    @staticmethod
+    def _get_dataframe_mask(df_data: pd.DataFrame, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        conditions = [
+            _FilterDataNode.__get_dataframe_condition_per_key_value(df_data, key, value, operator)
             for key, value, operator in operators
         ]
 
-        return _FilterDataNode.__dataframe_merge(filtered_df_data, how) if filtered_df_data else pd.DataFrame()
+        if join_operator == JoinOperator.AND:
+            return reduce(and_, conditions)
+        if join_operator == JoinOperator.OR:
+            return reduce(or_, conditions)
+        raise NotImplementedError
 
     @staticmethod
     def __filter_dataframe_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
+        return df_data[_FilterDataNode.__get_dataframe_condition_per_key_value(df_data, key, value, operator)]
+
+    @staticmethod
+    def __get_dataframe_condition_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
         df_by_col = df_data[key]
         if operator == Operator.EQUAL:
-            df_by_col = df_by_col == value
+            return df_by_col == value
         if operator == Operator.NOT_EQUAL:
-            df_by_col = df_by_col != value
+            return df_by_col != value
         if operator == Operator.LESS_THAN:
-            df_by_col = df_by_col < value
+            return df_by_col < value
         if operator == Operator.LESS_OR_EQUAL:
-            df_by_col = df_by_col <= value
+            return df_by_col <= value
         if operator == Operator.GREATER_THAN:
-            df_by_col = df_by_col > value
+            return df_by_col > value
         if operator == Operator.GREATER_OR_EQUAL:
-            df_by_col = df_by_col >= value
-        return df_data[df_by_col]
+            return df_by_col >= value
+        raise NotImplementedError
 
     @staticmethod
-    def __dataframe_merge(df_list: List, how="inner"):
-        return reduce(lambda df1, df2: pd.merge(df1, df2, how=how), df_list)
+    def _select_columns(data, columns: Optional[List]):
+        if not columns:
+            return data
+        if isinstance(data, Dict):
+            return {k: _FilterDataNode._select_columns(v, columns) for k, v in data.items()}
+        if isinstance(data, pd.DataFrame):
+            return data[columns]
+        if isinstance(data, np.ndarray):
+            return data[:, [int(column) for column in columns]]
+        return data
 
     @staticmethod
     def __filter_numpy_array(data: np.ndarray, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
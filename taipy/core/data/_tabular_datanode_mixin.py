@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Union
 
 import numpy as np
 import pandas as pd
@@ -54,6 +54,20 @@ class _TabularDataNodeMixin(object):
             return pd.DataFrame.from_records([self._encoder(row) for row in data])
         return pd.DataFrame(data)
 
+    def _convert_dataframe_to_exposed_type(self, exposed_type: Any, df: pd.DataFrame) -> Any:
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return df
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return df.to_numpy()
+        if self.properties.get(self._HAS_HEADER_PROPERTY, True):  # type: ignore[attr-defined]
+            return [self._decoder(row) for row in df.to_dict(orient="records")]
+        return [self._decoder(list(row)) for row in df.itertuples(index=False)]
+
+    @staticmethod
+    def _is_chunked(data: Any) -> bool:
+        """Return True if the data to write is an iterator over chunks of data, such as a generator."""
+        return isinstance(data, Iterator)
+
     @classmethod
     def _get_valid_exposed_type(cls, properties: Dict):
         if (
@@ -0,0 +1,184 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+from datetime import datetime, timedelta
+from importlib import util
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config.common.scope import Scope
+
+from .._entity._reload import _Reloader
+from .._version._version_manager_factory import _VersionManagerFactory
+from ..common._check_dependencies import _check_dependency_is_installed
+from ._file_datanode_mixin import _FileDataNodeMixin
+from ._tabular_datanode_mixin import _TabularDataNodeMixin
+from .data_node import DataNode
+from .data_node_id import DataNodeId, Edit
+
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+
+
+class ArrowDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
+    """Data Node stored as an Apache Arrow IPC file.
+
+    The data is stored uncompressed in the Arrow IPC file format and read through a memory map, so
+    reading does not parse nor copy the data: the pages of the file are shared between all the
+    processes reading it. This makes this data node well suited to exchange intermediate data
+    between the tasks of a scenario, in particular in *"standalone"* job execution mode. Setting the
+    *default_path* on a memory-backed file system (such as */dev/shm* on Linux) avoids any disk I/O.
+
+    The file is replaced atomically when written, so readers never observe a partially written file.
+    As a consequence, appending data to the data node reads the whole file and rewrites it with the
+    appended rows: appending many small pieces of data one at a time costs a time quadratic in their
+    number. Prefer concatenating the data first and writing it at once.
+
+    The *properties* attribute can contain the following optional entries:
+
+    - *default_path* (`str`): The default path of the Arrow file used at the instantiation of the
+        data node.
+    - *default_data* (`Any`): The default data of the data node. It is used at the data node
+        instantiation to write the data to the Arrow file.
+    - *exposed_type* (`str`): The exposed type of the data read from the Arrow file. The possible
+        values are *"pandas"*, *"numpy"*, *"arrow"* (a memory-mapped `pyarrow.Table`), or a custom
+        type.<br/> The default value is `pandas`.
+    """
+
+    __STORAGE_TYPE = "arrow"
+    _EXPOSED_TYPE_ARROW = "arrow"
+    _VALID_STRING_EXPOSED_TYPES = [
+        _TabularDataNodeMixin._EXPOSED_TYPE_PANDAS,
+        _TabularDataNodeMixin._EXPOSED_TYPE_NUMPY,
+        _EXPOSED_TYPE_ARROW,
+    ]
+    _REQUIRED_PROPERTIES: List[str] = []
+
+    def __init__(
+        self,
+        config_id: str,
+        scope: Scope,
+        id: Optional[DataNodeId] = None,
+        owner_id: Optional[str] = None,
+        parent_ids: Optional[Set[str]] = None,
+        last_edit_date: Optional[datetime] = None,
+        edits: Optional[List[Edit]] = None,
+        version: Optional[str] = None,
+        validity_period: Optional[timedelta] = None,
+        edit_in_progress: bool = False,
+        editor_id: Optional[str] = None,
+        editor_expiration_date: Optional[datetime] = None,
+        properties: Optional[Dict] = None,
+    ) -> None:
+        _check_dependency_is_installed("Arrow Data Node", "pyarrow")
+        self.id = id or self._new_id(config_id)
+
+        if properties is None:
+            properties = {}
+
+        properties[self._EXPOSED_TYPE_PROPERTY] = _TabularDataNodeMixin._get_valid_exposed_type(properties)
+        self._check_exposed_type(properties[self._EXPOSED_TYPE_PROPERTY])
+
+        default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
+        _FileDataNodeMixin.__init__(self, properties)
+        _TabularDataNodeMixin.__init__(self, **properties)
+
+        DataNode.__init__(
+            self,
+            config_id,
+            scope,
+            self.id,
+            owner_id,
+            parent_ids,
+            last_edit_date,
+            edits,
+            version or _VersionManagerFactory._build_manager()._get_latest_version(),
+            validity_period,
+            edit_in_progress,
+            editor_id,
+            editor_expiration_date,
+            **properties,
+        )
+
+        with _Reloader():
+            self._write_default_data(default_value)
+
+        self._TAIPY_PROPERTIES.update(
+            {
+                self._EXPOSED_TYPE_PROPERTY,
+                self._PATH_KEY,
+                self._DEFAULT_PATH_KEY,
+                self._DEFAULT_DATA_KEY,
+                self._IS_GENERATED_KEY,
+            }
+        )
+
+    @classmethod
+    def storage_type(cls) -> str:
+        """Return the storage type of the data node: "arrow"."""
+        return cls.__STORAGE_TYPE
+
+    def _read(self):
+        return self._read_from_path()
+
+    def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
+        if path is None:
+            path = self._path
+
+        table = self._read_as_arrow_table(path)
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_ARROW:
+            return table
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self._to_pandas_dataframe(table)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self._to_pandas_dataframe(table).to_numpy()
+        return [exposed_type(**dct) for dct in self._to_pandas_dataframe(table).to_dict(orient="records")]
+
+    @staticmethod
+    def _read_as_arrow_table(path: str) -> "pa.Table":
+        # The buffers of the table keep the memory map open as long as they are referenced.
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+    @staticmethod
+    def _to_pandas_dataframe(table: "pa.Table") -> pd.DataFrame:
+        # Splitting the blocks lets the numerical columns without nulls reference the mapped memory.
+        return table.to_pandas(split_blocks=True)
+
+    def _convert_data_to_arrow_table(self, data: Any) -> "pa.Table":
+        if isinstance(data, pa.Table):
+            return data
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_ARROW:
+            exposed_type = self._EXPOSED_TYPE_NUMPY if isinstance(data, np.ndarray) else self._EXPOSED_TYPE_PANDAS
+        df = self._convert_data_to_dataframe(exposed_type, data)
+        if isinstance(df, pd.Series):
+            df = pd.DataFrame(df)
+        return pa.Table.from_pandas(df.rename(columns=str))
+
+    def _write_table(self, table: "pa.Table"):
+        tmp_path = f"{self._path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, self._path)
+
+    def _append(self, data: Any):
+        table = self._convert_data_to_arrow_table(data)
+        if os.path.exists(self._path):
+            table = pa.concat_tables([self._read_as_arrow_table(self._path), table], promote_options="default")
+        self._write_table(table)
+
+    def _write(self, data: Any):
+        self._write_table(self._convert_data_to_arrow_table(data))
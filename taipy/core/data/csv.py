@@ -11,7 +11,7 @@
 
 import csv
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -22,9 +22,11 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
 
 
 class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -39,10 +41,14 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         to write the data to the CSV file.
     - *has_header* (`bool`): If True, indicates that the CSV file has a header.
     - *exposed_type*: The exposed type of the data read from CSV file. The default value is `pandas`.
+    - *chunk_size* (`int`): The number of rows of the chunks returned by `read_chunks()`. If set,
+        the data is passed to the task functions as an iterator over chunks instead of being read
+        at once.
     """
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    _FILTER_CHUNK_SIZE = 100_000
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -109,6 +115,7 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__ENCODING_KEY,
+                self._CHUNK_SIZE_PROPERTY,
             }
         )
 
@@ -127,6 +134,74 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         self._write(data, columns)
         self.track_edit(timestamp=datetime.now(), job_id=job_id)
 
+    def filter(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[Union[str, int]]] = None,
+    ):
+        """Read and filter the data referenced by this data node.
+
+        With a *"pandas"* or *"numpy"* exposed type, the CSV file is scanned by chunks and each
+        chunk is filtered as soon as it is read, so the whole file is never loaded in memory.
+        Only the selected columns, and the columns the filters apply to, are parsed.
+
+        Parameters:
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of
+                3-element tuples, each is in the form of (key, value, `Operator^`). All the rows
+                are returned if no operator is provided.
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[Union[str, int]]]): The names (or the indexes for the
+                *"numpy"* exposed type) of the columns to read. All the columns are read by
+                default. This is ignored for custom exposed types.
+
+        Returns:
+            The filtered data.
+        """
+        if operators and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return self.__scan(operators, join_operator, columns)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return self.__scan(operators, join_operator, columns, by_position=True).to_numpy()
+        data = self._read()
+        return _FilterDataNode._filter(data, operators, join_operator) if operators else data
+
+    def __scan(
+        self,
+        operators: Optional[Union[List, Tuple]],
+        join_operator,
+        columns: Optional[List[Union[str, int]]],
+        by_position: bool = False,
+    ) -> pd.DataFrame:
+        properties = self.properties
+        operators = operators or []
+        kwargs: Dict[str, Any] = {"encoding": properties[self.__ENCODING_KEY], "chunksize": self._FILTER_CHUNK_SIZE}
+        if by_position:
+            # Columns are labeled by their index, whether the file has a header or not.
+            operators = [(int(key), value, operator) for key, value, operator in operators]
+            columns = [int(column) for column in columns] if columns else None
+            kwargs.update(header=None, skiprows=1 if properties[self._HAS_HEADER_PROPERTY] else 0)
+        elif not properties[self._HAS_HEADER_PROPERTY]:
+            kwargs["header"] = None
+        if columns:
+            kwargs["usecols"] = list(dict.fromkeys([*columns, *(key for key, _, _ in operators)]))
+
+        try:
+            with pd.read_csv(self._path, **kwargs) as reader:
+                chunks = [
+                    chunk[_FilterDataNode._get_dataframe_mask(chunk, operators, join_operator)] if operators else chunk
+                    for chunk in reader
+                ]
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+        if not chunks:
+            return pd.DataFrame()
+        df = pd.concat([chunk for chunk in chunks if len(chunk)] or chunks[:1])
+        return df[columns] if columns else df
+
     def _read(self):
         return self._read_from_path()
 
@@ -173,13 +248,38 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
+    def _read_chunks(self, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator:
+        properties = self.properties
+        kwargs: Dict[str, Any] = {"encoding": properties[self.__ENCODING_KEY], "chunksize": chunk_size}
+        if not properties[self._HAS_HEADER_PROPERTY]:
+            kwargs["header"] = None
+        if columns:
+            kwargs["usecols"] = columns
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        try:
+            with pd.read_csv(self._path, **kwargs) as reader:
+                for chunk in reader:
+                    yield self._convert_dataframe_to_exposed_type(exposed_type, chunk[columns] if columns else chunk)
+        except pd.errors.EmptyDataError:
+            return
+
     def _append(self, data: Any):
+        if self._is_chunked(data):
+            for chunk in data:
+                self._append(chunk)
+            return
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
         data = self._convert_data_to_dataframe(exposed_type, data)
         data.to_csv(self._path, mode="a", index=False, encoding=properties[self.__ENCODING_KEY], header=False)
 
     def _write(self, data: Any, columns: Optional[List[str]] = None):
+        if self._is_chunked(data):
+            # The first chunk overwrites the file and writes the header, the next ones are appended.
+            chunks = iter(data)
+            self._write(next(chunks, pd.DataFrame()), columns)
+            self._append(chunks)
+            return
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
         data = self._convert_data_to_dataframe(exposed_type, data)
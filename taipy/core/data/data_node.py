@@ -14,7 +14,7 @@ import os
 import uuid
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 
@@ -107,6 +107,8 @@ class DataNode(_Entity, _Labeled):
     _REQUIRED_PROPERTIES: List[str] = []
     _MANAGER_NAME: str = "data"
     _PATH_KEY = "path"
+    _CHUNK_SIZE_PROPERTY = "chunk_size"
+    _DEFAULT_CHUNK_SIZE = 100_000
     __EDIT_TIMEOUT = 30
 
     _TAIPY_PROPERTIES: Set[str] = set()
@@ -415,9 +417,40 @@ class DataNode(_Entity, _Labeled):
             )
             return None
 
+    def read_chunks(self, chunk_size: Optional[int] = None, columns: Optional[List[str]] = None) -> Iterator:
+        """Read the data referenced by this data node, chunk by chunk.
+
+        The chunks are read lazily from the storage, so the whole data is never loaded in
+        memory. Each chunk has the exposed type of the data node.
+
+        Only the CSV, Parquet, SQL, SQL table and Mongo collection data nodes can be read by
+        chunks.
+
+        Parameters:
+            chunk_size (Optional[int]): The maximum number of rows (or documents) of each chunk.
+                The default value is the *chunk_size* property of the data node if set, or 100000.
+            columns (Optional[List[str]]): The names of the columns to read. All the columns are
+                read by default.
+
+        Returns:
+            An iterator over the chunks of data.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+            NotImplementedError: If the storage type does not support reading by chunks.
+        """
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        chunk_size = chunk_size or self.properties.get(self._CHUNK_SIZE_PROPERTY) or self._DEFAULT_CHUNK_SIZE
+        return self._read_chunks(int(chunk_size), columns)
+
     def append(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
         """Append some data to this data node.
 
+        The data nodes supporting `read_chunks()` also accept an iterator over chunks of data,
+        such as a generator of data frames, which are appended one at a time. The other data nodes
+        do not support iterators over chunks.
+
         Parameters:
             data (Any): The data to write to this data node.
             job_id (JobId): An optional identifier of the writer.
@@ -434,6 +467,10 @@ class DataNode(_Entity, _Labeled):
     def write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
         """Write some data to this data node.
 
+        The data nodes supporting `read_chunks()` also accept an iterator over chunks of data,
+        such as a generator of data frames, which are written one at a time. The other data nodes
+        do not support iterators over chunks.
+
         Parameters:
             data (Any): The data to write to this data node.
             job_id (JobId): An optional identifier of the writer.
@@ -571,6 +608,9 @@ class DataNode(_Entity, _Labeled):
     def _read(self):
         raise NotImplementedError
 
+    def _read_chunks(self, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator:
+        raise NotImplementedError
+
     def _append(self, data):
         raise NotImplementedError
 
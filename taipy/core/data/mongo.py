@@ -12,7 +12,10 @@
 from datetime import datetime, timedelta
 from importlib import util
 from inspect import isclass
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import pandas as pd
 
 from taipy.common.config.common.scope import Scope
 
@@ -47,6 +50,9 @@ class MongoCollectionDataNode(DataNode):
     - *db_driver* (`str`): The database driver.
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into
         database connection string.
+    - *chunk_size* (`int`): The number of documents of the chunks returned by `read_chunks()`. If
+        set, the data is passed to the task functions as an iterator over chunks instead of being
+        read at once.
     """
 
     __STORAGE_TYPE = "mongo_collection"
@@ -150,6 +156,7 @@ class MongoCollectionDataNode(DataNode):
                 self.__DB_PORT_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self._CHUNK_SIZE_PROPERTY,
             }
         )
 
@@ -199,8 +206,25 @@ class MongoCollectionDataNode(DataNode):
 
         return self.collection.find(query)
 
+    def _read_chunks(self, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator:
+        # The cursor fetches the documents from the server by batches of the chunk size.
+        cursor = self.collection.find(projection=columns, batch_size=chunk_size)
+        try:
+            while chunk := [self._decoder(row) for row in islice(cursor, chunk_size)]:
+                yield chunk
+        finally:
+            cursor.close()
+
     def _append(self, data) -> None:
         """Append data to a Mongo collection."""
+        if isinstance(data, Iterator):
+            for chunk in data:
+                self._append(chunk)
+            return
+
+        if isinstance(data, pd.DataFrame):
+            data = data.to_dict(orient="records")
+
         if not isinstance(data, list):
             data = [data]
 
@@ -218,6 +242,14 @@ class MongoCollectionDataNode(DataNode):
         Parameters:
             data (Any): the data to write to the database.
         """
+        if isinstance(data, Iterator):
+            self.collection.drop()
+            self._append(data)
+            return
+
+        if isinstance(data, pd.DataFrame):
+            data = data.to_dict(orient="records")
+
         if not isinstance(data, list):
             data = [data]
 
@@ -10,8 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
+from functools import reduce
+from importlib import util
+from operator import and_, or_
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,12 +23,21 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..common._check_dependencies import _check_dependency_is_installed
 from ..exceptions.exceptions import UnknownCompressionAlgorithm, UnknownParquetEngine
 from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
+
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
 
 
 class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -45,6 +57,9 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     - *compression* (`Optional[str]`): Name of the compression to use. Possible values
         are *"snappy"*, *"gzip"*, *"brotli"*, or *"none"* (no compression).<br/>
         The default value is *"snappy"*.
+    - *chunk_size* (`int`): The number of rows of the chunks returned by `read_chunks()`. If set,
+        the data is passed to the task functions as an iterator over chunks instead of being read
+        at once.
     - *read_kwargs* (`Optional[dict]`): Additional parameters passed to the
         *pandas.read_parquet()* function when reading the data.<br/>
         The parameters in *"read_kwargs"* have a **higher precedence** than the top-level
@@ -62,6 +77,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     __VALID_COMPRESSION_ALGORITHMS = ["snappy", "gzip", "brotli", "none"]
     __READ_KWARGS_PROPERTY = "read_kwargs"
     __WRITE_KWARGS_PROPERTY = "write_kwargs"
+    __UNSUPPORTED_CHUNKED_WRITE_KWARGS = {"partition_cols", "storage_options"}
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -155,6 +171,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self.__COMPRESSION_PROPERTY,
                 self.__READ_KWARGS_PROPERTY,
                 self.__WRITE_KWARGS_PROPERTY,
+                self._CHUNK_SIZE_PROPERTY,
             }
         )
 
@@ -182,14 +199,47 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         kwargs.update(properties[self.__WRITE_KWARGS_PROPERTY])
         kwargs.update(write_kwargs)
 
-        df = self._convert_data_to_dataframe(properties[self._EXPOSED_TYPE_PROPERTY], data)
+        if self._is_chunked(data):
+            self.__write_chunks(data, **kwargs)
+        else:
+            self.__to_dataframe(data).to_parquet(self._path, **kwargs)
+        self.track_edit(timestamp=datetime.now(), job_id=job_id)
+
+    def __to_dataframe(self, data: Any) -> pd.DataFrame:
+        df = self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
         if isinstance(df, pd.Series):
             df = pd.DataFrame(df)
 
         # Ensure that the columns are strings, otherwise writing will fail with pandas 1.3.5
         df.columns = df.columns.astype(str)
-        df.to_parquet(self._path, **kwargs)
-        self.track_edit(timestamp=datetime.now(), job_id=job_id)
+        return df
+
+    def __write_chunks(self, chunks: Iterator, engine: str, index: Optional[bool] = False, **kwargs):
+        """Write each chunk of data as a row group of the Parquet file.
+
+        The keyword arguments of `pandas.DataFrame.to_parquet()` are forwarded to the pyarrow
+        writer, except the ones that need the whole data at once.
+        """
+        _check_dependency_is_installed("Parquet Data Node", "pyarrow")
+        if engine != "pyarrow":
+            raise NotImplementedError(f"Writing chunks of data is not supported by the {engine} engine.")
+        if unsupported := self.__UNSUPPORTED_CHUNKED_WRITE_KWARGS.intersection(kwargs):
+            raise NotImplementedError(f"Writing chunks of data does not support {', '.join(sorted(unsupported))}.")
+        row_group_size = kwargs.pop("row_group_size", None)
+        writer = None
+        try:
+            for chunk in chunks:
+                schema = writer.schema if writer else None
+                table = pa.Table.from_pandas(self.__to_dataframe(chunk), schema=schema, preserve_index=index)
+                if writer is None:
+                    writer = pq.ParquetWriter(self._path, table.schema, **kwargs)
+                writer.write_table(table, row_group_size=row_group_size)
+            if writer is None:
+                # No chunk: the previous data is replaced by an empty file.
+                pq.write_table(pa.table({}), self._path, **kwargs)
+        finally:
+            if writer is not None:
+                writer.close()
 
     def read_with_kwargs(self, **read_kwargs):
         """Read data from this data node.
@@ -202,6 +252,84 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         """
         return self._read_from_path(**read_kwargs)
 
+    def filter(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+    ):
+        """Read and filter the data referenced by this data node.
+
+        With the *"pyarrow"* engine and a *"pandas"* or custom exposed type, the filters and the
+        column selection are pushed down to the Parquet reader: the row groups whose statistics
+        do not match the filters are skipped, and only the selected columns are read.
+
+        Parameters:
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of
+                3-element tuples, each is in the form of (key, value, `Operator^`). All the rows
+                are returned if no operator is provided.
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[str]]): The names of the columns to read. All the columns
+                are read by default.
+
+        Returns:
+            The filtered data.
+        """
+        if operators and not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        if self.__can_push_down():
+            read_kwargs: Dict[str, Any] = {}
+            if columns:
+                read_kwargs["columns"] = columns
+            if operators:
+                read_kwargs["filters"] = self.__get_filter_expression(operators, join_operator)
+            try:
+                return self._read_from_path(**read_kwargs)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # The filters cannot be evaluated by Arrow (e.g. comparing a date to a string):
+                # fall back to filtering the data in memory.
+                pass
+        data = self._read()
+        if operators:
+            data = _FilterDataNode._filter(data, operators, join_operator)
+        return _FilterDataNode._select_columns(data, columns)
+
+    def __can_push_down(self) -> bool:
+        properties = self.properties
+        return (
+            properties[self.__ENGINE_PROPERTY] == "pyarrow"
+            and util.find_spec("pyarrow") is not None
+            and properties[self._EXPOSED_TYPE_PROPERTY] != self._EXPOSED_TYPE_NUMPY
+        )
+
+    @classmethod
+    def __get_filter_expression(cls, operators: Union[List, Tuple], join_operator) -> "pc.Expression":
+        conditions = [cls.__get_filter_condition_per_key_value(key, value, op) for key, value, op in operators]
+        if join_operator == JoinOperator.AND:
+            return reduce(and_, conditions)
+        if join_operator == JoinOperator.OR:
+            return reduce(or_, conditions)
+        raise NotImplementedError
+
+    @staticmethod
+    def __get_filter_condition_per_key_value(key: str, value, operator: Operator) -> "pc.Expression":
+        field = pc.field(key)
+        if operator == Operator.EQUAL:
+            return field == value
+        if operator == Operator.NOT_EQUAL:
+            # Missing values are different from any value, as in pandas.
+            return (field != value) | field.is_null(nan_is_null=True)
+        if operator == Operator.LESS_THAN:
+            return field < value
+        if operator == Operator.LESS_OR_EQUAL:
+            return field <= value
+        if operator == Operator.GREATER_THAN:
+            return field > value
+        if operator == Operator.GREATER_OR_EQUAL:
+            return field >= value
+        raise NotImplementedError
+
     def _read(self):
         return self._read_from_path()
 
@@ -218,12 +346,10 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
 
         properties = self.properties
 
-        kwargs = properties[self.__READ_KWARGS_PROPERTY]
-        kwargs.update(
-            {
-                self.__ENGINE_PROPERTY: properties[self.__ENGINE_PROPERTY],
-            }
-        )
+        kwargs = {
+            **properties[self.__READ_KWARGS_PROPERTY],
+            self.__ENGINE_PROPERTY: properties[self.__ENGINE_PROPERTY],
+        }
         kwargs.update(read_kwargs)
         return self._do_read_from_path(path, properties[self._EXPOSED_TYPE_PROPERTY], kwargs)
 
@@ -245,7 +371,18 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read_as_pandas_dataframe(self, path: str, read_kwargs: Dict) -> pd.DataFrame:
         return pd.read_parquet(path, **read_kwargs)
 
+    def _read_chunks(self, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator:
+        _check_dependency_is_installed("Parquet Data Node", "pyarrow")
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        # The batches are read from one row group at a time, and never span several row groups.
+        for batch in ds.dataset(self._path, format="parquet").to_batches(columns=columns, batch_size=chunk_size):
+            yield self._convert_dataframe_to_exposed_type(exposed_type, batch.to_pandas())
+
     def _append(self, data: Any):
+        if self._is_chunked(data):
+            for chunk in data:
+                self._append(chunk)
+            return
         self._write_with_kwargs(data, engine="fastparquet", append=True)
 
     def _write(self, data: Any):
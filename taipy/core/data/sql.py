@@ -52,6 +52,9 @@ class SQLDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *chunk_size* (`int`): The number of rows of the chunks returned by `read_chunks()`. If set,
+        the data is passed to the task functions as an iterator over chunks instead of being read
+        at once.
     """
 
     __STORAGE_TYPE = "sql"
@@ -46,6 +46,9 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *chunk_size* (`int`): The number of rows of the chunks returned by `read_chunks()`. If set,
+        the data is passed to the task functions as an iterator over chunks instead of being read
+        at once.
     """
 
     __STORAGE_TYPE = "sql_table"
@@ -104,6 +107,17 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     def __insert_data(self, data, engine, connection, delete_table: bool = False) -> None:
         table = self._create_table(engine)
+        if self._is_chunked(data):
+            # The chunks are inserted one at a time, within the transaction of the write.
+            self.__delete_all_rows(table, connection, delete_table)
+            for chunk in data:
+                self._insert_dataframe(
+                    self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], chunk),
+                    table,
+                    connection,
+                    delete_table=False,
+                )
+            return
         self._insert_dataframe(
             self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data),
             table,
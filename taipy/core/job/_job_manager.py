@@ -26,6 +26,7 @@ from .job_id import JobId
 
 class _JobManager(_Manager[Job], _VersionMixin):
     _ENTITY_NAME = Job.__name__
+    _ARCHIVE_NAME = "jobs"
     _ID_PREFIX = "JOB_"
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.JOB
@@ -42,21 +43,32 @@ class _JobManager(_Manager[Job], _VersionMixin):
     def _create(
         cls, task: Task, callbacks: Iterable[Callable], submit_id: str, submit_entity_id: str, force=False
     ) -> Job:
-        version = _VersionManagerFactory._build_manager()._get_latest_version()
-        job = Job(
-            id=JobId(f"{Job._ID_PREFIX}_{task.config_id}_{uuid.uuid4()}"),
-            task=task,
-            submit_id=submit_id,
-            submit_entity_id=submit_entity_id,
-            force=force,
-            version=version,
-        )
-        job._on_status_change(*callbacks)
-        cls._set(job)
-
-        Notifier.publish(_make_event(job, EventOperation.CREATION))
+        return cls._bulk_create([task], callbacks, submit_id, submit_entity_id, force=force)[0]
 
-        return job
+    @classmethod
+    def _bulk_create(
+        cls, tasks: Iterable[Task], callbacks: Iterable[Callable], submit_id: str, submit_entity_id: str, force=False
+    ) -> List[Job]:
+        version = _VersionManagerFactory._build_manager()._get_latest_version()
+        callbacks = list(callbacks)
+        jobs = []
+        for task in tasks:
+            job = Job(
+                id=JobId(f"{Job._ID_PREFIX}_{task.config_id}_{uuid.uuid4()}"),
+                task=task,
+                submit_id=submit_id,
+                submit_entity_id=submit_entity_id,
+                force=force,
+                version=version,
+            )
+            job._on_status_change(*callbacks)
+            jobs.append(job)
+        cls._set_many(jobs)
+
+        for job in jobs:
+            Notifier.publish(_make_event(job, EventOperation.CREATION))
+
+        return jobs
 
     @classmethod
     def _delete(cls, job: Union[Job, JobId], force=False) -> None:
@@ -79,13 +91,7 @@ class _JobManager(_Manager[Job], _VersionMixin):
 
     @classmethod
     def _get_latest(cls, task: Task) -> Optional[Job]:
-        jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
-        if len(jobs_of_task) == 0:
-            return None
-        if len(jobs_of_task) == 1:
-            return jobs_of_task[0]
-        else:
-            return max(jobs_of_task)
+        return cls._repository._load_latest("task_id", task.id, cls._build_filters_with_version(None))
 
     @classmethod
     def _is_deletable(cls, job: Union[Job, JobId]) -> ReasonCollection:
@@ -9,8 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from queue import SimpleQueue
-from typing import Optional
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import Optional, Union
 from uuid import uuid4
 
 from ._topic import _Topic
@@ -19,6 +19,12 @@ from .registration_id import RegistrationId
 
 
 class _Registration:
+    """A registration of a listener to a topic.
+
+    If *max_queue_size* is set, the queue of the registration is bounded: when it is full, the
+    oldest event is dropped to make room for the new one, and the number of dropped events is
+    counted. Publishing an event therefore never blocks on a slow listener.
+    """
 
     _ID_PREFIX = "REGISTRATION"
     __SEPARATOR = "_"
@@ -29,16 +35,34 @@ class _Registration:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
+        max_queue_size: Optional[int] = None,
     ):
 
         self.registration_id: str = self._new_id()
         self.topic: _Topic = _Topic(entity_type, entity_id, operation, attribute_name)
-        self.queue: SimpleQueue = SimpleQueue()
+        self.max_queue_size = max_queue_size if max_queue_size and max_queue_size > 0 else None
+        self.queue: Union[SimpleQueue, Queue] = SimpleQueue() if self.max_queue_size is None else Queue(max_queue_size)
+        self.nb_dropped_events = 0
 
     @staticmethod
     def _new_id() -> RegistrationId:
         """Generate a unique registration identifier."""
         return RegistrationId(_Registration.__SEPARATOR.join([_Registration._ID_PREFIX, str(uuid4())]))
 
+    def _put(self, event) -> None:
+        if self.max_queue_size is None:
+            self.queue.put(event)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except Full:
+                try:
+                    self.queue.get_nowait()
+                    self.nb_dropped_events += 1
+                except Empty:
+                    pass
+
     def __hash__(self) -> int:
         return hash(self.registration_id)
@@ -9,8 +9,11 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from queue import SimpleQueue
-from typing import Any, Dict, Optional, Set, Tuple
+import threading
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ._registration import _Registration
 from ._topic import _Topic
@@ -50,10 +53,34 @@ def _publish_event(
     Notifier.publish(event)
 
 
+_TopicKey = Tuple[Optional[EventEntityType], Optional[str], Optional[EventOperation]]
+
+
 class Notifier:
-    """A class for managing event registrations and publishing a Taipy application events."""
+    """A class for managing event registrations and publishing a Taipy application events.
+
+    The topics are indexed by entity type, entity id and operation, with a wildcard bucket (None)
+    for each of them, and then by attribute name. Finding the registrations matching an event
+    therefore only looks up a few buckets, whatever the number of registrations.
+
+    By default, events are delivered to the registration queues while being published. Once
+    `Notifier.start_async_delivery()^` is called, publishing only adds the event to a bounded
+    queue, and a background thread delivers the pending events by batches.
+    """
 
     _topics_registrations_list: Dict[_Topic, Set[_Registration]] = {}
+    _registrations: Dict[str, _Registration] = {}
+    _topics_index: Dict[_TopicKey, Dict[Optional[str], Set[_Topic]]] = {}
+
+    _DEFAULT_MAX_PENDING_EVENTS = 10_000
+    _DEFAULT_BATCH_SIZE = 100
+
+    __lock = threading.RLock()
+    __logger = _TaipyLogger._get_logger()
+    __pending_events: Optional[Queue] = None
+    __delivery_thread: Optional[threading.Thread] = None
+    __batch_size = _DEFAULT_BATCH_SIZE
+    _nb_dropped_events = 0
 
     @classmethod
     def register(
@@ -62,7 +89,8 @@ class Notifier:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
-    ) -> Tuple[str, SimpleQueue]:
+        max_queue_size: Optional[int] = None,
+    ) -> Tuple[str, Union[SimpleQueue, Queue]]:
         """Register a listener for a specific event topic.
 
         The topic is defined by the combination of an optional entity type, an optional
@@ -118,16 +146,25 @@ class Notifier:
             attribute_name (Optional[str]): If provided, the listener will be notified
                 for all events related to this entity's attribute. Otherwise, the listener
                 will be notified for events related to all attributes.
+            max_queue_size (Optional[int]): If provided, the queue holds at most this number of
+                events. When the queue is full, the oldest event is dropped to make room for the
+                new one, so that a slow listener never slows down the application. Otherwise,
+                the queue is not bounded.
 
         Returns:
             A tuple containing the registration id and the event queue.
         """
-        registration = _Registration(entity_type, entity_id, operation, attribute_name)
+        registration = _Registration(entity_type, entity_id, operation, attribute_name, max_queue_size)
+        topic = registration.topic
 
-        if registrations := cls._topics_registrations_list.get(registration.topic, None):
-            registrations.add(registration)
-        else:
-            cls._topics_registrations_list[registration.topic] = {registration}
+        with cls.__lock:
+            if registrations := cls._topics_registrations_list.get(topic, None):
+                registrations.add(registration)
+            else:
+                cls._topics_registrations_list[topic] = {registration}
+                key = (topic.entity_type, topic.entity_id, topic.operation)
+                cls._topics_index.setdefault(key, {}).setdefault(topic.attribute_name, set()).add(topic)
+            cls._registrations[registration.registration_id] = registration
 
         return registration.registration_id, registration.queue
 
@@ -150,19 +187,24 @@ class Notifier:
         Parameters:
             registration_id (`RegistrationId`): The registration id returned by the `register` method.
         """
-        to_remove_registration: Optional[_Registration] = None
-
-        for _, registrations in cls._topics_registrations_list.items():
-            for registration in registrations:
-                if registration.registration_id == registration_id:
-                    to_remove_registration = registration
-                    break
-
-        if to_remove_registration:
-            registrations = cls._topics_registrations_list[to_remove_registration.topic]
-            registrations.remove(to_remove_registration)
+        with cls.__lock:
+            if (registration := cls._registrations.pop(registration_id, None)) is None:
+                return
+            topic = registration.topic
+            registrations = cls._topics_registrations_list.get(topic)
+            if registrations is None:
+                return
+            registrations.discard(registration)
             if len(registrations) == 0:
-                del cls._topics_registrations_list[to_remove_registration.topic]
+                del cls._topics_registrations_list[topic]
+                key = (topic.entity_type, topic.entity_id, topic.operation)
+                if (attributes := cls._topics_index.get(key)) is not None:
+                    if (topics := attributes.get(topic.attribute_name)) is not None:
+                        topics.discard(topic)
+                        if not topics:
+                            del attributes[topic.attribute_name]
+                    if not attributes:
+                        del cls._topics_index[key]
 
     @classmethod
     def publish(cls, event: Event) -> None:
@@ -171,10 +213,137 @@ class Notifier:
         Parameters:
             event (`Event^`): The event to publish.
         """
-        for topic, registrations in cls._topics_registrations_list.items():
-            if Notifier._is_matching(event, topic):
-                for registration in registrations:
-                    registration.queue.put(event)
+        if (pending_events := cls.__pending_events) is not None:
+            try:
+                pending_events.put_nowait(event)
+            except Full:
+                cls._nb_dropped_events += 1
+            return
+        cls.__deliver(event)
+
+    @classmethod
+    def start_async_delivery(
+        cls, max_pending_events: int = _DEFAULT_MAX_PENDING_EVENTS, batch_size: int = _DEFAULT_BATCH_SIZE
+    ) -> None:
+        """Deliver the published events from a background thread.
+
+        Publishing an event then only adds it to a queue of pending events, which a background
+        thread delivers to the registered listeners by batches. When *max_pending_events* events
+        are pending, the newly published events are dropped and counted.
+
+        Parameters:
+            max_pending_events (int): The maximum number of events waiting to be delivered.
+            batch_size (int): The maximum number of events delivered at once.
+        """
+        with cls.__lock:
+            if cls.__delivery_thread is not None:
+                return
+            cls.__batch_size = max(batch_size, 1)
+            cls.__pending_events = Queue(max(max_pending_events, 1))
+            cls.__delivery_thread = threading.Thread(
+                target=cls.__run_delivery, args=(cls.__pending_events,), name="TaipyNotifier", daemon=True
+            )
+            cls.__delivery_thread.start()
+
+    @classmethod
+    def stop_async_delivery(cls, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop delivering the published events from a background thread.
+
+        The events published afterward are delivered while being published.
+
+        Parameters:
+            wait (bool): If True, wait for the pending events to be delivered.
+            timeout (Optional[float]): The maximum time to wait. If None, wait indefinitely.
+        """
+        with cls.__lock:
+            pending_events, thread = cls.__pending_events, cls.__delivery_thread
+            cls.__pending_events = None
+            cls.__delivery_thread = None
+        if pending_events is None or thread is None:
+            return
+        # The end of delivery marker is never dropped, even if the queue is full
+        pending_events.put(None)
+        if wait:
+            thread.join(timeout)
+
+    @classmethod
+    def _get_metrics(cls) -> Dict[str, Any]:
+        with cls.__lock:
+            registrations = list(cls._registrations.values())
+            nb_topics = len(cls._topics_registrations_list)
+        pending_events = cls.__pending_events
+        return {
+            "registrations": len(registrations),
+            "topics": nb_topics,
+            "async_delivery": pending_events is not None,
+            "pending_events": pending_events.qsize() if pending_events is not None else 0,
+            "dropped_events": cls._nb_dropped_events,
+            "dropped_events_by_registration": {
+                registration.registration_id: registration.nb_dropped_events
+                for registration in registrations
+                if registration.nb_dropped_events
+            },
+        }
+
+    @classmethod
+    def _clear(cls) -> None:
+        cls.stop_async_delivery()
+        with cls.__lock:
+            cls._topics_registrations_list = {}
+            cls._registrations = {}
+            cls._topics_index = {}
+            cls._nb_dropped_events = 0
+
+    @classmethod
+    def __deliver(cls, event: Event) -> None:
+        for registration in cls.__get_matching_registrations(event):
+            registration._put(event)
+
+    @classmethod
+    def __get_matching_registrations(cls, event: Event) -> List[_Registration]:
+        matching: List[_Registration] = []
+        with cls.__lock:
+            if not cls._topics_index:
+                return matching
+            for key in cls.__get_topic_keys(event):
+                if (attributes := cls._topics_index.get(key)) is None:
+                    continue
+                # An event that is not related to an attribute matches the topics of all the attributes
+                topics: Iterable[Set[_Topic]] = (
+                    [attributes.get(event.attribute_name, set()), attributes.get(None, set())]
+                    if event.attribute_name
+                    else attributes.values()
+                )
+                for attribute_topics in topics:
+                    for topic in attribute_topics:
+                        matching.extend(cls._topics_registrations_list[topic])
+        return matching
+
+    @staticmethod
+    def __get_topic_keys(event: Event) -> Set[_TopicKey]:
+        return {
+            (entity_type, entity_id, operation)
+            for entity_type in {event.entity_type, None}
+            for entity_id in {event.entity_id, None}
+            for operation in {event.operation, None}
+        }
+
+    @classmethod
+    def __run_delivery(cls, pending_events: Queue) -> None:
+        while True:
+            batch = [pending_events.get()]
+            try:
+                while len(batch) < cls.__batch_size:
+                    batch.append(pending_events.get_nowait())
+            except Empty:
+                pass
+            for event in batch:
+                if event is None:
+                    return
+                try:
+                    cls.__deliver(event)
+                except Exception as e:
+                    cls.__logger.error(f"Failed to deliver event {event}: {e}")
 
     @staticmethod
     def _is_matching(event: Event, topic: _Topic) -> bool:
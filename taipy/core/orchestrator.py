@@ -16,6 +16,7 @@ from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ._cli._core_cli_factory import _CoreCLIFactory
+from ._entity._history_compaction import _compact_history
 from ._orchestrator._dispatcher._job_dispatcher import _JobDispatcher
 from ._orchestrator._orchestrator import _Orchestrator
 from ._orchestrator._orchestrator_factory import _OrchestratorFactory
@@ -54,6 +55,7 @@ class Orchestrator:
         """ Start the Orchestrator service.
 
         This function checks and locks the configuration, manages application's version,
+        compacts the history of jobs and submissions if a retention policy is configured,
         and starts a job dispatcher.
         """
         if self.__class__._is_running:
@@ -63,6 +65,7 @@ class Orchestrator:
             self.__class__._is_running = True
 
         self._manage_version_and_block_config()
+        self.__compact_history()
         self.__start_dispatcher(force_restart)
         self.__logger.info("Orchestrator service has been started.")
 
@@ -121,6 +124,11 @@ class Orchestrator:
         cls.__logger.info("Blocking configuration update...")
         Config.block_update()
 
+    def __compact_history(self):
+        if Config.job_config.has_history_retention:
+            self.__logger.info("Compacting the history of jobs and submissions...")
+            _compact_history()
+
     def __start_dispatcher(self, force_restart):
         self.__logger.info("Starting job dispatcher...")
         if self._orchestrator is None:
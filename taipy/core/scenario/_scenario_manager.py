@@ -185,15 +185,19 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             sequences=sequences,
         )
 
+        tasks_to_update = []
         for task in tasks:
             if scenario_id not in task._parent_ids:
                 task._parent_ids.update([scenario_id])
-                _task_manager._set(task)
+                tasks_to_update.append(task)
+        _task_manager._set_many(tasks_to_update)
 
+        data_nodes_to_update = []
         for dn in additional_data_nodes.values():
             if scenario_id not in dn._parent_ids:
                 dn._parent_ids.update([scenario_id])
-                _data_manager._set(dn)
+                data_nodes_to_update.append(dn)
+        _data_manager._set_many(data_nodes_to_update)
 
         cls._set(scenario)
 
@@ -136,6 +136,14 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             cls._logger.error(f"Sequence {sequence.id} belongs to a non-existing Scenario {scenario_id}.")
             raise SequenceBelongsToNonExistingScenario(sequence.id, scenario_id)
 
+    @classmethod
+    def _set_many(cls, sequences: Iterable[Sequence]) -> None:
+        """
+        Save or update several Sequences. Sequences are stored within their scenario.
+        """
+        for sequence in sequences:
+            cls._set(sequence)
+
     @staticmethod
     def __get_sequence_tasks(tasks: Union[List[Task], List[TaskId]]) -> List[Task]:
         task_manager = _TaskManagerFactory._build_manager()
@@ -177,20 +185,33 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
     @classmethod
     def _bulk_create_from_scenario(cls, scenario: Scenario) -> Dict[str, Sequence]:
         _sequences: Dict[str, Sequence] = {}
+        tasks_to_update: Dict[str, Task] = {}
 
         for sequence_name, sequence_data in scenario._sequences.items():
-            sequence = cls._create(
+            # A task shared by several sequences is updated once, on the same instance.
+            _tasks = [
+                tasks_to_update.get(task.id, task)
+                for task in cls.__get_sequence_tasks(sequence_data.get(scenario._SEQUENCE_TASKS_KEY, []))
+            ]
+            sequence = cls._build_sequence(
                 sequence_name,
-                sequence_data.get(scenario._SEQUENCE_TASKS_KEY, []),
+                _tasks,
                 sequence_data.get(scenario._SEQUENCE_SUBSCRIBERS_KEY, []),
                 sequence_data.get(scenario._SEQUENCE_PROPERTIES_KEY, {}),
                 scenario.id,
                 scenario.version,
             )
-            if not isinstance(sequence, Sequence):
-                raise NonExistingSequence(sequence_name, scenario.id)
+            for task in _tasks:
+                if sequence.id not in task._parent_ids:
+                    task._parent_ids.update([sequence.id])
+                    tasks_to_update[task.id] = task
             _sequences[sequence_name] = sequence
 
+        _TaskManagerFactory._build_manager()._set_many(tasks_to_update.values())
+
+        for sequence in _sequences.values():
+            if not sequence._is_consistent():
+                raise InvalidSequence(sequence.id)
             Notifier.publish(_make_event(sequence, EventOperation.CREATION))
 
         return _sequences
@@ -252,6 +273,13 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             cls.__log_error_entity_not_found(sequence_id)
             return default
 
+    @classmethod
+    def _get_many(cls, sequences: Iterable[Union[str, Sequence]]) -> List[Sequence]:
+        """
+        Returns several Sequences by id or reference. Missing Sequences are skipped.
+        """
+        return [sequence for sequence in (cls._get(s) for s in sequences) if sequence is not None]
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Sequence]:
         """
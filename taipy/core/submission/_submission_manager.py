@@ -9,9 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from threading import Lock
-from typing import List, Optional, Union
+from threading import Lock, Timer
+from typing import Dict, Iterable, List, Optional, Union
 
+from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity._entity_ids import _EntityIds
@@ -30,9 +31,13 @@ from ..task.task import Task
 
 class _SubmissionManager(_Manager[Submission], _VersionMixin):
     _ENTITY_NAME = Submission.__name__
+    _ARCHIVE_NAME = "submission"
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.SUBMISSION
+    # Guards the per-submission locks
     __lock = Lock()
+    __locks: Dict[str, Lock] = {}
+    __pending_persistences: Dict[str, Timer] = {}
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -55,96 +60,158 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
         return submission
 
     @classmethod
-    def _update_submission_status(cls, submission: Submission, job: Job) -> None:
-        with cls.__lock:
-            submission = cls._get(submission)
+    def _update_submission_status(cls, submission: Submission, job: Job, reload: bool = True) -> None:
+        """Update the status of a submission according to the new status of one of its jobs.
+
+        The job statuses of the submission are tracked in memory by the running, pending and blocked
+        job sets of the submission. Updates of the same submission are serialized by a lock dedicated
+        to the submission, and the submission is persisted at most once per job status change.
+
+        Parameters:
+            submission (Submission^): The submission to update.
+            job (Job^): The job which status changed.
+            reload (bool): If True, the submission is reloaded before being updated. The orchestrator
+                passes False for the submissions it tracks, which hold the current job statuses.
+        """
+        with cls.__get_lock(submission.id):
+            if reload:
+                submission = cls._get(submission, submission)
 
             if submission._submission_status == SubmissionStatus.FAILED:
+                cls.__release(submission.id)
                 return
 
+            previous_submission_status = submission._submission_status
             job_status = job.status
             if job_status == Status.FAILED:
-                cls.__set_submission_status(submission, SubmissionStatus.FAILED, job)
-                cls.__logger.debug(
-                    f"{job.id} status is {job_status}. Submission status set to `{submission._submission_status}`."
-                )
-                return
-            if job_status == Status.CANCELED:
-                submission._is_canceled = True
-            elif job_status == Status.BLOCKED:
-                submission._blocked_jobs.add(job.id)
-                submission._pending_jobs.discard(job.id)
-            elif job_status == Status.PENDING or job_status == Status.SUBMITTED:
-                submission._pending_jobs.add(job.id)
-                submission._blocked_jobs.discard(job.id)
-            elif job_status == Status.RUNNING:
-                submission._running_jobs.add(job.id)
-                submission._pending_jobs.discard(job.id)
-            elif job_status == Status.COMPLETED or job_status == Status.SKIPPED:
-                submission._is_completed = True  # type: ignore
-                submission._blocked_jobs.discard(job.id)
-                submission._pending_jobs.discard(job.id)
-                submission._running_jobs.discard(job.id)
-            elif job_status == Status.ABANDONED:
-                submission._is_abandoned = True  # type: ignore
-                submission._running_jobs.discard(job.id)
-                submission._blocked_jobs.discard(job.id)
-                submission._pending_jobs.discard(job.id)
-            cls._set(submission)
-
-            # The submission_status is set later to make sure notification for updating
-            # the submission_status attribute is triggered
-            if submission._is_canceled:
-                cls.__set_submission_status(submission, SubmissionStatus.CANCELED, job)
-            elif submission._is_abandoned:
-                cls.__set_submission_status(submission, SubmissionStatus.UNDEFINED, job)
-            elif submission._running_jobs:
-                cls.__set_submission_status(submission, SubmissionStatus.RUNNING, job)
-            elif submission._pending_jobs:
-                cls.__set_submission_status(submission, SubmissionStatus.PENDING, job)
-            elif submission._blocked_jobs:
-                cls.__set_submission_status(submission, SubmissionStatus.BLOCKED, job)
-            elif submission._is_completed:
-                cls.__set_submission_status(submission, SubmissionStatus.COMPLETED, job)
+                submission._submission_status = SubmissionStatus.FAILED
             else:
-                cls.__set_submission_status(submission, SubmissionStatus.UNDEFINED, job)
+                cls.__track_job_status(submission, job)
+                submission._submission_status = cls.__compute_submission_status(submission)
+            status_changed = previous_submission_status != submission._submission_status
+            cls.__persist(submission, reload, status_changed)
             cls.__logger.debug(
                 f"{job.id} status is {job_status}. Submission status set to `{submission._submission_status}`."
             )
 
+            if status_changed:
+                event = _make_event(
+                    submission,
+                    EventOperation.UPDATE,
+                    "submission_status",
+                    submission._submission_status,
+                    job_triggered_submission_status_changed=job.id,
+                )
+                if not submission._is_in_context:
+                    Notifier.publish(event)
+                else:
+                    submission._in_context_attributes_changed_collector.append(event)
+
+    @staticmethod
+    def __track_job_status(submission: Submission, job: Job) -> None:
+        job_status = job.status
+        if job_status == Status.CANCELED:
+            submission._is_canceled = True
+        elif job_status == Status.BLOCKED:
+            submission._blocked_jobs.add(job.id)
+            submission._pending_jobs.discard(job.id)
+        elif job_status == Status.PENDING or job_status == Status.SUBMITTED:
+            submission._pending_jobs.add(job.id)
+            submission._blocked_jobs.discard(job.id)
+        elif job_status == Status.RUNNING:
+            submission._running_jobs.add(job.id)
+            submission._pending_jobs.discard(job.id)
+        elif job_status == Status.COMPLETED or job_status == Status.SKIPPED:
+            submission._is_completed = True  # type: ignore
+            submission._blocked_jobs.discard(job.id)
+            submission._pending_jobs.discard(job.id)
+            submission._running_jobs.discard(job.id)
+        elif job_status == Status.ABANDONED:
+            submission._is_abandoned = True  # type: ignore
+            submission._running_jobs.discard(job.id)
+            submission._blocked_jobs.discard(job.id)
+            submission._pending_jobs.discard(job.id)
+
+    @staticmethod
+    def __compute_submission_status(submission: Submission) -> SubmissionStatus:
+        if submission._is_canceled:
+            return SubmissionStatus.CANCELED
+        if submission._is_abandoned:
+            return SubmissionStatus.UNDEFINED
+        if submission._running_jobs:
+            return SubmissionStatus.RUNNING
+        if submission._pending_jobs:
+            return SubmissionStatus.PENDING
+        if submission._blocked_jobs:
+            return SubmissionStatus.BLOCKED
+        if submission._is_completed:
+            return SubmissionStatus.COMPLETED
+        return SubmissionStatus.UNDEFINED
+
     @classmethod
-    def __set_submission_status(cls, submission: Submission, new_submission_status: SubmissionStatus, job: Job) -> None:
-        if not submission._is_in_context:
-            submission = cls._get(submission)
-        _current_submission_status = submission._submission_status
-        submission._submission_status = new_submission_status
+    def __persist(cls, submission: Submission, reload: bool, status_changed: bool) -> None:
+        # Finished or abandoned submissions are not updated anymore
+        terminal = submission._is_finished() or submission._submission_status == SubmissionStatus.UNDEFINED
+        delay = Config.job_config.submission_status_persistence_delay
+        # A reloaded submission does not hold the job statuses whose persistence is delayed. A status change is
+        # persisted before its event is published, since the event subscribers may reload the submission.
+        if terminal or status_changed or not delay or reload:
+            cls.__cancel_pending_persistence(submission.id)
+            cls._set(submission)
+            if terminal:
+                cls.__release(submission.id)
+            return
+        # The intermediate statuses are persisted once the delay is elapsed, with the latest job statuses
+        if submission.id not in cls.__pending_persistences:
+            timer = Timer(float(delay), cls.__persist_pending, args=(submission,))
+            timer.daemon = True
+            cls.__pending_persistences[submission.id] = timer
+            timer.start()
 
-        cls._set(submission)
+    @classmethod
+    def __persist_pending(cls, submission: Submission) -> None:
+        with cls.__get_lock(submission.id):
+            # The submission may have been deleted in the meantime
+            if cls.__pending_persistences.pop(submission.id, None) is not None and cls._exists(submission.id):
+                cls._set(submission)
 
-        if _current_submission_status != submission._submission_status:
-            event = _make_event(
-                submission,
-                EventOperation.UPDATE,
-                "submission_status",
-                submission._submission_status,
-                job_triggered_submission_status_changed=job.id,
-            )
+    @classmethod
+    def __cancel_pending_persistence(cls, submission_id: str) -> None:
+        if timer := cls.__pending_persistences.pop(submission_id, None):
+            timer.cancel()
 
-            if not submission._is_in_context:
-                Notifier.publish(event)
-            else:
-                submission._in_context_attributes_changed_collector.append(event)
+    @classmethod
+    def __release(cls, submission_id: str) -> None:
+        cls.__cancel_pending_persistence(submission_id)
+        cls.__locks.pop(submission_id, None)
+
+    @classmethod
+    def __forget(cls, submission_ids: Optional[Iterable[str]] = None) -> None:
+        """Release the deleted submissions, or all the submissions if *submission_ids* is None."""
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        if submission_ids is None:
+            for timer in list(cls.__pending_persistences.values()):
+                timer.cancel()
+            cls.__pending_persistences.clear()
+            cls.__locks.clear()
+        else:
+            for submission_id in submission_ids:
+                cls.__release(submission_id)
+        if orchestrator := _OrchestratorFactory._orchestrator:
+            orchestrator._on_submissions_deleted(submission_ids)
+
+    @classmethod
+    def __get_lock(cls, submission_id: str) -> Lock:
+        with cls.__lock:
+            if (lock := cls.__locks.get(submission_id)) is None:
+                lock = cls.__locks[submission_id] = Lock()
+            return lock
 
     @classmethod
     def _get_latest(cls, entity: Union[Scenario, Sequence, Task]) -> Optional[Submission]:
         entity_id = entity.id if not isinstance(entity, str) else entity
-        submissions_of_task = list(filter(lambda submission: submission.entity_id == entity_id, cls._get_all()))
-        if len(submissions_of_task) == 0:
-            return None
-        if len(submissions_of_task) == 1:
-            return submissions_of_task[0]
-        else:
-            return max(submissions_of_task)
+        return cls._repository._load_latest("entity_id", entity_id, cls._build_filters_with_version(None))
 
     @classmethod
     def _delete(cls, submission: Union[Submission, SubmissionId]) -> None:
@@ -152,11 +219,29 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
             submission = cls._get(submission)
         if cls._is_deletable(submission):
             super()._delete(submission.id)
+            cls.__forget([submission.id])
         else:
             err = SubmissionNotDeletedException(submission.id)
             cls._logger.error(err)
             raise err
 
+    @classmethod
+    def _delete_many(cls, ids: Iterable) -> None:
+        ids = list(ids)
+        super()._delete_many(ids)
+        cls.__forget(ids)
+
+    @classmethod
+    def _delete_all(cls) -> None:
+        super()._delete_all()
+        cls.__forget()
+
+    @classmethod
+    def _delete_by_version(cls, version_number: str) -> None:
+        submission_ids = [submission.id for submission in cls._get_all(version_number)]
+        super()._delete_by_version(version_number)
+        cls.__forget(submission_ids)
+
     @classmethod
     def _hard_delete(cls, submission_id: SubmissionId) -> None:
         submission = cls._get(submission_id)
@@ -217,7 +217,7 @@ class Submission(_Entity, _Labeled):
         from ..job._job_manager_factory import _JobManagerFactory
 
         job_manager = _JobManagerFactory._build_manager()
-        return [job_manager._get(job) for job in self._jobs]
+        return job_manager._get_many(self._jobs)
 
     @jobs.setter  # type: ignore
     @_self_setter(_MANAGER_NAME)
@@ -307,6 +307,20 @@ class Submission(_Entity, _Labeled):
             SubmissionStatus.CANCELED,
         ]
 
+    def _is_finished(self) -> bool:
+        """Indicate if the submission is finished.
+
+        This function will not trigger the persistence feature unlike is_finished().
+
+        Returns:
+            True if the submission is finished.
+        """
+        return self._submission_status in [
+            SubmissionStatus.COMPLETED,
+            SubmissionStatus.FAILED,
+            SubmissionStatus.CANCELED,
+        ]
+
     def is_deletable(self) -> ReasonCollection:
         """Indicate if the submission can be deleted.
 
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Callable, List, Optional, Type, Union, cast
+from typing import Callable, Iterable, List, Optional, Type, Union, cast
 
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
@@ -57,6 +57,16 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         cls.__save_data_nodes(task.output.values())
         super()._set(task)
 
+    @classmethod
+    def _set_many(cls, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        data_nodes = {}
+        for task in tasks:
+            data_nodes.update((dn.id, dn) for dn in task.input.values())
+            data_nodes.update((dn.id, dn) for dn in task.output.values())
+        _DataManagerFactory._build_manager()._set_many(data_nodes.values())
+        super()._set_many(tasks)
+
     @classmethod
     def _bulk_get_or_create(
         cls,
@@ -94,6 +104,7 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         )
 
         tasks = []
+        new_tasks = []
         for task_config, owner_id in tasks_configs_and_owner_id:
             if task := tasks_by_config.get((task_config, owner_id)):
                 tasks.append(task)
@@ -122,9 +133,12 @@ class _TaskManager(_Manager[Task], _VersionMixin):
                 )
                 for dn in set(inputs + outputs):
                     dn._parent_ids.update([task.id])
-                cls._set(task)
-                Notifier.publish(_make_event(task, EventOperation.CREATION))
+                new_tasks.append(task)
                 tasks.append(task)
+
+        cls._set_many(new_tasks)
+        for task in new_tasks:
+            Notifier.publish(_make_event(task, EventOperation.CREATION))
         return tasks
 
     @classmethod
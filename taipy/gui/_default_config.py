@@ -47,6 +47,7 @@ default_config: Config = {
     "chart_dark_template": None,
     "base_url": "/",
     "client_url": "http://localhost:{port}",
+    "core_changed_delay": 100,
     "dark_mode": True,
     "dark_theme": None,
     "debug": False,
@@ -73,9 +74,12 @@ default_config: Config = {
     "time_zone": None,
     "title": None,
     "stylekit": _default_stylekit.copy(),
+    "table_cache_size": 256 * 1024 * 1024,
     "upload_folder": None,
     "use_arrow": False,
     "use_reloader": False,
     "watermark": "Taipy inside",
     "webapp_path": None,
+    "ws_queue_overflow": "block",
+    "ws_queue_size": 1000,
 }
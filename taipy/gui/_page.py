@@ -17,6 +17,8 @@ import re
 import typing as t
 import warnings
 
+from .utils._page_cache import _RenderedPage
+
 if t.TYPE_CHECKING:
     from ._renderers import Page
     from .gui import Gui
@@ -36,7 +38,12 @@ class _Page(object):
     def render(self, gui: Gui, silent: t.Optional[bool] = False):
         if self._renderer is None:
             raise RuntimeError(f"Can't render page {self._route}: no renderer found")
-        with warnings.catch_warnings(record=True) as w:
+        content = self._renderer._get_content_key()
+        if not silent and content is not None and (rendered := gui._get_rendered_page(self, content)) is not None:
+            self._rendered_jsx = rendered.jsx
+            self._head = rendered.head
+            return rendered.module_name
+        with warnings.catch_warnings(record=True) as w, gui._collect_render_dependencies() as dependencies:
             warnings.resetwarnings()
             with gui._set_locals_context(self._renderer._get_module_name()):
                 self._rendered_jsx = self._renderer.render(gui)
@@ -66,4 +73,12 @@ class _Page(object):
         if hasattr(self._renderer, "head"):
             self._head = list(self._renderer.head)  # type: ignore
         # return renderer module_name from frame
-        return self._renderer._get_module_name()
+        module_name = self._renderer._get_module_name()
+        if content is not None:
+            gui._set_rendered_page(
+                self,
+                content,
+                dependencies,
+                None if silent else _RenderedPage(content, self._rendered_jsx, self._head, module_name),
+            )
+        return module_name
@@ -112,6 +112,9 @@ class _Renderer(Page, ABC):
                 return
             self._notebook_gui._navigate(self._notebook_page._route, {"tp_reload_same_route_only": "true"})
 
+    def _get_content_key(self) -> t.Any:
+        return self._content
+
     def _get_content_detail(self, gui: "Gui") -> str:
         if self._filepath:
             return f"in file '{self._filepath}'"
@@ -55,6 +55,10 @@ class Page(_Renderer):
             element = _DefaultBlock()
         kwargs["content"] = element
         super().__init__(**kwargs)
+        self.__content_version = 0
+
+    def _get_content_key(self) -> t.Any:
+        return (self._base_element, self.__content_version)
 
     # Generate JSX from Element Object
     def render(self, gui) -> str:
@@ -68,6 +72,7 @@ class Page(_Renderer):
         for element in elements:
             if element not in self._base_element._children:
                 self._base_element._children.append(element)
+        self.__content_version += 1
         return self
 
     def __enter__(self):
@@ -80,3 +85,4 @@ class Page(_Renderer):
 
     def __exit__(self, exc_type, exc_value, traceback):
         _BuilderContextManager().pop()
+        self.__content_version += 1
@@ -35,6 +35,7 @@ ConfigParameter = t.Literal[
     "chart_dark_template",
     "base_url",
     "client_url",
+    "core_changed_delay",
     "dark_mode",
     "dark_theme",
     "data_url_max_size",
@@ -62,11 +63,14 @@ ConfigParameter = t.Literal[
     "title",
     "state_retention_period",
     "stylekit",
+    "table_cache_size",
     "upload_folder",
     "use_arrow",
     "use_reloader",
     "watermark",
     "webapp_path",
+    "ws_queue_overflow",
+    "ws_queue_size",
 ]
 
 Stylekit = t.TypedDict(
@@ -109,6 +113,7 @@ Config = t.TypedDict(
         "chart_dark_template": t.Optional[t.Dict[str, t.Any]],
         "base_url": t.Optional[str],
         "client_url": str,
+        "core_changed_delay": t.Optional[int],
         "dark_mode": bool,
         "dark_theme": t.Optional[t.Dict[str, t.Any]],
         "data_url_max_size": t.Optional[int],
@@ -132,6 +137,7 @@ Config = t.TypedDict(
         "single_client": bool,
         "state_retention_period": int,
         "stylekit": t.Union[bool, Stylekit],
+        "table_cache_size": int,
         "system_notification": bool,
         "theme": t.Optional[t.Dict[str, t.Any]],
         "time_zone": t.Optional[str],
@@ -141,6 +147,8 @@ Config = t.TypedDict(
         "use_reloader": bool,
         "watermark": t.Optional[str],
         "webapp_path": t.Optional[str],
+        "ws_queue_overflow": t.Literal["block", "drop"],
+        "ws_queue_size": int,
     },
     total=False,
 )
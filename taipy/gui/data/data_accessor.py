@@ -64,6 +64,9 @@ class _DataAccessor(ABC):
     def to_csv(self, var_name: str, value: t.Any) -> t.Optional[str]:
         pass
 
+    def _invalidate(self, value: t.Any) -> None:  # noqa: B027
+        """Drop any cached result computed on *value*, which may have been modified in place."""
+
 
 class _InvalidDataAccessor(_DataAccessor):
     @staticmethod
@@ -141,8 +144,17 @@ class _DataAccessors(object):
             return self.__invalid_data_accessor
         return access
 
+    def __get_data_format(self, payload: t.Dict[str, t.Any]) -> _DataFormat:
+        # The client lists the data formats it can decode in the 'data_formats' entry of its requests.
+        # Clients that do not list them are sent the configured data format.
+        formats = payload.get("data_formats")
+        if isinstance(formats, list) and self.__data_format.value not in formats:
+            return _DataFormat.JSON
+        return self.__data_format
+
     def get_data(self, var_name: str, value: _TaipyData, payload: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-        return self.__get_instance(value).get_data(var_name, value.get(), payload, self.__data_format)
+        data_format = self.__get_data_format(payload)
+        return self.__get_instance(value).get_data(var_name, value.get(), payload, data_format)
 
     def get_col_types(self, var_name: str, value: _TaipyData) -> t.Dict[str, str]:
         return self.__get_instance(value).get_col_types(var_name, value.get())
@@ -167,3 +179,7 @@ class _DataAccessors(object):
 
     def to_pandas(self, value: t.Any):
         return self.__get_instance(value).to_pandas(value.get())
+
+    def _invalidate(self, value: t.Any):
+        if access := self.__access_4_type.get(type(value)):
+            access._invalidate(value)
@@ -23,6 +23,8 @@ if t.TYPE_CHECKING:
 class _DataScopes:
     _GLOBAL_ID = "global"
     _META_PRE_RENDER = "pre_render"
+    _META_RENDERED_PAGES = "rendered_pages"
+    _META_UPDATED_VARS = "updated_vars"
     _DEFAULT_METADATA = {_META_PRE_RENDER: False}
 
     def __init__(self, gui: "Gui") -> None:
@@ -0,0 +1,134 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+class _Pyramid:
+    """Multi-resolution index of the points of a trace, sorted on x.
+
+    The level *k* splits the points in buckets of 2**k consecutive points, and holds the positions
+    of the first, last, minimum and maximum points of each bucket. Each level is built by merging
+    the pairs of buckets of the previous one. The finest levels are not stored: the windows that
+    would use them are small enough to be read directly.
+
+    Selecting the points of a window then only costs the number of buckets of the chosen level
+    that the window overlaps, plus a few buckets of the finer levels at its edges, whatever the
+    total number of points.
+    """
+
+    _FIRST_LEVEL = 4
+
+    def __init__(self, x: t.Union[pd.Index, pd.Series, np.ndarray], y: t.Union[pd.Series, np.ndarray]) -> None:
+        self.__x: t.Optional[pd.Index] = pd.Index(x, copy=False)
+        self.__levels: t.List[np.ndarray] = []
+        try:
+            y = np.asarray(y, dtype=float)
+        except (TypeError, ValueError):
+            self.__x = None
+        if self.__x is None or not self.__x.is_monotonic_increasing:
+            self.__x = None
+            return
+        # Missing values are never selected as minimum or maximum
+        y_low = np.where(np.isnan(y), np.inf, y)
+        y_high = np.where(np.isnan(y), -np.inf, y)
+        level = _Pyramid.__first_level(y_low, y_high, 1 << _Pyramid._FIRST_LEVEL)
+        self.__levels.append(level)
+        while level.shape[1] > 1:
+            level = _Pyramid.__merge(level, y_low, y_high)
+            self.__levels.append(level)
+
+    @staticmethod
+    def __first_level(y_low: np.ndarray, y_high: np.ndarray, bucket_size: int) -> np.ndarray:
+        nb_points = len(y_low)
+        nb_full = nb_points // bucket_size
+        starts = np.arange(0, nb_points, bucket_size)
+        first = starts
+        last = np.minimum(starts + bucket_size, nb_points) - 1
+        size = nb_full * bucket_size
+        imin = np.argmin(y_low[:size].reshape(nb_full, bucket_size), axis=1) + starts[:nb_full]
+        imax = np.argmax(y_high[:size].reshape(nb_full, bucket_size), axis=1) + starts[:nb_full]
+        if size < nb_points:
+            imin = np.append(imin, size + np.argmin(y_low[size:]))
+            imax = np.append(imax, size + np.argmax(y_high[size:]))
+        return np.stack([first, last, imin, imax])
+
+    @staticmethod
+    def __merge(level: np.ndarray, y_low: np.ndarray, y_high: np.ndarray) -> np.ndarray:
+        nb_pairs = level.shape[1] // 2
+        left = level[:, : 2 * nb_pairs : 2]
+        right = level[:, 1 : 2 * nb_pairs : 2]
+        merged = np.stack(
+            [
+                left[0],
+                right[1],
+                np.where(y_low[right[2]] < y_low[left[2]], right[2], left[2]),
+                np.where(y_high[right[3]] > y_high[left[3]], right[3], left[3]),
+            ]
+        )
+        if level.shape[1] % 2:
+            merged = np.concatenate([merged, level[:, -1:]], axis=1)
+        return merged
+
+    @property
+    def nbytes(self) -> int:
+        return sum(level.nbytes for level in self.__levels) + (self.__x.nbytes if self.__x is not None else 0)
+
+    def select(self, x0: t.Any, x1: t.Any, max_buckets: int) -> t.Optional[np.ndarray]:
+        """Return the sorted positions of the points to keep in the ]x0, x1[ window.
+
+        The points of the window are grouped in at most *max_buckets* buckets, and the first,
+        last, minimum and maximum points of each bucket are kept. All the points of the window are
+        returned when it is small enough.<br/>
+        None is returned if the index cannot be used (the x values are not sorted, or the y
+        values are not numerical) or if the window bounds cannot be compared with the x values.
+        """
+        if self.__x is None or max_buckets < 1:
+            return None
+        if is_numeric_dtype(self.__x.dtype) and not all(isinstance(v, (Number, type(None))) for v in (x0, x1)):
+            return None
+        try:
+            start = 0 if x0 is None else int(self.__x.searchsorted(x0, side="right"))
+            end = len(self.__x) if x1 is None else int(self.__x.searchsorted(x1, side="left"))
+        except (TypeError, ValueError):
+            return None
+        nb_points = end - start
+        if nb_points <= 0:
+            return np.empty(0, dtype=int)
+        # The level of the smallest buckets that splits the window in at most max_buckets buckets
+        level_index = int(np.ceil(np.log2(max(nb_points / max_buckets, 1)))) - _Pyramid._FIRST_LEVEL
+        if level_index < 0:
+            return np.arange(start, end)
+        level_index = min(level_index, len(self.__levels) - 1)
+        return np.unique(np.concatenate(self.__cover(start, end, level_index)))
+
+    def __cover(self, start: int, end: int, level_index: int) -> t.List[np.ndarray]:
+        # The buckets of the level that are inside the window, with the parts of the window on each
+        # side covered by the finer levels, so that the extremes of the partial buckets are kept.
+        if end <= start:
+            return []
+        if level_index < 0:
+            return [np.arange(start, end)]
+        bucket_size = 1 << (level_index + _Pyramid._FIRST_LEVEL)
+        first_bucket = -(-start // bucket_size)
+        end_bucket = end // bucket_size
+        if first_bucket >= end_bucket:
+            return self.__cover(start, end, level_index - 1)
+        return [
+            *self.__cover(start, first_bucket * bucket_size, level_index - 1),
+            self.__levels[level_index][:, first_bucket:end_bucket].ravel(),
+            *self.__cover(end_bucket * bucket_size, end, level_index - 1),
+        ]
@@ -39,6 +39,7 @@ class Decimator(ABC):
         zoom: t.Optional[bool],
         # apply_decimator: t.Optional[t.Callable] = None,
         # on_decimate: t.Optional[t.Callable] = None,
+        pyramid_threshold: t.Optional[int] = None,
     ) -> None:  # noqa: E501
         """Initialize a new `Decimator`.
 
@@ -47,6 +48,11 @@ class Decimator(ABC):
                 decimator class is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid_threshold (Optional[int]): The minimum amount of data points from which a
+                multi-resolution index of the trace is built, when the data changes, and used
+                to only process the visible data points on each zoom or re-layout event.<br/>
+                The index is only used for line charts whose x values are sorted. The default
+                value is None, meaning that no index is built.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
@@ -55,6 +61,7 @@ class Decimator(ABC):
         super().__init__()
         self.threshold = threshold
         self._zoom = zoom if zoom is not None else True
+        self._pyramid_threshold = pyramid_threshold
         self.__user_defined_on_decimate = None
         self.__user_defined_apply_decimator = None
 
@@ -70,6 +77,36 @@ class Decimator(ABC):
             return True
         return False
 
+    def _get_pyramid_query(
+        self,
+        nb_rows: int,
+        decimator_instance_payload: t.Dict[str, t.Any],
+        decimator_payload: t.Dict[str, t.Any],
+    ) -> t.Optional[t.Tuple[t.Any, t.Any, int]]:
+        """Return the x range and maximum number of buckets to select from the multi-resolution index
+        of the trace, or None if the index should not be used."""
+        if self._pyramid_threshold is None or nb_rows < self._pyramid_threshold:
+            return None
+        if decimator_instance_payload.get("zAxis") or decimator_instance_payload.get("chartMode") not in [
+            "lines+markers",
+            "lines",
+        ]:
+            return None
+        nb_rows_max = decimator_payload.get("width")
+        if not nb_rows_max:
+            return None
+        relayout_data = decimator_payload.get("relayoutData") if self._zoom else None
+        relayout_data = relayout_data if isinstance(relayout_data, dict) else {}
+        return (
+            relayout_data.get("xaxis.range[0]"),
+            relayout_data.get("xaxis.range[1]"),
+            self._get_nb_points_out(nb_rows_max),
+        )
+
+    def _get_nb_points_out(self, nb_rows_max: int) -> int:
+        """Return the maximum number of points the decimation produces."""
+        return nb_rows_max
+
     def __get_indexed_df_col(self, df):
         index = 0
         while f"tAiPy_index_{index}" in df.columns:
@@ -35,6 +35,7 @@ class LTTB(Decimator):
         zoom: t.Optional[bool] = True,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
+        pyramid_threshold: t.Optional[int] = None,
     ) -> None:
         """Initialize a new `LTTB`.
 
@@ -44,19 +45,24 @@ class LTTB(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid_threshold (Optional[int]): The minimum amount of data points from which a
+                multi-resolution index of the trace is built, so that zoom and re-layout events
+                only process the visible data points. The x values must be sorted.<br/>
+                The default value is None, meaning that no index is built.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid_threshold=pyramid_threshold)
         self._n_out = n_out
 
     @staticmethod
-    def _areas_of_triangles(a, bs, c):
-        bs_minus_a = bs - a
-        a_minus_bs = a - bs
-        return 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
+    def _areas_of_triangles(a_x, a_y, bs_x, bs_y, c_x, c_y):
+        return 0.5 * np.abs((a_x - c_x) * (bs_y - a_y) - (a_x - bs_x) * (c_y - a_y))
+
+    def _get_nb_points_out(self, nb_rows_max: int) -> int:
+        return self._n_out
 
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         n_out = self._n_out
@@ -67,11 +73,26 @@ class LTTB(Decimator):
             raise ValueError("Can only down-sample to a minimum of 3 points")
 
         # Split data into bins
+        # The inner points are split as np.array_split does: the first bins hold one more point.
         n_bins = n_out - 2
-        data_bins = np.array_split(data[1:-1], n_bins)
-
-        prev_a = data[0]
-        start_pos = 0
+        inner = data[1:-1]
+        bin_size, n_larger = divmod(len(inner), n_bins)
+        larger_size = n_larger * (bin_size + 1)
+        bin_starts = np.concatenate(
+            ([0], np.arange(1, n_bins) * bin_size + np.minimum(np.arange(1, n_bins), n_larger), [len(inner)])
+        )
+
+        # The centroid of the points in the next bin of each bin, computed on all the bins at once.
+        # The next bin of the last bin is the last point.
+        centroids = np.concatenate(
+            (
+                inner[:larger_size].reshape(n_larger, bin_size + 1, data.shape[1]).mean(axis=1),
+                inner[larger_size:].reshape(n_bins - n_larger, bin_size, data.shape[1]).mean(axis=1),
+                data[-1:],
+            )
+        )[1:]
+        x = inner[:, 0]
+        y = inner[:, 1]
 
         # Prepare output mask array
         # First and last points are the same as in the input.
@@ -83,17 +104,15 @@ class LTTB(Decimator):
         # In each bin, find the point that makes the largest triangle
         # with the point saved in the previous bin
         # and the centroid of the points in the next bin.
-        for i in range(len(data_bins)):
-            this_bin = data_bins[i]
-            next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
-            a = prev_a
-            bs = this_bin
-            c = next_bin.mean(axis=0)
-
-            areas = LTTB._areas_of_triangles(a, bs, c)
+        a_x, a_y = data[0, 0], data[0, 1]
+        for i in range(n_bins):
+            start_pos, end_pos = bin_starts[i], bin_starts[i + 1]
+            c_x, c_y = centroids[i, 0], centroids[i, 1]
+            bs_x = x[start_pos:end_pos]
+            bs_y = y[start_pos:end_pos]
+            areas = LTTB._areas_of_triangles(a_x, a_y, bs_x, bs_y, c_x, c_y)
             bs_pos = np.argmax(areas)
-            prev_a = bs[bs_pos]
+            a_x, a_y = bs_x[bs_pos], bs_y[bs_pos]
             out_mask[start_pos + bs_pos] = True
-            start_pos += len(this_bin)
 
         return out_mask
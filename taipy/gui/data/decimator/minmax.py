@@ -34,6 +34,7 @@ class MinMaxDecimator(Decimator):
         zoom: t.Optional[bool] = True,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
+        pyramid_threshold: t.Optional[int] = None,
     ):
         """Initialize a new `MinMaxDecimator`.
 
@@ -43,14 +44,21 @@ class MinMaxDecimator(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid_threshold (Optional[int]): The minimum amount of data points from which a
+                multi-resolution index of the trace is built, so that zoom and re-layout events
+                only process the visible data points. The x values must be sorted.<br/>
+                The default value is None, meaning that no index is built.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid_threshold=pyramid_threshold)
         self._n_out = n_out // 2
 
+    def _get_nb_points_out(self, nb_rows_max: int) -> int:
+        return self._n_out * 2
+
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         if self._n_out >= data.shape[0]:
             return np.full(len(data), False)
@@ -28,6 +28,9 @@ class RDP(Decimator):
 
     _CHART_MODES = ["lines+markers", "lines", "markers"]
 
+    # Segments with fewer points are processed together
+    __MIN_SLICED_LENGTH = 1_024
+
     def __init__(
         self,
         epsilon: t.Optional[int] = None,
@@ -36,6 +39,7 @@ class RDP(Decimator):
         zoom: t.Optional[bool] = True,
         # on_decimate: t.Optional[t.Callable] = None,
         # apply_decimator: t.Optional[t.Callable] = None,
+        pyramid_threshold: t.Optional[int] = None,
     ):
         """Initialize a new `RDP`.
 
@@ -50,65 +54,121 @@ class RDP(Decimator):
                 decimation is applied.
             zoom (Optional[bool]): set to True to reapply the decimation
                 when zoom or re-layout events are triggered.
+            pyramid_threshold (Optional[int]): The minimum amount of data points from which a
+                multi-resolution index of the trace is built, so that zoom and re-layout events
+                only process the visible data points. The x values must be sorted.<br/>
+                The default value is None, meaning that no index is built.
         """
         # on_decimate (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is found during runtime. This function can be used to provide custom decimation logic.
         # apply_decimator (Optional[Callable]): an user-defined function that is executed when the decimator
         #     is applied to modify the data.
-        super().__init__(threshold, zoom)
+        super().__init__(threshold, zoom, pyramid_threshold=pyramid_threshold)
         self._epsilon = epsilon
         self._n_out = n_out
 
+    def _get_nb_points_out(self, nb_rows_max: int) -> int:
+        return nb_rows_max if self._epsilon or not self._n_out else self._n_out
+
     @staticmethod
     def __dsquared_line_points(P1, P2, points):
         """
         Calculate only squared distance, only needed for comparison
+
+        P1 and P2 are either single points or arrays holding the line points of each point.
         """
-        xdiff = P2[0] - P1[0]
-        ydiff = P2[1] - P1[1]
-        nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+        xdiff = P2[..., 0] - P1[..., 0]
+        ydiff = P2[..., 1] - P1[..., 1]
+        nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[..., 0] * P1[..., 1] - P2[..., 1] * P1[..., 0]) ** 2
         denom = ydiff**2 + xdiff**2
         return np.divide(nom, denom)
 
     @staticmethod
-    def __rdp_epsilon(data, epsilon: int):
-        # initiate mask array
-        # same amount of points
-        mask = np.empty(data.shape[0], dtype=bool)
-
-        # Assume all points are valid and falsify those which are found
-        mask.fill(True)
+    def __max_points(data: np.ndarray, starts: np.ndarray, ends: np.ndarray, dsq_threshold: t.Optional[float] = None):
+        # Find the point between the start and end points of each segment that is the farthest from
+        # the line joining them, as np.argmax finds it on the squared distances of the segment.
+        # Returns the index and squared distance of these points, and whether any point of each
+        # segment is farther than the threshold, if any.
+        lengths = ends - starts - 1
+        indexes = np.empty(len(starts), dtype=int)
+        dsq_max = np.empty(len(starts))
+        above = np.empty(len(starts), dtype=bool)
+        # Long segments are processed one by one on slices of the data, the short ones all at once.
+        is_long = lengths >= RDP.__MIN_SLICED_LENGTH
+        for i in np.flatnonzero(is_long):
+            start, end = starts[i], ends[i]
+            dsq = RDP.__dsquared_line_points(data[start], data[end], data[start + 1 : end])
+            max_dist_index = np.argmax(dsq)
+            indexes[i] = start + 1 + max_dist_index
+            dsq_max[i] = dsq[max_dist_index]
+            if dsq_threshold is not None:
+                # The max distance is NaN if any distance is NaN
+                above[i] = (dsq > dsq_threshold).any() if np.isnan(dsq_max[i]) else dsq_max[i] > dsq_threshold
+        if not is_long.all():
+            is_short = ~is_long
+            lengths = lengths[is_short]
+            offsets = np.cumsum(lengths) - lengths
+            short_starts = starts[is_short]
+            dsq = RDP.__dsquared_line_points(
+                np.repeat(data[short_starts], lengths, axis=0),
+                np.repeat(data[ends[is_short]], lengths, axis=0),
+                data[np.arange(lengths.sum()) + np.repeat(short_starts + 1 - offsets, lengths)],
+            )
+            max_dist_index = RDP.__argmax_segments(lengths, offsets, dsq)
+            indexes[is_short] = short_starts + 1 + max_dist_index - offsets
+            dsq_max[is_short] = dsq[max_dist_index]
+            if dsq_threshold is not None:
+                above[is_short] = np.logical_or.reduceat(dsq > dsq_threshold, offsets)
+        return indexes, dsq_max, above
 
-        # The stack to select start and end index
-        stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]  # type: ignore
-
-        while stack:
-            # Pop the last item
-            (start, end) = stack.pop()
+    @staticmethod
+    def __argmax_segments(lengths: np.ndarray, offsets: np.ndarray, dsq: np.ndarray) -> np.ndarray:
+        # Position in dsq of the first max distance of each segment, as np.argmax returns it on the
+        # distances of the segment: NaN values are the max values.
+        is_nan = np.isnan(dsq)
+        if is_nan.any():
+            has_nan = np.logical_or.reduceat(is_nan, offsets)
+            dsq_max = np.maximum.reduceat(np.where(is_nan, -np.inf, dsq), offsets)
+            candidates = np.where(np.repeat(has_nan, lengths), is_nan, dsq == np.repeat(dsq_max, lengths))
+        else:
+            candidates = dsq == np.repeat(np.maximum.reduceat(dsq, offsets), lengths)
+        positions = np.flatnonzero(candidates)
+        return positions[np.searchsorted(positions, offsets)]
 
+    @staticmethod
+    def __rdp_epsilon(data, epsilon: int):
+        # The start and end indexes of the segments to process, sorted.
+        # All the segments produced by the previous split are processed at once.
+        starts = np.array([0])
+        ends = np.array([data.shape[0] - 1])
+        # The segments whose inner points are redundant
+        dropped_starts: t.List[np.ndarray] = []
+        dropped_ends: t.List[np.ndarray] = []
+
+        while True:
             # nothing to calculate if no points in between
-            if end - start <= 1:
-                continue
-            # Calculate distance to points
-            P1 = data[start]
-            P2 = data[end]
-            points = data[start + 1 : end]
-            dsq = RDP.__dsquared_line_points(P1, P2, points)
-
-            mask_eps = dsq > epsilon**2
-
-            if mask_eps.any():
-                # max point outside eps
-                # Include index that was sliced out
-                # Also include the start index to get absolute index
-                # And not relative
-                mid = np.argmax(dsq) + 1 + start
-                stack.append((start, mid))  # type: ignore
-                stack.append((mid, end))  # type: ignore
-            else:
-                # Points in between are redundant
-                mask[start + 1 : end] = False
-        return mask
+            keep = ends - starts > 1
+            starts, ends = starts[keep], ends[keep]
+            if not len(starts):
+                break
+            mid, _, mask_eps = RDP.__max_points(data, starts, ends, epsilon**2)
+            # Points in between are redundant if none of them is outside eps
+            dropped_starts.append(starts[~mask_eps])
+            dropped_ends.append(ends[~mask_eps])
+
+            # The other segments are split on their max point
+            mid = mid[mask_eps]
+            starts = np.column_stack((starts[mask_eps], mid)).ravel()
+            ends = np.column_stack((mid, ends[mask_eps])).ravel()
+
+        # Assume all points are valid and falsify the inner points of the dropped segments
+        nb_points = data.shape[0]
+        if not dropped_starts:
+            return np.full(nb_points, True)
+        dropped = np.bincount(np.concatenate(dropped_starts) + 1, minlength=nb_points + 1) - np.bincount(
+            np.concatenate(dropped_ends), minlength=nb_points + 1
+        )
+        return np.cumsum(dropped[:nb_points]) == 0
 
     @staticmethod
     def __rdp_points(M, n_out):
@@ -118,22 +178,23 @@ class RDP(Decimator):
             mask = np.empty(M_len, dtype=bool)
             mask.fill(True)
             return mask
+        # Every inner point is the max point of a segment once, and gets its distance as weight
         weights = np.empty(M_len)
-        # weights.fill(0)
         weights[0] = float("inf")
         weights[M_len - 1] = float("inf")
 
-        stack = [(0, M_len - 1)]
-
-        while stack:
-            (start, end) = stack.pop()
-            if end - start <= 1:
-                continue
-            dsq = RDP.__dsquared_line_points(M[start], M[end], M[start + 1 : end])
-            max_dist_index = np.argmax(dsq) + start + 1
-            weights[max_dist_index] = np.amax(dsq)
-            stack.append((start, max_dist_index))
-            stack.append((max_dist_index, end))
+        starts = np.array([0])
+        ends = np.array([M_len - 1])
+
+        while True:
+            keep = ends - starts > 1
+            starts, ends = starts[keep], ends[keep]
+            if not len(starts):
+                break
+            max_dist_index, dsq_max, _ = RDP.__max_points(M, starts, ends)
+            weights[max_dist_index] = dsq_max
+            starts = np.column_stack((starts, max_dist_index)).ravel()
+            ends = np.column_stack((max_dist_index, ends)).ravel()
         maxTolerance = np.sort(weights)[M_len - n_out]
 
         return weights >= maxTolerance
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
 import typing as t
 from datetime import datetime
@@ -26,6 +27,9 @@ from ..utils import _RE_PD_TYPE, _get_date_col_str_name
 from .comparison import _compare_function
 from .data_accessor import _DataAccessor
 from .data_format import _DataFormat
+from .decimator._pyramid import _Pyramid
+from .decimator.base import Decimator
+from .query_cache import _QueryCache
 
 _has_arrow_module = False
 if util.find_spec("pyarrow"):
@@ -40,6 +44,12 @@ class _PandasDataAccessor(_DataAccessor):
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
 
+    __DEFAULT_QUERY_CACHE_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, gui: Gui) -> None:
+        super().__init__(gui)
+        self.__query_cache: t.Optional[_QueryCache] = None
+
     def to_pandas(self, value: t.Union[pd.DataFrame, pd.Series]) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
         return self.__to_dataframe(value)
 
@@ -204,8 +214,8 @@ class _PandasDataAccessor(_DataAccessor):
         if data_format is _DataFormat.APACHE_ARROW:
             if not _has_arrow_module:
                 raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
-            # Convert from pandas to Arrow
-            table = pa.Table.from_pandas(data)  # type: ignore[reportPossiblyUnboundVariable]
+            # Convert from pandas to Arrow, without the index that the JSON format does not send either
+            table = pa.Table.from_pandas(data, preserve_index=False)  # type: ignore[reportPossiblyUnboundVariable]
             # Create sink buffer stream
             sink = pa.BufferOutputStream()  # type: ignore[reportPossiblyUnboundVariable]
             # Create Stream writer
@@ -233,14 +243,138 @@ class _PandasDataAccessor(_DataAccessor):
             return ret_dict
         return {str(k): v for k, v in self.__to_dataframe(value).dtypes.apply(lambda x: x.name.lower()).items()}
 
-    def __get_data(  # noqa: C901
+    def __get_query_cache(self) -> _QueryCache:
+        if self.__query_cache is None:
+            self.__query_cache = _QueryCache(
+                self._gui._get_config("table_cache_size", _PandasDataAccessor.__DEFAULT_QUERY_CACHE_SIZE)
+            )
+        return self.__query_cache
+
+    def _invalidate(self, value: t.Any) -> None:
+        self.__get_query_cache().invalidate(value)
+
+    def __select_with_pyramid(
         self,
         var_name: str,
+        value: t.Any,
         df: pd.DataFrame,
+        decimator: Decimator,
+        decimator_instance_payload: t.Dict[str, t.Any],
+        decimator_payload: t.Dict[str, t.Any],
+    ) -> pd.DataFrame:
+        query = decimator._get_pyramid_query(len(df), decimator_instance_payload, decimator_payload)
+        if query is None:
+            return df
+        x_column = decimator_instance_payload.get("xAxis", "")
+        y_column = decimator_instance_payload.get("yAxis", "")
+        if y_column not in df.columns or (x_column and x_column not in df.columns):
+            return df
+        # The index of a trace is cached like a query result, so that it is built once per value
+        query_cache = self.__get_query_cache()
+        signature = json.dumps(["pyramid", x_column, y_column])
+        pyramid = query_cache.get(var_name, value, signature)
+        if pyramid is None:
+            pyramid = _Pyramid(df[x_column] if x_column else df.index, df[y_column])
+            query_cache.put(var_name, value, signature, pyramid, pyramid.nbytes)
+        indexes = pyramid.select(*query)
+        return df if indexes is None else df.iloc[indexes]
+
+    def __get_filtered_indexes(self, df: pd.DataFrame, filters: t.List[t.Dict[str, t.Any]]) -> t.Optional[np.ndarray]:
+        query = ""
+        vars = []
+        for fd in filters:
+            col = fd.get("col")
+            val = fd.get("value")
+            action = fd.get("action")
+            if isinstance(val, str):
+                if self.__is_date_column(t.cast(pd.DataFrame, df), col):
+                    val = datetime.fromisoformat(val[:-1])
+                vars.append(val)
+            val = f"@vars[{len(vars) - 1}]" if isinstance(val, (str, datetime)) else val
+            right = f".str.contains({val})" if action == "contains" else f" {action} {val}"
+            if query:
+                query += " and "
+            query += f"`{col}`{right}"
+        try:
+            return np.flatnonzero(np.asarray(df.eval(query), dtype=bool))
+        except Exception as e:
+            _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
+        return None
+
+    def __get_view(
+        self, var_name: str, value: t.Any, df: pd.DataFrame, payload: t.Dict[str, t.Any], columns: t.List[str]
+    ) -> t.Tuple[t.Optional[pd.DataFrame], t.Optional[np.ndarray]]:
+        """Returns the aggregated data, if any, and the positions of its filtered and sorted rows.
+
+        A returned positions array of None selects all the rows, in their order. Views are cached so
+        that paginating through a view only slices the positions.
+        """
+        filters = payload.get("filters")
+        has_filters = isinstance(filters, list) and len(filters) > 0
+        aggregates = payload.get("aggregates")
+        applies = payload.get("applies")
+        has_aggregates = isinstance(aggregates, list) and len(aggregates) > 0 and isinstance(applies, dict)
+        order_by = payload.get("orderby")
+        has_order_by = isinstance(order_by, str) and len(order_by) > 0
+        if not has_filters and not has_aggregates and not has_order_by:
+            return None, None
+        query_cache = self.__get_query_cache()
+        signature = json.dumps(
+            [filters, aggregates, applies, columns if has_aggregates else None, order_by, payload.get("sort")],
+            sort_keys=True,
+            default=str,
+        )
+        if (view := query_cache.get(var_name, value, signature)) is not None:
+            return view
+
+        indexes = self.__get_filtered_indexes(df, t.cast(list, filters)) if has_filters else None
+        agg_df: t.Optional[pd.DataFrame] = None
+        if has_aggregates:
+            applies_with_fn = {
+                k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
+                for k, v in t.cast(dict, applies).items()
+            }
+            for col in columns:
+                if col not in applies_with_fn.keys():
+                    applies_with_fn[col] = "first"
+            if _PandasDataAccessor.__INDEX_COL not in df.columns:
+                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+            try:
+                agg_df = (df if indexes is None else df.iloc[indexes]).groupby(aggregates).agg(applies_with_fn)
+                indexes = None
+            except Exception:
+                _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+        # deal with sort
+        if has_order_by:
+            sorted_df = df if agg_df is None else agg_df
+            try:
+                if sorted_df.columns.dtype.name == "int64":
+                    order_by = int(t.cast(str, order_by))
+                sorted_values = sorted_df[order_by].values
+                order = (sorted_values if indexes is None else sorted_values[indexes]).argsort(axis=0)
+                if payload.get("sort") == "desc":
+                    # reverse order
+                    order = order[::-1]
+                indexes = order if indexes is None else indexes[order]
+            except Exception:
+                _warn(f"Cannot sort {var_name} on columns {order_by}.")
+
+        view = (agg_df, indexes)
+        size = 0 if indexes is None else indexes.nbytes
+        if agg_df is not None:
+            size += int(agg_df.memory_usage(index=True).sum())
+        query_cache.put(var_name, value, signature, view, size)
+        return view
+
+    def __get_data(  # noqa: C901
+        self,
+        var_name: str,
+        value: t.Union[pd.DataFrame, pd.Series],
         payload: t.Dict[str, t.Any],
         data_format: _DataFormat,
         col_prefix: t.Optional[str] = "",
     ) -> t.Dict[str, t.Any]:
+        df = self.__to_dataframe(value)
         columns = payload.get("columns", [])
         if col_prefix:
             columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
@@ -249,61 +383,19 @@ class _PandasDataAccessor(_DataAccessor):
         is_copied = False
 
         orig_df = df
-        # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in df.columns:
-                is_copied = True
-                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
-
         fullrowcount = len(df)
-        # filtering
-        filters = payload.get("filters")
-        if isinstance(filters, list) and len(filters) > 0:
-            query = ""
-            vars = []
-            for fd in filters:
-                col = fd.get("col")
-                val = fd.get("value")
-                action = fd.get("action")
-                if isinstance(val, str):
-                    if self.__is_date_column(t.cast(pd.DataFrame, df), col):
-                        val = datetime.fromisoformat(val[:-1])
-                    vars.append(val)
-                val = f"@vars[{len(vars) - 1}]" if isinstance(val, (str, datetime)) else val
-                right = f".str.contains({val})" if action == "contains" else f" {action} {val}"
-                if query:
-                    query += " and "
-                query += f"`{col}`{right}"
-            try:
-                df = df.query(query)
-                is_copied = True
-            except Exception as e:
-                _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
-
         dict_ret: t.Optional[t.Dict[str, t.Any]]
         if paged:
-            aggregates = payload.get("aggregates")
-            applies = payload.get("applies")
-            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
-                applies_with_fn = {
-                    k: v if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS else self._gui._get_user_function(v)
-                    for k, v in applies.items()
-                }
-
-                for col in columns:
-                    if col not in applies_with_fn.keys():
-                        applies_with_fn[col] = "first"
-                try:
-                    df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
-                except Exception:
-                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+            # add index if not chart
+            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
+                columns.append(_PandasDataAccessor.__INDEX_COL)
+            agg_df, indexes = self.__get_view(var_name, value, df, payload, columns)
+            view_df = df if agg_df is None else agg_df
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
             # real number of rows is needed to calculate the number of pages
-            rowcount = len(df)
+            rowcount = len(view_df) if indexes is None else len(indexes)
             # here we'll deal with start and end values from payload if present
             if isinstance(payload.get("start", 0), int):
                 start = int(payload.get("start", 0))
@@ -332,29 +424,18 @@ class _PandasDataAccessor(_DataAccessor):
                 start = end - diff
                 if start < 0:
                     start = 0
-            # deal with sort
-            order_by = payload.get("orderby")
-            if isinstance(order_by, str) and len(order_by):
-                try:
-                    if df.columns.dtype.name == "int64":
-                        order_by = int(order_by)
-                    new_indexes = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
-                    if payload.get("sort") == "desc":
-                        # reverse order
-                        new_indexes = new_indexes[::-1]
-                    new_indexes = new_indexes[slice(start, end + 1)]
-                except Exception:
-                    _warn(f"Cannot sort {var_name} on columns {order_by}.")
-                    new_indexes = slice(start, end + 1)  # type: ignore
-            else:
-                new_indexes = slice(start, end + 1)  # type: ignore
+            new_indexes = slice(start, end + 1) if indexes is None else indexes[start : end + 1]
+            df = view_df.iloc[new_indexes]
+            is_copied = agg_df is not None or indexes is not None
+            if agg_df is None and _PandasDataAccessor.__INDEX_COL not in df.columns:
+                is_copied = True
+                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
             df = self.__build_transferred_cols(
                 columns,
                 t.cast(pd.DataFrame, df),
                 styles=payload.get("styles"),
                 tooltips=payload.get("tooltips"),
                 is_copied=is_copied,
-                new_indexes=t.cast(np.ndarray, new_indexes),
                 handle_nan=payload.get("handlenan", False),
                 formats=payload.get("formats"),
             )
@@ -388,6 +469,13 @@ class _PandasDataAccessor(_DataAccessor):
 
         else:
             ret_payload["alldata"] = True
+            # filtering
+            filters = payload.get("filters")
+            if isinstance(filters, list) and len(filters) > 0:
+                filtered_indexes = self.__get_filtered_indexes(df, filters)
+                if filtered_indexes is not None:
+                    df = df.iloc[filtered_indexes]
+                    is_copied = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
             decimators = decimator_payload.get("decimators", [])
             decimated_dfs: t.List[pd.DataFrame] = []
@@ -409,10 +497,16 @@ class _PandasDataAccessor(_DataAccessor):
                     else None
                 )
                 if isinstance(decimator_instance, PropertyType.decimator.value):
+                    # Only keep the visible points that the decimator can select if the trace is indexed
+                    decimator_df = df
+                    if df is orig_df:
+                        decimator_df = self.__select_with_pyramid(
+                            var_name, value, df, decimator_instance, decimator_pl, decimator_payload
+                        )
                     # Run the on_decimate method -> check if the decimator should be applied
                     # -> apply the decimator
                     decimated_df, is_decimator_applied, is_copied = decimator_instance._on_decimate(
-                        df, decimator_pl, decimator_payload, is_copied
+                        decimator_df, decimator_pl, decimator_payload, is_copied
                     )
                     # add decimated dataframe to the list of decimated
                     decimated_dfs.append(decimated_df)
@@ -476,7 +570,7 @@ class _PandasDataAccessor(_DataAccessor):
                 data = []
                 for i, v in enumerate(value):
                     ret = (
-                        self.__get_data(var_name, self.__to_dataframe(v), payload, data_format, f"{i}/")
+                        self.__get_data(var_name, v, payload, data_format, f"{i}/")
                         if isinstance(v, _PandasDataAccessor.__types)
                         else {}
                     )
@@ -487,13 +581,14 @@ class _PandasDataAccessor(_DataAccessor):
                 return ret_payload
             else:
                 value = value[0]
-        return self.__get_data(var_name, self.__to_dataframe(value), payload, data_format)
+        return self.__get_data(var_name, value, payload, data_format)
 
     def on_edit(self, value: t.Any, payload: t.Dict[str, t.Any]):
         df = self.to_pandas(value)
         if not isinstance(df, pd.DataFrame):
             raise ValueError(f"Cannot edit {type(value)}.")
         df.at[payload["index"], payload["col"]] = payload["value"]
+        self._invalidate(value)
         return self._from_pandas(df, type(value))
 
     def on_delete(self, value: t.Any, payload: t.Dict[str, t.Any]):
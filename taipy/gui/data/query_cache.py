@@ -0,0 +1,78 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+
+class _QueryCache:
+    """LRU cache of the results of the queries run on the data bound to tables.
+
+    An entry is keyed on a variable name, on the identity of the data that was queried, and on a
+    signature of the query. It is only served while that data is still alive: the identity of a
+    garbage-collected object can be reused by a new one.
+
+    Entries are evicted, least recently used first, so that the total size of the cached results
+    does not exceed *max_size* bytes. A *max_size* of 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max(int(max_size), 0)
+        self.size = 0
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, var_name: str, data: t.Any, signature: str) -> t.Optional[t.Any]:
+        if not self.max_size:
+            return None
+        key = (var_name, id(data), signature)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            data_ref, result, _ = entry
+            if data_ref() is not data:
+                self.__pop(key)
+                return None
+            self.__entries.move_to_end(key)
+            return result
+
+    def put(self, var_name: str, data: t.Any, signature: str, result: t.Any, size: int) -> None:
+        if size > self.max_size:
+            return
+        try:
+            data_ref = weakref.ref(data)
+        except TypeError:
+            return
+        key = (var_name, id(data), signature)
+        with self.__lock:
+            self.__pop(key)
+            for dead_key in [k for k, e in self.__entries.items() if e[0]() is None]:
+                self.__pop(dead_key)
+            self.__entries[key] = (data_ref, result, size)
+            self.size += size
+            while self.size > self.max_size:
+                self.__pop(next(iter(self.__entries)))
+
+    def invalidate(self, data: t.Any) -> None:
+        """Drop the entries computed on *data*, which was modified in place."""
+        with self.__lock:
+            for key in [k for k, e in self.__entries.items() if e[0]() is data or e[0]() is None]:
+                self.__pop(key)
+
+    def __pop(self, key: t.Tuple) -> None:
+        if entry := self.__entries.pop(key, None):
+            self.size -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import importlib
 import json
 import math
@@ -111,6 +112,7 @@ from .utils import (
 from .utils._adapter import _Adapter
 from .utils._bindings import _Bindings
 from .utils._evaluator import _Evaluator
+from .utils._page_cache import _PageCache, _RenderedPage
 from .utils._variable_directory import _is_moduled_variable, _VariableDirectory
 from .utils.chart_config_builder import _build_chart_config
 from .utils.table_col_builder import _enhance_columns
@@ -142,6 +144,7 @@ class Gui:
     __USER_CONTENT_URL = "taipy-user-content"
     __BROADCAST_G_ID = "taipy_broadcasting"
     __BRDCST_CALLBACK_G_ID = "taipy_brdcst_callback"
+    __RENDER_DEPENDENCIES_G_ID = "taipy_render_dependencies"
     __SELF_VAR = "__gui"
     __DO_NOT_UPDATE_VALUE = _DoNotUpdate()
     _HTML_CONTENT_KEY = "__taipy_html_content"
@@ -360,6 +363,10 @@ class Gui:
 
         # sid from client_id
         self.__client_id_2_sid: t.Dict[str, t.Set[str]] = {}
+        # Fingerprints of the variable values last sent, per client_id
+        self.__var_fingerprints: t.Dict[str, t.Dict[str, bytes]] = {}
+        # Rendered pages
+        self.__page_cache = _PageCache()
 
         # Load default config
         self._flask_blueprint: t.List[Blueprint] = []
@@ -639,6 +646,8 @@ class Gui:
 
     def _handle_disconnect(self):
         _Hooks()._handle_disconnect(self)
+        if sid := getattr(request, "sid", None):
+            self._server._ws_dispatcher._remove_receiver(sid)
         if (sid := getattr(request, "sid", None)) and (st_to := self._get_config("state_retention_period", 0)) > 0:
             for cl_id, sids in self.__client_id_2_sid.items():
                 if sid in sids:
@@ -652,6 +661,8 @@ class Gui:
         if (sids := self.__client_id_2_sid.get(client_id, None)) and len(sids) == 1:
             try:
                 del self.__client_id_2_sid[client_id]
+                self.__var_fingerprints.pop(client_id, None)
+                self.__page_cache._remove_client(client_id)
                 self._bindings()._delete_scope(client_id)
             except Exception as e:
                 _warn(f"Unexpected error removing state {client_id}", e)
@@ -662,6 +673,8 @@ class Gui:
             if msg_type == _WsType.CLIENT_ID.value:
                 res = self._bindings()._get_or_create_scope(message.get("payload", ""))
                 client_id = res[0] if res[1] else None
+                # A new connection does not hold any value yet
+                self.__var_fingerprints.pop(res[0], None)
             expected_client_id = client_id or message.get(Gui.__ARG_CLIENT_ID)
             self.__set_client_id_in_context(expected_client_id)
             g.ws_client_id = expected_client_id
@@ -744,6 +757,8 @@ class Gui:
                         value = ret_val[0]
         elif isinstance(current_value, _TaipyBase):
             value = current_value.cast_value(value)
+        # The value displayed by the front-end is not the one last sent anymore
+        self.__get_var_fingerprints().pop(self.__evaluator.get_hash_from_expr(var_name), None)
         self._update_var(
             var_name, value, propagate, current_value if isinstance(current_value, _TaipyBase) else None, on_change
         )
@@ -766,12 +781,16 @@ class Gui:
             self._set_broadcast()
         # Use custom attrsetter function to allow value binding for _MapDict
         if propagate:
+            if self.__accessors is not None:
+                # The value may have been modified in place
+                self.__accessors._invalidate(value)
             _setscopeattr_drill(self, hash_expr, value)
             # In case expression == hash (which is when there is only a single variable in expression)
             if var_name == hash_expr or hash_expr.startswith("tpec_"):
                 derived_vars.update(self._re_evaluate_expr(var_name))
         elif holder:
             derived_vars.update(self._evaluate_holders(hash_expr))
+        self.__invalidate_rendered_pages(derived_vars)
         if forward:
             # if the variable has been evaluated then skip updating to prevent infinite loop
             var_modified = self.__is_var_modified_in_context(hash_expr, derived_vars)
@@ -787,7 +806,7 @@ class Gui:
                 )
             derived_modified = self.__clean_vars_on_exit()
             if derived_modified is not None:
-                self.__send_var_list_update(list(derived_modified), var_name)
+                self.__send_var_list_update(list(derived_modified), var_name, skip_unchanged=True)
 
     def _get_real_var_name(self, var_name: str) -> t.Tuple[str, str]:
         if not var_name:
@@ -969,6 +988,8 @@ class Gui:
                     "backend_version": self.__get_version(),
                     "host": f'{self._get_config("host", "localhost")}:{self._get_config("port", "default")}',
                     "python_version": sys.version,
+                    "ws_queues": self._server._ws_dispatcher._get_metrics(),
+                    "page_cache": self.__page_cache._get_metrics(),
                 }
             )
             self.__append_libraries_to_status(base_json)
@@ -1051,16 +1072,47 @@ class Gui:
                         setattr(self._bindings(), var_name, newvalue)
         return ("", 200)
 
+    def __get_var_fingerprints(self) -> t.Dict[str, bytes]:
+        return self.__var_fingerprints.setdefault(self._get_client_id(), {})
+
+    def _on_ws_message_dropped(self, sid: t.Optional[str], payload: t.Dict[str, t.Any]) -> None:
+        # The clients never received the dropped values: their fingerprints must not prevent sending them again
+        if payload.get("type") != _WsType.MULTIPLE_UPDATE.value or not isinstance(payload.get("payload"), list):
+            return
+        names = {update.get("name") for update in payload["payload"] if isinstance(update, dict)}
+        client_ids = [cl_id for cl_id, sids in self.__client_id_2_sid.items() if sid in sids] if sid else []
+        for client_id in client_ids or list(self.__var_fingerprints):
+            if fingerprints := self.__var_fingerprints.get(client_id):
+                for var_name in [v for v in fingerprints if _get_client_var_name(v) in names]:
+                    fingerprints.pop(var_name, None)
+
+    @staticmethod
+    def __get_fingerprint(value: t.Any, serialized: t.Optional[str]) -> bytes:
+        if value is None:
+            return b"n"
+        if isinstance(value, str):
+            return b"s" + hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return b"j" + hashlib.blake2b(str(serialized).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
     def __send_var_list_update(  # noqa C901
         self,
         modified_vars: t.List[str],
         front_var: t.Optional[str] = None,
+        skip_unchanged: bool = False,
     ):
+        """Send the values of the modified variables to the front-end.
+
+        The fingerprint of each value sent is kept per client, and if *skip_unchanged* is True, the
+        values that did not change since they were last sent to the client are not sent again.
+        """
         ws_dict = {}
         is_custom_page = is_in_custom_page_context()
         values = {v: _getscopeattr_drill(self, v) for v in modified_vars if is_custom_page or _is_moduled_variable(v)}
         if not values:
             return
+        # Values broadcast to all clients make the fingerprints of the other clients obsolete
+        is_broadcasting = self._is_broadcasting()
+        fingerprints = self.__get_var_fingerprints()
         for k, v in values.items():
             if isinstance(v, (_TaipyData, _TaipyContentHtml)) and v.get_name() in modified_vars:
                 modified_vars.remove(v.get_name())
@@ -1070,6 +1122,7 @@ class Gui:
             newvalue = values.get(_var)
             resource_handler = get_current_resource_handler()
             custom_page_filtered_types = resource_handler.data_layer_supported_types if resource_handler else ()
+            fingerprint = None
             if isinstance(newvalue, (_TaipyData)) or isinstance(newvalue, custom_page_filtered_types):
                 newvalue = {"__taipy_refresh": True}
             else:
@@ -1097,11 +1150,12 @@ class Gui:
                 if isinstance(newvalue, float) and math.isnan(newvalue):
                     # do not let NaN go through json, it is not handle well (dies silently through websocket)
                     newvalue = None
+                serialized = None
                 if newvalue is not None and not isinstance(newvalue, str):
                     debug_warnings: t.List[warnings.WarningMessage] = []
                     with warnings.catch_warnings(record=True) as warns:
                         warnings.resetwarnings()
-                        json.dumps(newvalue, cls=_TaipyJsonEncoder)
+                        serialized = json.dumps(newvalue, cls=_TaipyJsonEncoder)
                         if len(warns):
                             keep_value = True
                             for w in warns:
@@ -1115,9 +1169,23 @@ class Gui:
                                 continue
                     for w in debug_warnings:
                         warnings.warn(w.message, w.category)  # noqa: B028
+                # Content values are URLs to resources that may have changed
+                if not isinstance(values.get(_var), (_TaipyContent, _TaipyContentImage, _TaipyContentHtml)):
+                    fingerprint = Gui.__get_fingerprint(newvalue, serialized)
+            if is_broadcasting:
+                for client_fingerprints in self.__var_fingerprints.values():
+                    client_fingerprints.pop(_var, None)
+            elif fingerprint is None:
+                fingerprints.pop(_var, None)
+            elif skip_unchanged and fingerprints.get(_var) == fingerprint:
+                continue
+            else:
+                fingerprints[_var] = fingerprint
             ws_dict[_var] = newvalue
-        # TODO: What if value == newvalue?
-        self.__send_ws_update_with_dict(ws_dict)
+        if ws_dict:
+            self.__send_ws_update_with_dict(ws_dict)
+        elif is_broadcasting:
+            self._set_broadcast(False)
 
     def __update_state_context(self, payload: dict):
         # apply state context if any
@@ -1284,12 +1352,7 @@ class Gui:
         grouping_message = self.__get_message_grouping() if allow_grouping else None
         if grouping_message is None:
             try:
-                self._server._ws.emit(
-                    "message",
-                    payload,
-                    to=t.cast(str, self.__get_ws_receiver(send_back_only)),
-                )
-                time.sleep(0.001)
+                self._server._ws_dispatcher._send(payload, self.__get_ws_receiver(send_back_only))
             except Exception as e:  # pragma: no cover
                 _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
         else:
@@ -1298,20 +1361,16 @@ class Gui:
     def __broadcast_ws(self, payload: dict, client_id: t.Optional[str] = None):
         try:
             to = list(self.__get_sids(client_id)) if client_id else []
-            self._server._ws.emit("message", payload, to=t.cast(str, to) if to else None, include_self=True)
-            time.sleep(0.001)
+            self._server._ws_dispatcher._send(payload, to if to else None)
         except Exception as e:  # pragma: no cover
             _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
 
     def __send_ack(self, ack_id: t.Optional[str]) -> None:
         if ack_id:
             try:
-                self._server._ws.emit(
-                    "message",
-                    {"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id},
-                    to=t.cast(str, self.__get_ws_receiver(True)),
+                self._server._ws_dispatcher._send(
+                    {"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id}, self.__get_ws_receiver(True)
                 )
-                time.sleep(0.001)
             except Exception as e:  # pragma: no cover
                 _warn(f"Exception raised in WebSocket communication (send ack) in '{self.__frame.f_code.co_name}'", e)
 
@@ -1664,7 +1723,10 @@ class Gui:
     def _evaluate_expr(
         self, expr: str, lazy_declare: t.Optional[bool] = False, lambda_expr: t.Optional[bool] = False
     ) -> t.Any:
-        return self.__evaluator.evaluate_expr(self, expr, lazy_declare, lambda_expr)
+        hash_name = self.__evaluator.evaluate_expr(self, expr, lazy_declare, lambda_expr)
+        if isinstance(hash_name, str) and hash_name != expr:
+            self.__add_render_dependency(hash_name)
+        return hash_name
 
     def _re_evaluate_expr(self, var_name: str) -> t.Set[str]:
         return self.__evaluator.re_evaluate_expr(self, var_name)
@@ -2151,6 +2213,7 @@ class Gui:
             encoded_var_name = self.__var_dir.add_var(var_name, self._get_locals_context(), var_name)
         else:
             encoded_var_name = self.__var_dir.add_var(var_name, bind_context)
+        self.__add_render_dependency(encoded_var_name)
         if not hasattr(self._bindings(), encoded_var_name):
             bind_locals = self._get_locals_bind_from_context(bind_context)
             if var_name in bind_locals.keys():
@@ -2161,6 +2224,59 @@ class Gui:
                 )
         return encoded_var_name
 
+    def __add_render_dependency(self, name: str) -> None:
+        if (dependencies := getattr(g, Gui.__RENDER_DEPENDENCIES_G_ID, None)) is not None:
+            dependencies.add(name)
+
+    @contextlib.contextmanager
+    def _collect_render_dependencies(self) -> t.Iterator[t.Set[str]]:
+        """Collect the variables and expressions that are bound while rendering a page."""
+        dependencies: t.Set[str] = set()
+        previous = getattr(g, Gui.__RENDER_DEPENDENCIES_G_ID, None)
+        setattr(g, Gui.__RENDER_DEPENDENCIES_G_ID, dependencies)
+        try:
+            yield dependencies
+        finally:
+            if previous is None:
+                delattr(g, Gui.__RENDER_DEPENDENCIES_G_ID)
+            else:
+                previous.update(dependencies)
+                setattr(g, Gui.__RENDER_DEPENDENCIES_G_ID, previous)
+
+    def __get_page_cache_scope(
+        self, page: t.Optional[_Page] = None
+    ) -> t.Optional[t.Tuple[t.Dict[_Page, t.Any], t.Set[str]]]:
+        # Partials that are updated for a client are not cached, and neither are pages requested by unknown clients
+        if page is not None and page not in self._config.pages and page not in self._config.partials:
+            return None
+        if not self._bindings()._is_single_client() and not getattr(g, Gui.__ARG_CLIENT_ID, None):
+            return None
+        metadata = self._get_data_scope_metadata()
+        return (
+            metadata.setdefault(_DataScopes._META_RENDERED_PAGES, {}),
+            metadata.setdefault(_DataScopes._META_UPDATED_VARS, set()),
+        )
+
+    def _get_rendered_page(self, page: _Page, content: t.Any) -> t.Optional[_RenderedPage]:
+        if (scope := self.__get_page_cache_scope(page)) is None:
+            return None
+        return self.__page_cache._get(page, content, self._get_client_id(), *scope)
+
+    def _set_rendered_page(
+        self, page: _Page, content: t.Any, dependencies: t.Set[str], rendered: t.Optional[_RenderedPage]
+    ) -> None:
+        if (scope := self.__get_page_cache_scope(page)) is not None:
+            self.__page_cache._set(page, self._get_client_id(), content, *scope, dependencies, rendered)
+
+    def __invalidate_rendered_pages(self, var_names: t.Set[str]) -> None:
+        var_names = var_names.union(name.split(".")[0] for name in var_names)
+        if self._is_broadcasting() or self._bindings()._is_single_client():
+            # All the clients get the new values
+            self.__page_cache._invalidate(var_names, None)
+        elif (scope := self.__get_page_cache_scope()) is not None:
+            scope[1].update(var_names)
+            self.__page_cache._invalidate(var_names, self._get_client_id())
+
     def _bind_var_val(self, var_name: str, value: t.Any) -> bool:
         if not _is_moduled_variable(var_name):
             var_name = self.__var_dir.add_var(var_name, self._get_locals_context())
@@ -137,6 +137,10 @@ class Page:
     def _get_content_detail(self, gui) -> str:
         return f"in class {type(self).__name__}"
 
+    def _get_content_key(self) -> t.Any:
+        # Changes when the content of the page changes. Rendered pages are not cached if None.
+        return self._renderer._get_content_key() if self._renderer is not None else None
+
     def render(self, gui) -> str:
         if self._renderer is not None:
             return self._renderer.render(gui)
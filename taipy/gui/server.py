@@ -47,6 +47,7 @@ from .config import ServerConfig
 from .custom._page import _ExternalResourceHandlerManager
 from .utils import _is_in_notebook, _is_port_open, _RuntimeManager
 from .utils._css import get_style
+from .utils._ws_dispatcher import _WsDispatcher
 
 if t.TYPE_CHECKING:
     from .gui import Gui
@@ -100,6 +101,12 @@ class _Server:
         if "socketio" in server_config and isinstance(server_config["socketio"], dict):
             socketio_config.update(server_config["socketio"])
         self._ws = SocketIO(self._flask, **socketio_config)
+        self._ws_dispatcher = _WsDispatcher(
+            self._ws,
+            gui._get_config("ws_queue_size", 1000),
+            gui._get_config("ws_queue_overflow", _WsDispatcher.OVERFLOW_BLOCK),
+            on_drop=gui._on_ws_message_dropped,
+        )
 
         self._apply_patch()
 
@@ -343,6 +350,7 @@ class _Server:
             _TaipyLogger._get_logger().info(f" * Application is accessible at {client_url}")
         if not is_running_from_reloader() and self._gui._get_config("run_browser", False):
             webbrowser.open(client_url, new=2)
+        self._ws_dispatcher._start()
         if _is_in_notebook() or run_in_thread:
             self._thread = KThread(target=self._run_notebook)
             self._thread.start()
@@ -366,6 +374,7 @@ class _Server:
             pass
 
     def stop_thread(self):
+        self._ws_dispatcher._stop()
         if hasattr(self, "_thread") and self._thread.is_alive() and self._is_running:
             self._is_running = False
             with contextlib.suppress(Exception):
@@ -16,6 +16,7 @@ import builtins
 import re
 import typing as t
 import warnings
+from types import CodeType
 
 from .._warnings import TaipyGuiWarning, _warn
 
@@ -67,6 +68,17 @@ class _Evaluator:
         self.__expr_to_holders: t.Dict[str, t.Set[t.Type[_TaipyBase]]] = {}
         # shared variables between multiple clients
         self.__shared_variable = shared_variable
+        # names that are not bound as variables in expressions
+        self.__builtin_vars = frozenset(dir(builtins))
+        self.__non_vars = self.__builtin_vars.union(default_bindings.keys())
+        # evaluation builtins: the global context takes precedence over the Python built-ins
+        self.__eval_builtins = {**builtins.__dict__, **default_bindings}
+        # key = evaluated source, value = compiled code
+        self.__source_to_code: t.Dict[str, CodeType] = {}
+        # key = expression, value = source to evaluate when the expression variables change
+        self.__expr_to_source: t.Dict[str, str] = {}
+        # key = expression part, value = (names with their function call flag, arguments and comprehension targets)
+        self.__part_to_names: t.Dict[str, t.Tuple[t.List[t.Tuple[str, bool]], t.Set[str]]] = {}
 
     @staticmethod
     def _expr_decode(s: str):
@@ -92,48 +104,73 @@ class _Evaluator:
     ) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, str]]:
         var_val: t.Dict[str, t.Any] = {}
         var_map: t.Dict[str, str] = {}
-        non_vars = list(self.__global_ctx.keys())
-        builtin_vars = dir(builtins)
-        non_vars.extend(builtin_vars)
         # Get a list of expressions (value that has been wrapped in curly braces {}) and find variables to bind
         for e in self._fetch_expression_list(expr):
-            var_name = e.split(sep=".")[0]
-            st = ast.parse('f"{' + e + '}"' if _Evaluator.__EXPR_EDGE_CASE_F_STRING.match(e) else e)
-            args = [arg.arg for node in ast.walk(st) if isinstance(node, ast.arguments) for arg in node.args]
-            targets = [
-                comprehension.target.id  # type: ignore[attr-defined]
-                for node in ast.walk(st)
-                if isinstance(node, ast.ListComp)
-                for comprehension in node.generators
-            ]
-            functionsCalls = set()
-            for node in ast.walk(st):
-                if isinstance(node, ast.Call):
-                    functionsCalls.add(node.func)
-                elif isinstance(node, ast.Name):
-                    var_name = node.id.split(sep=".")[0]
-                    if var_name in builtin_vars:
-                        if node not in functionsCalls:
-                            _warn(
-                                f"Variable '{var_name}' cannot be used in Taipy expressions "
-                                "as its name collides with a Python built-in identifier."
-                            )
-                    elif var_name not in args and var_name not in targets and var_name not in non_vars:
-                        try:
-                            if lazy_declare and var_name.startswith("__"):
-                                with warnings.catch_warnings(record=True) as warns:
-                                    warnings.resetwarnings()
-                                    encoded_var_name = gui._bind_var(var_name)
-                                    if next((w for w in warns if w.category is TaipyGuiWarning), None):
-                                        gui._bind_var_val(var_name, None)
-                            else:
+            names, local_names = self.__get_names(e)
+            for var_name, is_function_call in names:
+                if var_name in self.__builtin_vars:
+                    if not is_function_call:
+                        _warn(
+                            f"Variable '{var_name}' cannot be used in Taipy expressions "
+                            "as its name collides with a Python built-in identifier."
+                        )
+                elif var_name not in local_names and var_name not in self.__non_vars:
+                    try:
+                        if lazy_declare and var_name.startswith("__"):
+                            with warnings.catch_warnings(record=True) as warns:
+                                warnings.resetwarnings()
                                 encoded_var_name = gui._bind_var(var_name)
-                            var_val[var_name] = _getscopeattr_drill(gui, encoded_var_name)
-                            var_map[var_name] = encoded_var_name
-                        except AttributeError as e:
-                            _warn(f"Variable '{var_name}' is not defined (in expression '{expr}')", e)
+                                if next((w for w in warns if w.category is TaipyGuiWarning), None):
+                                    gui._bind_var_val(var_name, None)
+                        else:
+                            encoded_var_name = gui._bind_var(var_name)
+                        var_val[var_name] = _getscopeattr_drill(gui, encoded_var_name)
+                        var_map[var_name] = encoded_var_name
+                    except AttributeError as e:
+                        _warn(f"Variable '{var_name}' is not defined (in expression '{expr}')", e)
         return var_val, var_map
 
+    def __get_names(self, part: str) -> t.Tuple[t.List[t.Tuple[str, bool]], t.Set[str]]:
+        # Parse an expression part once, keeping the names it uses (and whether they are called) and the names
+        # it declares (lambda arguments and comprehension targets)
+        if cached := self.__part_to_names.get(part):
+            return cached
+        st = ast.parse('f"{' + part + '}"' if _Evaluator.__EXPR_EDGE_CASE_F_STRING.match(part) else part)
+        local_names = {arg.arg for node in ast.walk(st) if isinstance(node, ast.arguments) for arg in node.args}
+        local_names.update(
+            comprehension.target.id  # type: ignore[attr-defined]
+            for node in ast.walk(st)
+            if isinstance(node, ast.ListComp)
+            for comprehension in node.generators
+        )
+        names: t.List[t.Tuple[str, bool]] = []
+        functionsCalls = set()
+        for node in ast.walk(st):
+            if isinstance(node, ast.Call):
+                functionsCalls.add(node.func)
+            elif isinstance(node, ast.Name):
+                names.append((node.id.split(sep=".")[0], node in functionsCalls))
+        self.__part_to_names[part] = (names, local_names)
+        return names, local_names
+
+    def __evaluate(self, source: str, var_values: t.Dict[str, t.Any]) -> t.Any:
+        # The source is compiled once.
+        # The variable values are the globals of the evaluation (entries in locals are not always seen, for example
+        # in comprehensions) and the global context is reached through the builtins, so that it is not copied.
+        if (code := self.__source_to_code.get(source)) is None:
+            code = self.__source_to_code[source] = compile(source, "<string>", "eval")
+        return eval(code, {"__builtins__": self.__eval_builtins, **var_values})
+
+    def __get_source(self, expr: str) -> str:
+        if (source := self.__expr_to_source.get(expr)) is None:
+            expr_decoded, _ = _variable_decode(expr)
+            if self._is_expression(expr_decoded):
+                source = 'f"' + expr_decoded.replace('"', '\\"') + '"'
+            else:
+                source = expr_decoded
+            self.__expr_to_source[expr] = source
+        return source
+
     def __save_expression(
         self,
         gui: Gui,
@@ -253,12 +290,8 @@ class _Evaluator:
             return self.__expr_to_hash[expr]
         try:
             # evaluate expressions
-            ctx: t.Dict[str, t.Any] = {}
-            ctx.update(self.__global_ctx)
-            # entries in var_val are not always seen (NameError) when passed as locals
-            ctx.update(var_val)
             with gui._get_authorization():
-                expr_evaluated = eval(not_encoded_expr if is_edge_case else expr_string, ctx)
+                expr_evaluated = self.__evaluate(not_encoded_expr if is_edge_case else expr_string, var_val)
         except Exception as e:
             _warn(f"Cannot evaluate expression '{not_encoded_expr if is_edge_case else expr_string}'", e)
             expr_evaluated = None
@@ -275,18 +308,11 @@ class _Evaluator:
         if not expr:
             return
 
-        expr_decoded, _ = _variable_decode(expr)
         var_map = self.__expr_to_var_map.get(expr, {})
         eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in var_map.items()}
-        if self._is_expression(expr_decoded):
-            expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-        else:
-            expr_string = expr_decoded
+        expr_string = self.__get_source(expr)
         try:
-            ctx: t.Dict[str, t.Any] = {}
-            ctx.update(self.__global_ctx)
-            ctx.update(eval_dict)
-            expr_evaluated = eval(expr_string, ctx)
+            expr_evaluated = self.__evaluate(expr_string, eval_dict)
             _setscopeattr(gui, var_name, expr_evaluated)
             if holder is not None:
                 holder.set(expr_evaluated)
@@ -346,24 +372,23 @@ class _Evaluator:
             # _warn("{var_name} not found.")
             return modified_vars
         # refresh expressions and holders
+        # the variables that expressions share are read once
+        var_values: t.Dict[str, t.Any] = {}
         for expr in self.__var_to_expr_list[var_name]:
-            expr_decoded, _ = _variable_decode(expr)
             hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
             if expr != var_name and not expr.startswith(_TaipyBase._HOLDER_PREFIX):
                 expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
                 if expr_var_map is None:
                     _warn(f"Something is amiss with expression list for {expr}.")
                 else:
-                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
-                    if self._is_expression(expr_decoded):
-                        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-                    else:
-                        expr_string = expr_decoded
+                    eval_dict = {}
+                    for k, v in expr_var_map.items():
+                        if v not in var_values:
+                            var_values[v] = _getscopeattr_drill(gui, gui._bind_var(v))
+                        eval_dict[k] = var_values[v]
+                    expr_string = self.__get_source(expr)
                     try:
-                        ctx: t.Dict[str, t.Any] = {}
-                        ctx.update(self.__global_ctx)
-                        ctx.update(eval_dict)
-                        expr_evaluated = eval(expr_string, ctx)
+                        expr_evaluated = self.__evaluate(expr_string, eval_dict)
                         _setscopeattr(gui, hash_expr, expr_evaluated)
                     except Exception as e:
                         _warn(f"Exception raised evaluating {expr_string}", e)
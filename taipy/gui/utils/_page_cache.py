@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from __future__ import annotations
+
+import typing as t
+from threading import Lock
+
+if t.TYPE_CHECKING:
+    from .._page import _Page
+
+
+class _RenderedPage(t.NamedTuple):
+    content: t.Any
+    jsx: t.Optional[str]
+    head: t.Optional[list]
+    module_name: t.Optional[str]
+
+
+class _PageCache:
+    """Cache of the rendered pages.
+
+    Rendering a page binds its variables and evaluates its expressions in the scope of the client
+    it is rendered for, and the generated JSX holds the values of these variables. Therefore:
+
+    - A page is served from the cache only to a client for which its current content was rendered
+      once (the pages are pre-rendered for each new client).
+    - The dependencies of a page are the variables and expressions bound while rendering it.
+      When a client updates one of them, the page is rendered and cached for that client
+      alone. The other clients keep sharing the entry rendered with the initial values.
+    - When a dependency is updated for all the clients (broadcast or single client mode), all the
+      entries of the page are dropped.
+    - An entry is not used anymore when the content of the page changes.
+
+    The cache is shared by the threads serving the clients.
+    """
+
+    def __init__(self) -> None:
+        # key = (page, client id or None if the client did not update any dependency of the page)
+        self.__entries: t.Dict[t.Tuple[_Page, t.Optional[str]], _RenderedPage] = {}
+        # key = variable or expression hash, value = pages that depend on it
+        self.__var_to_pages: t.Dict[str, t.Set[_Page]] = {}
+        self.__page_to_vars: t.Dict[_Page, t.Set[str]] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__invalidations = 0
+        self.__lock = Lock()
+
+    def __get_key(self, page: _Page, client_id: str, updated_vars: t.Set[str]) -> t.Tuple[_Page, t.Optional[str]]:
+        dependencies = self.__page_to_vars.get(page)
+        return (page, client_id if dependencies and not updated_vars.isdisjoint(dependencies) else None)
+
+    def _get(
+        self,
+        page: _Page,
+        content: t.Any,
+        client_id: str,
+        rendered_pages: t.Dict[_Page, t.Any],
+        updated_vars: t.Set[str],
+    ) -> t.Optional[_RenderedPage]:
+        with self.__lock:
+            if page not in rendered_pages or rendered_pages[page] != content:
+                # The variables of the page are not bound for this client yet
+                self.__misses += 1
+                return None
+            entry = self.__entries.get(self.__get_key(page, client_id, updated_vars))
+            if entry is None or entry.content != content:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            return entry
+
+    def _set(
+        self,
+        page: _Page,
+        client_id: str,
+        content: t.Any,
+        rendered_pages: t.Dict[_Page, t.Any],
+        updated_vars: t.Set[str],
+        dependencies: t.Set[str],
+        entry: t.Optional[_RenderedPage] = None,
+    ) -> None:
+        with self.__lock:
+            rendered_pages[page] = content
+            page_vars = self.__page_to_vars.setdefault(page, set())
+            for var_name in dependencies - page_vars:
+                self.__var_to_pages.setdefault(var_name, set()).add(page)
+            page_vars.update(dependencies)
+            if entry is not None:
+                self.__entries[self.__get_key(page, client_id, updated_vars)] = entry
+
+    def _invalidate(self, var_names: t.Iterable[str], client_id: t.Optional[str]) -> None:
+        """Drop the entries of the pages that depend on *var_names*.
+
+        Only the entries of *client_id* are dropped, or all the entries of these pages if
+        *client_id* is None.
+        """
+        with self.__lock:
+            pages = {page for var_name in var_names for page in self.__var_to_pages.get(var_name, ())}
+            if not pages:
+                return
+            keys = (
+                [key for key in self.__entries if key[0] in pages]
+                if client_id is None
+                else [(page, client_id) for page in pages]
+            )
+            for key in keys:
+                if self.__entries.pop(key, None) is not None:
+                    self.__invalidations += 1
+
+    def _remove_client(self, client_id: str) -> None:
+        with self.__lock:
+            for key in [key for key in self.__entries if key[1] == client_id]:
+                del self.__entries[key]
+
+    def _get_metrics(self) -> t.Dict[str, t.Any]:
+        with self.__lock:
+            requests = self.__hits + self.__misses
+            return {
+                "entries": len(self.__entries),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "hit_rate": self.__hits / requests if requests else 0.0,
+                "invalidations": self.__invalidations,
+            }
@@ -0,0 +1,201 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+import typing as t
+from collections import deque
+from itertools import count, groupby
+from threading import Lock
+
+from .._warnings import _warn
+
+if t.TYPE_CHECKING:
+    from flask_socketio import SocketIO
+
+
+class _WsDispatcher:
+    """Send the WebSocket messages from a background task.
+
+    Messages are queued per receiver (a socket id, or None for all the connected clients), and a
+    writer task started with the server sends all the messages pending for a receiver at once.
+    Messages to all the clients are not batched with the messages to a socket id queued before
+    or after them, so that every client receives its messages in the order they were sent.
+    In a pending batch, an update of a variable supersedes the previous updates of the same
+    variable.
+
+    The queue of a receiver holds at most *queue_size* messages. When it is full, the sender
+    waits for the writer (if *overflow* is "block") for at most *block_timeout* seconds, or the
+    oldest pending message is dropped (if *overflow* is "drop" or the wait timed out) and
+    *on_drop* is called with its receiver and payload.
+
+    Until the writer is started, or if *queue_size* is 0, messages are sent right away.
+    """
+
+    OVERFLOW_BLOCK = "block"
+    OVERFLOW_DROP = "drop"
+
+    __MULTIPLE_MESSAGE = "MS"
+    __MULTIPLE_UPDATE = "MU"
+    __FLUSH_INTERVAL = 0.005
+
+    def __init__(
+        self,
+        ws: "SocketIO",
+        queue_size: int,
+        overflow: str = OVERFLOW_BLOCK,
+        block_timeout: float = 1.0,
+        on_drop: t.Optional[t.Callable[[t.Optional[str], t.Dict[str, t.Any]], None]] = None,
+    ) -> None:
+        self.__ws = ws
+        self.__queue_size = queue_size
+        if overflow not in (_WsDispatcher.OVERFLOW_BLOCK, _WsDispatcher.OVERFLOW_DROP):
+            _warn(f"Invalid WebSocket queue overflow policy '{overflow}': using '{_WsDispatcher.OVERFLOW_BLOCK}'.")
+            overflow = _WsDispatcher.OVERFLOW_BLOCK
+        self.__overflow = overflow
+        self.__block_timeout = block_timeout
+        self.__on_drop = on_drop
+        # The pending messages of each receiver, with their sequence number across all the receivers
+        self.__queues: t.Dict[t.Optional[str], t.Deque[t.Tuple[int, t.Dict[str, t.Any]]]] = {}
+        self.__sequence = count()
+        self.__lock = Lock()
+        self.__running = False
+        self.__sent = 0
+        self.__batches = 0
+        self.__superseded = 0
+        self.__dropped = 0
+
+    def _start(self) -> None:
+        if self.__running or self.__queue_size <= 0:
+            return
+        self.__running = True
+        self.__ws.start_background_task(self.__run)
+
+    def _stop(self) -> None:
+        self.__running = False
+        self._flush()
+
+    def _send(self, payload: t.Dict[str, t.Any], to: t.Union[str, t.List[str], None]) -> None:
+        if not self.__running:
+            self.__ws.emit("message", payload, to=to)
+            time.sleep(0.001)
+            return
+        for receiver in to if isinstance(to, list) else [to]:
+            self.__enqueue(receiver, payload)
+
+    def _remove_receiver(self, receiver: str) -> None:
+        with self.__lock:
+            self.__queues.pop(receiver, None)
+
+    def _get_metrics(self) -> t.Dict[str, t.Any]:
+        with self.__lock:
+            depths = {str(receiver): len(queue) for receiver, queue in self.__queues.items() if queue}
+        return {
+            "running": self.__running,
+            "queue_size": self.__queue_size,
+            "overflow": self.__overflow,
+            "pending": sum(depths.values()),
+            "max_depth": max(depths.values(), default=0),
+            "depths": depths,
+            "sent": self.__sent,
+            "batches": self.__batches,
+            "superseded": self.__superseded,
+            "dropped": self.__dropped,
+        }
+
+    def __enqueue(self, receiver: t.Optional[str], payload: t.Dict[str, t.Any]) -> None:
+        deadline = time.monotonic() + self.__block_timeout
+        while True:
+            with self.__lock:
+                queue = self.__queues.setdefault(receiver, deque())
+                self.__supersede(queue, payload)
+                if len(queue) < self.__queue_size:
+                    queue.append((next(self.__sequence), payload))
+                    return
+                if self.__overflow == _WsDispatcher.OVERFLOW_DROP or time.monotonic() >= deadline:
+                    _, dropped = queue.popleft()
+                    self.__dropped += 1
+                    queue.append((next(self.__sequence), payload))
+                    break
+            # Backpressure: let the writer empty the queue
+            self.__ws.sleep(self.__FLUSH_INTERVAL)
+        if self.__on_drop is not None:
+            try:
+                self.__on_drop(receiver, dropped)
+            except Exception as e:  # pragma: no cover
+                _warn("Exception raised while handling a dropped WebSocket message", e)
+
+    def __supersede(self, queue: t.Deque[t.Tuple[int, t.Dict[str, t.Any]]], payload: t.Dict[str, t.Any]) -> None:
+        # Remove the pending updates of the variables that payload updates.
+        # Data updates are identified by their page key as well, since a table can request several pages.
+        if payload.get("type") != _WsDispatcher.__MULTIPLE_UPDATE or not isinstance(payload.get("payload"), list):
+            return
+        keys = {_WsDispatcher.__get_update_key(update) for update in payload["payload"]}
+        for index, (sequence, pending) in enumerate(queue):
+            if pending.get("type") != _WsDispatcher.__MULTIPLE_UPDATE or not isinstance(pending.get("payload"), list):
+                continue
+            updates = [update for update in pending["payload"] if _WsDispatcher.__get_update_key(update) not in keys]
+            if len(updates) != len(pending["payload"]):
+                self.__superseded += len(pending["payload"]) - len(updates)
+                # Pending payloads can be shared by several receivers: they are replaced, not modified
+                queue[index] = (sequence, {**pending, "payload": updates})
+        remaining = [e for e in queue if e[1].get("type") != _WsDispatcher.__MULTIPLE_UPDATE or e[1].get("payload")]
+        if len(remaining) != len(queue):
+            queue.clear()
+            queue.extend(remaining)
+
+    @staticmethod
+    def __get_update_key(update: t.Any) -> t.Tuple[t.Any, t.Any]:
+        if not isinstance(update, dict):
+            return (id(update), None)
+        value = update.get("payload")
+        return (update.get("name"), value.get("pagekey") if isinstance(value, dict) else None)
+
+    def _flush(self) -> bool:
+        with self.__lock:
+            pending = sorted(
+                (
+                    (sequence, receiver, message)
+                    for receiver, queue in self.__queues.items()
+                    for sequence, message in queue
+                ),
+                key=lambda entry: entry[0],
+            )
+            for queue in self.__queues.values():
+                queue.clear()
+        # Clients receive the messages to all the clients as well as the messages to their socket id: the
+        # pending messages are split where the messages to all the clients start or end, and batched per
+        # receiver in each part.
+        for _, part in groupby(pending, key=lambda entry: entry[1] is None):
+            batches: t.Dict[t.Optional[str], t.List[t.Dict[str, t.Any]]] = {}
+            for _, receiver, message in part:
+                batches.setdefault(receiver, []).append(message)
+            for receiver, messages in batches.items():
+                self.__emit(receiver, messages)
+        return bool(pending)
+
+    def __emit(self, receiver: t.Optional[str], messages: t.List[t.Dict[str, t.Any]]) -> None:
+        payload = messages[0] if len(messages) == 1 else {"type": _WsDispatcher.__MULTIPLE_MESSAGE, "payload": messages}
+        try:
+            self.__ws.emit("message", payload, to=receiver)
+            self.__sent += len(messages)
+            self.__batches += 1
+        except Exception as e:  # pragma: no cover
+            _warn(f"Exception raised in WebSocket communication to '{receiver or 'all clients'}'", e)
+
+    def __run(self) -> None:
+        while self.__running:
+            try:
+                sent = self._flush()
+            except Exception as e:  # pragma: no cover
+                _warn("Exception raised while sending WebSocket messages", e)
+                sent = False
+            # Yield to the other tasks after a batch, wait for messages otherwise
+            self.__ws.sleep(0 if sent else self.__FLUSH_INTERVAL)
@@ -16,7 +16,7 @@ import zoneinfo
 from collections import defaultdict
 from numbers import Number
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
 
 import pandas as pd
 from dateutil import parser
@@ -84,6 +84,8 @@ class _GuiCoreContext(CoreEventConsumerBase):
     __ACTION = "action"
     _CORE_CHANGED_NAME = "core_changed"
     _AUTH_CHANGED_NAME = "auth_changed"
+    __CORE_CHANGED_IDS = ("scenario", "datanode")
+    __DEFAULT_CORE_CHANGED_DELAY = 100
 
     def __init__(self, gui: Gui) -> None:
         self.gui = gui
@@ -97,6 +99,10 @@ class _GuiCoreContext(CoreEventConsumerBase):
         # locks
         self.lock = Lock()
         self.submissions_lock = Lock()
+        # coalesced broadcasts
+        self.__core_changes: t.Dict[str, t.Any] = {}
+        self.__core_changes_lock = Lock()
+        self.__core_changes_timer: t.Optional[Timer] = None
         # lazy_start
         self.__started = False
         # Gui event listener
@@ -120,8 +126,17 @@ class _GuiCoreContext(CoreEventConsumerBase):
                 self.scenario_refresh(
                     event.entity_id
                     if event.operation is EventOperation.DELETION or is_readable(t.cast(ScenarioId, event.entity_id))
-                    else None
+                    else None,
+                    event.operation,
                 )
+        elif event.entity_type is EventEntityType.CYCLE:
+            if event.operation is EventOperation.DELETION:
+                with self.lock:
+                    if event.entity_id is None:
+                        self.scenario_by_cycle = None
+                    elif self.scenario_by_cycle is not None:
+                        for cycle in [c for c in self.scenario_by_cycle if c and c.id == event.entity_id]:
+                            del self.scenario_by_cycle[cycle]
         elif event.entity_type is EventEntityType.SEQUENCE and event.entity_id:
             sequence = None
             try:
@@ -145,21 +160,88 @@ class _GuiCoreContext(CoreEventConsumerBase):
         elif event.entity_type is EventEntityType.SUBMISSION:
             self.submission_status_callback(event.entity_id, event)
         elif event.entity_type is EventEntityType.DATA_NODE:
-            with self.lock:
-                self.data_nodes_by_owner = None
-            self.broadcast_core_changed(
-                {"datanode": event.entity_id if event.operation != EventOperation.DELETION else True}
-            )
+            with self.lock, self.gui._get_authorization(system=True):
+                self.__update_data_nodes_by_owner(event.entity_id, event.operation)
+            self.broadcast_core_changed({"datanode": event.entity_id or True})
 
     def broadcast_core_changed(self, payload: t.Dict[str, t.Any], client_id: t.Optional[str] = None):
-        self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
-
-    def scenario_refresh(self, scenario_id: t.Optional[str]):
+        """Broadcast the changes of core entities.
+
+        Changes broadcast to all clients are accumulated over the *core_changed_delay* configuration
+        setting (in milliseconds) and sent at once, with the ids of all the changed entities.
+        """
+        delay = self.gui._get_config("core_changed_delay", _GuiCoreContext.__DEFAULT_CORE_CHANGED_DELAY)
+        if client_id is not None or not delay or delay <= 0:
+            self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
+            return
+        with self.__core_changes_lock:
+            for key, value in payload.items():
+                changes = self.__core_changes.get(key)
+                if key not in _GuiCoreContext.__CORE_CHANGED_IDS or value is True or changes is True:
+                    self.__core_changes[key] = True if value is True or changes is True else value
+                    continue
+                if changes is None:
+                    # dict used as an ordered set of ids
+                    changes = self.__core_changes[key] = {}
+                changes.update(dict.fromkeys(value if isinstance(value, (list, tuple, set)) else [value]))
+            if self.__core_changes_timer is None:
+                self.__core_changes_timer = Timer(delay / 1000, self.__flush_core_changes)
+                self.__core_changes_timer.daemon = True
+                self.__core_changes_timer.start()
+
+    def __flush_core_changes(self):
+        with self.__core_changes_lock:
+            changes, self.__core_changes = self.__core_changes, {}
+            self.__core_changes_timer = None
+        if changes:
+            payload = {k: list(v) if isinstance(v, dict) else v for k, v in changes.items()}
+            self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload)
+
+    def scenario_refresh(self, scenario_id: t.Optional[str], operation: t.Optional[EventOperation] = None):
         with self.lock:
-            self.scenario_by_cycle = None
-            self.data_nodes_by_owner = None
+            if scenario_id is None or operation is None:
+                self.scenario_by_cycle = None
+                self.data_nodes_by_owner = None
+            else:
+                self.__update_scenario_by_cycle(scenario_id, operation)
         self.broadcast_core_changed({"scenario": scenario_id or True})
 
+    def __update_scenario_by_cycle(self, scenario_id: str, operation: EventOperation):
+        # Entities reload their attributes when accessed: only creations and deletions change the cache
+        if self.scenario_by_cycle is None or operation not in (EventOperation.CREATION, EventOperation.DELETION):
+            return
+        for cycle, scenarios in list(self.scenario_by_cycle.items()):
+            if any(s.id == scenario_id for s in scenarios):
+                if remaining := [s for s in scenarios if s.id != scenario_id]:
+                    self.scenario_by_cycle[cycle] = remaining
+                else:
+                    del self.scenario_by_cycle[cycle]
+        if operation is EventOperation.CREATION:
+            scenario = core_get(scenario_id)
+            if isinstance(scenario, Scenario):
+                self.scenario_by_cycle.setdefault(scenario.cycle, []).append(scenario)
+            else:
+                self.scenario_by_cycle = None
+
+    def __update_data_nodes_by_owner(self, data_node_id: t.Optional[str], operation: EventOperation):
+        if self.data_nodes_by_owner is None or operation not in (EventOperation.CREATION, EventOperation.DELETION):
+            return
+        if data_node_id is None:
+            self.data_nodes_by_owner = None
+            return
+        for owner_id, data_nodes in list(self.data_nodes_by_owner.items()):
+            if any(dn.id == data_node_id for dn in data_nodes):
+                if remaining := [dn for dn in data_nodes if dn.id != data_node_id]:
+                    self.data_nodes_by_owner[owner_id] = remaining
+                else:
+                    del self.data_nodes_by_owner[owner_id]
+        if operation is EventOperation.CREATION:
+            data_node = core_get(data_node_id)
+            if isinstance(data_node, DataNode):
+                self.data_nodes_by_owner[data_node.owner_id].append(data_node)
+            else:
+                self.data_nodes_by_owner = None
+
     def submission_status_callback(self, submission_id: t.Optional[str] = None, event: t.Optional[Event] = None):
         if not submission_id or not is_readable(t.cast(SubmissionId, submission_id)):
             return
@@ -514,7 +596,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
             except Exception as e:
                 state.assign(error_var, f"Error creating Scenario. {e}")
             finally:
-                self.scenario_refresh(scenario_id)
+                self.scenario_refresh(scenario_id, EventOperation.CREATION if scenario else None)
                 if (scenario or user_scenario) and (sel_scenario_var := args[1] if isinstance(args[1], str) else None):
                     try:
                         var_name, _ = gui._get_real_var_name(sel_scenario_var)
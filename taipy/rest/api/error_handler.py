@@ -25,7 +25,12 @@ from taipy.core.exceptions.exceptions import (
     NonExistingTaskConfig,
 )
 
-from .exceptions.exceptions import ConfigIdMissingException, ScenarioIdMissingException, SequenceNameMissingException
+from .exceptions.exceptions import (
+    ConfigIdMissingException,
+    InvalidQueryParameterException,
+    ScenarioIdMissingException,
+    SequenceNameMissingException,
+)
 from .views import blueprint
 
 
@@ -58,6 +63,11 @@ def handle_sequence_name_missing_exception(e):
     return jsonify({"message": e.message}), 400
 
 
+@blueprint.errorhandler(InvalidQueryParameterException)
+def handle_invalid_query_parameter_exception(e):
+    return jsonify({"message": e.message}), 400
+
+
 @blueprint.errorhandler(NonExistingDataNode)
 def handle_data_node_not_found(e):
     return _create_404(e)
@@ -23,3 +23,8 @@ class ScenarioIdMissingException(Exception):
 class SequenceNameMissingException(Exception):
     def __init__(self) -> None:
         self.message = "Sequence name is missing."
+
+
+class InvalidQueryParameterException(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -9,21 +9,26 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import List
+import io
+from importlib import util
+from itertools import chain
+from typing import Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
-from flask import request
+from flask import Response, request, stream_with_context
 from flask_restful import Resource
 
 from taipy.common.config import Config
 from taipy.core import DataNode
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._filter import _FilterDataNode
 from taipy.core.data.operator import Operator
-from taipy.core.exceptions.exceptions import NonExistingDataNode, NonExistingDataNodeConfig
+from taipy.core.exceptions.exceptions import NoData, NonExistingDataNode, NonExistingDataNodeConfig
 
+from ...commons.pagination import paginate
 from ...commons.to_from_model import _to_model
-from ..exceptions.exceptions import ConfigIdMissingException
+from ..exceptions.exceptions import ConfigIdMissingException, InvalidQueryParameterException
 from ..middlewares._middleware import _middleware
 from ..schemas import (
     CSVDataNodeConfigSchema,
@@ -51,6 +56,9 @@ ds_schema_map = {
     "json": JSONDataNodeConfigSchema,
 }
 
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+
 REPOSITORY = "data"
 
 
@@ -358,10 +366,33 @@ class DataNodeList(Resource):
                 []
                 ```
 
+        The data nodes are ordered by id. When any of the *limit*, *offset* or *cursor* query parameters is set,
+        only a page of data nodes is returned, as an object holding the `DataNodeSchema^` list under the *results*
+        key, the cursor of the next page under the *next_cursor* key, and the url of the next page under the
+        *next* key. The cursor and url are null on the last page. Following the cursors does not get slower
+        on the last pages, unlike increasing the offset.
+
         !!! Note
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      parameters:
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of data nodes of the page. The default value is 50 if *offset* or *cursor* is set.
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of data nodes to skip.
+        - in: query
+          name: cursor
+          schema:
+            type: string
+          description: The *next_cursor* returned with the previous page.
       responses:
         200:
           content:
@@ -465,8 +496,11 @@ class DataNodeList(Resource):
     def get(self):
         schema = DataNodeSchema(many=True)
         manager = _DataManagerFactory._build_manager()
-        datanodes = [_to_model(REPOSITORY, datanode) for datanode in manager._get_all()]
-        return schema.dump(datanodes)
+        filters = manager._build_filters_with_version(None)
+        return paginate(
+            lambda limit, offset, after: manager._get_page(filters, limit, offset, after),
+            lambda datanodes: schema.dump([_to_model(REPOSITORY, datanode) for datanode in datanodes]),
+        )
 
     @_middleware
     def post(self):
@@ -545,6 +579,11 @@ class DataNodeReader(Resource):
                     ]}
                 ```
 
+        When the *format* query parameter is set, the data is not returned as a JSON object but streamed in
+        the given format: *"ndjson"* (one JSON object per row), *"csv"*, or *"arrow"* (Apache Arrow IPC
+        stream, which requires the pyarrow package). The data nodes that can be read by chunks (see
+        `DataNode.read_chunks()^`) are streamed chunk by chunk, so the whole data is never loaded in memory.
+
         !!! Note
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
@@ -555,6 +594,22 @@ class DataNodeReader(Resource):
           schema:
             type: string
           description: The id of the data node to read.
+        - in: query
+          name: columns
+          schema:
+            type: string
+          description: The comma-separated names of the columns to read. All the columns are read by default.
+        - in: query
+          name: format
+          schema:
+            type: string
+            enum: [ndjson, csv, arrow]
+          description: The format of the streamed data.
+        - in: query
+          name: chunk_size
+          schema:
+            type: integer
+          description: The maximum number of rows of the chunks read from the data node when streamed.
       requestBody:
         content:
           application/json:
@@ -574,6 +629,12 @@ class DataNodeReader(Resource):
           description: No data node has the *datanode_id* identifier.
     """
 
+    _STREAM_FORMATS = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+        "arrow": "application/vnd.apache.arrow.stream",
+    }
+
     def __init__(self, **kwargs):
         self.logger = kwargs.get("logger")
 
@@ -587,13 +648,94 @@ class DataNodeReader(Resource):
             for x in schema.get("operators")
         ]
 
+    @staticmethod
+    def __to_dataframe(data) -> pd.DataFrame:
+        if isinstance(data, pd.DataFrame):
+            return data
+        if isinstance(data, pd.Series):
+            return data.to_frame()
+        if isinstance(data, np.ndarray):
+            return pd.DataFrame(data)
+        if isinstance(data, list):
+            return pd.DataFrame([vars(row) if hasattr(row, "__dict__") else row for row in data])
+        raise InvalidQueryParameterException("The data of the data node cannot be read as a stream.")
+
+    def __read_chunks(self, data_node: DataNode, operators: List, columns: Optional[List[str]]) -> Iterator:
+        chunk_size = request.args.get("chunk_size")
+        if chunk_size is not None and (not chunk_size.isdigit() or int(chunk_size) < 1):
+            raise InvalidQueryParameterException("The chunk_size parameter must be a positive integer.")
+        # The filtered columns are read as well, and dropped once the chunks are filtered.
+        read_columns = columns and list(dict.fromkeys([*columns, *(key for key, _, _ in operators)]))
+        try:
+            chunks = data_node.read_chunks(chunk_size and int(chunk_size), read_columns)
+        except NoData:
+            return iter([])
+        except NotImplementedError:
+            data = _FilterDataNode._select_columns(data_node.filter(operators), columns)
+            return iter([self.__to_dataframe(data)])
+        return (
+            self.__to_dataframe(_FilterDataNode._select_columns(_FilterDataNode._filter(chunk, operators), columns))
+            for chunk in chunks
+        )
+
+    @staticmethod
+    def __encode_ndjson(chunks: Iterator[pd.DataFrame]) -> Iterator:
+        for df in chunks:
+            if not df.empty:
+                lines = df.to_json(orient="records", lines=True, date_format="iso", default_handler=str)
+                # Depending on the pandas version, the last line may not end with a line break.
+                yield lines if lines.endswith("\n") else f"{lines}\n"
+
+    @staticmethod
+    def __encode_csv(chunks: Iterator[pd.DataFrame]) -> Iterator:
+        for i, df in enumerate(chunks):
+            yield df.to_csv(index=False, header=i == 0)
+
+    @staticmethod
+    def __encode_arrow(chunks: Iterator[pd.DataFrame]) -> Iterator:
+        sink = io.BytesIO()
+        writer = None
+        for df in chunks:
+            batch = pa.RecordBatch.from_pandas(df.rename(columns=str), preserve_index=False)
+            if writer is None:
+                writer = pa.ipc.new_stream(sink, batch.schema)
+            writer.write_batch(batch)
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+        if writer is not None:
+            writer.close()
+            yield sink.getvalue()
+
+    def __stream(self, data_node: DataNode, operators: List, columns: Optional[List[str]], format: str) -> Response:
+        if format not in self._STREAM_FORMATS:
+            raise InvalidQueryParameterException(
+                f"Invalid format: {format}. The possible values are {', '.join(self._STREAM_FORMATS)}."
+            )
+        if format == "arrow" and not util.find_spec("pyarrow"):
+            raise InvalidQueryParameterException("The arrow format requires the pyarrow package to be installed.")
+        # The first chunk is read before the response is sent, so an invalid request is answered with an error
+        # status rather than with a truncated body.
+        try:
+            chunks = self.__read_chunks(data_node, operators, columns)
+            first_chunk = next(chunks, None)
+        except (KeyError, ValueError) as e:
+            raise InvalidQueryParameterException(f"The data node cannot be read with these parameters: {e}") from None
+        if first_chunk is not None:
+            chunks = chain([first_chunk], chunks)
+        encoder = {"ndjson": self.__encode_ndjson, "csv": self.__encode_csv, "arrow": self.__encode_arrow}[format]
+        return Response(stream_with_context(encoder(chunks)), mimetype=self._STREAM_FORMATS[format])
+
     @_middleware
     def get(self, datanode_id):
         schema = DataNodeFilterSchema()
         data = request.get_json(silent=True)
         data_node = _get_or_raise(datanode_id)
         operators = self.__make_operators(schema.load(data)) if data else []
-        data = data_node.filter(operators)
+        columns = request.args["columns"].split(",") if request.args.get("columns") else None
+        if format := request.args.get("format"):
+            return self.__stream(data_node, operators, columns, format)
+        data = _FilterDataNode._select_columns(data_node.filter(operators), columns)
         if isinstance(data, pd.DataFrame):
             data = data.to_dict(orient="records")
         elif isinstance(data, np.ndarray):
@@ -21,6 +21,7 @@ from taipy.core.exceptions.exceptions import NonExistingJob, NonExistingTaskConf
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
+from ...commons.pagination import paginate
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
 from ..schemas import JobSchema
@@ -135,6 +136,12 @@ class JobList(Resource):
       description: |
         Return an array of all jobs.
 
+        The jobs are ordered by id. When any of the *limit*, *offset* or *cursor* query parameters is set,
+        only a page of jobs is returned, as an object holding the `JobSchema^` list under the *results*
+        key, the cursor of the next page under the *next_cursor* key, and the url of the next page under the
+        *next* key. The cursor and url are null on the last page. Following the cursors does not get slower
+        on the last pages, unlike increasing the offset.
+
         !!! Note
           When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
           requires `TAIPY_READER` role.
@@ -145,6 +152,23 @@ class JobList(Resource):
           curl -X GET http://localhost:5000/api/v1/jobs
         ```
 
+      parameters:
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of jobs of the page. The default value is 50 if *offset* or *cursor* is set.
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of jobs to skip.
+        - in: query
+          name: cursor
+          schema:
+            type: string
+          description: The *next_cursor* returned with the previous page.
       responses:
         200:
           content:
@@ -206,8 +230,8 @@ class JobList(Resource):
     def get(self):
         schema = JobSchema(many=True)
         manager = _JobManagerFactory._build_manager()
-        jobs = manager._get_all()
-        return schema.dump(jobs)
+        filters = manager._build_filters_with_version(None)
+        return paginate(lambda limit, offset, after: manager._get_page(filters, limit, offset, after), schema.dump)
 
     @_middleware
     def post(self):
@@ -17,6 +17,7 @@ from taipy.core import Scenario
 from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingScenarioConfig
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 
+from ...commons.pagination import paginate
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
@@ -307,10 +308,33 @@ class ScenarioList(Resource):
                 []
                 ```
 
+        The scenarios are ordered by id. When any of the *limit*, *offset* or *cursor* query parameters is set,
+        only a page of scenarios is returned, as an object holding the `ScenarioSchema^` list under the *results*
+        key, the cursor of the next page under the *next_cursor* key, and the url of the next page under the
+        *next* key. The cursor and url are null on the last page. Following the cursors does not get slower
+        on the last pages, unlike increasing the offset.
+
         !!! Note
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      parameters:
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of scenarios of the page. The default value is 50 if *offset* or *cursor* is set.
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of scenarios to skip.
+        - in: query
+          name: cursor
+          schema:
+            type: string
+          description: The *next_cursor* returned with the previous page.
       responses:
         200:
           content:
@@ -425,8 +449,11 @@ class ScenarioList(Resource):
     def get(self):
         schema = ScenarioResponseSchema(many=True)
         manager = _ScenarioManagerFactory._build_manager()
-        scenarios = [_to_model(REPOSITORY, scenario) for scenario in manager._get_all()]
-        return schema.dump(scenarios)
+        filters = manager._build_filters_with_version(None)
+        return paginate(
+            lambda limit, offset, after: manager._get_page(filters, limit, offset, after),
+            lambda scenarios: schema.dump([_to_model(REPOSITORY, scenario) for scenario in scenarios]),
+        )
 
     @_middleware
     def post(self):
@@ -9,42 +9,66 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-"""Simple helper to paginate query
-"""
+"""Simple helper to paginate the entity listings"""
+
+import base64
+import binascii
+
 from flask import request, url_for
 
+from ..api.exceptions.exceptions import InvalidQueryParameterException
+
 DEFAULT_PAGE_SIZE = 50
-DEFAULT_PAGE_NUMBER = 1
-
-
-def extract_pagination(page=None, per_page=None, **request_args):
-    page = int(page) if page is not None else DEFAULT_PAGE_NUMBER
-    per_page = int(per_page) if per_page is not None else DEFAULT_PAGE_SIZE
-    return page, per_page, request_args
-
-
-def paginate(query, schema):
-    page, per_page, other_request_args = extract_pagination(**request.args)
-    page_obj = query.paginate(page=page, per_page=per_page)
-    next_ = url_for(
-        request.endpoint,
-        page=page_obj.next_num if page_obj.has_next else page_obj.page,
-        per_page=per_page,
-        **other_request_args,
-        **request.view_args
-    )
-    prev = url_for(
-        request.endpoint,
-        page=page_obj.prev_num if page_obj.has_prev else page_obj.page,
-        per_page=per_page,
-        **other_request_args,
-        **request.view_args
-    )
-
-    return {
-        "total": page_obj.total,
-        "pages": page_obj.pages,
-        "next": next_,
-        "prev": prev,
-        "results": schema.dump(page_obj.items),
-    }
+
+
+def _encode_cursor(entity_id: str) -> str:
+    return base64.urlsafe_b64encode(entity_id.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> str:
+    try:
+        return base64.b64decode(cursor.encode(), altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeError):
+        raise InvalidQueryParameterException(f"Invalid cursor: {cursor}.") from None
+
+
+def _to_int(name: str, value: str, minimum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise InvalidQueryParameterException(f"The {name} parameter must be an integer.") from None
+    if number < minimum:
+        raise InvalidQueryParameterException(f"The {name} parameter must be greater than or equal to {minimum}.")
+    return number
+
+
+def extract_pagination(limit=None, offset=None, cursor=None, **request_args):
+    limit = _to_int("limit", limit, 1) if limit is not None else DEFAULT_PAGE_SIZE
+    offset = _to_int("offset", offset, 0) if offset is not None else 0
+    after = _decode_cursor(cursor) if cursor is not None else None
+    return limit, offset, after, request_args
+
+
+def paginate(get_page, dump):
+    """Dump the page of entities requested by the *limit*, *offset* and *cursor* query parameters.
+
+    *get_page* is called with the limit, offset and the id after which the entities are retrieved,
+    and returns the entities ordered by id. *dump* serializes a list of entities.
+
+    Without any pagination parameter, all the entities are returned as a plain list. Otherwise, the
+    result holds the entities of the page, and the cursor and url of the next page if any.
+    """
+    if not any(arg in request.args for arg in ("limit", "offset", "cursor")):
+        return dump(get_page(None, 0, None))
+
+    limit, offset, after, other_request_args = extract_pagination(**request.args)
+    # One more entity is retrieved to know if there is a next page.
+    entities = get_page(limit + 1, offset, after)
+    next_cursor, next_ = None, None
+    if len(entities) > limit:
+        entities = entities[:limit]
+        next_cursor = _encode_cursor(entities[-1].id)
+        next_ = url_for(
+            request.endpoint, limit=limit, cursor=next_cursor, **other_request_args, **(request.view_args or {})
+        )
+    return {"results": dump(entities), "next_cursor": next_cursor, "next": next_}
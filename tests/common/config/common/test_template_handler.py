@@ -197,3 +197,15 @@ def test_to_frequency():
     assert Frequency.MONTHLY == _TemplateHandler._to_frequency("MONThLY")
     assert Frequency.QUARTERLY == _TemplateHandler._to_frequency("QuaRtERlY")
     assert Frequency.YEARLY == _TemplateHandler._to_frequency("Yearly")
+
+
+def test_replace_template_with_timedelta_type():
+    with mock.patch.dict(os.environ, {"foo": "7d"}):
+        assert _TemplateHandler._replace_templates("ENV[foo]", type=datetime.timedelta) == datetime.timedelta(days=7)
+    with mock.patch.dict(os.environ, {"foo": "2h13m"}):
+        assert _TemplateHandler._replace_templates("ENV[foo]", type=datetime.timedelta) == datetime.timedelta(
+            hours=2, minutes=13
+        )
+    with mock.patch.dict(os.environ, {"foo": "plop"}):
+        with pytest.raises(InconsistentEnvVariableError):
+            _TemplateHandler._replace_templates("ENV[foo]", type=datetime.timedelta)
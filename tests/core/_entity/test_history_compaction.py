@@ -0,0 +1,124 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.core import Orchestrator
+from taipy.core._entity._history_cli import _HistoryCLI
+from taipy.core._entity._history_compaction import _compact_history
+from taipy.core._repository._sql_repository import _SQLRepository
+from taipy.core.job._job_manager import _JobManager
+from taipy.core.job.status import Status
+from taipy.core.submission._submission_manager import _SubmissionManager
+
+
+def double(nb):
+    return nb * 2
+
+
+@pytest.fixture
+def storage_folder(tmp_path, request):
+    Config.configure_core(taipy_storage_folder=str(tmp_path), repository_type=getattr(request, "param", "filesystem"))
+    yield tmp_path
+    _SQLRepository._close_connections()
+    Config.unblock_update()
+    Config.configure_core(repository_type="filesystem")
+
+
+def _submit_scenario(nb_submissions):
+    input_cfg = Config.configure_data_node("number", default_data=21)
+    output_cfg = Config.configure_data_node("result")
+    task_cfg = Config.configure_task("double", double, input_cfg, output_cfg)
+    scenario = tp.create_scenario(Config.configure_scenario("scenario", [task_cfg]))
+    start = datetime.now() - timedelta(days=nb_submissions)
+    submissions = []
+    for i in range(nb_submissions):
+        submission = _SubmissionManager._get(tp.submit(scenario).id)
+        # Spread the creation dates over the past days
+        creation_date = start + timedelta(days=i)
+        submission._creation_date = creation_date
+        _SubmissionManager._set(submission)
+        job = _JobManager._get(submission.jobs[0].id)
+        job._creation_date = creation_date
+        _JobManager._set(job)
+        submissions.append(submission)
+    return scenario, submissions
+
+
+@pytest.mark.parametrize("storage_folder", ["filesystem", "sql"], indirect=True)
+def test_compact_history_keeps_the_most_recent_entities(storage_folder):
+    scenario, submissions = _submit_scenario(5)
+
+    assert _compact_history(history_max_nb=2) == (3, 3)
+    assert {s.id for s in _SubmissionManager._get_all()} == {s.id for s in submissions[3:]}
+    assert {j.id for j in _JobManager._get_all()} == {s.jobs[0].id for s in submissions[3:]}
+    assert tp.get_latest_submission(scenario) == submissions[-1]
+
+    archived_submissions = _SubmissionManager._get_archived()
+    assert {s.id for s in archived_submissions} == {s.id for s in submissions[:3]}
+    assert all(s.entity_id == scenario.id for s in archived_submissions)
+    archived_jobs = _JobManager._get_archived([{"submit_id": submissions[0].id}])
+    assert len(archived_jobs) == 1
+    assert archived_jobs[0].status == Status.COMPLETED
+
+    # Nothing more to compact
+    assert _compact_history(history_max_nb=2) == (0, 0)
+
+
+def test_compact_history_keeps_recent_and_unfinished_entities(storage_folder):
+    _, submissions = _submit_scenario(4)
+    unfinished_job = submissions[0].jobs[0]
+    unfinished_job.status = Status.PENDING
+
+    # The submissions of the last 2 days and the unfinished job are retained
+    assert _compact_history(history_max_age=timedelta(days=1, hours=12)) == (2, 3)
+    assert {s.id for s in _SubmissionManager._get_all()} == {submissions[3].id}
+    assert {j.id for j in _JobManager._get_all()} == {unfinished_job.id, submissions[3].jobs[0].id}
+
+    # The latest entities are always retained
+    assert _compact_history(history_max_age=timedelta(days=1), now=datetime.now() + timedelta(days=30)) == (0, 0)
+
+
+def test_compact_history_with_job_config(storage_folder):
+    _, submissions = _submit_scenario(3)
+    assert _compact_history() == (0, 0)
+
+    Config.unblock_update()
+    Config.configure_job_executions(history_max_nb=1)
+    orchestrator = Orchestrator()
+    orchestrator.run()
+    orchestrator.stop()
+    assert [s.id for s in _SubmissionManager._get_all()] == [submissions[-1].id]
+    assert len(_JobManager._get_archived()) == 2
+
+
+def test_compact_history_cli(storage_folder, caplog):
+    _submit_scenario(3)
+    Config.unblock_update()
+
+    _HistoryCLI.create_parser()
+    with patch("sys.argv", ["prog", "compact-history"]):
+        with pytest.raises(SystemExit) as error:
+            _HistoryCLI.handle_command()
+    assert error.value.code == 1
+    assert "No history retention policy is configured" in caplog.text
+
+    with patch("sys.argv", ["prog", "compact-history", "--storage-folder", str(storage_folder), "--max-nb", "2"]):
+        with pytest.raises(SystemExit) as error:
+            _HistoryCLI.handle_command()
+    assert error.value.code == 0
+    assert "Archived 1 jobs and 1 submissions." in caplog.text
+    assert len(_SubmissionManager._get_all()) == 2
@@ -12,6 +12,7 @@
 import filecmp
 import os
 import shutil
+import sqlite3
 from unittest.mock import patch
 
 import mongomock
@@ -251,3 +252,46 @@ def test_not_provide_valid_repository_type(caplog):
         with patch("sys.argv", ["prog", "migrate", "--repository-type", "invalid-repository-type"]):
             _MigrateCLI.handle_command()
             assert "Unknown repository type invalid-repository-type" in caplog.text
+
+
+def test_migrate_fs_rebuild_catalog(caplog):
+    _MigrateCLI.create_parser()
+
+    data_sample_path = "tests/core/_entity/data_sample"
+    data_path = "tests/core/_entity/.data"
+    shutil.copytree(data_sample_path, data_path)
+
+    with pytest.raises(SystemExit) as err:
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "filesystem", data_path, "--rebuild-catalog"]):
+            _MigrateCLI.handle_command()
+    assert err.value.code == 0
+    assert f"Rebuilt the entity catalogs of the '{data_path}' folder." in caplog.text
+    for dir_name in ["cycles", "data_nodes", "jobs", "scenarios", "tasks"]:
+        assert os.path.exists(os.path.join(data_path, dir_name, ".catalog.jsonl"))
+
+    # Rebuilding the catalog of a mongo repository is not supported
+    with pytest.raises(SystemExit) as err:
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "mongo", "--rebuild-catalog"]):
+            _MigrateCLI.handle_command()
+    assert err.value.code == 1
+
+
+def test_migrate_fs_to_sql(caplog):
+    _MigrateCLI.create_parser()
+
+    data_sample_path = "tests/core/_entity/data_sample_migrated"
+    data_path = "tests/core/_entity/.data"
+    shutil.copytree(data_sample_path, data_path)
+    db_location = os.path.join(data_path, "taipy.sqlite3")
+
+    with pytest.raises(SystemExit) as err:
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "filesystem", data_path, "--to-sql"]):
+            _MigrateCLI.handle_command()
+    assert err.value.code == 0
+    assert f"Starting entity copy from '{data_path}' folder to '{db_location}' database." in caplog.text
+
+    with sqlite3.connect(db_location) as connection:
+        for table_name in ["cycles", "data_nodes", "jobs", "scenarios", "tasks", "version"]:
+            nb_files = len([f for f in os.listdir(os.path.join(data_path, table_name)) if f.endswith(".json")])
+            assert connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0] == nb_files
+    connection.close()
@@ -13,11 +13,13 @@ import dataclasses
 import pathlib
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Union
+from unittest import mock
 
 from taipy.common.config import Config
 from taipy.core._manager._manager import _Manager
 from taipy.core._repository._abstract_converter import _AbstractConverter
 from taipy.core._repository._abstract_repository import _AbstractRepository
+from taipy.core._repository._file_content_cache import _FileContentCache
 from taipy.core._repository._filesystem_repository import _FileSystemRepository
 from taipy.core._version._version_manager import _VersionManager
 
@@ -79,6 +81,9 @@ class MockRepository(_AbstractRepository):  # type: ignore
     def _exists(self, entity_id: str) -> bool:
         return self.repo._exists(entity_id)
 
+    def _get_revision(self, entity_id: str, reliable: bool = True):
+        return self.repo._get_revision(entity_id, reliable)
+
     def _delete(self, entity_id: str):
         return self.repo._delete(entity_id)
 
@@ -125,6 +130,34 @@ class TestManager:
         MockManager._set(m)
         assert MockManager._get(m.id) == m
 
+    def test_get_entity_not_saved_since(self):
+        MockManager._set(MockEntity("uuid", "foo"))
+        loaded = MockManager._get("uuid")
+        # The entity was saved too recently for its revision to be reliable
+        assert MockManager._get(loaded) is not loaded
+
+        with mock.patch.object(_FileContentCache, "_RACY_WINDOW_NS", -1_000_000_000):
+            loaded = MockManager._get("uuid")
+            assert MockManager._get(loaded) is loaded
+
+            # Only the last instance loaded is returned as is
+            other = MockManager._get("uuid")
+            assert MockManager._get(other) is other
+            assert MockManager._get(loaded) is not loaded
+
+            # A saved instance is loaded again
+            latest = MockManager._get("uuid")
+            MockManager._set(latest)
+            assert MockManager._get(latest) is not latest
+
+            latest = MockManager._get("uuid")
+            MockManager._set(MockEntity("uuid", "bar"))
+            assert MockManager._get(latest).name == "bar"
+
+            latest = MockManager._get("uuid")
+            MockManager._delete("uuid")
+            assert MockManager._get(latest) is None
+
     def test_get_all(self):
         MockManager._delete_all()
 
@@ -161,6 +194,15 @@ class TestManager:
         MockManager._delete_many(["uuid-0", "uuid-1"])
         assert len(MockManager._get_all()) == 3
 
+    def test_set_and_get_many(self):
+        MockManager._delete_all()
+
+        objs = [MockEntity(f"uuid-{i}", f"Foo{i}") for i in range(5)]
+        MockManager._set_many(objs)
+
+        assert len(MockManager._get_all()) == 5
+        assert MockManager._get_many(["uuid-4", objs[0], "non-existent"]) == [objs[4], objs[0]]
+
     def test_is_editable(self):
         m = MockEntity("uuid", "Foo")
         MockManager._set(m)
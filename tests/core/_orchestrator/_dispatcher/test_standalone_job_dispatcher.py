@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import call
 
@@ -17,6 +17,7 @@ from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.core import JobId
 from taipy.core._orchestrator._dispatcher import _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.job.job import Job
@@ -69,7 +70,9 @@ def test_dispatch_job():
     assert submit_first_call[0].job_id == job.id
     assert submit_first_call[0].task == task
     assert submit_first_call[1] == ()
-    assert submit_first_call[2]["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+    config_as_string = _TomlSerializer()._serialize(Config._applied_config)
+    assert submit_first_call[2]["config_as_string"] == config_as_string
+    assert submit_first_call[2]["config_hash"] == _TaskFunctionWrapper._hash_config(config_as_string)
 
     # test that the job status is updated after execution on future
     assert len(dispatcher.update_job_status_from_future_calls) == 1
@@ -77,6 +80,39 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+
+def test_dispatch_job_without_config_when_workers_are_synchronized():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    dispatcher = MockStandaloneDispatcher(orchestrator)
+    Config.block_update()
+    _, dispatcher._workers_config_hash = dispatcher._get_config()
+
+    dispatcher._dispatch(job)
+
+    submit_call = dispatcher._executor.submit_called[-1]
+    assert submit_call[2] == {"config_hash": dispatcher._workers_config_hash}
+    Config.unblock_update()
+
+
+
+def test_dispatch_job_of_task_executed_in_a_thread():
+    task = Task("config_id", {"execution_mode": "thread"}, nothing, [], [])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("job"), task, "s_id", task.id)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    dispatcher = MockStandaloneDispatcher(orchestrator)
+    nb_process_submissions = len(dispatcher._executor.submit_called)
+
+    dispatcher._dispatch(job)
+
+    assert len(dispatcher._executor.submit_called) == nb_process_submissions
+    assert isinstance(dispatcher._thread_executor, ThreadPoolExecutor)
+    assert_true_after_time(job.is_completed)
+    dispatcher._thread_executor.shutdown()
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
@@ -124,3 +160,42 @@ def test_run():
         assert_true_after_time(lambda: mck.call_count == 4, time=5, msg="The 4 jobs were not dequeued.")
         dispatcher.stop()
         mck.assert_has_calls([call(job_1), call(job_2), call(job_3), call(job_4)])
+
+
+def test_run_is_woken_up_when_a_job_is_queued():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    with mock.patch("taipy.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher._execute_job") as mck:
+        dispatcher = _StandaloneJobDispatcher(orchestrator)
+        dispatcher.start()
+        orchestrator._orchestrate_job_to_run_or_block([job])
+        assert_true_after_time(lambda: mck.call_count == 1, time=1, msg="The job was not dequeued.")
+        dispatcher.stop(timeout=1)
+        assert not dispatcher.is_running()
+        mck.assert_called_once_with(job)
+
+
+def test_run_is_woken_up_when_a_worker_is_released():
+    task = create_task()
+    job_1 = Job(JobId("job1"), task, "s_id", task.id)
+    job_2 = Job(JobId("job2"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job_1)
+    _JobManagerFactory._build_manager()._set(job_2)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    with mock.patch("taipy.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher._execute_job") as mck:
+        dispatcher = _StandaloneJobDispatcher(orchestrator)
+        dispatcher._nb_available_workers = 0
+        orchestrator.jobs_to_run.put(job_2)
+        dispatcher.start()
+        assert not mck.called
+
+        ft = Future()
+        ft.set_result(None)
+        dispatcher._update_job_status_from_future(job_1, ft)
+        assert_true_after_time(lambda: mck.call_count == 1, time=1, msg="The job was not dequeued.")
+        dispatcher.stop(timeout=1)
+        mck.assert_called_once_with(job_2)
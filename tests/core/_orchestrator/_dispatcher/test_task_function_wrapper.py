@@ -11,6 +11,9 @@
 
 import random
 import string
+from typing import Iterator
+
+import pandas as pd
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
@@ -128,3 +131,59 @@ def test_can_execute_task_with_a_modified_config():
     res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_config_is_only_applied_when_its_hash_changes(monkeypatch):
+    monkeypatch.setattr(_TaskFunctionWrapper, "_config_hash", None)
+    deserialize = _TomlSerializer._deserialize
+    calls = []
+
+    def spy_deserialize(config_as_string):
+        calls.append(config_as_string)
+        return deserialize(config_as_string)
+
+    monkeypatch.setattr(_TomlSerializer, "_deserialize", staticmethod(spy_deserialize))
+    task = _create_task(multiply)
+    cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+    cfg_hash = _TaskFunctionWrapper._hash_config(cfg_as_str)
+
+    _TaskFunctionWrapper("job_id_1", task).execute(config_as_string=cfg_as_str, config_hash=cfg_hash)
+    _TaskFunctionWrapper("job_id_2", task).execute(config_as_string=cfg_as_str, config_hash=cfg_hash)
+    _TaskFunctionWrapper("job_id_3", task).execute(config_hash=cfg_hash)
+    assert len(calls) == 1
+
+    # The config could have been modified while it was unblocked
+    Config.unblock_update()
+    _TaskFunctionWrapper("job_id_4", task).execute(config_as_string=cfg_as_str, config_hash=cfg_hash)
+    assert len(calls) == 2
+
+
+def test_initialize_worker(monkeypatch):
+    monkeypatch.setattr(_TaskFunctionWrapper, "_in_worker", False)
+    monkeypatch.setattr(_TaskFunctionWrapper, "_config_hash", None)
+    monkeypatch.setattr(_TaskFunctionWrapper, "_data_node_cache", _TaskFunctionWrapper._data_node_cache)
+    initializer_calls = []
+
+    Config.configure_job_executions(mode="standalone", worker_cache_size=12)
+    cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+    _TaskFunctionWrapper._initialize_worker(cfg_as_str, None, lambda: initializer_calls.append(True))
+
+    assert _TaskFunctionWrapper._config_hash == _TaskFunctionWrapper._hash_config(cfg_as_str)
+    assert _TaskFunctionWrapper._data_node_cache.max_size == 12
+    assert initializer_calls == [True]
+
+
+def double_chunks(chunks):
+    assert isinstance(chunks, Iterator)
+    return (chunk * 2 for chunk in chunks)
+
+
+def test_execute_task_with_chunked_input(tmp_path):
+    input_config = Config.configure_csv_data_node("chunked_input", str(tmp_path / "input.csv"), chunk_size=3)
+    output_config = Config.configure_csv_data_node("chunked_output", str(tmp_path / "output.csv"))
+    input_dn, output_dn = _DataManager._bulk_get_or_create([input_config, output_config]).values()
+    input_dn.write(pd.DataFrame({"a": range(10)}))
+    task = Task("double_chunks", {}, function=double_chunks, input=[input_dn], output=[output_dn])
+
+    assert _TaskFunctionWrapper("job_id", task).execute() == []
+    assert output_dn.read()["a"].tolist() == [i * 2 for i in range(10)]
@@ -0,0 +1,85 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from taipy.common.config import Config
+from taipy.core import JobId
+from taipy.core._orchestrator._dispatcher import _ThreadJobDispatcher
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.config.job_config import JobConfig
+from taipy.core.job.job import Job
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from taipy.core.task.task import Task
+from tests.core.utils import assert_true_after_time
+
+
+def nothing(*args):
+    return
+
+
+THREAD_NAMES = []
+
+
+def append_thread_name():
+    THREAD_NAMES.append(threading.current_thread().name)
+
+
+def create_task(function=nothing):
+    task = Task("config_id", {}, function, [], [])
+    _TaskManagerFactory._build_manager()._set(task)
+    return task
+
+
+def test_init_default():
+    Config.configure_job_executions(mode=JobConfig._THREAD_MODE)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_dispatcher = _ThreadJobDispatcher(orchestrator)
+
+    assert job_dispatcher.orchestrator == orchestrator
+    assert job_dispatcher.lock == orchestrator.lock
+    assert job_dispatcher._nb_available_workers == 2
+    assert isinstance(job_dispatcher._executor, ThreadPoolExecutor)
+
+
+def test_init_with_nb_workers():
+    Config.configure_job_executions(mode=JobConfig._THREAD_MODE, max_nb_of_workers=3)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_dispatcher = _ThreadJobDispatcher(orchestrator)
+
+    assert job_dispatcher._nb_available_workers == 3
+
+
+def test_dispatch_job_in_a_thread():
+    THREAD_NAMES.clear()
+    task = create_task(append_thread_name)
+    job = Job(JobId("job"), task, "s_id", task.id)
+    dispatcher = _ThreadJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    dispatcher._dispatch(job)
+
+    assert_true_after_time(job.is_completed)
+    assert THREAD_NAMES[0].startswith("Thread-Taipy-Job")
+    assert_true_after_time(lambda: dispatcher._nb_available_workers == 2)
+    dispatcher._executor.shutdown()
+
+
+def test_update_job_status_from_future():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    dispatcher = _ThreadJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    ft = Future()
+    ft.set_result([ValueError("error")])
+    dispatcher._nb_available_workers = 1
+    dispatcher._update_job_status_from_future(job, ft)
+    assert dispatcher._nb_available_workers == 2
+    assert job.is_failed()
@@ -0,0 +1,65 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+
+from taipy.common.config import Config
+from taipy.core._orchestrator._dispatcher._warm_data_node_cache import _WarmDataNodeCache
+from taipy.core.data._data_manager import _DataManager
+
+
+def _age_entity_file(data_node):
+    path = _DataManager._repository.dir_path / f"{data_node.id}.json"
+    file_stat = path.stat()
+    # Files modified within the racy window have no reliable revision
+    os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns - 2_000_000_000))
+
+
+def test_serve_data_node_while_revision_is_unchanged():
+    dn = _DataManager._create_and_set(Config.configure_pickle_data_node("dn", default_data=1), None, None)
+    _age_entity_file(dn)
+    cache = _WarmDataNodeCache(10)
+
+    first, second = cache._get(dn.id), cache._get(dn.id)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    first.write(2)
+    _age_entity_file(dn)
+    third = cache._get(dn.id)
+    assert third is not first
+    assert third.read() == 2
+    assert cache.misses == 2
+
+
+def test_data_node_is_not_cached_without_revision():
+    dn = _DataManager._create_and_set(Config.configure_pickle_data_node("dn", default_data=1), None, None)
+    cache = _WarmDataNodeCache(10)
+
+    assert cache._get(dn.id) is not cache._get(dn.id)
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded():
+    dn_config = Config.configure_pickle_data_node("dn", default_data=1)
+    data_nodes = [_DataManager._create_and_set(dn_config, None, None) for _ in range(3)]
+    for dn in data_nodes:
+        _age_entity_file(dn)
+
+    disabled_cache = _WarmDataNodeCache(0)
+    disabled_cache._get(data_nodes[0].id)
+    assert len(disabled_cache) == 0
+
+    cache = _WarmDataNodeCache(2)
+    for dn in data_nodes:
+        cache._get(dn.id)
+    assert len(cache) == 2
+    assert list(cache._entries) == [data_nodes[1].id, data_nodes[2].id]
@@ -13,7 +13,9 @@ from unittest import mock
 import taipy
 from taipy import Job, JobId, Status
 from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.config import JobConfig
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
@@ -76,68 +78,74 @@ def test_on_status_change_on_running_job_does_nothing():
         assert orchestrator.jobs_to_run.qsize() == 0
 
 
-def test_on_status_change_on_completed_job():
+def create_blocked_jobs(scenario):
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_completed = create_job("completed_job", Status.COMPLETED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
+    j1 = create_job_from_task("j1", scenario.t1)
+    j2 = create_job_from_task("j2", scenario.t2)
+    j3 = create_job_from_task("j3", scenario.t3)
+    scenario.dn_1.lock_edit()
+    orchestrator._orchestrate_job_to_run_or_block([j2, j3])
+    return j1, j2, j3
+
 
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+def test_on_status_change_on_completed_job():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    j1, j2, j3 = create_blocked_jobs(scenario)
+    assert j2.is_blocked()
+    assert j3.is_blocked()
+    assert len(orchestrator.blocked_jobs) == 2
 
+    scenario.dn_1.write(1)
+    j1.status = Status.COMPLETED
     with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
-        orchestrator._on_status_change(job_4_completed)
+        orchestrator._on_status_change(j1)
 
-        assert job_1_blocked in orchestrator.blocked_jobs
-        assert job_1_blocked.is_blocked()
-        assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
-        assert job_2_to_be_unblocked.is_pending()
-        assert job_3_blocked in orchestrator.blocked_jobs
-        assert job_3_blocked.is_blocked()
-        assert job_4_completed.is_completed()
-        assert len(orchestrator.blocked_jobs) == 2
+        # Only the jobs waiting for the outputs of the completed job are checked
+        mck.assert_not_called()
+        assert j1.is_completed()
+        assert j2 not in orchestrator.blocked_jobs
+        assert j2.is_pending()
+        assert j3 in orchestrator.blocked_jobs
+        assert j3.is_blocked()
+        assert len(orchestrator.blocked_jobs) == 1
         assert orchestrator.jobs_to_run.qsize() == 1
-        assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
+        assert orchestrator.jobs_to_run.get() == j2
 
 
 def test_on_status_change_on_skipped_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_skipped = create_job("skipped_job", Status.SKIPPED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
+    scenario = create_scenario()
+    j1, j2, j3 = create_blocked_jobs(scenario)
 
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+    scenario.dn_1.write(1)
+    j1.status = Status.SKIPPED
+    orchestrator._on_status_change(j1)
 
-    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
+    # Assert that when the status is skipped, the unblock jobs mechanism is executed
+    assert j1.is_skipped()
+    assert j2 not in orchestrator.blocked_jobs
+    assert j2.is_pending()
+    assert j3 in orchestrator.blocked_jobs
+    assert j3.is_blocked()
+    assert len(orchestrator.blocked_jobs) == 1
+    assert orchestrator.jobs_to_run.qsize() == 1
+    assert orchestrator.jobs_to_run.get() == j2
 
-        orchestrator._on_status_change(job_4_skipped)
 
-        # Assert that when the status is skipped, the unblock jobs mechanism is executed
-        assert job_1_blocked in orchestrator.blocked_jobs
-        assert job_1_blocked.is_blocked()
-        assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
-        assert job_2_to_be_unblocked.is_pending()
-        assert job_3_blocked in orchestrator.blocked_jobs
-        assert job_3_blocked.is_blocked()
-        assert job_4_skipped.is_skipped()
-        assert len(orchestrator.blocked_jobs) == 2
-        assert orchestrator.jobs_to_run.qsize() == 1
-        assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
+def test_on_status_change_on_completed_job_with_output_still_locked():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    j1, j2, j3 = create_blocked_jobs(scenario)
+
+    # dn_1 is still being edited, so j2 cannot run yet
+    j1.status = Status.COMPLETED
+    orchestrator._on_status_change(j1)
+
+    assert j2.is_blocked()
+    assert j3.is_blocked()
+    assert len(orchestrator.blocked_jobs) == 2
+    assert orchestrator.jobs_to_run.qsize() == 0
 
 
 def test_on_status_change_on_failed_job():
@@ -162,3 +170,64 @@ def test_on_status_change_on_failed_job():
     assert j3.is_blocked()
     assert len(orchestrator.blocked_jobs) == 1
     assert orchestrator.jobs_to_run.qsize() == 0
+
+
+def test_blocked_job_is_released_by_a_manual_write():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    _, j2, j3 = create_blocked_jobs(scenario)
+
+    scenario.dn_1.write(1)
+
+    assert j2 not in orchestrator.blocked_jobs
+    assert j2.is_pending()
+    assert j3.is_blocked()
+    assert orchestrator.jobs_to_run.get_nowait() == j2
+
+
+def create_scenarios_sharing_a_data_node():
+    # scenario_a: t_write --> shared_dn
+    # scenario_b: shared_dn --> t_read
+    shared_dn_cfg = Config.configure_pickle_data_node("shared_dn", scope=Scope.GLOBAL)
+    t_write_cfg = Config.configure_task("t_write", nothing, [], [shared_dn_cfg])
+    t_read_cfg = Config.configure_task("t_read", nothing, [shared_dn_cfg], [])
+    scenario_a_cfg = Config.configure_scenario("scenario_a", [t_write_cfg])
+    scenario_b_cfg = Config.configure_scenario("scenario_b", [t_read_cfg])
+    return taipy.create_scenario(scenario_a_cfg), taipy.create_scenario(scenario_b_cfg)
+
+
+def test_blocked_job_is_released_when_another_submission_writes_its_input():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario_a, scenario_b = create_scenarios_sharing_a_data_node()
+
+    # No dispatcher is running: the jobs are not executed
+    job_write = orchestrator.submit(scenario_a).jobs[0]
+    job_read = orchestrator.submit(scenario_b).jobs[0]
+    assert job_write.is_pending()
+    assert job_read.is_blocked()
+
+    # The reading job waits for the writing job to be completed
+    scenario_a.shared_dn.write(1, job_id=job_write.id)
+    assert job_read.is_blocked()
+
+    job_write.completed()
+    assert job_read not in orchestrator.blocked_jobs
+    assert job_read.is_pending()
+
+
+def test_blocked_job_is_released_when_another_submission_fails():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario_a, scenario_b = create_scenarios_sharing_a_data_node()
+    scenario_a.shared_dn.write(0)
+
+    job_write = orchestrator.submit(scenario_a).jobs[0]
+    job_read = orchestrator.submit(scenario_b).jobs[0]
+    assert job_read.is_blocked()
+
+    # The output of the failed job is unlocked, and its previous value can be read
+    job_write.failed()
+
+    assert job_read not in orchestrator.blocked_jobs
+    assert job_read.is_pending()
@@ -52,6 +52,32 @@ def create_scenario():
     return taipy.create_scenario(sc_conf)
 
 
+def test_submit_scenario_without_task_does_not_track_submission():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    scenario = taipy.create_scenario(Config.configure_scenario("empty_scenario_cfg"))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    orchestrator.submit(scenario)
+    assert orchestrator.tracked_submissions == {}
+
+
+def test_deleted_submissions_are_not_tracked_anymore():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    scenario = create_scenario()
+    scenario.dn_0.write(0)  # input data is made ready
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    submission_manager = _SubmissionManagerFactory._build_manager()
+
+    submission_1 = orchestrator.submit(scenario)
+    submission_2 = orchestrator.submit(scenario)
+    assert set(orchestrator.tracked_submissions) == {submission_1.id, submission_2.id}
+
+    submission_manager._delete_many([submission_1.id])
+    assert set(orchestrator.tracked_submissions) == {submission_2.id}
+    submission_manager._delete_all()
+    assert orchestrator.tracked_submissions == {}
+
+
 def test_submit_scenario_development_mode():
     scenario = create_scenario()
     scenario.dn_0.write(0)  # input data is made ready
@@ -488,6 +514,27 @@ def test_submit_sequence_with_callbacks_and_force_and_wait():
     assert len(jobs[2]._subscribers) == 3  # nothing, _update_submission_status, and _on_status_change
 
 
+def test_submit_scenario_tracks_submission_until_finished():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE)
+    scenario = create_scenario()
+    scenario.dn_0.write(0)  # input data is made ready
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    submission = orchestrator.submit(scenario)  # No dispatcher running. The scenario is not executed.
+    assert orchestrator.tracked_submissions == {submission.id: submission}
+    assert submission.submission_status == SubmissionStatus.PENDING
+
+    # The job status changes update the tracked submission without reloading it
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    jobs = submission.jobs
+    with mock.patch.object(submission_manager, "_get") as mck_get:
+        for job in jobs:
+            job.completed()
+        mck_get.assert_not_called()
+    assert orchestrator.tracked_submissions == {}
+    assert submission.submission_status == SubmissionStatus.COMPLETED
+
+
 def test_submit_submittable_generate_unique_submit_id():
     dn_1 = PickleDataNode("dn_config_id_1", Scope.SCENARIO)
     dn_2 = PickleDataNode("dn_config_id_2", Scope.SCENARIO)
@@ -14,7 +14,11 @@ from unittest import mock
 import pytest
 
 from taipy.common.config import Config
-from taipy.core._orchestrator._dispatcher import _DevelopmentJobDispatcher, _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher import (
+    _DevelopmentJobDispatcher,
+    _StandaloneJobDispatcher,
+    _ThreadJobDispatcher,
+)
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.config.job_config import JobConfig
@@ -104,6 +108,23 @@ def test_rebuild_standalone_dispatcher_and_force_restart():
     _OrchestratorFactory._dispatcher.stop()
 
 
+def test_build_thread_dispatcher():
+    Config.configure_job_executions(mode=JobConfig._THREAD_MODE)
+    _OrchestratorFactory._orchestrator = None
+    _OrchestratorFactory._dispatcher = None
+    _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+    assert isinstance(_OrchestratorFactory._dispatcher, _ThreadJobDispatcher)
+    assert _OrchestratorFactory._dispatcher.is_running()
+
+    dispatcher = _OrchestratorFactory._dispatcher
+    Config.unblock_update()
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    _OrchestratorFactory._build_dispatcher()
+    assert isinstance(_OrchestratorFactory._dispatcher, _DevelopmentJobDispatcher)
+    assert not dispatcher.is_running()
+
+
 def test_build_unknown_dispatcher():
     Config.configure_job_executions(mode="UNKNOWN")
     _OrchestratorFactory._build_orchestrator()
@@ -0,0 +1,78 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from taipy import Job, JobId, Task
+from taipy.core._orchestrator._readiness_graph import _ReadinessGraph
+
+
+def nothing(*args, **kwargs):
+    pass
+
+
+def create_job(id):
+    return Job(JobId(id), Task("config_id", {}, nothing), "s_id", "e_id")
+
+
+def test_resolve_decrements_only_waiting_jobs():
+    graph = _ReadinessGraph()
+    job_1, job_2 = create_job("job_1"), create_job("job_2")
+    graph._add(job_1, {"dn_1", "dn_2"})
+    graph._add(job_2, {"dn_2", "dn_3"})
+    assert len(graph) == 2
+
+    assert graph._resolve("dn_1") == []
+    assert graph._resolve("dn_1") == []
+    assert graph._resolve("dn_2") == [job_1]
+    assert "job_1" not in graph
+    assert graph._jobs_waiting_for("dn_2") == []
+    assert graph._jobs_waiting_for("dn_3") == [job_2]
+    assert graph._resolve("dn_3") == [job_2]
+    assert len(graph) == 0
+
+
+def test_remove():
+    graph = _ReadinessGraph()
+    job_1, job_2 = create_job("job_1"), create_job("job_2")
+    graph._add(job_1, {"dn_1"})
+    graph._add(job_2, {"dn_1"})
+
+    graph._remove("job_1")
+    graph._remove("unknown_job")
+
+    assert graph._job_ids() == ["job_2"]
+    assert graph._resolve("dn_1") == [job_2]
+
+
+def test_add_twice_replaces_the_dependencies():
+    graph = _ReadinessGraph()
+    job = create_job("job")
+    graph._add(job, {"dn_1"})
+    graph._add(job, {"dn_2"})
+
+    assert graph._jobs_waiting_for("dn_1") == []
+    assert graph._resolve("dn_2") == [job]
+
+
+def test_producers():
+    graph = _ReadinessGraph()
+    job_1, job_2 = create_job("job_1"), create_job("job_2")
+    graph._add_producer(job_1, {"dn_1"})
+    graph._add_producer(job_2, {"dn_1", "dn_2"})
+
+    graph._remove_producer(job_2, {"dn_1", "dn_2"})
+    assert graph._is_produced("dn_1")
+    assert not graph._is_produced("dn_2")
+
+    # Clearing the blocked jobs keeps the producers
+    graph._clear()
+    assert graph._is_produced("dn_1")
+    graph._remove_producer(job_1, {"dn_1"})
+    assert not graph._is_produced("dn_1")
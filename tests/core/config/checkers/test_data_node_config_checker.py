@@ -130,7 +130,7 @@ class TestDataNodeConfigChecker:
         assert len(Config._collector.errors) == 1
         expected_error_message = (
             "`storage_type` field of DataNodeConfig `new` must be either csv, sql_table,"
-            " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+            " sql, mongo_collection, pickle, excel, generic, json, parquet, arrow, s3_object, or in_memory."
             ' Current value of property `storage_type` is "bar".'
         )
         assert expected_error_message in caplog.text
@@ -688,3 +688,38 @@ class TestDataNodeConfigChecker:
         config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": MyCustomClass}
         Config.check()
         assert len(Config._collector.errors) == 0
+
+        config._sections[DataNodeConfig.name]["default"].properties = {"exposed_type": "arrow"}
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+
+        config._sections[DataNodeConfig.name]["default"].storage_type = "arrow"
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+    def test_check_chunk_size(self, caplog):
+        config = Config._applied_config
+        Config._compile_configs()
+
+        for storage_type in ["csv", "parquet"]:
+            config._sections[DataNodeConfig.name]["default"].storage_type = storage_type
+            config._sections[DataNodeConfig.name]["default"].properties = {"chunk_size": 10}
+            Config._collector = IssueCollector()
+            Config.check()
+            assert len(Config._collector.errors) == 0
+
+        for storage_type in ["pickle", "json", "excel", "arrow"]:
+            config._sections[DataNodeConfig.name]["default"].storage_type = storage_type
+            config._sections[DataNodeConfig.name]["default"].properties = {"chunk_size": 10}
+            with pytest.raises(SystemExit):
+                Config._collector = IssueCollector()
+                Config.check()
+            assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            "The `chunk_size` of DataNodeConfig `default` is only supported by the csv, parquet, sql, sql_table, "
+            "mongo_collection storage types. Current value of property `chunk_size` is 10."
+        )
+        assert expected_error_message in caplog.text
@@ -9,6 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
 
 from taipy.common.config import Config
@@ -37,7 +41,7 @@ class TestJobConfigChecker:
             Config._collector = IssueCollector()
             Config.check()
         assert len(Config._collector.errors) == 1
-        expected_error_message = "Job execution mode must be either development, standalone."
+        expected_error_message = "Job execution mode must be either development, standalone, thread."
         assert expected_error_message in caplog.text
 
         Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
@@ -70,3 +74,39 @@ class TestJobConfigChecker:
             ' value of property `storage_type` is "in_memory".'
         )
         assert expected_error_message in caplog.text
+
+    def test_check_history_retention(self, caplog):
+        Config.configure_job_executions(history_max_nb=10, history_max_age=timedelta(days=30))
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_job_executions(history_max_nb=0, history_max_age=30)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 2
+        assert "`history_max_nb` field of the job config must be a positive integer." in caplog.text
+        assert "`history_max_age` field of the job config must be a timedelta." in caplog.text
+
+    def test_check_submission_status_persistence_delay(self, caplog):
+        Config.configure_job_executions(submission_status_persistence_delay=0.5)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_job_executions(submission_status_persistence_delay="ENV[PERSISTENCE_DELAY]")
+        with patch.dict(os.environ, {"PERSISTENCE_DELAY": "0.5"}):
+            Config._collector = IssueCollector()
+            Config.check()
+            assert len(Config._collector.errors) == 0
+            assert Config.job_config.submission_status_persistence_delay == 0.5
+
+        Config.configure_job_executions(submission_status_persistence_delay=-1)
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "`submission_status_persistence_delay` field of the job config must be a non-negative number." in (
+            caplog.text
+        )
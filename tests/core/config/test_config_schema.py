@@ -218,3 +218,18 @@ def test_validate_s3_object_datanode_config():
         }
     }
     validate(s3_object_cfg, json_schema)
+
+
+def test_validate_arrow_datanode_config():
+    validate({"DATA_NODE": {"arrow_dn": {"storage_type": "arrow"}}}, json_schema)
+
+    with pytest.raises(ValidationError):
+        validate({"DATA_NODE": {"unknown_dn": {"storage_type": "unknown"}}}, json_schema)
+
+
+def test_validate_job_config():
+    for mode in ["standalone", "development", "thread"]:
+        validate({"JOB": {"mode": mode}}, json_schema)
+
+    with pytest.raises(ValidationError):
+        validate({"JOB": {"mode": "unknown"}}, json_schema)
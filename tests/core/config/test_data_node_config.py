@@ -60,6 +60,11 @@ def test_data_node_config_default_parameter():
     assert pickle_dn_cfg.scope == Scope.SCENARIO
     assert pickle_dn_cfg.validity_period is None
 
+    arrow_dn_cfg = Config.configure_data_node("data_node_7_arrow", "arrow")
+    assert arrow_dn_cfg.scope == Scope.SCENARIO
+    assert arrow_dn_cfg.exposed_type == "pandas"
+    assert arrow_dn_cfg.validity_period is None
+
     sql_table_dn_cfg = Config.configure_data_node(
         "data_node_8", "sql_table", db_name="test", db_engine="mssql", table_name="test"
     )
@@ -132,7 +137,7 @@ def test_data_node_config_check(caplog):
         Config.check()
     expected_error_message = (
         "`storage_type` field of DataNodeConfig `data_nodes` must be either csv, sql_table,"
-        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory. Current"
+        " sql, mongo_collection, pickle, excel, generic, json, parquet, arrow, s3_object, or in_memory. Current"
         ' value of property `storage_type` is "bar".'
     )
     assert expected_error_message in caplog.text
@@ -154,7 +159,7 @@ def test_data_node_config_check(caplog):
         Config.check()
     expected_error_message = (
         "`storage_type` field of DataNodeConfig `data_nodes` must be either csv, sql_table,"
-        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+        " sql, mongo_collection, pickle, excel, generic, json, parquet, arrow, s3_object, or in_memory."
         ' Current value of property `storage_type` is "bar".'
     )
     assert expected_error_message in caplog.text
@@ -9,6 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
 from taipy.common.config import Config
 
 
@@ -26,6 +30,25 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_history_retention():
+    assert not Config.job_config.has_history_retention
+
+    job_c = Config.configure_job_executions(history_max_nb=10, history_max_age=timedelta(days=30))
+    assert job_c.history_max_nb == 10
+    assert job_c.history_max_age == timedelta(days=30)
+    assert job_c.has_history_retention
+
+    Config.configure_job_executions(history_max_nb="ENV[HISTORY_MAX_NB]")
+    with patch.dict(os.environ, {"HISTORY_MAX_NB": "5"}):
+        assert Config.job_config.history_max_nb == 5
+
+    Config.configure_job_executions(history_max_age="ENV[MAX_AGE]")
+    with patch.dict(os.environ, {"HISTORY_MAX_NB": "5", "MAX_AGE": "7d"}):
+        assert Config.job_config.history_max_age == timedelta(days=7)
+        collector = Config.check()
+        assert len(collector.errors) == 0
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=3, prop="foo")
 
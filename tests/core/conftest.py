@@ -26,6 +26,7 @@ from taipy.common.config.checker._checker import _Checker
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core._orchestrator._readiness_graph import _ReadinessGraph
 from taipy.core._version._version import _Version
 from taipy.core._version._version_manager_factory import _VersionManagerFactory
 from taipy.core.config import (
@@ -385,6 +386,8 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator.readiness_graph = _ReadinessGraph()
+        _OrchestratorFactory._orchestrator.tracked_submissions = {}
 
     return _init_orchestrator
 
@@ -392,7 +395,7 @@ def init_orchestrator():
 @pytest.fixture
 def init_notifier():
     def _init_notifier():
-        Notifier._topics_registrations_list = {}
+        Notifier._clear()
 
     return _init_notifier
 
@@ -0,0 +1,140 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas.testing import assert_frame_equal
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.common.config.exceptions.exceptions import InvalidConfigurationId
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.arrow import ArrowDataNode
+from taipy.core.data.data_node_id import DataNodeId
+from taipy.core.exceptions.exceptions import InvalidExposedType
+
+
+class MyCustomObject:
+    def __init__(self, id, integer, text):
+        self.id = id
+        self.integer = integer
+        self.text = text
+
+
+class TestArrowDataNode:
+    def test_create(self):
+        path = "data/node/path"
+        arrow_dn_config = Config.configure_arrow_data_node(id="foo_bar", default_path=path, name="super name")
+        dn = _DataManagerFactory._build_manager()._create_and_set(arrow_dn_config, None, None)
+        assert isinstance(dn, ArrowDataNode)
+        assert dn.storage_type() == "arrow"
+        assert dn.config_id == "foo_bar"
+        assert dn.name == "super name"
+        assert dn.scope == Scope.SCENARIO
+        assert dn.last_edit_date is None
+        assert not dn.is_ready_for_reading
+        assert dn.path == path
+        assert dn.properties["exposed_type"] == "pandas"
+
+        with pytest.raises(InvalidConfigurationId):
+            ArrowDataNode("foo bar", Scope.SCENARIO, properties={"path": path})
+
+    def test_get_user_properties(self, tmp_path):
+        path = str(tmp_path / "dn.arrow")
+        dn = ArrowDataNode(
+            "dn", Scope.SCENARIO, properties={"default_path": path, "exposed_type": "arrow", "foo": "bar"}
+        )
+        assert dn._get_user_properties() == {"foo": "bar"}
+
+    @pytest.mark.parametrize(
+        ["properties", "exists"],
+        [
+            ({}, False),
+            ({"default_data": {"a": ["foo", "bar"]}}, True),
+        ],
+    )
+    def test_create_with_default_data(self, properties, exists):
+        dn = ArrowDataNode("foo", Scope.SCENARIO, DataNodeId(f"dn_id_{uuid.uuid4()}"), properties=properties)
+        assert dn.path == os.path.join(Config.core.storage_folder.strip("/"), "arrows", dn.id + ".arrow")
+        assert os.path.exists(dn.path) is exists
+
+    def test_raise_error_invalid_exposed_type(self, tmp_path):
+        with pytest.raises(InvalidExposedType):
+            ArrowDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow"), "exposed_type": "foo"})
+
+    def test_write_and_read_pandas(self, tmp_path):
+        dn = ArrowDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow")})
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]})
+        dn.write(df)
+        assert_frame_equal(dn.read(), df)
+
+    def test_write_and_read_numpy(self, tmp_path):
+        dn = ArrowDataNode(
+            "foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow"), "exposed_type": "numpy"}
+        )
+        array = np.array([[1, 2], [3, 4], [5, 6]])
+        dn.write(array)
+        assert np.array_equal(dn.read(), array)
+
+    def test_read_arrow_table_is_memory_mapped(self, tmp_path):
+        dn = ArrowDataNode(
+            "foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow"), "exposed_type": "arrow"}
+        )
+        dn.write(pd.DataFrame({"a": np.arange(1_000_000)}))
+
+        pool_bytes = pa.total_allocated_bytes()
+        table = dn.read()
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 1_000_000
+        # The columns reference the mapped file instead of being copied in the Arrow memory pool
+        assert pa.total_allocated_bytes() - pool_bytes < table.nbytes
+
+        dn.write(pa.table({"b": [1, 2]}))
+        assert dn.read().column_names == ["b"]
+        # The table read before the write is still valid since the file has been replaced, not modified
+        assert table.column("a")[-1].as_py() == 999_999
+
+    def test_read_custom_exposed_type(self, tmp_path):
+        dn = ArrowDataNode(
+            "foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow"), "exposed_type": MyCustomObject}
+        )
+        dn.write(pd.DataFrame({"id": [1, 2], "integer": [3, 4], "text": ["a", "b"]}))
+        data = dn.read()
+        assert all(isinstance(obj, MyCustomObject) for obj in data)
+        assert [obj.text for obj in data] == ["a", "b"]
+
+    def test_append(self, tmp_path):
+        dn = ArrowDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow")})
+        dn.append(pd.DataFrame({"a": [1, 2]}))
+        dn.append(pd.DataFrame({"a": [3], "b": ["x"]}))
+        df = dn.read()
+        assert df["a"].tolist() == [1, 2, 3]
+        assert df["b"].tolist() == [None, None, "x"]
+
+    def test_write_and_append_do_not_modify_the_data(self, tmp_path):
+        dn = ArrowDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow")})
+        df = pd.DataFrame({0: [1, 2], 1: [3, 4]})
+        dn.write(df)
+        dn.append(df)
+        assert df.columns.tolist() == [0, 1]
+        assert dn.read().columns.tolist() == ["0", "1"]
+        assert dn.read()["0"].tolist() == [1, 2, 1, 2]
+
+    def test_write_does_not_leave_temporary_files(self, tmp_path):
+        dn = ArrowDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.arrow")})
+        dn.write(pd.DataFrame({"a": [1]}))
+        dn.write(pd.DataFrame({"a": [2]}))
+        assert os.listdir(tmp_path) == ["dn.arrow"]
@@ -11,6 +11,7 @@
 
 import os
 import pathlib
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -117,3 +118,41 @@ def test_filter_numpy_exposed_type(csv_file):
         np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
     )
     assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+
+def test_filter_scans_the_file_by_chunks(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    df = pd.DataFrame({"foo": range(100), "bar": [i % 7 for i in range(100)], "baz": ["x"] * 100})
+    dn.write(df)
+
+    read_all = patch.object(CSVDataNode, "_read", side_effect=AssertionError("The whole file is read"))
+    with patch.object(CSVDataNode, "_FILTER_CHUNK_SIZE", 10), read_all:
+        filtered = dn.filter([("foo", 5, Operator.LESS_THAN), ("bar", 0, Operator.EQUAL)], JoinOperator.OR)
+        assert_frame_equal(filtered, df[(df["foo"] < 5) | (df["bar"] == 0)])
+
+        filtered = dn.filter(("bar", 3, Operator.EQUAL), columns=["baz", "foo"])
+        assert_frame_equal(filtered, df[df["bar"] == 3][["baz", "foo"]])
+
+        assert dn.filter(("foo", 100, Operator.GREATER_OR_EQUAL)).empty
+
+
+def test_filter_without_operators_returns_all_the_data(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    df = pd.DataFrame({"foo": range(10), "bar": [i % 3 for i in range(10)]})
+    dn.write(df)
+
+    with patch.object(CSVDataNode, "_FILTER_CHUNK_SIZE", 3):
+        assert_frame_equal(dn.filter([]), df)
+        assert_frame_equal(dn.filter([], JoinOperator.OR, columns=["bar"]), df[["bar"]])
+
+
+def test_filter_numpy_exposed_type_with_columns(csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "numpy"})
+    dn.write(np.array([[1, 1, 5], [1, 2, 6], [2, 1, 7], [2, 2, 8]]))
+
+    with patch.object(CSVDataNode, "_FILTER_CHUNK_SIZE", 3):
+        assert np.array_equal(dn.filter((1, 1, Operator.EQUAL), columns=[2]), np.array([[5], [7]]))
+        assert np.array_equal(
+            dn.filter([(0, 2, Operator.EQUAL), (1, 2, Operator.EQUAL)], JoinOperator.AND, columns=[2, 0]),
+            np.array([[8, 2]]),
+        )
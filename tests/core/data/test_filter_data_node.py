@@ -104,6 +104,25 @@ def test_filter_pandas_exposed_type(default_data_frame):
     ) == len(default_data_frame[(default_data_frame[COLUMN_NAME_1] > 10) | (default_data_frame[COLUMN_NAME_1] < -10)])
 
 
+def test_filter_pandas_exposed_type_keeps_the_rows_and_their_index():
+    df = pd.DataFrame({"a": [1, 1, 2, 3], "b": [1, 1, 5, 6]}, index=[10, 20, 30, 40])
+    df_dn = FakeDataframeDataNode("fake_dataframe_dn", df)
+
+    pd.testing.assert_frame_equal(
+        df_dn.filter([("a", 1, Operator.EQUAL), ("b", 6, Operator.EQUAL)], JoinOperator.OR), df.loc[[10, 20, 40]]
+    )
+    pd.testing.assert_frame_equal(
+        df_dn.filter([("a", 1, Operator.EQUAL), ("b", 1, Operator.EQUAL)], JoinOperator.AND), df.loc[[10, 20]]
+    )
+
+
+def test_filter_without_operators_returns_all_the_data(default_data_frame):
+    df_dn = FakeDataframeDataNode("fake_dataframe_dn", default_data_frame)
+
+    pd.testing.assert_frame_equal(df_dn.filter([]), default_data_frame)
+    pd.testing.assert_frame_equal(df_dn.filter([], JoinOperator.OR), default_data_frame)
+
+
 def test_filter_list():
     list_dn = FakeListDataNode("fake_list_dn")
 
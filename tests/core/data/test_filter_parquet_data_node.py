@@ -12,6 +12,7 @@
 import os
 import pathlib
 from importlib import util
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -137,3 +138,62 @@ class TestFilterParquetDataNode:
             np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
         )
         assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+    def test_filter_is_pushed_down_to_the_parquet_reader(self, parquet_file_path):
+        dn = ParquetDataNode(
+            "foo",
+            Scope.SCENARIO,
+            properties={"path": parquet_file_path, "write_kwargs": {"row_group_size": 10}},
+        )
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=100, freq="D"),
+                "value": range(100),
+                "label": [f"label_{i}" for i in range(100)],
+            }
+        )
+        dn.write(df)
+
+        with patch.object(ParquetDataNode, "_read", side_effect=AssertionError("The whole file is read")):
+            filtered = dn.filter(
+                [
+                    ("date", pd.Timestamp("2024-02-01"), Operator.GREATER_OR_EQUAL),
+                    ("date", pd.Timestamp("2024-02-10"), Operator.LESS_THAN),
+                ],
+                columns=["value"],
+            )
+            expected = df[(df["date"] >= "2024-02-01") & (df["date"] < "2024-02-10")][["value"]]
+            assert_frame_equal(filtered.reset_index(drop=True), expected.reset_index(drop=True))
+
+            filtered = dn.filter(
+                [("value", 3, Operator.LESS_THAN), ("value", 97, Operator.GREATER_THAN)], JoinOperator.OR
+            )
+            assert filtered["value"].tolist() == [0, 1, 2, 98, 99]
+
+    def test_filter_falls_back_when_the_filter_cannot_be_pushed_down(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        df = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=5, freq="D"), "value": range(5)})
+        dn.write(df)
+
+        # Arrow cannot compare a timestamp with a string
+        filtered = dn.filter(("date", "2024-01-04", Operator.GREATER_OR_EQUAL), columns=["value"])
+        assert filtered["value"].tolist() == [3, 4]
+        assert filtered.columns.tolist() == ["value"]
+
+    def test_filter_without_operators_returns_all_the_data(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        df = pd.DataFrame({"foo": range(10), "bar": [i % 3 for i in range(10)]})
+        dn.write(df)
+
+        assert_frame_equal(dn.filter([]), df)
+        assert_frame_equal(dn.filter([], JoinOperator.OR, columns=["bar"]), df[["bar"]])
+
+    def test_filter_custom_exposed_type(self, parquet_file_path):
+        dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": MyCustomObject}
+        )
+        dn.write(pd.DataFrame({"id": [1, 2, 3], "integer": [4, 5, 6], "text": ["a", "b", "c"]}))
+
+        filtered = dn.filter([("integer", 4, Operator.EQUAL), ("text", "c", Operator.EQUAL)], JoinOperator.OR)
+        assert all(isinstance(obj, MyCustomObject) for obj in filtered)
+        assert [obj.id for obj in filtered] == [1, 3]
@@ -15,6 +15,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 import mongomock
+import pandas as pd
 import pymongo
 import pytest
 from bson import ObjectId
@@ -371,3 +372,18 @@ class TestMongoCollectionDataNode:
             mongo_dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_write_and_read_chunks(self, properties):
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+        mongo_dn.write(
+            iter([[{"foo": i, "bar": -i} for i in range(5)], pd.DataFrame({"foo": [5, 6], "bar": [-5, -6]})])
+        )
+        assert [document.foo for document in mongo_dn.read()] == list(range(7))
+
+        mongo_dn.append(({"foo": i, "bar": -i} for i in range(7, 9)))
+        chunks = list(mongo_dn.read_chunks(chunk_size=4, columns=["foo"]))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        assert [document.foo for chunk in chunks for document in chunk] == list(range(9))
+        assert not any(hasattr(document, "bar") for chunk in chunks for document in chunk)
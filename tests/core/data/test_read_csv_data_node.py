@@ -114,3 +114,28 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_read_chunks():
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    chunks = list(dn.read_chunks(chunk_size=4, columns=["text", "id"]))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.DataFrame.equals(pd.concat(chunks), pd.read_csv(csv_file_path)[["text", "id"]])
+
+    numpy_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "numpy"})
+    chunks = list(numpy_dn.read_chunks(chunk_size=6))
+    assert all(isinstance(chunk, np.ndarray) for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), pd.read_csv(csv_file_path).to_numpy())
+
+    custom_dn = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject, "chunk_size": 3}
+    )
+    chunks = list(custom_dn.read_chunks())
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert all(isinstance(row, MyCustomObject) for chunk in chunks for row in chunk)
+
+
+def test_read_chunks_raise_no_data():
+    not_existing_csv = CSVDataNode("foo", Scope.SCENARIO, properties={"path": "WRONG.csv", "has_header": True})
+    with pytest.raises(NoData):
+        not_existing_csv.read_chunks()
@@ -186,3 +186,30 @@ class TestReadParquetDataNode:
         path = "data/node/path"
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
         assert dn.read_with_kwargs() is None
+
+    def test_read_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        df = pd.DataFrame({"id": range(10), "integer": range(10, 20), "text": [f"text_{i}" for i in range(10)]})
+        df.to_parquet(temp_file_path, row_group_size=5)
+
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        chunks = list(dn.read_chunks(chunk_size=3, columns=["text"]))
+        # A chunk never spans several row groups
+        assert [len(chunk) for chunk in chunks] == [3, 2, 3, 2]
+        assert pd.concat(chunks)["text"].tolist() == df["text"].tolist()
+        assert all(chunk.columns.tolist() == ["text"] for chunk in chunks)
+
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": "numpy"})
+        assert np.array_equal(np.concatenate(list(dn.read_chunks())), df.to_numpy())
+
+        dn = ParquetDataNode(
+            "foo", Scope.SCENARIO, properties={"path": temp_file_path, "exposed_type": MyCustomObject, "chunk_size": 4}
+        )
+        chunks = list(dn.read_chunks())
+        assert [len(chunk) for chunk in chunks] == [4, 1, 4, 1]
+        assert [obj.id for chunk in chunks for obj in chunk] == list(range(10))
+
+    def test_read_chunks_raise_no_data(self):
+        not_existing_parquet = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": "nonexistent.parquet"})
+        with pytest.raises(NoData):
+            not_existing_parquet.read_chunks()
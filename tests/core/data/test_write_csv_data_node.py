@@ -188,3 +188,17 @@ def test_write_with_column_names(tmp_csv_file):
     csv_dn.write_with_column_names(data, columns)
     df = pd.DataFrame(data, columns=columns)
     assert pd.DataFrame.equals(df, csv_dn.read())
+
+
+def test_write_and_append_chunks(tmp_csv_file):
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    df = pd.DataFrame({"a": range(10), "b": [f"text_{i}" for i in range(10)]})
+
+    dn.write(df.iloc[i : i + 3] for i in range(0, 10, 3))
+    assert_frame_equal(dn.read(), df)
+
+    dn.append(iter([df.iloc[:2], df.iloc[2:4]]))
+    assert_frame_equal(dn.read(), pd.concat([df, df.iloc[:4]]).reset_index(drop=True))
+
+    dn.write(iter([]))
+    assert dn.read().empty
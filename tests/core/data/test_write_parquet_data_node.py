@@ -15,6 +15,7 @@ from importlib import util
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -234,3 +235,49 @@ class TestWriteParquetDataNode:
             dn.read(),
             pd.concat([default_data_frame, pd.DataFrame(content, columns=["a", "b", "c"])]).reset_index(drop=True),
         )
+
+    def test_write_chunks(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        df = pd.DataFrame({"a": range(10), "b": [f"text_{i}" for i in range(10)]})
+
+        dn.write(df.iloc[i : i + 4] for i in range(0, 10, 4))
+        assert_frame_equal(dn.read(), df)
+        # Each chunk is written as a row group
+        assert [len(chunk) for chunk in dn.read_chunks(chunk_size=100)] == [4, 4, 2]
+
+    def test_write_chunks_with_kwargs(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode(
+            "foo",
+            Scope.SCENARIO,
+            properties={"path": temp_file_path, "compression": "gzip", "write_kwargs": {"row_group_size": 2}},
+        )
+        df = pd.DataFrame({"a": range(10)}, index=range(10, 20))
+
+        dn._write_with_kwargs((df.iloc[i : i + 5] for i in range(0, 10, 5)), index=True)
+        assert_frame_equal(dn.read(), df)
+        metadata = pq.ParquetFile(temp_file_path).metadata
+        assert metadata.num_row_groups == 6
+        assert metadata.row_group(0).column(0).compression == "GZIP"
+
+        with pytest.raises(NotImplementedError):
+            dn._write_with_kwargs(iter([df]), partition_cols=["a"])
+        with pytest.raises(NotImplementedError):
+            dn._write_with_kwargs(iter([df]), engine="fastparquet")
+
+    def test_write_no_chunk(self, tmpdir_factory):
+        temp_file_path = str(tmpdir_factory.mktemp("data").join("temp.parquet"))
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": temp_file_path})
+        dn.write(pd.DataFrame({"a": range(10)}))
+
+        dn.write(iter([]))
+        assert dn.read().empty
+
+    @pytest.mark.skipif(not util.find_spec("fastparquet"), reason="Append parquet requires fastparquet to be installed")
+    def test_append_chunks(self, parquet_file_path, default_data_frame):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path})
+        dn.append(iter([default_data_frame.iloc[:1], default_data_frame.iloc[1:2]]))
+        assert_frame_equal(
+            dn.read(), pd.concat([default_data_frame, default_data_frame.iloc[:2]]).reset_index(drop=True)
+        )
@@ -187,3 +187,30 @@ class TestWriteSQLTableDataNode:
         append_data_1 = pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}])
         dn.append(append_data_1)
         assert_frame_equal(dn.read(), pd.concat([original_data, append_data_1]).reset_index(drop=True))
+
+    def test_sqlite_write_and_read_chunks(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        df = pd.DataFrame({"foo": range(10), "bar": range(10, 20)})
+        dn.write(df.iloc[i : i + 4] for i in range(0, 10, 4))
+        assert_frame_equal(dn.read(), df)
+
+        chunks = list(dn.read_chunks(chunk_size=3, columns=["bar"]))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert_frame_equal(pd.concat(chunks, ignore_index=True), df[["bar"]])
+
+        dn.append(iter([df.iloc[:1], df.iloc[1:2]]))
+        assert len(dn.read()) == 12
+
+        numpy_dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties={**properties, "exposed_type": "numpy"})
+        chunks = list(numpy_dn.read_chunks(chunk_size=5))
+        assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+        assert all(isinstance(chunk, np.ndarray) for chunk in chunks)
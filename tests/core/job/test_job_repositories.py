@@ -9,7 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -162,6 +164,58 @@ class TestJobRepository:
 
         assert repository._search("id", "job-2", filters=[{"version": "non_existed_version"}]) == []
 
+    def test_load_latest(self, data_node, job):
+        repository = _JobFSRepository()
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        other_task = Task("other_task_config_id", {}, print, [data_node], [data_node])
+        _DataFSRepository()._save(data_node)
+        _TaskFSRepository()._save(task)
+        _TaskFSRepository()._save(other_task)
+        now = datetime.now()
+
+        for i in range(4):
+            job.id = JobId(f"job-{i}")
+            job._task = task if i < 3 else other_task
+            job._version = "1.0" if i < 2 else "2.0"
+            job._creation_date = now + timedelta(seconds=i)
+            repository._save(job)
+
+        assert repository._load_latest("task_id", task.id).id == "job-2"
+        assert repository._load_latest("task_id", task.id, [{"version": "1.0"}]).id == "job-1"
+        assert repository._load_latest("task_id", task.id, [{"version": "1.0"}, {"version": "2.0"}]).id == "job-2"
+        assert repository._load_latest("task_id", other_task.id).id == "job-3"
+        assert repository._load_latest("task_id", other_task.id, [{"version": "1.0"}]) is None
+        assert repository._load_latest("task_id", "unknown_task_id") is None
+
+        repository._delete("job-2")
+        assert repository._load_latest("task_id", task.id).id == "job-1"
+        repository._delete_by("version", "1.0")
+        assert repository._load_latest("task_id", task.id) is None
+
+    def test_load_latest_indexes_catalog_of_older_version(self, data_node, job):
+        repository = _JobFSRepository()
+        _DataFSRepository()._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        _TaskFSRepository()._save(task)
+        job._task = task
+        now = datetime.now()
+        for i in range(3):
+            job.id = JobId(f"job-{i}")
+            job._creation_date = now + timedelta(seconds=i)
+            repository._save(job)
+
+        # Simulate a catalog written by an older taipy version, that did not index the task ids
+        catalog_path = repository.dir_path / ".catalog.jsonl"
+        records = [json.loads(line) for line in catalog_path.read_text().splitlines()]
+        for record in records:
+            record[2].pop("task_id", None)
+        catalog_path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        repository = _JobFSRepository()
+        assert repository._catalog._get_latest("task_id", task.id) is None
+        assert repository._load_latest("task_id", task.id).id == "job-2"
+        assert repository._catalog._get_latest("task_id", task.id) == ["job-2"]
+
     def test_export(self, tmpdir, job):
         repository = _JobFSRepository()
         repository._save(job)
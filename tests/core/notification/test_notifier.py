@@ -843,3 +843,80 @@ def test_publish_deletion_event():
         and event.attribute_name is None
         for i, event in enumerate(published_events)
     )
+
+
+def test_publish_matches_indexed_topics():
+    topics = [
+        _Topic(),
+        _Topic(EventEntityType.CYCLE),
+        _Topic(EventEntityType.SCENARIO),
+        _Topic(EventEntityType.CYCLE, "cycle_id"),
+        _Topic(EventEntityType.CYCLE, "other_id"),
+        _Topic(operation=EventOperation.UPDATE),
+        _Topic(EventEntityType.CYCLE, "cycle_id", EventOperation.UPDATE),
+        _Topic(EventEntityType.CYCLE, operation=EventOperation.UPDATE, attribute_name="frequency"),
+        _Topic(EventEntityType.CYCLE, operation=EventOperation.UPDATE, attribute_name="name"),
+    ]
+    queues = [Notifier.register(t.entity_type, t.entity_id, t.operation, t.attribute_name)[1] for t in topics]
+    events = [
+        Event(EventEntityType.CYCLE, EventOperation.CREATION, entity_id="cycle_id"),
+        Event(EventEntityType.CYCLE, EventOperation.UPDATE, entity_id="cycle_id"),
+        Event(EventEntityType.CYCLE, EventOperation.UPDATE, entity_id="cycle_id", attribute_name="frequency"),
+        Event(EventEntityType.SCENARIO, EventOperation.DELETION, entity_id="scenario_id"),
+    ]
+
+    for event in events:
+        Notifier.publish(event)
+        for topic, queue in zip(topics, queues):
+            if Notifier._is_matching(event, topic):
+                assert queue.get_nowait() == event
+            assert queue.empty()
+
+
+def test_unregister_cleans_the_index():
+    registration_id_0, _ = Notifier.register(EventEntityType.CYCLE, "cycle_id", attribute_name="name")
+    registration_id_1, queue_1 = Notifier.register(EventEntityType.CYCLE, "cycle_id", attribute_name="name")
+    assert len(Notifier._topics_registrations_list) == 1
+    assert len(Notifier._registrations) == 2
+
+    Notifier.unregister(registration_id_0)
+    Notifier.unregister(registration_id_0)
+    assert len(Notifier._registrations) == 1
+    Notifier.publish(Event(EventEntityType.CYCLE, EventOperation.UPDATE, entity_id="cycle_id", attribute_name="name"))
+    assert queue_1.qsize() == 1
+
+    Notifier.unregister(registration_id_1)
+    assert Notifier._topics_registrations_list == {}
+    assert Notifier._topics_index == {}
+    assert Notifier._registrations == {}
+
+
+def test_bounded_registration_queue_drops_oldest_events():
+    registration_id, queue = Notifier.register(max_queue_size=2)
+    events = [Event(EventEntityType.CYCLE, EventOperation.CREATION, entity_id=f"cycle_{i}") for i in range(5)]
+    for event in events:
+        Notifier.publish(event)
+
+    assert [queue.get_nowait(), queue.get_nowait()] == events[3:]
+    assert queue.empty()
+    assert Notifier._get_metrics()["dropped_events_by_registration"] == {registration_id: 3}
+
+
+def test_async_delivery():
+    _, queue = Notifier.register(EventEntityType.CYCLE)
+    events = [Event(EventEntityType.CYCLE, EventOperation.CREATION, entity_id=f"cycle_{i}") for i in range(10)]
+
+    Notifier.start_async_delivery(max_pending_events=100, batch_size=3)
+    assert Notifier._get_metrics()["async_delivery"]
+    for event in events:
+        Notifier.publish(event)
+    Notifier.stop_async_delivery()
+
+    assert [queue.get_nowait() for _ in range(10)] == events
+    metrics = Notifier._get_metrics()
+    assert not metrics["async_delivery"]
+    assert metrics["dropped_events"] == 0
+
+    # Events are delivered synchronously again
+    Notifier.publish(events[0])
+    assert queue.get_nowait() == events[0]
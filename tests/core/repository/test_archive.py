@@ -0,0 +1,39 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from taipy.core._repository._archive import _Archive
+
+
+def test_archive_by_month(tmp_path):
+    archive = _Archive("jobs", str(tmp_path))
+    assert archive._months() == []
+    assert archive._load_all() == []
+
+    models = [
+        {"id": "job-0", "task_id": "t1", "creation_date": "2024-01-31T23:59:59"},
+        {"id": "job-1", "task_id": "t2", "creation_date": "2024-02-01T00:00:00"},
+        {"id": "job-2", "task_id": "t1", "creation_date": None},
+    ]
+    assert archive._append(models) == 3
+    assert archive._months() == ["2024-01", "2024-02", "unknown"]
+    assert (tmp_path / "archive" / "jobs" / "2024-01.jsonl.gz").exists()
+
+    assert archive._load_all() == models
+    assert archive._load_all(months=["2024-02"]) == [models[1]]
+    assert [m["id"] for m in archive._load_all([{"task_id": "t1"}])] == ["job-0", "job-2"]
+    assert [m["id"] for m in archive._load_all([{"task_id": "t1", "id": "job-0"}, {"id": "job-1"}])] == [
+        "job-0",
+        "job-1",
+    ]
+
+    # Models are appended, and archiving a model twice does not duplicate it
+    archive._append([models[0], {"id": "job-3", "task_id": "t2", "creation_date": "2024-01-02T00:00:00"}])
+    assert [m["id"] for m in archive._load_all(months=["2024-01"])] == ["job-0", "job-3"]
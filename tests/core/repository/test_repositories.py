@@ -18,7 +18,7 @@ import pytest
 
 from taipy.core.exceptions.exceptions import ModelNotFound
 
-from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj, MockSQLRepository
 
 
 class TestRepositoriesStorage:
@@ -42,6 +42,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_save_and_fetch_model(self, mock_repo, params):
@@ -56,6 +57,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_exists(self, mock_repo, params):
@@ -70,6 +72,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_get_all(self, mock_repo, params):
@@ -93,6 +96,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_all(self, mock_repo, params):
@@ -114,6 +118,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_many(self, mock_repo, params):
@@ -134,6 +139,44 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_save_and_load_many(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        objs = [MockObj(f"uuid-{i}", f"Foo{i}") for i in range(5)]
+        r._save_many(objs)
+
+        assert len(r._load_all()) == 5
+        assert r._load_many(["uuid-3", "non-existent", "uuid-1"]) == [objs[3], objs[1]]
+
+        objs[3].name = "Bar"
+        r._save_many([objs[3]])
+        assert r._load("uuid-3").name == "Bar"
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_delete_many_with_missing_entity(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        r._save_many([MockObj(f"uuid-{i}", f"Foo{i}") for i in range(3)])
+
+        with pytest.raises(ModelNotFound):
+            r._delete_many(["uuid-0", "non-existent", "uuid-1"])
+        assert [m.id for m in r._load_all()] == ["uuid-2"]
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_search(self, mock_repo, params):
@@ -153,6 +196,30 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_page(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        for i in [3, 0, 4, 1, 2]:
+            r._save(MockObj(f"uuid-{i}", "foo" if i % 2 else "bar"))
+
+        assert [m.id for m in r._load_page()] == [f"uuid-{i}" for i in range(5)]
+        assert [m.id for m in r._load_page(limit=2)] == ["uuid-0", "uuid-1"]
+        assert [m.id for m in r._load_page(limit=2, offset=2)] == ["uuid-2", "uuid-3"]
+        assert [m.id for m in r._load_page(offset=4)] == ["uuid-4"]
+        assert [m.id for m in r._load_page(limit=2, after="uuid-2")] == ["uuid-3", "uuid-4"]
+        assert [m.id for m in r._load_page(limit=2, after="uuid-4")] == []
+        assert [m.id for m in r._load_page([{"name": "foo"}], limit=1, after="uuid-1")] == ["uuid-3"]
+        assert [m.id for m in r._load_page([{"name": "bar"}], offset=1)] == ["uuid-2", "uuid-4"]
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     @pytest.mark.parametrize("export_path", ["tmp"])
@@ -174,3 +241,101 @@ class TestRepositoriesStorage:
         assert pathlib.Path(os.path.join(export_path, "mock_model/uuid.json")).exists()
 
         shutil.rmtree(export_path, ignore_errors=True)
+
+    def test_catalog_is_updated_on_save_and_delete(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+
+        r._save(MockObj("uuid-0", "foo", version="1.0"))
+        r._save(MockObj("uuid-1", "bar", version="2.0"))
+        assert (r.dir_path / ".catalog.jsonl").exists()
+        assert r._catalog._search([{"version": "1.0"}]) == ["uuid-0"]
+        assert sorted(r._catalog._search([{"version": "1.0"}, {"version": "2.0"}])) == ["uuid-0", "uuid-1"]
+        assert [m.id for m in r._load_all([{"version": "2.0"}])] == ["uuid-1"]
+
+        r._delete("uuid-0")
+        assert r._catalog._search() == ["uuid-1"]
+
+        r._delete_by("version", "2.0")
+        assert r._catalog._search() == []
+        assert r._load_all() == []
+
+    def test_catalog_is_shared_between_repositories(self):
+        r_1 = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r_2 = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r_1._delete_all()
+
+        r_1._save(MockObj("uuid-0", "foo", version="1.0"))
+        assert [m.id for m in r_2._load_all()] == ["uuid-0"]
+
+        r_2._save(MockObj("uuid-1", "bar", version="1.0"))
+        r_2._delete("uuid-0")
+        assert [m.id for m in r_1._load_all([{"version": "1.0"}])] == ["uuid-1"]
+
+    def test_catalog_is_rebuilt_for_folder_without_catalog(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+
+        for i in range(3):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+
+        # Simulate a folder written by an older taipy version
+        os.remove(r.dir_path / ".catalog.jsonl")
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+
+        assert len(r._load_all([{"version": "1.0"}])) == 3
+        assert (r.dir_path / ".catalog.jsonl").exists()
+
+    def test_file_content_cache(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+        path = r.dir_path / "uuid.json"
+        # Files modified within the racy window are not served from the cache
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns - 2_000_000_000))
+
+        first, second = r._load("uuid"), r._load("uuid")
+        assert first == second
+        assert first is not second
+        assert r._cache.hits == 1
+
+        # A file written by another process invalidates the cached content
+        data = json.loads(path.read_text())
+        data["name"] = "bar"
+        path.write_text(json.dumps(data))
+        assert r._load("uuid").name == "bar"
+
+        r._save(MockObj("uuid", "baz"))
+        assert r._load("uuid").name == "baz"
+
+        r._delete("uuid")
+        assert len(r._cache) == 0
+        with pytest.raises(ModelNotFound):
+            r._load("uuid")
+
+    def test_get_revision(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        assert r._get_revision("uuid") is None
+
+        r._save(MockObj("uuid", "foo"))
+        path = r.dir_path / "uuid.json"
+        # Files modified within the racy window have no reliable revision
+        assert r._get_revision("uuid") is None
+        unreliable_revision = r._get_revision("uuid", reliable=False)
+        assert unreliable_revision is not None
+
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns - 2_000_000_000))
+        revision = r._get_revision("uuid")
+        assert revision is not None
+        assert revision != unreliable_revision
+        assert r._get_revision("uuid") == revision
+        assert r._get_revision("uuid", reliable=False) == revision
+
+        r._save(MockObj("uuid", "foobar"))
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns - 2_000_000_000))
+        assert r._get_revision("uuid") != revision
+
+        sql_repo = MockSQLRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+        sql_repo._save(MockObj("uuid", "foo"))
+        assert sql_repo._get_revision("uuid") is None
@@ -0,0 +1,120 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.core import Orchestrator
+from taipy.core._repository._sql_repository import _SQLRepository
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job._job_sql_repository import _JobSQLRepository
+from taipy.core.job.job import Job, JobId
+from taipy.core.job.status import Status
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.submission._submission_sql_repository import _SubmissionSQLRepository
+from taipy.core.submission.submission import Submission
+from taipy.core.task._task_sql_repository import _TaskSQLRepository
+from taipy.core.task.task import Task
+
+
+def double(nb):
+    return nb * 2
+
+
+@pytest.fixture
+def sql_repository_type(tmp_path):
+    Config.configure_core(repository_type="sql", repository_properties={"db_location": str(tmp_path / "taipy.sqlite3")})
+    yield
+    _SQLRepository._close_connections()
+    Config.configure_core(repository_type="filesystem")
+
+
+def test_sql_repository_type_selects_sql_repositories(sql_repository_type):
+    assert isinstance(_ScenarioManagerFactory._build_manager()._repository, _SQLRepository)
+    assert isinstance(_JobManagerFactory._build_manager()._repository, _SQLRepository)
+    assert isinstance(_DataManagerFactory._build_manager()._repository, _SQLRepository)
+
+
+def test_create_submit_and_delete_scenario(sql_repository_type):
+    input_cfg = Config.configure_data_node("number", default_data=21)
+    output_cfg = Config.configure_data_node("result")
+    task_cfg = Config.configure_task("double", double, input_cfg, output_cfg)
+    scenario_cfg = Config.configure_scenario("scenario", [task_cfg])
+
+    orchestrator = Orchestrator()
+    orchestrator.run()
+    scenario = tp.create_scenario(scenario_cfg)
+    submission = tp.submit(scenario)
+
+    assert scenario.result.read() == 42
+    assert tp.get(scenario.id) == scenario
+    assert tp.get_scenarios() == [scenario]
+    assert submission.jobs[0].status == Status.COMPLETED
+    assert tp.get_latest_submission(scenario) == submission
+    assert len(tp.get_jobs()) == 1
+    assert len(tp.get_data_nodes()) == 2
+
+    data_manager = _DataManagerFactory._build_manager()
+    task_id = scenario.double.id
+    assert {dn.config_id for dn in data_manager._repository._get_by_parent_id(task_id)} == {"number", "result"}
+    assert data_manager._repository._count([{"config_id": "number"}]) == 1
+
+    tp.delete(scenario.id)
+    assert tp.get_scenarios() == []
+    assert tp.get_data_nodes() == []
+    assert tp.get_jobs() == []
+    orchestrator.stop()
+
+
+def test_load_latest_job_and_submission(sql_repository_type):
+    task = Task("task_config_id", {}, print)
+    _TaskSQLRepository()._save(task)
+    job_repository, submission_repository = _JobSQLRepository(), _SubmissionSQLRepository()
+    now = datetime.now()
+    for i in range(3):
+        job = Job(JobId(f"job-{i}"), task, "submit_id", task.id, version="1.0" if i < 2 else "2.0")
+        job._creation_date = now + timedelta(seconds=i)
+        job_repository._save(job)
+        submission = Submission(
+            task.id, "TASK", task.config_id, f"submission-{i}", creation_date=now + timedelta(seconds=i)
+        )
+        submission_repository._save(submission)
+
+    assert job_repository._load_latest("task_id", task.id).id == "job-2"
+    assert job_repository._load_latest("task_id", task.id, [{"version": "1.0"}]).id == "job-1"
+    assert job_repository._load_latest("task_id", "unknown_task_id") is None
+    assert submission_repository._load_latest("entity_id", task.id).id == "submission-2"
+
+    job_repository._delete("job-2")
+    assert job_repository._load_latest("task_id", task.id).id == "job-1"
+
+
+def test_indexed_columns_are_added_to_existing_tables(sql_repository_type):
+    task = Task("task_config_id", {}, print)
+    _TaskSQLRepository()._save(task)
+    job_repository = _JobSQLRepository()
+    job_repository._save(Job(JobId("job"), task, "submit_id", task.id))
+
+    # Simulate a table created by an older taipy version, without the task_id column
+    connection = job_repository._connection()
+    with connection:
+        connection.execute("DROP INDEX jobs_task_id_latest")
+        connection.execute("ALTER TABLE jobs DROP COLUMN task_id")
+    _SQLRepository._close_connections()
+
+    job_repository = _JobSQLRepository()
+    assert job_repository._load_latest("task_id", task.id).id == "job"
+    columns = {row[1] for row in job_repository._connection().execute("PRAGMA table_info(jobs)")}
+    assert "task_id" in columns
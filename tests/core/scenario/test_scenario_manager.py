@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, List, Optional
 from unittest.mock import ANY, patch
 
 import freezegun
@@ -1099,16 +1099,16 @@ def test_submit():
         submit_calls = []
 
         @classmethod
-        def _lock_dn_output_and_create_job(
+        def _lock_dn_outputs_and_create_jobs(
             cls,
-            task: Task,
+            tasks: List[Task],
             submit_id: str,
             submit_entity_id: str,
             callbacks: Optional[Iterable[Callable]] = None,
             force: bool = False,
-        ) -> Job:
-            cls.submit_calls.append(task.id)
-            return super()._lock_dn_output_and_create_job(task, submit_id, submit_entity_id, callbacks, force)
+        ) -> List[Job]:
+            cls.submit_calls.extend(task.id for task in tasks)
+            return super()._lock_dn_outputs_and_create_jobs(tasks, submit_id, submit_entity_id, callbacks, force)
 
     with patch("taipy.core.task._task_manager._TaskManager._orchestrator", new=MockOrchestrator):
         with pytest.raises(NonExistingScenario):
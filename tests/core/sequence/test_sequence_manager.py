@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, List, Optional
 from unittest import mock
 from unittest.mock import ANY
 
@@ -256,16 +256,16 @@ def test_submit():
         submit_calls = []
 
         @classmethod
-        def _lock_dn_output_and_create_job(
+        def _lock_dn_outputs_and_create_jobs(
             cls,
-            task: Task,
+            tasks: List[Task],
             submit_id: str,
             submit_entity_id: str,
             callbacks: Optional[Iterable[Callable]] = None,
             force: bool = False,
         ):
-            cls.submit_calls.append(task)
-            return super()._lock_dn_output_and_create_job(task, submit_id, submit_entity_id, callbacks, force)
+            cls.submit_calls.extend(tasks)
+            return super()._lock_dn_outputs_and_create_jobs(tasks, submit_id, submit_entity_id, callbacks, force)
 
     with mock.patch("taipy.core.task._task_manager._TaskManager._orchestrator", new=MockOrchestrator):
         # sequence does not exist. We expect an exception to be raised
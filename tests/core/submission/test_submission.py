@@ -10,10 +10,13 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime
+from time import sleep
+from unittest.mock import patch
 
 import freezegun
 import pytest
 
+from taipy.common.config import Config
 from taipy.core import TaskId
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.job.job import Job
@@ -941,3 +944,99 @@ def test_execution_duration():
 
     assert submission.finished_at == datetime(2024, 9, 25, 13, 35, 50)
     assert submission.execution_duration == 315  # = 13:35:50 - 13:30:35
+
+
+def test_update_tracked_submission_status_persists_once_per_transition():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    jobs = [MockJob("job_1", Status.SUBMITTED), MockJob("job_2", Status.SUBMITTED)]
+    submission = Submission("submission_id", "ENTITY_TYPE", "entity_config_id")
+    submission_manager._set(submission)
+
+    transitions = [
+        (jobs[0], Status.PENDING, SubmissionStatus.PENDING),
+        (jobs[1], Status.BLOCKED, SubmissionStatus.PENDING),
+        (jobs[0], Status.RUNNING, SubmissionStatus.RUNNING),
+        (jobs[0], Status.COMPLETED, SubmissionStatus.BLOCKED),
+        (jobs[1], Status.PENDING, SubmissionStatus.PENDING),
+        (jobs[1], Status.RUNNING, SubmissionStatus.RUNNING),
+        (jobs[1], Status.COMPLETED, SubmissionStatus.COMPLETED),
+    ]
+    with patch.object(submission_manager, "_get", wraps=submission_manager._get) as mck_get:
+        with patch.object(submission_manager, "_set", wraps=submission_manager._set) as mck_set:
+            for job, job_status, submission_status in transitions:
+                job.status = job_status
+                submission_manager._update_submission_status(submission, job, reload=False)
+                assert submission._submission_status == submission_status
+            mck_get.assert_not_called()
+            assert mck_set.call_count == len(transitions)
+    assert submission_manager._get(submission.id).submission_status == SubmissionStatus.COMPLETED
+
+
+def test_update_tracked_submission_status_with_persistence_delay():
+    Config.configure_job_executions(submission_status_persistence_delay=0.2)
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    jobs = [MockJob("job_1", Status.SUBMITTED), MockJob("job_2", Status.SUBMITTED)]
+    submission = Submission("submission_id", "ENTITY_TYPE", "entity_config_id")
+    submission_manager._set(submission)
+
+    with patch.object(submission_manager, "_set", wraps=submission_manager._set) as mck_set:
+        # A status change is persisted immediately
+        jobs[0].status = Status.RUNNING
+        submission_manager._update_submission_status(submission, jobs[0], reload=False)
+        assert mck_set.call_count == 1
+        assert submission_manager._get(submission.id).submission_status == SubmissionStatus.RUNNING
+
+        # The job statuses that do not change the submission status are persisted once, after the delay
+        for job_status in [Status.PENDING, Status.RUNNING]:
+            jobs[1].status = job_status
+            submission_manager._update_submission_status(submission, jobs[1], reload=False)
+        assert submission._submission_status == SubmissionStatus.RUNNING
+        assert mck_set.call_count == 1
+        sleep(0.5)
+        assert mck_set.call_count == 2
+        assert submission_manager._get(submission.id)._running_jobs == {"job_1", "job_2"}
+
+        # A finished submission is persisted immediately, with the delayed job statuses
+        for job in jobs:
+            job.status = Status.COMPLETED
+            submission_manager._update_submission_status(submission, job, reload=False)
+        assert mck_set.call_count == 3
+        assert submission_manager._get(submission.id).submission_status == SubmissionStatus.COMPLETED
+
+
+def test_submission_status_event_is_published_after_the_persistence():
+    Config.configure_job_executions(submission_status_persistence_delay=10)
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    job = MockJob("job_id", Status.SUBMITTED)
+    submission = Submission("submission_id", "ENTITY_TYPE", "entity_config_id")
+    submission_manager._set(submission)
+
+    persisted_statuses = []
+
+    def publish(event):
+        persisted_statuses.append(submission_manager._get(event.entity_id).submission_status)
+
+    with patch("taipy.core.submission._submission_manager.Notifier.publish", side_effect=publish):
+        for job_status in [Status.PENDING, Status.RUNNING, Status.COMPLETED]:
+            job.status = job_status
+            submission_manager._update_submission_status(submission, job, reload=False)
+    assert persisted_statuses == [SubmissionStatus.PENDING, SubmissionStatus.RUNNING, SubmissionStatus.COMPLETED]
+
+
+@pytest.mark.parametrize("failing_status", [Status.FAILED, Status.ABANDONED])
+def test_update_submission_status_releases_terminal_submissions(failing_status):
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    locks = submission_manager._SubmissionManager__locks  # type: ignore[attr-defined]
+    jobs = [MockJob("job_1", Status.RUNNING), MockJob("job_2", Status.RUNNING)]
+    submission = Submission("submission_id", "ENTITY_TYPE", "entity_config_id")
+    submission_manager._set(submission)
+
+    submission_manager._update_submission_status(submission, jobs[0], reload=False)
+    assert submission.id in locks
+    jobs[0].status = failing_status
+    submission_manager._update_submission_status(submission, jobs[0], reload=False)
+    assert submission.id not in locks
+    # The updates of the other jobs of a failed submission do not leak a lock either
+    jobs[1].status = Status.ABANDONED
+    submission_manager._update_submission_status(submission, jobs[1], reload=False)
+    assert submission.id not in locks
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -110,7 +111,7 @@ class TestSubmissionRepository:
 
         for i in range(10):
             submission.id = f"submission-{i}"
-            submission._version = f"{(i+1) // 5}.0"
+            submission._version = f"{(i + 1) // 5}.0"
             submission_repository._save(submission)
 
         objs = submission_repository._load_all()
@@ -138,6 +139,22 @@ class TestSubmissionRepository:
 
         assert submission_repository._search("id", "submission-2", filters=[{"version": "non_existed_version"}]) == []
 
+    def test_load_latest(self):
+        repository = _SubmissionManagerFactory._build_manager()._repository
+        now = datetime.now()
+        for i in range(4):
+            submission = Submission("entity_id" if i < 3 else "other_entity_id", "ENTITY_TYPE", "entity_config_id")
+            submission.id = f"submission-{i}"
+            submission._creation_date = now + timedelta(seconds=i)
+            repository._save(submission)
+
+        assert repository._load_latest("entity_id", "entity_id").id == "submission-2"
+        assert repository._load_latest("entity_id", "other_entity_id").id == "submission-3"
+        assert repository._load_latest("entity_id", "entity_id", [{"version": "unknown_version"}]) is None
+
+        repository._delete("submission-2")
+        assert repository._load_latest("entity_id", "entity_id").id == "submission-1"
+
     def test_export(self, tmpdir):
         repository = _SubmissionManagerFactory._build_manager()._repository
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
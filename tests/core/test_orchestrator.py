@@ -12,16 +12,25 @@
 
 import pytest
 
+import taipy as tp
 from taipy.common.config import Config
 from taipy.common.config.exceptions.exceptions import ConfigurationUpdateBlocked
 from taipy.core import Orchestrator
-from taipy.core._orchestrator._dispatcher import _DevelopmentJobDispatcher, _StandaloneJobDispatcher
+from taipy.core._orchestrator._dispatcher import (
+    _DevelopmentJobDispatcher,
+    _StandaloneJobDispatcher,
+    _ThreadJobDispatcher,
+)
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.config.job_config import JobConfig
 from taipy.core.exceptions.exceptions import OrchestratorServiceIsAlreadyRunning
 
 
+def double(nb):
+    return nb * 2
+
+
 class TestOrchestrator:
     def test_run_orchestrator_trigger_config_check(self, caplog):
         Config.configure_data_node(id="d0", storage_type="toto")
@@ -30,7 +39,7 @@ class TestOrchestrator:
             orchestrator.run()
         expected_error_message = (
             "`storage_type` field of DataNodeConfig `d0` must be either csv, sql_table,"
-            " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+            " sql, mongo_collection, pickle, excel, generic, json, parquet, arrow, s3_object, or in_memory."
             ' Current value of property `storage_type` is "toto".'
         )
         assert expected_error_message in caplog.text
@@ -76,6 +85,26 @@ class TestOrchestrator:
         assert _OrchestratorFactory._dispatcher.is_running()
         orchestrator.stop()
 
+    def test_run_orchestrator_as_a_service_thread_mode(self):
+        _OrchestratorFactory._dispatcher = None
+
+        Config.configure_job_executions(mode=JobConfig._THREAD_MODE, max_nb_of_workers=2)
+        input_cfg = Config.configure_data_node("nb", "in_memory", default_data=20)
+        output_cfg = Config.configure_data_node("doubled_nb", "in_memory")
+        task_cfg = Config.configure_task("double", double, input_cfg, output_cfg)
+        scenario_cfg = Config.configure_scenario("scenario", [task_cfg])
+
+        orchestrator = Orchestrator()
+        orchestrator.run()
+        assert isinstance(orchestrator._dispatcher, _ThreadJobDispatcher)
+        assert orchestrator._dispatcher.is_running()
+
+        scenario = tp.create_scenario(scenario_cfg)
+        submission = tp.submit(scenario, wait=True, timeout=10)
+        assert submission.jobs[0].is_completed()
+        assert scenario.doubled_nb.read() == 40
+        orchestrator.stop()
+
     def test_orchestrator_service_can_only_be_run_once(self):
         orchestrator_instance_1 = Orchestrator()
         orchestrator_instance_2 = Orchestrator()
@@ -0,0 +1,70 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP, MinMaxDecimator
+from taipy.gui.data.decimator._pyramid import _Pyramid
+
+
+@pytest.mark.parametrize("x0, x1", [(None, None), (1_000.5, 90_000), (12_345, 12_400), (50_000, None)])
+def test_select_keeps_the_extremes_of_the_window(x0, x1):
+    y = np.random.default_rng(0).standard_normal(100_001)
+    pyramid = _Pyramid(np.arange(len(y)), y)
+    indexes = pyramid.select(x0, x1, 100)
+
+    start = 0 if x0 is None else int(np.floor(x0)) + 1
+    end = len(y) if x1 is None else int(np.ceil(x1))
+    assert np.array_equal(indexes, np.unique(indexes))
+    assert indexes[0] == start
+    assert indexes[-1] == end - 1
+    assert start + np.argmin(y[start:end]) in indexes
+    assert start + np.argmax(y[start:end]) in indexes
+    if end - start > 1_600:
+        assert len(indexes) <= 4 * 100 + 2 * 16 * 4
+    else:
+        # Small windows are returned entirely
+        assert np.array_equal(indexes, np.arange(start, end))
+
+
+def test_select_with_dates_and_missing_values():
+    x = pd.Series(pd.date_range("2024-01-01", periods=10_000, freq="min"))
+    y = np.arange(10_000, dtype=float)
+    y[[0, 5_000]] = np.nan
+    pyramid = _Pyramid(x, y)
+    indexes = pyramid.select("2024-01-01 01:00:00", "2024-01-07 00:00:00", 10)
+    assert indexes[0] == 61
+    assert indexes[-1] == 8_639
+    assert 0 not in indexes
+    assert len(indexes) <= 4 * 10 + 2 * 16 * 4
+
+
+def test_select_is_not_available():
+    assert _Pyramid(np.array([3, 1, 2]), np.array([1, 2, 3])).select(None, None, 1) is None
+    assert _Pyramid(np.arange(3), np.array(["a", "b", "c"])).select(None, None, 1) is None
+    assert _Pyramid(np.arange(3), np.arange(3)).select("a", None, 1) is None
+    assert len(_Pyramid(np.arange(3), np.arange(3)).select(5, 10, 1)) == 0
+
+
+def test_pyramid_query_uses_the_output_size():
+    instance_payload = {"chartMode": "lines"}
+    payload = {"width": 800, "relayoutData": {"xaxis.range[0]": 10, "xaxis.range[1]": 20}}
+    assert LTTB(n_out=300, threshold=5_000, pyramid_threshold=1_000)._get_pyramid_query(
+        10_000, instance_payload, payload
+    ) == (10, 20, 300)
+    assert MinMaxDecimator(n_out=300, threshold=5_000, pyramid_threshold=1_000)._get_pyramid_query(
+        10_000, instance_payload, payload
+    ) == (10, 20, 300)
+    assert RDP(epsilon=3, threshold=5_000, pyramid_threshold=1_000)._get_pyramid_query(
+        10_000, instance_payload, payload
+    ) == (10, 20, 800)
@@ -0,0 +1,50 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import numpy as np
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP
+
+_POLYLINE = np.array([[0, 0], [1, 0.1], [2, 0], [3, 5], [4, 0]])
+
+
+def test_rdp_epsilon():
+    assert RDP(epsilon=1)._decimate(_POLYLINE, {}).tolist() == [True, False, True, True, True]
+    assert RDP(epsilon=10)._decimate(_POLYLINE, {}).tolist() == [True, False, False, False, True]
+
+
+def test_rdp_n_out():
+    assert RDP(n_out=4)._decimate(_POLYLINE, {}).tolist() == [True, False, True, True, True]
+    assert RDP(n_out=3)._decimate(_POLYLINE, {}).tolist() == [True, False, False, True, True]
+
+
+@pytest.mark.parametrize("nb_points", [10, 3_000, 100_000])
+def test_rdp_on_short_and_long_segments(nb_points):
+    # Long segments are processed one by one, the short ones all at once
+    y = np.cumsum(np.random.default_rng(0).standard_normal(nb_points))
+    data = np.column_stack([np.arange(nb_points), y])
+    mask = RDP(n_out=nb_points // 5)._decimate(data, {})
+    assert mask.sum() == nb_points // 5
+    assert mask[0] and mask[-1]
+    mask = RDP(epsilon=1)._decimate(data, {})
+    assert mask[0] and mask[-1]
+    assert mask.sum() < nb_points
+
+
+def test_lttb():
+    data = np.column_stack([np.arange(1_001), np.sin(np.arange(1_001) / 50)])
+    mask = LTTB(100)._decimate(data, {})
+    assert mask.sum() == 100
+    assert mask[0] and mask[-1]
+    assert LTTB(2_000)._decimate(data, {}).all()
+    with pytest.raises(ValueError):
+        LTTB(2)._decimate(data, {})
@@ -13,14 +13,18 @@ import inspect
 import os
 from datetime import datetime
 from importlib import util
+from unittest.mock import patch
 
 import pandas
 from flask import g
 
 from taipy.gui import Gui
+from taipy.gui.data.data_accessor import _DataAccessors
 from taipy.gui.data.data_format import _DataFormat
-from taipy.gui.data.decimator import ScatterDecimator
+from taipy.gui.data.decimator import MinMaxDecimator, ScatterDecimator
+from taipy.gui.data.decimator._pyramid import _Pyramid
 from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+from taipy.gui.utils import _TaipyData
 
 
 def test_simple_data(gui: Gui, helpers, small_dataframe):
@@ -48,6 +52,34 @@ def test_simple_data_with_arrow(gui: Gui, helpers, small_dataframe):
         assert isinstance(data, bytes)
 
 
+def test_arrow_data_has_no_index(gui: Gui, helpers, small_dataframe):
+    if util.find_spec("pyarrow"):
+        import pyarrow as pa
+
+        accessor = _PandasDataAccessor(gui)
+        pd = pandas.DataFrame(data=small_dataframe, index=[10, 20, 30])
+        value = accessor.get_data("x", pd, {"alldata": True}, _DataFormat.APACHE_ARROW)["value"]
+        table = pa.ipc.open_stream(value["data"]).read_all()
+        assert table.column_names == list(small_dataframe.keys())
+
+
+def test_negotiated_data_format(gui: Gui, helpers, small_dataframe):
+    if util.find_spec("pyarrow"):
+        accessors = _DataAccessors(gui)
+        accessors.set_data_format(_DataFormat.APACHE_ARROW)
+        value = _TaipyData(pandas.DataFrame(data=small_dataframe), "x")
+        payload = {"start": 0, "end": -1}
+        assert accessors.get_data("x", value, payload)["value"]["format"] == "ARROW"
+        payload["data_formats"] = ["ARROW", "JSON"]
+        assert accessors.get_data("x", value, payload)["value"]["format"] == "ARROW"
+        payload["data_formats"] = ["JSON"]
+        assert accessors.get_data("x", value, payload)["value"]["format"] == "JSON"
+
+        accessors.set_data_format(_DataFormat.JSON)
+        payload["data_formats"] = ["ARROW", "JSON"]
+        assert accessors.get_data("x", value, payload)["value"]["format"] == "JSON"
+
+
 def test_get_all_simple_data(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(data=small_dataframe)
@@ -200,6 +232,41 @@ def test_filters(gui: Gui, helpers, small_dataframe):
     assert value["value"]["data"][0]["_tp_index"] == 1
 
 
+def test_paginate_cached_filtered_sorted_view(gui: Gui, helpers):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data={"name": [f"n{i}" for i in range(10)], "value": [5, 1, 8, 3, 9, 0, 7, 2, 6, 4]})
+    query = {
+        "columns": ["name", "value"],
+        "orderby": "value",
+        "sort": "desc",
+        "filters": [{"col": "value", "action": ">", "value": 2}],
+    }
+    value = accessor.get_data("x", pd, {**query, "start": 0, "end": 2}, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 7
+    assert value["fullrowcount"] == 10
+    assert [row["value"] for row in value["data"]] == [9, 8, 7]
+    assert [row["_tp_index"] for row in value["data"]] == [4, 2, 6]
+
+    # The next page is sliced from the cached view, without filtering again
+    with patch.object(pandas.DataFrame, "eval") as mck:
+        value = accessor.get_data("x", pd, {**query, "start": 3, "end": 5}, _DataFormat.JSON)["value"]
+        mck.assert_not_called()
+    assert [row["value"] for row in value["data"]] == [6, 5, 4]
+    assert [row["_tp_index"] for row in value["data"]] == [8, 0, 9]
+
+
+def test_edit_invalidates_cached_view(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame(data=small_dataframe)
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value"}
+    data = accessor.get_data("x", pd, query, _DataFormat.JSON)["value"]["data"]
+    assert data[0]["name"] == "A"
+
+    accessor.on_edit(pd, {"index": 0, "col": "value", "value": 10})
+    data = accessor.get_data("x", pd, query, _DataFormat.JSON)["value"]["data"]
+    assert data[0]["name"] == "B"
+
+
 def test_filter_by_date(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(data=small_dataframe)
@@ -298,6 +365,39 @@ def test_decimator(gui: Gui, helpers, small_dataframe):
         assert len(data) == 2
 
 
+def test_decimator_with_pyramid(gui: Gui, helpers):
+    a_decimator = MinMaxDecimator(n_out=100, pyramid_threshold=1_000)  # noqa: F841
+
+    accessor = _PandasDataAccessor(gui)
+    pd = pandas.DataFrame({"x": range(100_000), "y": [(i * 7_919) % 1_000 for i in range(100_000)]})
+
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", "<|Hello {a_decimator}|button|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+
+    cid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={cid}")
+    with gui.get_flask_app().test_request_context(f"/taipy-jsx/test/?client_id={cid}", data={"client_id": cid}):
+        g.client_id = cid
+        query = {
+            "alldata": True,
+            "decimatorPayload": {
+                "decimators": [{"decimator": "a_decimator", "chartMode": "lines", "xAxis": "x", "yAxis": "y"}],
+                "width": 100,
+                "relayoutData": {"xaxis.range[0]": 20_000, "xaxis.range[1]": 30_000},
+            },
+        }
+        with patch("taipy.gui.data.pandas_data_accessor._Pyramid", wraps=_Pyramid) as pyramid_mock:
+            data = accessor.get_data("x", pd, query, _DataFormat.JSON)["value"]["data"]
+            accessor.get_data("x", pd, query, _DataFormat.JSON)
+            pyramid_mock.assert_called_once()
+        assert 0 < len(data["x"]) <= 100
+        assert all(20_000 < x < 30_000 for x in data["x"])
+        assert max(data["y"]) == 999
+        assert min(data["y"]) == 0
+
+
 def test_edit(gui, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(small_dataframe)
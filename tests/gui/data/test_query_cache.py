@@ -0,0 +1,68 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gc
+
+import pandas
+
+from taipy.gui.data.query_cache import _QueryCache
+
+
+def test_get_put():
+    cache = _QueryCache(100)
+    df = pandas.DataFrame({"a": [1]})
+    assert cache.get("x", df, "q") is None
+    cache.put("x", df, "q", "result", 10)
+    assert cache.get("x", df, "q") == "result"
+    assert cache.get("x", df, "other") is None
+    assert cache.get("y", df, "q") is None
+    assert cache.get("x", pandas.DataFrame({"a": [1]}), "q") is None
+
+
+def test_evict_least_recently_used_entries_over_budget():
+    cache = _QueryCache(25)
+    df = pandas.DataFrame({"a": [1]})
+    cache.put("x", df, "q1", 1, 10)
+    cache.put("x", df, "q2", 2, 10)
+    assert cache.get("x", df, "q1") == 1
+    cache.put("x", df, "q3", 3, 10)
+    assert cache.get("x", df, "q2") is None
+    assert cache.get("x", df, "q1") == 1
+    assert cache.get("x", df, "q3") == 3
+    assert cache.size == 20
+
+    cache.put("x", df, "q4", 4, 30)
+    assert cache.get("x", df, "q4") is None
+    assert len(cache) == 2
+
+
+def test_disabled():
+    cache = _QueryCache(0)
+    df = pandas.DataFrame({"a": [1]})
+    cache.put("x", df, "q", "result", 0)
+    assert cache.get("x", df, "q") is None
+
+
+def test_invalidate_and_collected_data():
+    cache = _QueryCache(100)
+    df1 = pandas.DataFrame({"a": [1]})
+    df2 = pandas.DataFrame({"a": [2]})
+    cache.put("x", df1, "q", 1, 10)
+    cache.put("x", df2, "q", 2, 10)
+    cache.invalidate(df1)
+    assert cache.get("x", df1, "q") is None
+    assert cache.get("x", df2, "q") == 2
+
+    del df2
+    gc.collect()
+    cache.invalidate(df1)
+    assert len(cache) == 0
+    assert cache.size == 0
@@ -0,0 +1,99 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import threading
+import typing as t
+
+from taipy.gui import Gui, Markdown
+from taipy.gui.utils._page_cache import _PageCache, _RenderedPage
+
+
+def test_page_cache(gui: Gui):
+    x = 10  # noqa: F841
+    y = "text"  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    page = Markdown("<|{x}|number|>")
+    gui.add_page("test", page)
+    gui.add_page("other", Markdown("<|{y}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid1, sid2 = "client1", "client2"
+    gui._bindings()._get_or_create_scope(sid1)
+    gui._bindings()._get_or_create_scope(sid2)
+
+    def get_metrics():
+        return gui._Gui__page_cache._get_metrics()  # type: ignore[attr-defined]
+
+    def get_jsx(sid, page="test"):
+        return flask_client.get(f"/taipy-jsx/{page}?client_id={sid}").json["jsx"]
+
+    def update(sid, name, value):
+        ws_client.emit("message", {"client_id": sid, "type": "U", "name": name, "payload": {"value": value}})
+
+    # The variables of the page must be bound for each client
+    jsx = get_jsx(sid1)
+    assert 'defaultValue="10"' in jsx
+    assert get_metrics()["misses"] == 1
+    assert get_jsx(sid1) == jsx
+    jsx = get_jsx(sid2)
+    assert get_jsx(sid2) == jsx
+    assert get_metrics()["hits"] == 2
+    assert get_metrics()["entries"] == 1
+
+    # Updating a variable of the page renders it for that client only
+    update(sid1, "tpec_TpExPr_x_TPMDL_0", 20)
+    assert 'defaultValue="20"' in get_jsx(sid1)
+    assert get_jsx(sid2) == jsx
+    assert get_metrics()["entries"] == 2
+    update(sid1, "tpec_TpExPr_x_TPMDL_0", 30)
+    assert get_metrics()["invalidations"] == 1
+    assert 'defaultValue="30"' in get_jsx(sid1)
+    assert get_jsx(sid2) == jsx
+
+    # The variables of other pages do not impact it
+    assert "new" not in get_jsx(sid2, "other")
+    update(sid2, "tpec_TpExPr_y_TPMDL_0", "new")
+    assert "new" in get_jsx(sid2, "other")
+    assert get_jsx(sid2) == jsx
+    assert get_metrics()["hits"] == 5
+
+    # Changing the content renders the page again
+    page._content = "<|{x}|slider|>"
+    assert "Slider" in get_jsx(sid2)
+    assert get_metrics()["misses"] == 7
+
+
+def test_page_cache_is_shared_by_threads():
+    cache = _PageCache()
+    entry = _RenderedPage("content", "jsx", None, None)
+    errors = []
+
+    def serve(client_id: str):
+        try:
+            for i in range(500):
+                page: t.Any = f"page{i % 10}"
+                rendered_pages: t.Dict = {}
+                cache._set(page, client_id, "content", rendered_pages, {"x"}, {"x", f"y{i}"}, entry)
+                cache._get(page, "content", client_id, rendered_pages, {"x"})
+                cache._invalidate([f"y{i}"], None)
+            cache._remove_client(client_id)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=serve, args=(f"client{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert cache._get_metrics()["hits"] + cache._get_metrics()["misses"] == 8 * 500
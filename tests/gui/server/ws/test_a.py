@@ -43,3 +43,73 @@ def test_a_button_pressed(gui: Gui, helpers):
     received_messages = ws_client.get_received()
     helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 20)
     helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+
+
+def test_a_unchanged_values_are_not_sent(gui: Gui, helpers):
+    def do_something(state, id):
+        state.x = state.x + 10
+        state.text = "constant"
+
+    x = 10  # noqa: F841
+    text = "hi"  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page(
+        "test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x}|> | <|{text}|>")
+    )
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    action = {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"}
+    ws_client.emit("message", action)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 2
+    helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "constant")
+
+    # text did not change
+    ws_client.emit("message", action)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 1
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 30)
+
+    # text was changed by the front-end
+    ws_client.emit(
+        "message", {"client_id": sid, "type": "U", "name": "tpec_TpExPr_text_TPMDL_0", "payload": {"value": "other"}}
+    )
+    ws_client.get_received()
+    ws_client.emit("message", action)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 2
+    helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "constant")
+
+
+def test_a_dropped_values_are_sent_again(gui: Gui, helpers):
+    def do_something(state, id):
+        state.x = state.x + 10
+        state.text = "constant"
+
+    x = 10  # noqa: F841
+    text = "hi"  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page(
+        "test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x}|> | <|{text}|>")
+    )
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    action = {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"}
+    ws_client.emit("message", action)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 2
+
+    # The update of text was dropped by the WebSocket queue
+    gui._on_ws_message_dropped(
+        None, {"type": "MU", "payload": [{"name": "tpec_TpExPr_text_TPMDL_0", "payload": {"value": "constant"}}]}
+    )
+    ws_client.emit("message", action)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 2
+    helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "constant")
@@ -15,6 +15,7 @@ import warnings
 from flask import g
 
 from taipy.gui import Gui
+from taipy.gui.utils import _getscopeattr
 from taipy.gui.utils.types import _TaipyNumber
 
 
@@ -87,3 +88,17 @@ def test_evaluate_expression_2_clients(gui: Gui):
         g.client_id = "B"
         gui._evaluate_expr("x")
         gui._re_evaluate_expr("x")
+
+
+def test_re_evaluate_compiled_expressions(gui: Gui):
+    x = [1, 2]  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        # Variables are seen in comprehensions, and functions of the global context as well
+        s1 = gui._evaluate_expr("{[v * 2 for v in x]}")
+        s2 = gui._evaluate_expr("{len(x)} items: {str(x)}")
+        assert _getscopeattr(gui, s1) == [2, 4]
+        gui._bindings().x = [1, 2, 3]
+        assert _getscopeattr(gui, s1) == [2, 4, 6]
+        assert _getscopeattr(gui, s2) == "3 items: [1, 2, 3]"
@@ -0,0 +1,168 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+from taipy.gui.utils._ws_dispatcher import _WsDispatcher
+
+
+class MockSocketIO:
+    def __init__(self):
+        self.emitted = []
+        self.tasks = []
+
+    def emit(self, event, payload, to=None):
+        self.emitted.append((payload, to))
+
+    def start_background_task(self, target):
+        # The writer is not run: tests flush the queues explicitly
+        self.tasks.append(target)
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+def _update(name, value, pagekey=None):
+    payload = {"value": value} if pagekey is None else {"value": value, "pagekey": pagekey}
+    return {"type": "MU", "payload": [{"name": name, "payload": payload}]}
+
+
+def test_send_right_away_when_not_started():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 10)
+    dispatcher._send({"type": "AL"}, "sid")
+    assert ws.emitted == [({"type": "AL"}, "sid")]
+
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 0)
+    dispatcher._start()
+    assert not ws.tasks
+    dispatcher._send({"type": "AL"}, "sid")
+    assert len(ws.emitted) == 1
+
+
+def test_batch_per_receiver():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 10)
+    dispatcher._start()
+    assert len(ws.tasks) == 1
+    dispatcher._send({"type": "AL"}, ["sid1", "sid2"])
+    dispatcher._send({"type": "NA"}, "sid1")
+    dispatcher._send({"type": "BC"}, None)
+    assert dispatcher._get_metrics()["pending"] == 4
+    assert dispatcher._get_metrics()["depths"] == {"sid1": 2, "sid2": 1, "None": 1}
+    assert not ws.emitted
+
+    assert dispatcher._flush()
+    assert ({"type": "MS", "payload": [{"type": "AL"}, {"type": "NA"}]}, "sid1") in ws.emitted
+    assert ({"type": "AL"}, "sid2") in ws.emitted
+    assert ({"type": "BC"}, None) in ws.emitted
+    assert dispatcher._get_metrics()["pending"] == 0
+    assert dispatcher._get_metrics()["sent"] == 4
+    assert not dispatcher._flush()
+
+
+def test_keep_the_order_of_the_messages_to_all_the_clients():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 10)
+    dispatcher._start()
+    dispatcher._send({"type": "AL", "message": 0}, "sid1")
+    dispatcher._send({"type": "AL", "message": 1}, None)
+    dispatcher._send({"type": "AL", "message": 2}, "sid1")
+    dispatcher._send({"type": "AL", "message": 3}, "sid2")
+    dispatcher._send({"type": "AL", "message": 4}, None)
+    dispatcher._send({"type": "AL", "message": 5}, None)
+
+    assert dispatcher._flush()
+    assert ws.emitted == [
+        ({"type": "AL", "message": 0}, "sid1"),
+        ({"type": "AL", "message": 1}, None),
+        ({"type": "AL", "message": 2}, "sid1"),
+        ({"type": "AL", "message": 3}, "sid2"),
+        ({"type": "MS", "payload": [{"type": "AL", "message": 4}, {"type": "AL", "message": 5}]}, None),
+    ]
+
+
+def test_updates_supersede_pending_updates():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 10)
+    dispatcher._start()
+    first = {
+        "type": "MU",
+        "payload": [{"name": "a", "payload": {"value": 1}}, {"name": "b", "payload": {"value": 1}}],
+    }
+    dispatcher._send(first, ["sid1", "sid2"])
+    dispatcher._send(_update("t", "page 1", "p1"), "sid1")
+    dispatcher._send(_update("a", 2), "sid1")
+    dispatcher._send(_update("t", "page 2", "p2"), "sid1")
+    dispatcher._send(_update("b", 2), "sid1")
+    # The payload of the other receiver is not impacted
+    assert len(first["payload"]) == 2
+    assert dispatcher._get_metrics()["superseded"] == 2
+
+    dispatcher._flush()
+    messages = {to: payload for payload, to in ws.emitted}
+    assert messages["sid2"] == first
+    assert messages["sid1"]["payload"] == [
+        _update("t", "page 1", "p1"),
+        _update("a", 2),
+        _update("t", "page 2", "p2"),
+        _update("b", 2),
+    ]
+
+
+def test_drop_oldest_messages_when_full():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 2, _WsDispatcher.OVERFLOW_DROP)
+    dispatcher._start()
+    for i in range(5):
+        dispatcher._send({"type": "AL", "message": i}, "sid")
+    assert dispatcher._get_metrics()["dropped"] == 3
+    dispatcher._flush()
+    assert ws.emitted == [
+        ({"type": "MS", "payload": [{"type": "AL", "message": 3}, {"type": "AL", "message": 4}]}, "sid")
+    ]
+
+
+def test_notify_dropped_messages():
+    ws = MockSocketIO()
+    dropped = []
+    dispatcher = _WsDispatcher(
+        ws, 1, _WsDispatcher.OVERFLOW_DROP, on_drop=lambda receiver, payload: dropped.append((receiver, payload))
+    )
+    dispatcher._start()
+    dispatcher._send(_update("a", 1), "sid")
+    dispatcher._send({"type": "AL"}, "sid")
+    assert dropped == [("sid", _update("a", 1))]
+
+
+def test_block_when_full():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 1, _WsDispatcher.OVERFLOW_BLOCK, block_timeout=0.05)
+    dispatcher._start()
+    dispatcher._send({"type": "AL", "message": 0}, "sid")
+    start = time.monotonic()
+    dispatcher._send({"type": "AL", "message": 1}, "sid")
+    # Nobody emptied the queue
+    assert time.monotonic() - start >= 0.05
+    assert dispatcher._get_metrics()["dropped"] == 1
+
+
+def test_remove_receiver():
+    ws = MockSocketIO()
+    dispatcher = _WsDispatcher(ws, 10)
+    dispatcher._start()
+    dispatcher._send({"type": "AL"}, "sid")
+    dispatcher._remove_receiver("sid")
+    assert not dispatcher._flush()
+    dispatcher._stop()
+    dispatcher._send({"type": "AL"}, "sid")
+    assert len(ws.emitted) == 1
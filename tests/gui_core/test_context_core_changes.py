@@ -0,0 +1,125 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.common.config.common.frequency import Frequency
+from taipy.common.config.common.scope import Scope
+from taipy.core import Orchestrator
+from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.notification.event import Event, EventEntityType, EventOperation
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from taipy.gui_core._context import _GuiCoreContext
+
+
+def _delete_entities():
+    for factory in (_ScenarioManagerFactory, _CycleManagerFactory, _TaskManagerFactory, _DataManagerFactory):
+        factory._build_manager()._delete_all()
+
+
+@pytest.fixture(autouse=True)
+def clean_entities(reset_configuration_singleton, inject_core_sections):
+    reset_configuration_singleton()
+    inject_core_sections()
+    Orchestrator._is_running = False
+    Orchestrator._version_is_initialized = False
+    _delete_entities()
+    yield
+    _delete_entities()
+    reset_configuration_singleton()
+
+
+def _build_context(core_changed_delay=0) -> _GuiCoreContext:
+    gui = MagicMock()
+    gui._get_config.return_value = core_changed_delay
+    context = _GuiCoreContext(gui)
+    # do not consume the core events in a separate thread
+    context._GuiCoreContext__started = True  # type: ignore[attr-defined]
+    return context
+
+
+class TestGuiCoreContext_core_changes:
+    def test_scenario_events_patch_the_scenario_cache(self):
+        dn_config = Config.configure_pickle_data_node("dn")
+        scenario_config = Config.configure_scenario("sc", additional_data_node_configs=[dn_config])
+        cycle_scenario_config = Config.configure_scenario("sc_cycle", frequency=Frequency.DAILY)
+        scenario_1 = tp.create_scenario(scenario_config)
+        context = _build_context()
+        context.get_scenarios(None, None, None)
+        assert context.scenario_by_cycle == {None: [scenario_1]}
+
+        with patch("taipy.gui_core._context.get_cycles_scenarios") as mck:
+            scenario_2 = tp.create_scenario(scenario_config)
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.CREATION, scenario_2.id))
+            scenario_3 = tp.create_scenario(cycle_scenario_config)
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.CREATION, scenario_3.id))
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.UPDATE, scenario_3.id, "tags"))
+            assert context.scenario_by_cycle == {None: [scenario_1, scenario_2], scenario_3.cycle: [scenario_3]}
+
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.DELETION, scenario_1.id))
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.DELETION, scenario_3.id))
+            assert context.scenario_by_cycle == {None: [scenario_2]}
+            mck.assert_not_called()
+
+        context.process_event(Event(EventEntityType.SCENARIO, EventOperation.DELETION, metadata={"delete_all": True}))
+        assert context.scenario_by_cycle is None
+
+    def test_data_node_events_patch_the_data_node_cache(self):
+        dn_config = Config.configure_pickle_data_node("dn")
+        global_dn_config = Config.configure_pickle_data_node("global_dn", scope=Scope.GLOBAL)
+        scenario_config = Config.configure_scenario("sc", additional_data_node_configs=[dn_config])
+        scenario = tp.create_scenario(scenario_config)
+        context = _build_context()
+        context.get_datanodes_tree(None, None, None, None)
+        assert context.data_nodes_by_owner == {scenario.id: [scenario.dn]}
+
+        with patch("taipy.gui_core._context.get_data_nodes") as mck:
+            global_dn = tp.create_global_data_node(global_dn_config)
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.CREATION, global_dn.id))
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, global_dn.id, "name"))
+            assert context.data_nodes_by_owner == {scenario.id: [scenario.dn], None: [global_dn]}
+
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.DELETION, scenario.dn.id))
+            assert context.data_nodes_by_owner == {None: [global_dn]}
+            mck.assert_not_called()
+
+    def test_broadcasts_are_coalesced(self):
+        context = _build_context(core_changed_delay=50)
+        context.broadcast_core_changed({"scenario": "s1"})
+        context.broadcast_core_changed({"scenario": ["s2", "s1"], "datanode": "d1"})
+        context.broadcast_core_changed({"jobs": True})
+        context.broadcast_core_changed({"jobs": True, "submission": 2}, "client_id")
+        context.gui._broadcast.assert_called_once_with(
+            _GuiCoreContext._CORE_CHANGED_NAME, {"jobs": True, "submission": 2}, "client_id"
+        )
+
+        time.sleep(0.3)
+        assert context.gui._broadcast.call_count == 2
+        context.gui._broadcast.assert_called_with(
+            _GuiCoreContext._CORE_CHANGED_NAME, {"scenario": ["s1", "s2"], "datanode": ["d1"], "jobs": True}
+        )
+
+        context.broadcast_core_changed({"datanode": "d2"})
+        context.broadcast_core_changed({"datanode": True})
+        time.sleep(0.3)
+        context.gui._broadcast.assert_called_with(_GuiCoreContext._CORE_CHANGED_NAME, {"datanode": True})
+
+    def test_broadcasts_are_immediate_without_delay(self):
+        context = _build_context(core_changed_delay=0)
+        context.broadcast_core_changed({"scenario": "s1"})
+        context.gui._broadcast.assert_called_once_with(_GuiCoreContext._CORE_CHANGED_NAME, {"scenario": "s1"}, None)
@@ -24,6 +24,7 @@ from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
 from taipy.core import Cycle, DataNodeId, Job, JobId, Scenario, Sequence, Task
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core._orchestrator._readiness_graph import _ReadinessGraph
 from taipy.core.cycle._cycle_manager import _CycleManager
 from taipy.core.data.pickle import PickleDataNode
 from taipy.core.job._job_manager import _JobManager
@@ -337,5 +338,7 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator.readiness_graph = _ReadinessGraph()
+        _OrchestratorFactory._orchestrator.tracked_submissions = {}
 
     return _init_orchestrator
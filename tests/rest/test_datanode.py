@@ -9,10 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
+import json
 from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
 from flask import url_for
 
+from taipy.common.config.common.scope import Scope
+from taipy.core.data.csv import CSVDataNode
+from taipy.core.data.pickle import PickleDataNode
+
 
 def test_get_datanode(client, default_datanode):
     # test 404
@@ -73,6 +81,30 @@ def test_get_all_datanodes(client, default_datanode_config_list):
     assert len(results) == 10
 
 
+def test_get_datanodes_by_page(client, default_datanode_config_list):
+    for config in default_datanode_config_list:
+        with mock.patch("taipy.rest.api.resources.datanode.DataNodeList.fetch_config") as config_mock:
+            config_mock.return_value = config
+            client.post(url_for("api.datanodes", config_id=config.id))
+    all_ids = [datanode["id"] for datanode in client.get(url_for("api.datanodes")).get_json()]
+    assert all_ids == sorted(all_ids)
+
+    rep = client.get(url_for("api.datanodes", limit=4, offset=2)).get_json()
+    assert [datanode["id"] for datanode in rep["results"]] == all_ids[2:6]
+
+    ids, url = [], url_for("api.datanodes", limit=4)
+    while url:
+        rep = client.get(url).get_json()
+        ids.extend(datanode["id"] for datanode in rep["results"])
+        url = rep["next"]
+    assert ids == all_ids
+    assert rep["next_cursor"] is None
+
+    assert client.get(url_for("api.datanodes", limit=0)).status_code == 400
+    assert client.get(url_for("api.datanodes", offset="foo")).status_code == 400
+    assert client.get(url_for("api.datanodes", cursor="%")).status_code == 400
+
+
 def test_read_datanode(client, default_df_datanode):
     with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
         config_mock.return_value = default_df_datanode
@@ -108,3 +140,62 @@ def test_write_datanode(client, default_datanode):
         rep = client.get(datanodes_read_url, json={})
         assert rep.status_code == 200
         assert rep.json == {"data": [1, 2, 3]}
+
+
+def test_read_datanode_as_stream(client, tmp_path):
+    df = pd.DataFrame({"a": range(10), "b": [f"x{i}" for i in range(10)]})
+    data_node = CSVDataNode("csv_dn", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.csv")})
+    data_node.write(df)
+    operators = {"operators": [{"key": "a", "value": 6, "operator": "LESS_THAN"}]}
+
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock:
+        manager_mock.return_value = data_node
+
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="ndjson", chunk_size=4))
+        assert rep.status_code == 200
+        assert rep.mimetype == "application/x-ndjson"
+        lines = rep.get_data(as_text=True).splitlines()
+        assert [json.loads(line) for line in lines] == df.to_dict(orient="records")
+
+        url = url_for("api.datanode_reader", datanode_id="foo", format="csv", columns="b", chunk_size=4)
+        rep = client.get(url, json=operators)
+        assert rep.mimetype == "text/csv"
+        assert rep.get_data(as_text=True).splitlines() == ["b", "x0", "x1", "x2", "x3", "x4", "x5"]
+
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="arrow", chunk_size=4))
+        assert rep.mimetype == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(io.BytesIO(rep.get_data())).read_all()
+        assert table.to_pandas().equals(df)
+
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", columns="a"), json=operators)
+        assert rep.json == {"data": [{"a": i} for i in range(6)]}
+
+        assert client.get(url_for("api.datanode_reader", datanode_id="foo", format="xml")).status_code == 400
+        url = url_for("api.datanode_reader", datanode_id="foo", format="csv", chunk_size=0)
+        assert client.get(url).status_code == 400
+
+
+def test_read_non_tabular_datanode_as_stream(client, default_datanode):
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock:
+        manager_mock.return_value = default_datanode
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="csv"))
+        assert rep.status_code == 200
+        assert rep.get_data(as_text=True).splitlines() == ["0", "1", "2", "3", "4", "5", "6"]
+
+
+def test_read_datanode_as_stream_with_invalid_parameters(client, tmp_path):
+    data_node = CSVDataNode("csv_dn", Scope.SCENARIO, properties={"path": str(tmp_path / "dn.csv")})
+
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock:
+        manager_mock.return_value = data_node
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="ndjson"))
+        assert rep.status_code == 200
+        assert rep.get_data(as_text=True) == ""
+
+        data_node.write(pd.DataFrame({"a": range(10)}))
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="csv", columns="a,unknown"))
+        assert rep.status_code == 400
+
+        manager_mock.return_value = PickleDataNode("pickle_dn", Scope.SCENARIO, properties={"default_data": {"a": 1}})
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", format="csv"))
+        assert rep.status_code == 400
@@ -64,6 +64,20 @@ def test_get_all_jobs(client, create_job_list):
     assert len(results) == 10
 
 
+def test_get_jobs_by_page(client, create_job_list):
+    rep = client.get(url_for("api.jobs", limit=6))
+    assert rep.status_code == 200
+    first_page = rep.get_json()
+    assert len(first_page["results"]) == 6
+
+    second_page = client.get(first_page["next"]).get_json()
+    assert len(second_page["results"]) == 4
+    assert second_page["next"] is None
+    ids = [job["id"] for job in first_page["results"] + second_page["results"]]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 10
+
+
 def test_cancel_job(client, default_job):
     # test 404
     from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
@@ -74,6 +74,19 @@ def test_get_all_scenarios(client, default_sequence, default_scenario_config_lis
     assert len(results) == 10
 
 
+def test_get_scenarios_by_page(client, default_sequence, default_scenario_config_list):
+    for config in default_scenario_config_list[:3]:
+        with mock.patch("taipy.rest.api.resources.scenario.ScenarioList.fetch_config") as config_mock:
+            config_mock.return_value = config
+            client.post(url_for("api.scenarios", config_id=config.id))
+
+    rep = client.get(url_for("api.scenarios", limit=2)).get_json()
+    assert len(rep["results"]) == 2
+    rep = client.get(url_for("api.scenarios", cursor=rep["next_cursor"])).get_json()
+    assert len(rep["results"]) == 1
+    assert rep["next_cursor"] is None
+
+
 def test_execute_scenario(client, default_scenario_config):
     # test 404
     user_url = url_for("api.scenario_submit", scenario_id="foo")
@@ -0,0 +1,82 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the scheduling overhead of the standalone job dispatcher of taipy-core.
+
+Usage:
+    python tools/benchmarks/core_dispatcher_latency.py [--nb-tasks 200] [--nb-workers 2] [--runs 3]
+
+The benchmark submits a linear scenario, where each task reads the output of the previous one, and
+measures the time between the submission and the completion of the last job. The tasks do not do any
+work, so the time per task is the end-to-end overhead of the orchestration: job creation, dispatch,
+execution in a worker process and release of the next job.
+"""
+
+import argparse
+import tempfile
+import time
+
+import taipy as tp
+from taipy.common.config import Config
+from taipy.core import Orchestrator
+
+
+def increment(value):
+    return value + 1
+
+
+def _configure(nb_tasks: int, nb_workers: int, folder: str):
+    Config.configure_core(storage_folder=folder, taipy_storage_folder=folder)
+    Config.configure_job_executions(mode="standalone", max_nb_of_workers=nb_workers)
+    data_node_configs = [Config.configure_data_node(f"value_{i}", default_data=0) for i in range(nb_tasks + 1)]
+    task_configs = [
+        Config.configure_task(f"increment_{i}", increment, data_node_configs[i], data_node_configs[i + 1])
+        for i in range(nb_tasks)
+    ]
+    return Config.configure_scenario("linear", task_configs)
+
+
+def _run(scenario_config) -> float:
+    scenario = tp.create_scenario(scenario_config)
+    start = time.perf_counter()
+    submission = tp.submit(scenario)
+    # In a linear scenario, the last job is the last one to finish.
+    last_job = submission.jobs[-1]
+    while not last_job.is_finished():
+        time.sleep(0.002)
+    elapsed = time.perf_counter() - start
+    if not last_job.is_completed():
+        raise RuntimeError(f"Job {last_job.id} ended with status {last_job.status}.")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nb-tasks", type=int, default=200)
+    parser.add_argument("--nb-workers", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        scenario_config = _configure(args.nb_tasks, args.nb_workers, folder)
+        orchestrator = Orchestrator()
+        orchestrator.run()
+        try:
+            print(f"{'run':>4}{'total':>12}{'per task':>14}")
+            for run in range(args.runs):
+                elapsed = _run(scenario_config)
+                print(f"{run:>4}{elapsed:>11.3f}s{elapsed / args.nb_tasks * 1000:>12.2f}ms")
+        finally:
+            orchestrator.stop()
+
+
+if __name__ == "__main__":
+    main()
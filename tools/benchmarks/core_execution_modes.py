@@ -0,0 +1,96 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the job throughput of the taipy-core job execution modes.
+
+Usage:
+    python tools/benchmarks/core_execution_modes.py [--nb-tasks 40] [--nb-workers 4] [--io-delay 0.05]
+
+The benchmark submits a scenario made of independent tasks in the "development", "standalone" and
+"thread" job execution modes, and reports the number of jobs completed per second. It is run for an
+I/O-bound task mix, where each task waits for `--io-delay` seconds, for a CPU-bound task mix, where
+each task computes a pure Python loop, and for a mix of both.
+"""
+
+import argparse
+import tempfile
+import time
+
+import taipy as tp
+from taipy.common.config import Config
+from taipy.core import Orchestrator
+from taipy.core.config.job_config import JobConfig
+
+_MODES = [JobConfig._DEVELOPMENT_MODE, JobConfig._STANDALONE_MODE, JobConfig._THREAD_MODE]
+
+
+def io_bound(delay):
+    time.sleep(delay)
+    return delay
+
+
+def cpu_bound(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _configure(nb_tasks: int, io_delay: float, cpu_loops: int, folder: str):
+    Config.configure_core(storage_folder=folder, taipy_storage_folder=folder)
+    scenario_configs = {}
+    for mix in ("io", "cpu", "mixed"):
+        task_configs = []
+        for i in range(nb_tasks):
+            is_io = mix == "io" or (mix == "mixed" and i % 2 == 0)
+            function, default_data = (io_bound, io_delay) if is_io else (cpu_bound, cpu_loops)
+            input_cfg = Config.configure_data_node(f"{mix}_in_{i}", default_data=default_data)
+            output_cfg = Config.configure_data_node(f"{mix}_out_{i}")
+            task_configs.append(Config.configure_task(f"{mix}_task_{i}", function, input_cfg, output_cfg))
+        scenario_configs[mix] = Config.configure_scenario(f"{mix}_scenario", task_configs)
+    return scenario_configs
+
+
+def _run(mode: str, nb_workers: int, scenario_config) -> float:
+    Config.configure_job_executions(mode=mode, max_nb_of_workers=nb_workers)
+    orchestrator = Orchestrator()
+    orchestrator.run()
+    try:
+        scenario = tp.create_scenario(scenario_config)
+        start = time.perf_counter()
+        submission = tp.submit(scenario, wait=True)
+        elapsed = time.perf_counter() - start
+        if failed := [job.id for job in submission.jobs if not job.is_completed()]:
+            raise RuntimeError(f"Jobs {failed} did not complete.")
+        return elapsed
+    finally:
+        orchestrator.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nb-tasks", type=int, default=40)
+    parser.add_argument("--nb-workers", type=int, default=4)
+    parser.add_argument("--io-delay", type=float, default=0.05)
+    parser.add_argument("--cpu-loops", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        scenario_configs = _configure(args.nb_tasks, args.io_delay, args.cpu_loops, folder)
+        print(f"{'mix':>6}{'mode':>13}{'total':>10}{'jobs/s':>10}")
+        for mix, scenario_config in scenario_configs.items():
+            for mode in _MODES:
+                elapsed = _run(mode, args.nb_workers, scenario_config)
+                print(f"{mix:>6}{mode:>13}{elapsed:>9.2f}s{args.nb_tasks / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
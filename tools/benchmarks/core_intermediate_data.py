@@ -0,0 +1,69 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the cost of exchanging an intermediate data frame through the file-based data nodes.
+
+Usage:
+    python tools/benchmarks/core_intermediate_data.py [--nb-rows 10_000_000] [--nb-columns 8] [--folder /dev/shm]
+
+For each storage type, the benchmark writes a numerical data frame with a first data node, as the
+upstream task of a scenario does, and reads it back with another instance of the data node, as the
+downstream task does in another process.
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from taipy.common.config import Config
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+
+_STORAGE_TYPES = ["pickle", "parquet", "arrow"]
+
+
+def _measure(storage_type: str, df: pd.DataFrame, folder: str):
+    config = Config.configure_data_node(f"{storage_type}_dn", storage_type, default_path=f"{folder}/dn.{storage_type}")
+    data_manager = _DataManagerFactory._build_manager()
+    data_node = data_manager._create_and_set(config, None, None)
+
+    start = time.perf_counter()
+    data_node.write(df)
+    written = time.perf_counter()
+    data = data_manager._get(data_node.id).read()
+    read = time.perf_counter()
+    assert len(data) == len(df)
+    return written - start, read - written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nb-rows", type=int, default=10_000_000)
+    parser.add_argument("--nb-columns", type=int, default=8)
+    parser.add_argument("--folder", default=None, help="Folder of the data files. Defaults to a temporary folder.")
+    args = parser.parse_args()
+
+    df = pd.DataFrame(np.random.default_rng(0).random((args.nb_rows, args.nb_columns)))
+    df.columns = [f"c{i}" for i in range(args.nb_columns)]
+    print(f"Data frame of {df.memory_usage().sum() / 2**20:.0f} MiB")
+
+    with tempfile.TemporaryDirectory() as storage_folder, tempfile.TemporaryDirectory(dir=args.folder) as folder:
+        Config.configure_core(storage_folder=storage_folder, taipy_storage_folder=storage_folder)
+        print(f"{'storage':>8}{'write':>10}{'read':>10}")
+        for storage_type in _STORAGE_TYPES:
+            write_time, read_time = _measure(storage_type, df, folder)
+            print(f"{storage_type:>8}{write_time:>9.3f}s{read_time:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
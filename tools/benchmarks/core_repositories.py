@@ -0,0 +1,105 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the filesystem and SQLite repositories of taipy-core on data node entities.
+
+Usage:
+    python tools/benchmarks/core_repositories.py [--sizes 10000 100000 1000000] [--repositories filesystem sql]
+
+Each run uses a fresh temporary storage folder. The 1M entities run of the filesystem repository
+writes one file per entity and takes a long time.
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_fs_repository import _DataFSRepository
+from taipy.core.data._data_sql_repository import _DataSQLRepository
+from taipy.core.data.in_memory import InMemoryDataNode
+
+_REPOSITORIES = {"filesystem": _DataFSRepository, "sql": _DataSQLRepository}
+_NB_VERSIONS = 10
+_NB_CONFIGS = 100
+
+
+@contextmanager
+def _timer(results: dict, name: str):
+    start = time.perf_counter()
+    yield
+    results[name] = time.perf_counter() - start
+
+
+def _data_nodes(size: int):
+    for i in range(size):
+        yield InMemoryDataNode(
+            config_id=f"config_{i % _NB_CONFIGS}",
+            scope=Scope.SCENARIO,
+            id=f"DATANODE_config_{i % _NB_CONFIGS}_{uuid.uuid4()}",
+            owner_id=f"SCENARIO_{i}",
+            parent_ids={f"TASK_{i}"},
+            version=f"version_{i % _NB_VERSIONS}",
+        )
+
+
+def _run(repository_type: str, size: int) -> dict:
+    results: dict = {}
+    with tempfile.TemporaryDirectory() as folder:
+        Config.configure_core(taipy_storage_folder=folder)
+        repository = _REPOSITORIES[repository_type]()
+        data_nodes = list(_data_nodes(size))
+
+        with _timer(results, "save"):
+            if repository_type == "sql":
+                repository._save_documents(repository.converter._entity_to_model(dn).to_dict() for dn in data_nodes)
+            else:
+                for dn in data_nodes:
+                    repository._save(dn)
+        with _timer(results, "load_all"):
+            repository._load_all()
+        with _timer(results, "filter_by_version"):
+            repository._load_all([{"version": "version_0"}])
+        with _timer(results, "count"):
+            len(repository._load_all()) if repository_type == "filesystem" else repository._count()
+        with _timer(results, "get_by_config_and_owner"):
+            for dn in data_nodes[:100]:
+                repository._get_by_config_and_owner_id(dn.config_id, dn.owner_id)
+        with _timer(results, "load_100"):
+            for dn in data_nodes[:100]:
+                repository._load(dn.id)
+        if repository_type == "sql":
+            repository._close_connections()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repositories", nargs="+", choices=list(_REPOSITORIES), default=list(_REPOSITORIES))
+    args = parser.parse_args()
+
+    print(f"{'repository':<12}{'entities':>10}  " + "  ".join(f"{name:>24}" for name in _operation_names()))
+    for size in args.sizes:
+        for repository_type in args.repositories:
+            results = _run(repository_type, size)
+            print(f"{repository_type:<12}{size:>10}  " + "  ".join(f"{results[n]:>23.3f}s" for n in _operation_names()))
+
+
+def _operation_names():
+    return ["save", "load_all", "filter_by_version", "count", "get_by_config_and_owner", "load_100"]
+
+
+if __name__ == "__main__":
+    main()
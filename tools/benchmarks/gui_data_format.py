@@ -0,0 +1,80 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the JSON and Apache Arrow data formats used to send table and chart data to the browser.
+
+Usage:
+    python tools/benchmarks/gui_data_format.py [--sizes 10000 100000 1000000]
+
+For each size, the benchmark builds the payload of a chart request (all the data, as columns) and
+of a table request (all the rows, as records), and serializes it as Socket.IO does: the JSON
+format is entirely encoded as JSON text, while the Arrow buffer is sent as a binary attachment.
+The time includes both the preparation of the data and the serialization.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from taipy.gui import Gui
+from taipy.gui._renderers.json import _TaipyJsonEncoder
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+
+_REQUESTS = {
+    "chart": lambda nb_rows: {"alldata": True, "columns": ["date", "x", "y"]},
+    "table": lambda nb_rows: {"start": 0, "end": nb_rows - 1, "columns": ["date", "x", "y", "label"]},
+}
+
+
+def _serialize(payload: dict) -> int:
+    value = payload["value"]
+    data = value.get("data")
+    if isinstance(data, bytes):
+        # The buffer is sent as is, next to the JSON text of the rest of the message.
+        return len(json.dumps({**payload, "value": {**value, "data": None}}, cls=_TaipyJsonEncoder)) + len(data)
+    return len(json.dumps(payload, cls=_TaipyJsonEncoder))
+
+
+def _measure(accessor: _PandasDataAccessor, df: pd.DataFrame, request: dict, data_format: _DataFormat):
+    start = time.perf_counter()
+    size = _serialize(accessor.get_data("df", df, request, data_format))
+    return time.perf_counter() - start, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    accessor = _PandasDataAccessor(Gui())
+    rng = np.random.default_rng(0)
+    print(f"{'request':>8}{'rows':>10}{'format':>8}{'time':>10}{'size':>12}")
+    for nb_rows in args.sizes:
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2020-01-01", periods=nb_rows, freq="min"),
+                "x": np.arange(nb_rows),
+                "y": rng.random(nb_rows),
+                "label": rng.choice(["alpha", "beta", "gamma"], nb_rows),
+            }
+        )
+        for name, request in _REQUESTS.items():
+            for data_format in (_DataFormat.JSON, _DataFormat.APACHE_ARROW):
+                duration, size = _measure(accessor, df, request(nb_rows), data_format)
+                print(f"{name:>8}{nb_rows:>10}{data_format.value:>8}{duration:>9.3f}s{size / 2**20:>9.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the vectorized LTTB and RDP decimators with their per-bin and per-segment implementations.
+
+Usage:
+    python tools/benchmarks/gui_decimators.py [--sizes 100000 1000000 10000000] [--n-out 1000]
+        [--reference-limit 1000000]
+
+For each size, a random walk is decimated by each decimator, and the resulting mask is checked to
+be identical to the one of the reference implementation, which is the loop-based implementation
+these decimators used before being vectorized. The reference implementations are only run up to
+the --reference-limit size, as the RDP one takes minutes on millions of points.
+"""
+
+import argparse
+import time
+import typing as t
+
+import numpy as np
+
+from taipy.gui.data.decimator import LTTB, RDP
+
+
+def _reference_lttb(data: np.ndarray, n_out: int) -> np.ndarray:
+    if n_out >= data.shape[0]:
+        return np.full(len(data), True)
+    n_bins = n_out - 2
+    data_bins = np.array_split(data[1:-1], n_bins)
+    prev_a = data[0]
+    start_pos = 0
+    out_mask = np.full(len(data), False)
+    out_mask[0] = True
+    out_mask[len(data) - 1] = True
+    for i in range(len(data_bins)):
+        this_bin = data_bins[i]
+        next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
+        a = prev_a
+        bs = this_bin
+        c = next_bin.mean(axis=0)
+        bs_minus_a = bs - a
+        a_minus_bs = a - bs
+        areas = 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
+        bs_pos = np.argmax(areas)
+        prev_a = bs[bs_pos]
+        out_mask[start_pos + bs_pos] = True
+        start_pos += len(this_bin)
+    return out_mask
+
+
+def _dsquared_line_points(P1, P2, points):
+    xdiff = P2[0] - P1[0]
+    ydiff = P2[1] - P1[1]
+    nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+    denom = ydiff**2 + xdiff**2
+    return np.divide(nom, denom)
+
+
+def _reference_rdp_epsilon(data: np.ndarray, epsilon: int) -> np.ndarray:
+    mask = np.full(data.shape[0], True)
+    stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _dsquared_line_points(data[start], data[end], data[start + 1 : end])
+        if (dsq > epsilon**2).any():
+            mid = np.argmax(dsq) + 1 + start
+            stack.append((start, mid))
+            stack.append((mid, end))
+        else:
+            mask[start + 1 : end] = False
+    return mask
+
+
+def _reference_rdp_points(M: np.ndarray, n_out: int) -> np.ndarray:
+    M_len = M.shape[0]
+    if M_len <= n_out:
+        return np.full(M_len, True)
+    weights = np.empty(M_len)
+    weights[0] = float("inf")
+    weights[M_len - 1] = float("inf")
+    stack = [(0, M_len - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _dsquared_line_points(M[start], M[end], M[start + 1 : end])
+        max_dist_index = np.argmax(dsq) + start + 1
+        weights[max_dist_index] = np.amax(dsq)
+        stack.append((start, max_dist_index))
+        stack.append((max_dist_index, end))
+    maxTolerance = np.sort(weights)[M_len - n_out]
+    return weights >= maxTolerance
+
+
+def _timed(function: t.Callable[[], np.ndarray]) -> t.Tuple[float, np.ndarray]:
+    start = time.perf_counter()
+    mask = function()
+    return time.perf_counter() - start, mask
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--n-out", type=int, default=1_000)
+    parser.add_argument("--reference-limit", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'decimator':>12}{'points':>10}{'vectorized':>12}{'reference':>12}{'speedup':>9}{'identical':>11}")
+    for nb_points in args.sizes:
+        data = np.column_stack([np.arange(nb_points, dtype=float), np.cumsum(rng.standard_normal(nb_points))])
+        epsilon = int(np.ptp(data[:, 1]) // 100) or 1
+        decimators = {
+            "lttb": (LTTB(args.n_out), _reference_lttb, args.n_out),
+            "rdp n_out": (RDP(n_out=args.n_out), _reference_rdp_points, args.n_out),
+            "rdp epsilon": (RDP(epsilon=epsilon), _reference_rdp_epsilon, epsilon),
+        }
+        for name, (decimator, reference, parameter) in decimators.items():
+            duration, mask = _timed(lambda: decimator._decimate(data, {}))  # noqa: B023
+            if nb_points > args.reference_limit:
+                print(f"{name:>12}{nb_points:>10}{duration:>11.3f}s{'-':>12}{'-':>9}{'-':>11}")
+                continue
+            reference_duration, reference_mask = _timed(lambda: reference(data, parameter))  # noqa: B023
+            print(
+                f"{name:>12}{nb_points:>10}{duration:>11.3f}s{reference_duration:>11.3f}s"
+                f"{reference_duration / duration:>8.1f}x{str(np.array_equal(mask, reference_mask)):>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the re-evaluation of the expressions of a page when the variable they depend on changes.
+
+Usage:
+    python tools/benchmarks/gui_expressions.py [--expressions 1000] [--updates 100]
+
+The benchmark evaluates --expressions expressions that all depend on a single variable, as a page
+holding as many visual elements bound to expressions would, then changes the value of that
+variable --updates times. Each update re-evaluates all the expressions and sends their values.
+
+The evaluation of the expressions alone is also compared with the way it was done before the
+evaluator cached their compiled code: by copying the global context and evaluating the source of
+each expression.
+"""
+
+import argparse
+import builtins
+import inspect
+import time
+import warnings
+
+from taipy.gui import Gui
+
+
+def _uncached_evaluation(sources, global_ctx, value):
+    for source in sources:
+        ctx = {}
+        ctx.update(global_ctx)
+        ctx.update({"x": value})
+        eval(source, ctx)
+
+
+def _cached_evaluation(codes, eval_builtins, value):
+    for code in codes:
+        eval(code, {"__builtins__": eval_builtins, "x": value})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--expressions", type=int, default=1_000)
+    parser.add_argument("--updates", type=int, default=100)
+    args = parser.parse_args()
+
+    x = 0  # noqa: F841
+    gui = Gui()
+    gui._set_frame(inspect.currentframe())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        expressions = [f"Value {i}: {{x * {i} + len(str(x))}}" for i in range(args.expressions)]
+        start = time.perf_counter()
+        for expression in expressions:
+            gui._evaluate_expr(expression)
+        declaration = time.perf_counter() - start
+
+        # Setting the variable re-evaluates the expressions that depend on it
+        start = time.perf_counter()
+        for value in range(args.updates):
+            gui._bindings().x = value
+        update = (time.perf_counter() - start) / args.updates
+
+    # The global context of the evaluator holds the modules and functions of the main module
+    global_ctx = {k: v for k, v in globals().items() if inspect.ismodule(v) or callable(v)}
+    global_ctx["gui"] = gui
+    sources = ['f"' + expression.replace('"', '\\"') + '"' for expression in expressions]
+    start = time.perf_counter()
+    for value in range(args.updates):
+        _uncached_evaluation(sources, global_ctx, value)
+    uncached = (time.perf_counter() - start) / args.updates
+    codes = [compile(source, "<string>", "eval") for source in sources]
+    eval_builtins = {**builtins.__dict__, **global_ctx}
+    start = time.perf_counter()
+    for value in range(args.updates):
+        _cached_evaluation(codes, eval_builtins, value)
+    cached = (time.perf_counter() - start) / args.updates
+
+    print(f"Declaration of {args.expressions} expressions: {declaration * 1_000:.1f}ms")
+    print(f"Variable update: {update * 1_000:.2f}ms")
+    print(f"Evaluation only: {cached * 1_000:.2f}ms (uncached: {uncached * 1_000:.2f}ms, {uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+N.
\ No newline at end of file